@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+"""Benchmarks of the solver variants. Run as a script, results are printed."""
+import contextlib
+import io
+import time
+import timeit
+import numpy as np
+import loadcases as lc
+from helpers import limited_reachout, case_dependent_results, box_section_stress, reachout_response, max_feasible
+from model_batch import INPUT_KEYS
+from model_jit import results_fused, JIT_AVAILABLE
+from limit_curve import limit_curve, default_inputs
+from load_chart import load_chart
+
+
+def _quiet(fun, *args, **kwargs):
+    """Call fun without the SLSQP console output."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        return fun(*args, **kwargs)
+
+
+def bench_continuation(inputs, step=5.):
+    """Compare SLSQP iterations per angle of cold-started and warm-started (continuation) sweeps."""
+    d_cold, f_cold = _quiet(limit_curve, inputs, step)
+    d_warm, f_warm = _quiet(limit_curve, inputs, step, continuation=True)
+
+    nit_cold = dict(zip(d_cold['phi'], d_cold['nit']))
+    nit_warm = dict(zip(d_warm['phi'], d_warm['nit']))
+    print('Continuation: SLSQP iterations per angle (cold -> warm, saved)')
+    for phi in sorted(set(nit_cold) | set(nit_warm)):
+        cold = nit_cold.get(phi, '-')
+        warm = nit_warm.get(phi, '-')
+        saved = cold - warm if phi in nit_cold and phi in nit_warm else '-'
+        print(f'  phi={phi:6.1f}: {cold:>3} -> {warm:>3} ({saved})')
+    total_cold = sum(nit_cold.values()) + sum(f_cold['No of iterations'])
+    total_warm = sum(nit_warm.values()) + sum(f_warm['No of iterations'])
+    print(f'  total (incl. failed angles): {total_cold} -> {total_warm} iterations, '
+          f'failed angles: {len(f_cold["phi"])} -> {len(f_warm["phi"])}')
+
+
+def bench_model_evaluations(inputs, step=15.):
+    """Compare model evaluations per angle of limited_reachout with finite-difference and analytic constraint Jacobian."""
+    print('limited_reachout: model evaluations (finite differences -> analytic Jacobian)')
+    totals = {False: [0, 0.], True: [0, 0.]}
+    for phi in np.arange(0., 360., step):
+        i = dict(inputs, phi_deg_boom=phi, phi_deg_load=phi + 90.)
+        counts = []
+        for jac in (False, True):
+            t = time.perf_counter()
+            res = _quiet(limited_reachout, i, jac=jac)
+            totals[jac][0] += res.nmodel
+            totals[jac][1] += time.perf_counter() - t
+            counts.append(f'{res.nmodel:3d} ({res.nit:2d} it, ro={float(res.x[0]):7.3f})')
+        print(f'  phi={phi:6.1f}: {counts[0]} -> {counts[1]}')
+    print(f'  total: {totals[False][0]} -> {totals[True][0]} evaluations, '
+          f'{totals[False][1] * 1e3:.0f} ms -> {totals[True][1] * 1e3:.0f} ms')
+
+
+def random_load_cases(ini, n, seed=0):
+    """Return n load cases of the machine ini with random load moments (dict of arrays)."""
+    rng = np.random.default_rng(seed)
+    cols = {k: np.full(n, float(ini[k])) for k in INPUT_KEYS + ['B', 'H', 'tb', 'th']}
+    cols['x1'] = np.full(n, float(ini['x23']))
+    cols['x3'] = np.full(n, float(ini['x14']))
+    ml = rng.uniform(0., 2. * ini['ml'], n)
+    phi = rng.uniform(0., 2. * np.pi, n)
+    cols['mlx'] = ml * np.cos(phi)
+    cols['mly'] = ml * np.sin(phi)
+    # Unsymmetrische Stützensteifigkeit, damit der allgemeine Kern verwendet wird
+    cols['d1'] = cols['d1'] * 1.1
+    return cols
+
+
+def bench_throughput(ini, n=200000, n_scalar=2000):
+    """Print the throughput (load cases per second) of the model incl. lift-off selection and frame stresses per backend."""
+    cols = random_load_cases(ini, n)
+    print(f'Throughput, model + lift-off selection + frame stresses ({n} load cases)')
+
+    def scalar():
+        for j in range(n_scalar):
+            results, _, _ = case_dependent_results(*[cols[k][j] for k in INPUT_KEYS], x1=cols['x1'][j], x3=cols['x3'][j])
+            box_section_stress(B=cols['B'][j], H=cols['H'][j], tb=cols['tb'][j], th=cols['th'][j], m_t=results['t14x'], m_by=results['t14y'])
+            box_section_stress(B=cols['B'][j], H=cols['H'][j], tb=cols['tb'][j], th=cols['th'][j], m_t=results['t23x'], m_by=results['t23y'])
+
+    runs = [('scalar loop', scalar, n_scalar), ('numpy', lambda: results_fused(cols, backend='numpy'), n)]
+    if JIT_AVAILABLE:
+        results_fused({k: v[:10] for k, v in cols.items()}, backend='jit')  # Kompilieren
+        runs.append(('jit', lambda: results_fused(cols, backend='jit'), n))
+    else:
+        print('  jit: numba not installed')
+    for label, fun, count in runs:
+        t = min(timeit.repeat(fun, number=1, repeat=3))
+        print(f'  {label:12s}: {count / t:12,.0f} load cases/s')
+
+    if JIT_AVAILABLE:
+        r_np, g_np, _ = results_fused(cols, backend='numpy')
+        r_jit, g_jit, _ = results_fused(cols, backend='jit')
+        dev = max(float(np.max(np.abs(r_np[k] - r_jit[k]) / np.maximum(np.abs(r_np[k]), 1e-6))) for k in r_np)
+        print(f'  jit vs. numpy: same regimes {bool(np.all(g_np == g_jit))}, max. relative deviation {dev:.1e}')
+
+
+def bench_load_chart(inputs, n_ro=50, step=5.):
+    """Compare the vectorized load chart with the exact solver of limited_reachout per cell (f_ro as free variable)."""
+    ro = np.linspace(inputs['ro_lb'], inputs['ro_ub'], n_ro)
+    phi = np.arange(0., 360., step)
+    free = dict(inputs, ro_lb=0., ro_ub=1e12)
+
+    def per_cell():
+        return np.array([[max_feasible(reachout_response(free, p + 90., scale=r), free)[0] for r in ro] for p in phi])
+
+    t_cell = min(timeit.repeat(per_cell, number=1, repeat=1))
+    t_chart = min(timeit.repeat(lambda: load_chart(inputs, ro, phi), number=1, repeat=3))
+    dev = np.nanmax(np.abs(load_chart(inputs, ro, phi)['f_ro'] - per_cell()) / per_cell())
+    print(f'Load chart ({ro.size * phi.size} cells): per cell {t_cell * 1e3:.0f} ms -> vectorized {t_chart * 1e3:.1f} ms, '
+          f'max. relative deviation {dev:.1e}')
+
+
+if __name__ == "__main__":
+    ini, _ = lc.ro_default()
+    bench_throughput(ini)
+    bench_model_evaluations(default_inputs(ini, rl_lb=5000.))
+    bench_continuation(default_inputs(ini, rl_lb=5000.))
+    bench_load_chart(default_inputs(ini, rl_lb=5000.))
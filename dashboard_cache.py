@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""
+Cached building blocks of the dashboard pages (Streamlit memoization).
+
+Results, figures and load case registries depend only on their (hashable)
+arguments and are memoized with st.cache_data: each rerun and each session
+with the same inputs gets a copy of the stored value instead of recomputing
+it. The number of stored values per function is bounded by MAX_ENTRIES. The
+process pool of the limit curve sweeps (os.cpu_count() workers, each sweep
+uses at most the workers chosen on the page), the persistent sweep cache and
+the manager of the background sweep jobs are st.cache_resource, i.e. shared
+by all sessions.
+
+Streamlit < 1.18 (see requirements.txt) provides the same functionality as
+st.experimental_memo, st.experimental_singleton and st.experimental_rerun.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+import streamlit as st
+import loadcases
+from jobs import JobManager
+from sweep_cache import SweepCache
+from helpers import case_dependent_results_spec
+from plot import topview_plot, sideview_plot, supports_bar_plot, topview_plot_ro_polar
+from slewing import slewing_envelope
+
+cache_data = getattr(st, 'cache_data', None) or st.experimental_memo
+cache_resource = getattr(st, 'cache_resource', None) or st.experimental_singleton
+rerun = getattr(st, 'rerun', None) or st.experimental_rerun
+
+# Maximum number of stored values per memoized function
+MAX_ENTRIES = 256
+
+# Predefined load cases of the pages: name -> loadcases function
+SUPPORT_FORCE_LOADCASES = {'Elast A': loadcases.elast_a,
+                           'Elast B': loadcases.elast_b,
+                           'Elast C': loadcases.elast_c,
+                           'Liftoff A': loadcases.liftoff_a,
+                           'Liftoff B': loadcases.liftoff_b,
+                           'Liftoff C': loadcases.liftoff_c,
+                           'Liftoff D': loadcases.liftoff_d}
+WORKING_RADIUS_LOADCASES = {'Default': loadcases.ro_default,
+                            'Pillow A': loadcases.ro_pillow_a}
+
+
+@cache_data(show_spinner=False)
+def load_case(name):
+    """Return the predefined load case (ini, description) of name."""
+    registry = {**SUPPORT_FORCE_LOADCASES, **WORKING_RADIUS_LOADCASES}
+    return registry[name]()
+
+
+@cache_data(max_entries=MAX_ENTRIES, show_spinner=False)
+def support_forces(spec):
+    """Return case_dependent_results_spec(spec)."""
+    return case_dependent_results_spec(spec)
+
+
+@cache_data(max_entries=MAX_ENTRIES, show_spinner=False)
+def envelope(spec, ml):
+    """Return slewing_envelope(spec, ml)."""
+    return slewing_envelope(spec, ml)
+
+
+@cache_data(max_entries=MAX_ENTRIES, show_spinner=False)
+def support_force_figures(data, range_x, range_y):
+    """Return the figures of the Support Force Distribution page (top view, side views XZ/YZ, support deflections)."""
+    return (topview_plot(data, range_x, range_y), sideview_plot(data, 'xz'), sideview_plot(data, 'yz'),
+            supports_bar_plot(data))
+
+
+@cache_data(max_entries=MAX_ENTRIES, show_spinner=False)
+def polar_figure(data):
+    """Return the polar plot of the Working Radius page without limit curve."""
+    return topview_plot_ro_polar(d=data, d_ro={'phi': [], 'ro': []})
+
+
+@cache_resource(show_spinner=False)
+def process_pool():
+    """Return the process pool for the limit curve sweeps (os.cpu_count() workers, shared by all sessions, kept warm)."""
+    return ProcessPoolExecutor(max_workers=os.cpu_count() or 1)
+
+
+@cache_resource(show_spinner=False)
+def sweep_cache():
+    """Return the cache of completed sweeps (shared by all sessions and with the command line)."""
+    return SweepCache()
+
+
+@cache_resource(show_spinner=False)
+def job_manager():
+    """Return the manager of the background limit curve sweeps (shared by all sessions)."""
+    return JobManager()
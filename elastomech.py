@@ -0,0 +1,233 @@
+# -*- coding: utf-8 -*-
+"""
+Command line interface for batch runs without the dashboards.
+
+Examples (from the repository directory):
+    python -m elastomech sweep variants.json -o out --step 5 --bound rl_lb=5000
+    python -m elastomech forces variants.csv -o out --format parquet
+    python -m elastomech chart variants.json -o out --n-ro 50 --step 5
+
+Inputs are load cases in the shape of loadcases.ro_default()[0], one per
+variant: a JSON object, a JSON list or a JSON object of named objects, or a
+CSV/Parquet table with one row per variant. An optional 'name' field names
+the variant. Shortcuts as in loadcases are expanded: 'h' for y1...y4, 'd' for
+d1...d4 and phi_deg_load = phi_deg_boom + 90.
+"""
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+from helpers import case_dependent_results, restlast, check_liftoffs, box_section_stress
+from limit_curve import default_inputs, BOUND_KEYS
+from sweep_cache import SweepCache, cached_limit_curve
+from load_chart import load_chart, chart_table
+
+FORMATS = ['csv', 'parquet', 'json']
+
+
+def complete_inputs(variant):
+    """Return a copy of the variant with the shortcuts h, d and phi_deg_boom expanded."""
+    i = {k: v for k, v in variant.items() if not (isinstance(v, float) and np.isnan(v))}
+    for n in (1, 2, 3, 4):
+        if 'h' in i:
+            i.setdefault(f'y{n}', i['h'])
+        if 'd' in i:
+            i.setdefault(f'd{n}', i['d'])
+    if 'phi_deg_boom' in i:
+        i.setdefault('phi_deg_load', i['phi_deg_boom'] + 90.)
+    return i
+
+
+def read_variants(path):
+    """
+    Read the machine variants from a JSON, CSV or Parquet file.
+
+    Parameters
+    ----------
+    path : str
+        Input file, the format is taken from the extension.
+
+    Returns
+    -------
+    variants : list of tuples
+        List of (name, inputs).
+    """
+    ext = os.path.splitext(path)[1].lower()
+    if ext == '.json':
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        if isinstance(data, dict) and all(isinstance(v, dict) for v in data.values()):
+            records = [dict(v, name=v.get('name', k)) for k, v in data.items()]
+        elif isinstance(data, dict):
+            records = [data]
+        else:
+            records = data
+    elif ext == '.csv':
+        records = pd.read_csv(path).to_dict('records')
+    elif ext in ('.parquet', '.pq'):
+        records = pd.read_parquet(path).to_dict('records')
+    else:
+        raise ValueError(f'Unknown input format: {path}')
+
+    variants = []
+    for n, record in enumerate(records):
+        inputs = complete_inputs(record)
+        name = str(inputs.pop('name', n))
+        variants.append((name, inputs))
+    return variants
+
+
+def write_table(df, out, name, fmt):
+    """Write a DataFrame to <out>/<name>.<fmt> and return the path."""
+    os.makedirs(out, exist_ok=True)
+    path = os.path.join(out, f'{name}.{fmt}')
+    if fmt == 'csv':
+        df.to_csv(path, index=False)
+    elif fmt == 'parquet':
+        df.to_parquet(path, index=False)
+    else:
+        df.to_json(path, orient='records', indent=1)
+    return path
+
+
+def _ids(value):
+    """Lists (e.g. lift ids) as comma separated string for flat tables."""
+    return ','.join(str(v) for v in value) if isinstance(value, (list, tuple)) else value
+
+
+def sweep_variant(name, inputs, args):
+    """Return the limit curve (lift-off as regime code, see sweep_result) and the error log of one variant as DataFrames."""
+    i = default_inputs(inputs, **args.bounds)
+    cache = None if args.no_cache else SweepCache(args.cache)
+    result = cached_limit_curve(i, args.step, method=args.method, continuation=args.continuation, adaptive=args.adaptive,
+                                min_step=args.min_step, tol_ro=args.tol_ro, cache=cache, disp=False)
+    df_ro = result.to_pandas()
+    df_fails = result.fails_frame()
+    for df in (df_ro, df_fails):
+        df.insert(0, 'variant', name)
+    return df_ro, df_fails
+
+
+def _sweep_task(task):
+    return sweep_variant(*task)
+
+
+def forces_variant(name, inputs):
+    """Return the support forces (and frame stresses if the box section is given) of one variant as dict."""
+    i = inputs
+    results, errors, warnings = case_dependent_results(i['fl'], i['mlx'], i['mly'], i['fe'], i['y1'], i['y2'], i['y3'], i['y4'], i['xe'],
+                                                       i['x14'], i['x23'], i['d14'], i['d23'], i['d1'], i['d2'], i['d3'], i['d4'],
+                                                       x1=i.get('x1'), x3=i.get('x3'))
+    row = {'variant': name}
+    row.update({k: float(v) for k, v in results.items()})
+    if all(k in i for k in ['B', 'H', 'tb', 'th']) and 't14y' in results:
+        row['sv14'] = float(box_section_stress(B=i['B'], H=i['H'], tb=i['tb'], th=i['th'], m_t=results['t14x'], m_by=results['t14y']))
+        row['sv23'] = float(box_section_stress(B=i['B'], H=i['H'], tb=i['tb'], th=i['th'], m_t=results['t23x'], m_by=results['t23y']))
+    rl_min, rl = restlast(results)
+    row.update(rl)
+    row['Restlast key'], row['Restlast val'] = rl_min
+    _, lift_ids, _ = check_liftoffs(results)
+    row['lift id'] = _ids(lift_ids)
+    row['errors'] = ' '.join(errors)
+    row['warnings'] = ' '.join(warnings)
+    return row
+
+
+def cmd_sweep(args):
+    variants = read_variants(args.inputs)
+    tasks = [(name, inputs, args) for name, inputs in variants]
+    if args.workers > 1:
+        with ProcessPoolExecutor(max_workers=args.workers) as pool:
+            frames = list(pool.map(_sweep_task, tasks))
+    else:
+        frames = [_sweep_task(t) for t in tasks]
+    df_ro = pd.concat([f[0] for f in frames], ignore_index=True)
+    df_fails = pd.concat([f[1] for f in frames], ignore_index=True)
+    print(write_table(df_ro, args.out, 'limit_curve', args.format))
+    print(write_table(df_fails, args.out, 'fails', args.format))
+    if not args.no_cache:
+        cache = SweepCache(args.cache)
+        stats = cache.stats()
+        print(f"Sweep cache {cache.path}: {stats['hits']} hits, {stats['misses']} misses, "
+              f"{stats['entries']} sweeps ({stats['bytes'] / 2**20:.1f} MB)", file=sys.stderr)
+    return 0
+
+
+def cmd_chart(args):
+    variants = read_variants(args.inputs)
+    frames = []
+    for name, inputs in variants:
+        i = default_inputs(inputs, **args.bounds)
+        chart = load_chart(i, np.linspace(i['ro_lb'], i['ro_ub'], args.n_ro), np.arange(0., 360., args.step))
+        df = chart_table(chart, long=True)
+        df.insert(0, 'variant', name)
+        frames.append(df)
+    print(write_table(pd.concat(frames, ignore_index=True), args.out, 'load_chart', args.format))
+    return 0
+
+
+def cmd_forces(args):
+    variants = read_variants(args.inputs)
+    df = pd.DataFrame([forces_variant(name, inputs) for name, inputs in variants])
+    print(write_table(df, args.out, 'forces', args.format))
+    return 0
+
+
+def _bound(text):
+    key, _, value = text.partition('=')
+    if key[:-3] not in BOUND_KEYS or key[-3:] not in ('_lb', '_ub'):
+        raise argparse.ArgumentTypeError(f'Unknown bound: {key}')
+    return key, float(value)
+
+
+def build_parser():
+    """Return the argument parser of the command line interface."""
+    parser = argparse.ArgumentParser(prog='elastomech', description=__doc__.splitlines()[1])
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    def common(p):
+        p.add_argument('inputs', help='Input file (.json, .csv, .parquet)')
+        p.add_argument('-o', '--out', default='.', help='Output directory (default: current directory)')
+        p.add_argument('--format', choices=FORMATS, default='csv', help='Format of the result tables (default: csv)')
+
+    p = sub.add_parser('sweep', help='Working radius limit curve (limited_reachout over phi) per variant')
+    common(p)
+    p.add_argument('--step', type=float, default=5., help='Step size of phi in degrees (default: 5)')
+    p.add_argument('--method', choices=['SLSQP', 'exact'], default='SLSQP', help='Solver of limited_reachout')
+    p.add_argument('--continuation', action='store_true', help='Warm-start each angle from the previous one')
+    p.add_argument('--adaptive', action='store_true', help='Adaptive refinement of the phi grid, starting at --step')
+    p.add_argument('--min-step', type=float, default=0.5, help='Minimum step of the adaptive refinement (default: 0.5)')
+    p.add_argument('--tol-ro', type=float, default=0.1, help='Tolerance of ro of the adaptive refinement (default: 0.1)')
+    p.add_argument('--bound', type=_bound, action='append', default=[], dest='bounds',
+                   help='Bound override, e.g. rl_lb=5000 (repeatable). Defaults from loadcases.lim_working_radius')
+    p.add_argument('--workers', type=int, default=1, help='Number of worker processes over the variants (default: 1)')
+    p.add_argument('--cache', default=None, help='Sweep cache database (default: $ELASTOMECH_CACHE_DIR/sweeps.sqlite or ~/.cache/elastomech)')
+    p.add_argument('--no-cache', action='store_true', help='Do not read or write the sweep cache')
+    p.set_defaults(func=cmd_sweep)
+
+    p = sub.add_parser('chart', help='Load chart (allowable tip load over ro and phi) per variant')
+    common(p)
+    p.add_argument('--step', type=float, default=5., help='Step size of phi in degrees (default: 5)')
+    p.add_argument('--n-ro', type=int, default=50, help='Number of radii between ro_lb and ro_ub (default: 50)')
+    p.add_argument('--bound', type=_bound, action='append', default=[], dest='bounds',
+                   help='Bound override, e.g. rl_lb=5000 (repeatable). Defaults from loadcases.lim_working_radius')
+    p.set_defaults(func=cmd_chart)
+
+    p = sub.add_parser('forces', help='Support forces and moments of the load case per variant')
+    common(p)
+    p.set_defaults(func=cmd_forces)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if hasattr(args, 'bounds'):
+        args.bounds = dict(args.bounds)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,8 +1,39 @@
 # -*- coding: utf-8 -*-
 """Collection of helper functions for both dashboards."""
+import time
 import numpy as np
 from model_plain import results_plain, results_liftoff_plain
-from scipy.optimize import minimize
+from model_linear import results_linear, results_liftoff_linear, results_linear_batch
+from model_batch import batch_inputs, results_batch
+from scipy.optimize import minimize, OptimizeResult
+from influence import influence_matrix
+from spec import as_inputs
+
+# Solver backends for case_dependent_results: (elastostatic model, lift-off model)
+BACKENDS = {'plain': (results_plain, results_liftoff_plain),
+            'linear': (results_linear, results_liftoff_linear)}
+BATCH_BACKENDS = {'plain': results_batch,
+                  'linear': results_linear_batch}
+
+# Regime codes of case_dependent_results_batch (1...4: id of the lifted support)
+REGIME_ELASTIC = 0
+REGIME_SEVERAL = -1
+REGIME_TIPOVER = -2
+
+# Active bound of the exact solver if the next regime has no model (several supports lift off / tipping)
+LIFTOFF_LABELS = {REGIME_SEVERAL: 'liftoff_several', REGIME_TIPOVER: 'tipover'}
+
+# Constraints of limited_reachout: (result key, bound prefix in inputs)
+REACHOUT_CONSTRAINTS = [('f12', 'rl'), ('f23', 'rl'), ('f34', 'rl'), ('f14', 'rl'),
+                        ('f1', 'f1'), ('f2', 'f2'), ('f3', 'f3'), ('f4', 'f4'),
+                        ('t14x', 't14x'), ('t23x', 't23x'),
+                        ('sv14', 'sv14'), ('sv23', 'sv23')]
+
+# Model outputs needed for the constraints of limited_reachout
+REACHOUT_OUTPUTS = {'f1', 'f2', 'f3', 'f4', 't14x', 't23x', 't14y', 't23y'}
+
+# Status of limited_reachout if the time budget is used up (SLSQP uses -1...9)
+STATUS_TIME_BUDGET = 10
 
 
 def cart2pol(x, y):
@@ -53,13 +84,15 @@ def pol2cart(rho, phi):
     return x, y
 
 
-def case_dependent_results(fl, mlx, mly, fe, y1, y2, y3, y4, xe, x14, x23, d14, d23, d1, d2, d3, d4, x1=None, x3=None):
+def case_dependent_results(fl, mlx, mly, fe, y1, y2, y3, y4, xe, x14, x23, d14, d23, d1, d2, d3, d4, x1=None, x3=None, backend='plain', outputs=None,
+                           regime=None):
     """
     Check if one or more supports are lifting off ground and select the appropriate calculation model. Return the results of the calculation.
 
     If there is no lift-off of any support, the results are calculated from the (statically overdetermined) elastostatic model.
     If exactly one support lifts off, the corresponding statically determined model is used.
     If several supports lift off, the solution of the elastostatic model is returned and an error string is generated.
+    If the lift-off regime is known in advance (e.g. from slewing.regime_partition), the elastostatic model is skipped for a lifted support.
 
     Parameters
     ----------
@@ -84,6 +117,16 @@ def case_dependent_results(fl, mlx, mly, fe, y1, y2, y3, y4, xe, x14, x23, d14,
          The default is None.
     x3 : float, optional
          The default is None.
+    backend : str, optional
+         Solver backend, one of BACKENDS: 'plain' (closed-form solutions) or
+         'linear' (linear equation system). The default is 'plain'.
+    outputs : set of str, optional
+         Results to compute (f1...f4 are always computed for the lift-off
+         check). The default is None (all results).
+    regime : int, optional
+         Known lift-off regime of the load case: REGIME_ELASTIC or the id of
+         the lifted support (1...4). The default is None (regime found with
+         the elastostatic model).
 
     Returns
     -------
@@ -94,18 +137,26 @@ def case_dependent_results(fl, mlx, mly, fe, y1, y2, y3, y4, xe, x14, x23, d14,
     warnings : list of strings
         List of warning messages.
     """
-    # Initial run
     errors = []
     warnings = []
-    results = results_plain(fl, mlx, mly, fe, y1, y2, y3, y4, xe, x14, x23, d14, d23, d1, d2, d3, d4, x1, x3)
+    model, model_liftoff = BACKENDS[backend]
+    if outputs is not None:
+        outputs = set(outputs) | {'f1', 'f2', 'f3', 'f4'}
 
-    # Check if elastostatic model is valid
-    # if any(f < 0 for f in [results['f1'], results['f2'], results['f3'], results['f4']]):
-    count, lift_ids, _ = check_liftoffs(results)
-
-    if count == 1:  # Genau eine Stütze hebt ab
-        results = results_liftoff_plain(fl, mlx, mly, fe, y1, y2, y3, y4, xe, x14, x23, d14, d23, d1, d2, d3, d4, lift=lift_ids[0], x1=x1, x3=x3)
+    if regime is not None and regime > 0:  # Abhebende Stütze bekannt
+        results = model_liftoff(fl, mlx, mly, fe, y1, y2, y3, y4, xe, x14, x23, d14, d23, d1, d2, d3, d4, lift=regime, x1=x1, x3=x3, outputs=outputs)
         count, lift_ids, warnings = check_liftoffs(results)
+    else:
+        # Initial run
+        results = model(fl, mlx, mly, fe, y1, y2, y3, y4, xe, x14, x23, d14, d23, d1, d2, d3, d4, x1, x3, outputs=outputs)
+
+        # Check if elastostatic model is valid
+        # if any(f < 0 for f in [results['f1'], results['f2'], results['f3'], results['f4']]):
+        count, lift_ids, _ = check_liftoffs(results)
+
+        if count == 1:  # Genau eine Stütze hebt ab
+            results = model_liftoff(fl, mlx, mly, fe, y1, y2, y3, y4, xe, x14, x23, d14, d23, d1, d2, d3, d4, lift=lift_ids[0], x1=x1, x3=x3, outputs=outputs)
+            count, lift_ids, warnings = check_liftoffs(results)
 
     if count > 1:  # Mehrere Stützen heben ab
         errors = ['Mehr als eine Stütze hebt ab. Berechnung ungültig.']
@@ -113,6 +164,165 @@ def case_dependent_results(fl, mlx, mly, fe, y1, y2, y3, y4, xe, x14, x23, d14,
     return results, errors, warnings
 
 
+def case_dependent_results_spec(spec, backend='plain', outputs=None, regime=None):
+    """
+    Return case_dependent_results for a MachineSpec (or an input dict).
+
+    Parameters
+    ----------
+    spec : MachineSpec or dict
+        Machine and load case.
+    backend : str, optional
+        See case_dependent_results. The default is 'plain'.
+    outputs : set of str, optional
+        See case_dependent_results. The default is None.
+    regime : int, optional
+        See case_dependent_results. The default is None.
+
+    Returns
+    -------
+    results : dict
+        Dict of results.
+    errors : list of strings
+        List of error messages.
+    warnings : list of strings
+        List of warning messages.
+    """
+    i = as_inputs(spec)
+    return case_dependent_results(i['fl'], i['mlx'], i['mly'], i['fe'], i['y1'], i['y2'], i['y3'], i['y4'], i['xe'], i['x14'], i['x23'],
+                                  i['d14'], i['d23'], i['d1'], i['d2'], i['d3'], i['d4'], x1=i.get('x1'), x3=i.get('x3'),
+                                  backend=backend, outputs=outputs, regime=regime)
+
+
+def _results_by_regime(model, cols, regime, outputs):
+    """Evaluate the elastostatic model for rows with regime 0 and the lift-off models for rows with regime 1...4."""
+    results = None
+    for lift in (REGIME_ELASTIC, 1, 2, 3, 4):
+        rows = regime == lift
+        if not rows.any():
+            continue
+        sub = model({k: v[rows] for k, v in cols.items()}, lift=lift or None, outputs=outputs)
+        if results is None:
+            results = {k: np.full(rows.shape, np.nan) for k in sub}
+        for k, v in sub.items():
+            results[k][rows] = v
+    return results
+
+
+def _active_set(model, cols, max_iter, outputs):
+    """Primal-dual active set iteration over the unilateral support springs, see case_dependent_results_batch."""
+    n = cols['fl'].size
+    d = np.stack([cols[k] for k in ['d1', 'd2', 'd3', 'd4']])
+    regime = np.zeros(n, dtype=np.int8)
+    open_ = np.ones(n, dtype=bool)  # Rows which are not converged yet
+    results = _results_by_regime(model, cols, regime, outputs)
+    for _ in range(max_iter):
+        rows = np.flatnonzero(open_)
+        if not rows.size:
+            break
+        sub = _results_by_regime(model, {k: v[rows] for k, v in cols.items()}, regime[rows], outputs)
+        for k, v in sub.items():
+            results[k][rows] = v
+
+        # Kontakt: f_i = d_i * s_i > 0, abgehoben: f_i = 0 und s_i < 0. In
+        # both cases the support stays in contact if f_i + d_i * s_i > 0.
+        f = np.stack([sub[k] for k in ['f1', 'f2', 'f3', 'f4']])
+        s = np.stack([sub[k] for k in ['s1', 's2', 's3', 's4']])
+        c = f + d[:, rows] * s
+        lifted = c <= 0
+        count = lifted.sum(axis=0)
+        current = regime[rows]
+        proposed = np.where(count == 0, REGIME_ELASTIC, np.argmin(c, axis=0) + 1).astype(np.int8)
+
+        # Two supports open at the same time: the platform is a mechanism
+        still_open = (current > 0) & lifted[np.maximum(current - 1, 0), np.arange(rows.size)]
+        tipover = (count > 1) & still_open
+        proposed[tipover] = REGIME_TIPOVER
+
+        done = (proposed == current) | tipover
+        regime[rows] = proposed
+        open_[rows[done]] = False
+
+    regime[open_] = REGIME_SEVERAL  # Keine Konvergenz
+    return results, regime
+
+
+def case_dependent_results_batch(inputs, backend='plain', mode='regime', max_iter=10, outputs=None):
+    """
+    Array version of case_dependent_results for a whole batch of load cases.
+
+    mode='regime' (as case_dependent_results): The elastostatic model is
+    evaluated for all rows, each of the four lift-off models only for the
+    rows where exactly this support lifts off. Rows with several lifted
+    supports keep the elastostatic results and are marked in the error mask.
+
+    mode='active_set': The four support springs are treated as unilateral
+    contacts and the set of lifted supports is iterated to convergence (rows
+    are grouped by their current set in each iteration). A support is lifted
+    if its force would become negative and closed again if it would
+    penetrate the ground. If a second support has to lift off while the
+    first one is still open, the platform tips over (with only two supports
+    the equation system is singular).
+
+    Parameters
+    ----------
+    inputs : dict, DataFrame or structured array
+        Input columns, see model_batch.batch_inputs.
+    backend : str, optional
+        Batch solver backend, one of BATCH_BACKENDS. The default is 'plain'.
+    mode : str, optional
+        'regime' or 'active_set'. The default is 'regime'.
+    max_iter : int, optional
+        Maximum number of active set iterations. The default is 10.
+    outputs : set of str, optional
+        Results to compute (f1...f4, for active_set also s1...s4, are always
+        computed). The default is None (all results).
+
+    Returns
+    -------
+    results : dict
+        Dict of float arrays. Tip-over rows hold the last iterate.
+    regime : array of int8
+        REGIME_ELASTIC, id of the lifted support (1...4), REGIME_SEVERAL
+        (several lifted supports, resp. no convergence of the active set) or
+        REGIME_TIPOVER (active_set only).
+    error : array of bool
+        True where the results are invalid (regime < 0).
+    """
+    model = BATCH_BACKENDS[backend]
+    cols = batch_inputs(inputs)
+    if outputs is not None:
+        outputs = set(outputs) | {'f1', 'f2', 'f3', 'f4'}
+    if mode == 'active_set':
+        if outputs is not None:
+            outputs |= {'s1', 's2', 's3', 's4'}
+        results, regime = _active_set(model, cols, max_iter, outputs)
+        return results, regime, regime < 0
+    if mode != 'regime':
+        raise ValueError(f'Unknown mode: {mode}')
+
+    results = model(cols, outputs=outputs)
+    forces = np.stack([results[k] for k in ['f1', 'f2', 'f3', 'f4']])
+    lifted = forces <= 0
+    count = lifted.sum(axis=0)
+    regime = np.where(count == 0, REGIME_ELASTIC, REGIME_SEVERAL).astype(np.int8)
+
+    for lift in (1, 2, 3, 4):
+        rows = (count == 1) & lifted[lift - 1]
+        if not rows.any():
+            continue
+        sub = model({k: v[rows] for k, v in cols.items()}, lift=lift, outputs=outputs)
+        for k, v in sub.items():
+            results[k][rows] = v
+        regime[rows] = lift
+        # Genau eine Stütze hebt ab: weitere abhebende Stützen im Lift-off-Modell prüfen
+        others = [k for n, k in enumerate(['f1', 'f2', 'f3', 'f4'], start=1) if n != lift]
+        invalid = np.any([sub[k] <= 0 for k in others], axis=0)
+        regime[np.flatnonzero(rows)[invalid]] = REGIME_SEVERAL
+
+    return results, regime, regime < 0
+
+
 def load_moment(force_distance_pairs):
     """
     Return load moment from multiple pairs of forces and distances.
@@ -163,7 +373,11 @@ def restlast(results):
     return rl_min, rl
 
 
-def limited_reachout(inputs):
+class _TimeBudgetExceeded(Exception):
+    pass
+
+
+def limited_reachout(inputs, method='SLSQP', initial_guess=None, jac=True, time_budget=None, disp=True):
     """
     Maximize working radius ro within its boundaries (ro_lb, ro_ub).
 
@@ -174,12 +388,36 @@ def limited_reachout(inputs):
 
     SLSQP method ([Sequential Least Squares Programming](https://docs.scipy.org
     /doc/scipy/reference/optimize.minimize-slsqp.html#optimize-minimize-slsqp))
-    is used for optimization
+    is used for optimization by default. With method='exact' the maximum ro is
+    determined in closed form: within each lift-off regime all results are
+    affine in ro, so every bound gives an interval of ro (a quadratic
+    inequality for the equivalent stresses). The intervals are intersected
+    per regime, see reachout_response and max_feasible.
+
+    With SLSQP the model is evaluated only once per ro (the results are cached
+    for the optimization) and all bounds form one vector valued constraint
+    with an analytic Jacobian, see reachout_gradient.
 
     Parameters
     ----------
-    inputs : dict
-        Dict of input values.
+    inputs : dict or MachineSpec
+        Dict of input values. The optional key 'backend' selects the solver
+        backend of case_dependent_results.
+    method : str, optional
+        'SLSQP' or 'exact'. The default is 'SLSQP'.
+    initial_guess : float, optional
+        Start value of ro for SLSQP (e.g. the solution of a neighbouring
+        angle). The default is None (ro_ub).
+    jac : bool, optional
+        Use the analytic Jacobian of the constraints (SLSQP only). If False,
+        it is approximated by finite differences. The default is True.
+    time_budget : float, optional
+        Maximum wall time in seconds (SLSQP only). If it is used up, the
+        optimization is stopped unsuccessfully with status
+        STATUS_TIME_BUDGET. The default is None (no limit).
+    disp : bool, optional
+        Print the convergence message of SLSQP to stdout. The default is
+        True.
 
     Returns
     -------
@@ -187,102 +425,382 @@ def limited_reachout(inputs):
         The optimization result represented as a OptimizeResult object. Importa
         nt attributes are: x the solution array, success a Boolean flag indicat
         ing if the optimizer exited successfully and message which describes th
-        e cause of the termination.
+        e cause of the termination. The exact method additionally returns the
+        label of the active bound (active) and the lift-off regime (lift),
+        SLSQP the number of model evaluations (nmodel).
     """
-    def results_by_ro(ro, inputs):
-        i = inputs
-        ml = load_moment([(i['f_ro'], ro)])
-        mlx, mly = xy_load(ml, i['phi_deg_load'])
-        results, _, _ = case_dependent_results(i['fl'], mlx, mly, i['fe'], i['y1'], i['y2'], i['y3'], i['y4'], i['xe'], i['x14'], i['x23'], i['d14'], i['d23'], i['d1'], i['d2'], i['d3'], i['d4'], x1=i['x1'], x3=i['x3'])
+    inputs = as_inputs(inputs)
+    if method == 'exact':
+        return _limited_reachout_exact(inputs)
+
+    i = inputs
+    cache = {}
+    deadline = None if time_budget is None else time.monotonic() + time_budget
+
+    def results_by_ro(ro):
+        # Modell nur einmal je ro auswerten
+        ro = float(ro)
+        if ro not in cache:
+            if deadline is not None and time.monotonic() > deadline:
+                raise _TimeBudgetExceeded
+            ml = load_moment([(i['f_ro'], ro)])
+            mlx, mly = xy_load(ml, i['phi_deg_load'])
+            results, _, _ = case_dependent_results(i['fl'], mlx, mly, i['fe'], i['y1'], i['y2'], i['y3'], i['y4'], i['xe'], i['x14'], i['x23'], i['d14'], i['d23'], i['d1'], i['d2'], i['d3'], i['d4'], x1=i['x1'], x3=i['x3'], backend=i.get('backend', 'plain'), outputs=REACHOUT_OUTPUTS)
+
+            # Zusätzlich Spannungen im Rahmen berechnen
+            results['sv14'] = box_section_stress(B=i['B'], H=i['H'], tb=i['tb'], th=i['th'], m_t=results['t14x'], m_by=results['t14y'])
+            results['sv23'] = box_section_stress(B=i['B'], H=i['H'], tb=i['tb'], th=i['th'], m_t=results['t23x'], m_by=results['t23y'])
+            _, rl = restlast(results)
+            results.update(rl)
+            cache[ro] = results
+        return cache[ro]
+
+    def constraints(x):
+        # Randbedingungen lb <= value(ro) <= ub für alle REACHOUT_CONSTRAINTS
+        results = results_by_ro(x[0])
+        return np.array([g for key, bound in REACHOUT_CONSTRAINTS
+                         for g in (results[key] - i[bound + '_lb'], i[bound + '_ub'] - results[key])])
+
+    def constraints_jac(x):
+        grad = reachout_gradient(i, x[0], results_by_ro(x[0]))
+        return np.array([[g] for key, _ in REACHOUT_CONSTRAINTS for g in (grad[key], -grad[key])])
 
-        # Zusätzlich Spannungen im Rahmen berechnen
-        results['sv14'] = box_section_stress(B=i['B'], H=i['H'], tb=i['tb'], th=i['th'], m_t=results['t14x'], m_by=results['t14y'])
-        results['sv23'] = box_section_stress(B=i['B'], H=i['H'], tb=i['tb'], th=i['th'], m_t=results['t23x'], m_by=results['t23y'])
+    # Bounds for ro
+    ro_lb = inputs['ro_lb']
+    ro_ub = inputs['ro_ub']
+    bnds = ((ro_lb, ro_ub),)  # Grenzwerte zusammenfassen
 
-        return results
+    # Constraints (Nebenbedingungen) as one vector valued constraint
+    cons = {'type': 'ineq', 'fun': constraints}
+    if jac:
+        cons['jac'] = constraints_jac
+
+    if initial_guess is None:
+        initial_guess = ro_ub
+    initial_guess = min(max(initial_guess, ro_lb), ro_ub)
+
+    nit = [0]
+
+    def count(x):
+        nit[0] += 1
+
+    try:
+        res = minimize(lambda x: -x,  # mit x=ro --> Maximiere ro
+                       x0=(initial_guess,),
+                       method='SLSQP',
+                       bounds=bnds,
+                       constraints=cons,
+                       tol=1e-6,
+                       callback=count,
+                       options={'maxiter': 50,
+                                'eps': 0.1,
+                                'disp': disp})
+    except _TimeBudgetExceeded:
+        res = OptimizeResult(x=np.array([initial_guess]),
+                             success=False,
+                             status=STATUS_TIME_BUDGET,
+                             message=f'Time budget of {time_budget:g} s exceeded',
+                             nit=nit[0])
+    res.nmodel = len(cache)
+    return res
 
-    def restlast_by_ro(ro, inputs):
-        results = results_by_ro(ro, inputs)
-        _, rl = restlast(results)
-        return rl
 
-    def restlast_constraint_lb(ro, inputs, key):
-        # Randbedingung: rl_lb <= restlast(ro)
-        return restlast_by_ro(ro, inputs)[key] - inputs['rl_lb']
+def _affine_response(inputs, phi_deg_load, scale, lift):
+    """Return the results at t = 0 and their slopes per unit t (ml = scale * t) of one regime."""
+    i = inputs
+    rad = np.radians(phi_deg_load)
+    base = np.array([i['fl'], 0., 0., i['fe'], i['fe'] * i['xe']])
+    direction = np.array([0., np.cos(rad), np.sin(rad), 0., 0.]) * scale
+    keys, matrix = influence_matrix(i, lift)
+    a = dict(zip(keys, matrix @ base))
+    b = dict(zip(keys, matrix @ direction))
+    for d in (a, b):
+        _, rl = restlast(d)
+        d.update(rl)
+    return a, b
 
-    def restlast_constraint_ub(ro, inputs, key):
-        # Randbedingung: restlast(ro) <= rl_ub
-        return inputs['rl_ub'] - restlast_by_ro(ro, inputs)[key]
 
-    def f_constraint_lb(ro, inputs, key):
-        # Randbedingung: f1_lb <= f1(ro)
-        return results_by_ro(ro, inputs)[key] - inputs[key + '_lb']
+def reachout_gradient(inputs, ro, results):
+    """
+    Return the derivatives of the constrained results of limited_reachout with respect to ro.
 
-    def f_constraint_ub(ro, inputs, key):
-        # Randbedingung: f1(ro) <= f1_ub
-        return inputs[key + '_ub'] - results_by_ro(ro, inputs)[key]
+    Parameters
+    ----------
+    inputs : dict
+        Dict of input values.
+    ro : float
+        Working radius.
+    results : dict
+        Results at ro including sv14 and sv23.
 
-    def tx_constraint_lb(ro, inputs, key):
-        # Randbedingung: tx_lb <= tx(ro)
-        return results_by_ro(ro, inputs)[key] - inputs[key + '_lb']
+    Returns
+    -------
+    grad : dict
+        Dict of derivatives for all keys of REACHOUT_CONSTRAINTS.
+    """
+    i = inputs
+    a0, b0 = _affine_response(i, i['phi_deg_load'], i['f_ro'], None)
+    lift_ids = [n + 1 for n, k in enumerate(['f1', 'f2', 'f3', 'f4']) if a0[k] + b0[k] * ro <= 0]
+    if len(lift_ids) == 1:  # Wie in case_dependent_results
+        _, b0 = _affine_response(i, i['phi_deg_load'], i['f_ro'], lift_ids[0])
+    grad = {key: b0[key] for key, _ in REACHOUT_CONSTRAINTS if not key.startswith('sv')}
+
+    # Kettenregel für die Vergleichsspannung sv = sqrt(kb * mb**2 + kt * mt**2)
+    iy, _ = second_moment_of_area_box_section(i['B'], i['H'], i['tb'], i['th'])
+    wt_h, _ = torsional_resistance_moment_box_section(i['B'], i['H'], i['tb'], i['th'])
+    kb = (i['H'] / 2. / iy)**2
+    kt = 3. / wt_h**2
+    for key, mt, mb in [('sv14', 't14x', 't14y'), ('sv23', 't23x', 't23y')]:
+        sv = results[key]
+        grad[key] = (kb * results[mb] * b0[mb] + kt * results[mt] * b0[mt]) / sv if sv > 0 else 0.
+    return grad
+
+
+def reachout_response(inputs, phi_deg_load, scale=1.):
+    """
+    Return the response of the model to a load moment in direction phi_deg_load as piecewise affine function.
 
-    def tx_constraint_ub(ro, inputs, key):
-        # Randbedingung: tx(ro) <= tx_ub
-        return inputs[key + '_ub'] - results_by_ro(ro, inputs)[key]
+    The load moment is ml = scale * t (e.g. scale = f_ro, t = ro). For fixed
+    geometry and lift-off regime all results are affine in t. The range of t
+    is split at the lift-off breakpoints (zero crossings of f1...f4 of the
+    elastostatic model).
 
-    def stress_constraint_lb(ro, inputs, key):
-        # Randbedingung: sv_lb <= sv(ro)
-        return results_by_ro(ro, inputs)[key] - inputs[key + '_lb']
+    Parameters
+    ----------
+    inputs : dict
+        Dict of input values.
+    phi_deg_load : float
+        Direction of the load moment in degrees.
+    scale : float, optional
+        Load moment per unit of t. The default is 1.
 
-    def stress_constraint_ub(ro, inputs, key):
-        # Randbedingung: sv(ro) <= sv_ub
-        return inputs[key + '_ub'] - results_by_ro(ro, inputs)[key]
+    Returns
+    -------
+    segments : list of dicts
+        One dict per regime with the keys 'lo', 'hi' (range of t), 'lift'
+        (0: no lift-off, 1...4: id of the lifted support, -1: several
+        supports lift off), 'a' and 'b' (dicts of results at t = 0 and slopes
+        per unit t, including the residual loads f12...f14).
+    """
+    i = as_inputs(inputs)
+
+    def affine(lift):
+        return _affine_response(i, phi_deg_load, scale, lift)
+
+    a0, b0 = affine(None)
+    f_keys = ['f1', 'f2', 'f3', 'f4']
+    t_lo, t_hi = i['ro_lb'], i['ro_ub']
+    breaks = sorted(-a0[k] / b0[k] for k in f_keys if b0[k] != 0 and t_lo < -a0[k] / b0[k] < t_hi)
+    edges = [t_lo] + breaks + [t_hi]
+
+    segments = []
+    for lo, hi in zip(edges[:-1], edges[1:]):
+        t_mid = (lo + hi) / 2.
+        lift_ids = [n + 1 for n, k in enumerate(f_keys) if a0[k] + b0[k] * t_mid <= 0]
+        if not lift_ids:
+            lift, (a, b) = 0, (a0, b0)
+        elif len(lift_ids) == 1:
+            lift, (a, b) = lift_ids[0], affine(lift_ids[0])
+        else:
+            lift, (a, b) = -1, (a0, b0)
+        segments.append({'lo': lo, 'hi': hi, 'lift': lift, 'a': a, 'b': b})
+    return segments
+
+
+def _intersect(set_a, set_b):
+    """Intersect two sorted lists of closed intervals (lo, hi, lo_label, hi_label)."""
+    out = []
+    for lo_a, hi_a, lla, hla in set_a:
+        for lo_b, hi_b, llb, hlb in set_b:
+            lo, ll = (lo_a, lla) if lo_a >= lo_b else (lo_b, llb)
+            hi, hl = (hi_a, hla) if hi_a <= hi_b else (hi_b, hlb)
+            if lo <= hi:
+                out.append((lo, hi, ll, hl))
+    return sorted(out)
+
+
+def _linear_set(a, b, lb, ub, key):
+    """Return the set of t with lb <= a + b * t <= ub."""
+    if b == 0:
+        return [(-np.inf, np.inf, None, None)] if lb <= a <= ub else []
+    t1, t2 = (lb - a) / b, (ub - a) / b
+    if b > 0:
+        return [(t1, t2, key + '_lb', key + '_ub')]
+    return [(t2, t1, key + '_ub', key + '_lb')]
+
+
+def _quadratic_set(qa, qb, qc, lb, ub, key):
+    """Return the set of t with lb**2 <= qa * t**2 + qb * t + qc <= ub**2 (qa >= 0)."""
+    def roots(c):
+        if qa == 0:
+            if qb == 0:
+                return None if qc - c <= 0 else ()
+            r = (c - qc) / qb
+            return (-np.inf, r) if qb > 0 else (r, np.inf)
+        disc = qb**2 - 4. * qa * (qc - c)
+        if disc < 0:
+            return ()
+        sq = np.sqrt(disc)
+        return ((-qb - sq) / (2. * qa), (-qb + sq) / (2. * qa))
+
+    # Upper bound: q(t) <= ub**2 is a single interval (q is convex)
+    r = roots(ub**2)
+    if r is None:
+        out = [(-np.inf, np.inf, None, None)]
+    elif not r:
+        return []
+    else:
+        out = [(r[0], r[1], key + '_ub', key + '_ub')]
+
+    # Lower bound: q(t) >= lb**2 excludes an open interval
+    if lb > 0:
+        r = roots(lb**2)
+        if r is None:
+            return []
+        if r:
+            out = _intersect(out, [(-np.inf, r[0], None, key + '_lb'), (r[1], np.inf, key + '_lb', None)])
+    return out
+
+
+def reachout_constraint_sets(segment, inputs):
+    """
+    Return the feasible set of t for each constraint of limited_reachout within one regime segment.
 
-    # Bounds for ro
-    ro_lb = inputs['ro_lb']
-    ro_ub = inputs['ro_ub']
-    bnds = ((ro_lb, ro_ub),)  # Grenzwerte zusammenfassen
+    Parameters
+    ----------
+    segment : dict
+        Regime segment, see reachout_response.
+    inputs : dict
+        Dict of input values (bounds and frame box section).
 
-    # Constraints (Nebenbedingungen)
-    cons = (
-        {'type': 'ineq', 'fun': restlast_constraint_lb, 'args': (inputs, 'f12')},
-        {'type': 'ineq', 'fun': restlast_constraint_ub, 'args': (inputs, 'f12')},
-        {'type': 'ineq', 'fun': restlast_constraint_lb, 'args': (inputs, 'f23')},
-        {'type': 'ineq', 'fun': restlast_constraint_ub, 'args': (inputs, 'f23')},
-        {'type': 'ineq', 'fun': restlast_constraint_lb, 'args': (inputs, 'f34')},
-        {'type': 'ineq', 'fun': restlast_constraint_ub, 'args': (inputs, 'f34')},
-        {'type': 'ineq', 'fun': restlast_constraint_lb, 'args': (inputs, 'f14')},
-        {'type': 'ineq', 'fun': restlast_constraint_ub, 'args': (inputs, 'f14')},
-        {'type': 'ineq', 'fun': f_constraint_lb, 'args': (inputs, 'f1',)},
-        {'type': 'ineq', 'fun': f_constraint_ub, 'args': (inputs, 'f1',)},
-        {'type': 'ineq', 'fun': f_constraint_lb, 'args': (inputs, 'f2',)},
-        {'type': 'ineq', 'fun': f_constraint_ub, 'args': (inputs, 'f2',)},
-        {'type': 'ineq', 'fun': f_constraint_lb, 'args': (inputs, 'f3',)},
-        {'type': 'ineq', 'fun': f_constraint_ub, 'args': (inputs, 'f3',)},
-        {'type': 'ineq', 'fun': f_constraint_lb, 'args': (inputs, 'f4',)},
-        {'type': 'ineq', 'fun': f_constraint_ub, 'args': (inputs, 'f4',)},
-        {'type': 'ineq', 'fun': tx_constraint_lb, 'args': (inputs, 't14x',)},
-        {'type': 'ineq', 'fun': tx_constraint_ub, 'args': (inputs, 't14x',)},
-        {'type': 'ineq', 'fun': tx_constraint_lb, 'args': (inputs, 't23x',)},
-        {'type': 'ineq', 'fun': tx_constraint_ub, 'args': (inputs, 't23x',)},
-        {'type': 'ineq', 'fun': stress_constraint_lb, 'args': (inputs, 'sv14',)},
-        {'type': 'ineq', 'fun': stress_constraint_ub, 'args': (inputs, 'sv14',)},
-        {'type': 'ineq', 'fun': stress_constraint_lb, 'args': (inputs, 'sv23',)},
-        {'type': 'ineq', 'fun': stress_constraint_ub, 'args': (inputs, 'sv23',)},
-    )
-
-    initial_guess = ro_ub
-
-    res = minimize(lambda x: -x,  # mit x=ro --> Maximiere ro
-                   x0=(initial_guess,),
-                   method='SLSQP',
-                   bounds=bnds,
-                   constraints=cons,
-                   tol=1e-6,
-                   options={'maxiter': 50,
-                            'eps': 0.1,
-                            'disp': True})
-    return res
+    Returns
+    -------
+    sets : dict
+        Dict of constraint key -> sorted list of intervals (lo, hi, lo_label,
+        hi_label). Labels name the active bound, e.g. 'f1_ub'.
+    """
+    i = inputs
+    a, b = segment['a'], segment['b']
+    sets = {}
+    for key, bound in REACHOUT_CONSTRAINTS:
+        if key.startswith('sv'):
+            continue
+        sets[key] = _linear_set(a[key], b[key], i[bound + '_lb'], i[bound + '_ub'], key)
+
+    # Equivalent stresses: sv**2 is a convex quadratic function of t
+    iy, _ = second_moment_of_area_box_section(i['B'], i['H'], i['tb'], i['th'])
+    wt_h, _ = torsional_resistance_moment_box_section(i['B'], i['H'], i['tb'], i['th'])
+    kb = (i['H'] / 2. / iy)**2
+    kt = 3. / wt_h**2
+    for key, mt, mb in [('sv14', 't14x', 't14y'), ('sv23', 't23x', 't23y')]:
+        qa = kb * b[mb]**2 + kt * b[mt]**2
+        qb = 2. * (kb * a[mb] * b[mb] + kt * a[mt] * b[mt])
+        qc = kb * a[mb]**2 + kt * a[mt]**2
+        sets[key] = _quadratic_set(qa, qb, qc, max(i[key + '_lb'], 0.), i[key + '_ub'], key)
+    return sets
+
+
+def max_feasible(segments, inputs):
+    """
+    Return the largest t which satisfies all constraints of limited_reachout.
+
+    Parameters
+    ----------
+    segments : list of dicts
+        Regime segments, see reachout_response.
+    inputs : dict
+        Dict of input values (bounds and frame box section).
+
+    Returns
+    -------
+    t : float
+        Largest feasible t, nan if there is no feasible t.
+    active : str
+        Label of the active bound (e.g. 'f1_ub', 'ro_ub'), a label of
+        LIFTOFF_LABELS if t is limited by a regime without model (e.g.
+        'liftoff_several' if two supports lift off at t) or '' if
+        infeasible.
+    lift : int
+        Lift-off regime at t (see reachout_response).
+    """
+    best = (np.nan, '', 0)
+    sets_by_segment = []
+    for n, seg in enumerate(segments):
+        sets = reachout_constraint_sets(seg, inputs) if seg['lift'] >= 0 else None
+        sets_by_segment.append(sets)
+        if sets is None:
+            continue
+        lo_label = 'ro_lb' if n == 0 else 'liftoff'
+        hi_label = 'ro_ub' if n == len(segments) - 1 else 'liftoff'
+        feasible = [(seg['lo'], seg['hi'], lo_label, hi_label)]
+        for s in sets.values():
+            feasible = _intersect(feasible, s)
+        if feasible:
+            best = (feasible[-1][1], feasible[-1][3], seg['lift'])
+
+    # Name the bound which excludes the next regime right after a breakpoint
+    t, active, lift = best
+    if active == 'liftoff':
+        n = next(n for n, seg in enumerate(segments) if seg['hi'] == t) + 1
+        if sets_by_segment[n] is not None:
+            active = _excluding_bound(sets_by_segment[n], t)
+        else:
+            active = LIFTOFF_LABELS[segments[n]['lift']]
+    return t, active, lift
+
+
+def _excluding_bound(sets, t):
+    """Return the label of the first bound whose feasible set does not contain t."""
+    for key, s in sets.items():
+        if not any(lo <= t <= hi for lo, hi, _, _ in s):
+            above = [ll for lo, _, ll, _ in s if lo > t]
+            below = [hl for _, hi, _, hl in s if hi < t]
+            return (above + below[::-1] + [key])[0] or key
+    return 'liftoff'
+
+
+def active_bound(results, inputs, ro):
+    """
+    Return the label of the bound of limited_reachout which is closest to being violated.
+
+    Slacks are normalized by the width of the respective bound interval.
+
+    Parameters
+    ----------
+    results : dict
+        Results at ro including the residual loads and equivalent stresses.
+    inputs : dict
+        Dict of input values (bounds).
+    ro : float
+        Working radius.
+
+    Returns
+    -------
+    label : str
+        E.g. 'f1_ub' or 'ro_ub'.
+    """
+    i = inputs
+    values = [('ro', 'ro', ro)] + [(key, bound, results[key]) for key, bound in REACHOUT_CONSTRAINTS]
+    slacks = {}
+    for key, bound, v in values:
+        width = max(i[bound + '_ub'] - i[bound + '_lb'], 1e-12)
+        slacks[key + '_lb'] = (v - i[bound + '_lb']) / width
+        slacks[key + '_ub'] = (i[bound + '_ub'] - v) / width
+    return min(slacks, key=slacks.get)
+
+
+def _limited_reachout_exact(inputs):
+    i = inputs
+    segments = reachout_response(i, i['phi_deg_load'], scale=i['f_ro'])
+    ro, active, lift = max_feasible(segments, i)
+    success = not np.isnan(ro)
+    return OptimizeResult(x=np.array([ro]),
+                          success=success,
+                          status=0 if success else 2,
+                          message='Exact solution found' if success else 'No admissible working radius within the bounds',
+                          nit=0,
+                          active=active,
+                          lift=lift)
 
 
 def scalar_vec_projection(x, y):
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+"""
+Influence coefficients of the mechanical models.
+
+For fixed geometry and stiffness every output of the elastostatic and lift-off
+models is linear in the load vector (fl, mlx, mly, fe, fe * xe). The influence
+matrix is computed once per geometry (cached) and any number of load states is
+then evaluated with a single matrix multiplication.
+"""
+from functools import lru_cache
+import numpy as np
+from model_batch import results_batch
+from spec import as_inputs
+
+# Columns of the influence matrix
+LOAD_KEYS = ['fl', 'mlx', 'mly', 'fe', 'fexe']
+
+# Inputs which define the influence matrix (x1, x3 are optional)
+GEOMETRY_KEYS = ['y1', 'y2', 'y3', 'y4', 'x14', 'x23', 'd14', 'd23', 'd1', 'd2', 'd3', 'd4', 'x1', 'x3']
+
+
+def geometry_key(inputs):
+    """Return the geometry/stiffness values of an input dict or MachineSpec as hashable tuple."""
+    inputs = as_inputs(inputs)
+    return tuple(None if inputs.get(k) is None else float(inputs[k]) for k in GEOMETRY_KEYS)
+
+
+@lru_cache(maxsize=256)
+def _influence_matrix(geometry, lift):
+    cols = dict(zip(GEOMETRY_KEYS, geometry))
+    if cols['x1'] is None or cols['x3'] is None:
+        del cols['x1'], cols['x3']
+
+    # Unit load states, the fe * xe column is the difference of the last two
+    cols['fl'] = np.array([1., 0., 0., 0., 0.])
+    cols['mlx'] = np.array([0., 1., 0., 0., 0.])
+    cols['mly'] = np.array([0., 0., 1., 0., 0.])
+    cols['fe'] = np.array([0., 0., 0., 1., 1.])
+    cols['xe'] = np.array([0., 0., 0., 0., 1.])
+
+    results = results_batch(cols, lift=lift)
+    keys = list(results)
+    matrix = np.array([results[k] for k in keys])
+    matrix[:, 4] -= matrix[:, 3]
+    matrix.setflags(write=False)
+    return keys, matrix
+
+
+def influence_matrix(inputs, lift=None):
+    """
+    Return the influence matrix of a geometry.
+
+    Parameters
+    ----------
+    inputs : dict
+        Dict of input values, only GEOMETRY_KEYS are used.
+    lift : int, optional
+        Id of the lifted support (1...4). If None, the elastostatic model is
+        used. The default is None.
+
+    Returns
+    -------
+    keys : list of str
+        Output keys (rows of the matrix).
+    matrix : array
+        Read-only influence matrix of shape (len(keys), 5), columns see
+        LOAD_KEYS.
+    """
+    return _influence_matrix(geometry_key(inputs), lift)
+
+
+def load_vectors(inputs):
+    """
+    Return the load vectors (fl, mlx, mly, fe, fe * xe) of one or several load states.
+
+    Parameters
+    ----------
+    inputs : dict
+        Dict with the keys fl, mlx, mly, fe, xe. Values can be numbers or
+        arrays.
+
+    Returns
+    -------
+    loads : array
+        Array of shape (5, n).
+    """
+    inputs = as_inputs(inputs)
+    fl, mlx, mly, fe, xe = np.broadcast_arrays(*[np.atleast_1d(np.asarray(inputs[k], dtype=float)) for k in ['fl', 'mlx', 'mly', 'fe', 'xe']])
+    return np.stack([fl, mlx, mly, fe, fe * xe])
+
+
+def results_influence(inputs, lift=None):
+    """
+    Evaluate the elastostatic or lift-off model using the cached influence matrix.
+
+    Parameters
+    ----------
+    inputs : dict
+        Dict of input values. Geometry values must be numbers, load values
+        (fl, mlx, mly, fe, xe) can be arrays.
+    lift : int, optional
+        Id of the lifted support (1...4). The default is None.
+
+    Returns
+    -------
+    results : dict
+        Dict of float arrays.
+    """
+    keys, matrix = influence_matrix(inputs, lift)
+    values = matrix @ load_vectors(inputs)
+    return dict(zip(keys, values))
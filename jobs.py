@@ -0,0 +1,225 @@
+# -*- coding: utf-8 -*-
+"""
+Background jobs for limit curve sweeps.
+
+A JobManager runs sweeps (sweep_cache.cached_limit_curve) on its own thread
+pool and returns a job id at once, so the caller (e.g. the Streamlit script
+thread) is not blocked. The state of a job is polled with status(). A job can
+be cancelled: the sweep stops after the angle which is being computed, pending
+angles on a process pool are not started any more. With time_budget each angle
+of a SLSQP sweep is stopped after the given wall time (see limited_reachout),
+so an infeasible set of bounds cannot hang a job for the full number of
+iterations per angle. The angles computed so far are collected in the job
+(partial_result), with coarse_to_fine=True the whole circle is covered early.
+
+The jobs are kept by the manager for keep seconds after they have finished.
+A page which stores the job id in its session state can reattach to a running
+job after a rerun.
+"""
+import os
+import threading
+import time
+import traceback
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from sweep_cache import cached_limit_curve
+from sweep_result import SweepResult
+
+# States of a job
+QUEUED = 'queued'
+RUNNING = 'running'
+DONE = 'done'
+CANCELLED = 'cancelled'
+FAILED = 'failed'
+FINISHED = (DONE, CANCELLED, FAILED)
+
+
+class JobCancelled(Exception):
+    """Raised inside a sweep to stop a cancelled job."""
+
+
+class Job:
+    """
+    State of a background sweep.
+
+    Attributes
+    ----------
+    id : str
+        Job id.
+    inputs : dict or MachineSpec
+        Inputs of the sweep.
+    settings : dict
+        Sweep settings (arguments of cached_limit_curve).
+    state : str
+        QUEUED, RUNNING, DONE, CANCELLED or FAILED.
+    done, total : int
+        Number of computed angles and number of angles known so far.
+    result : SweepResult
+        Limit curve of a finished job (DONE), otherwise None.
+    error : str
+        Traceback of a failed job (FAILED), otherwise None.
+    submitted, started, finished : float
+        Times (time.time()) of the state changes, None if not reached yet.
+    """
+
+    def __init__(self, inputs, settings):
+        self.id = uuid.uuid4().hex
+        self.inputs = inputs
+        self.settings = settings
+        self.state = QUEUED
+        self.done = 0
+        self.total = 0
+        self.result = None
+        self.error = None
+        self.submitted = time.time()
+        self.started = None
+        self.finished = None
+        self._cancel = threading.Event()
+        self._lock = threading.Lock()
+        self._partial = SweepResult()
+
+    @property
+    def cancel_requested(self):
+        return self._cancel.is_set()
+
+    def status(self):
+        """Return a dict with id, state, done, total and the elapsed time in seconds."""
+        end = self.finished or time.time()
+        return {'id': self.id, 'state': self.state, 'done': self.done, 'total': self.total,
+                'elapsed': end - self.started if self.started else 0.}
+
+    def partial_result(self):
+        """Return the angles computed so far as SweepResult sorted by phi (the result if the job is done)."""
+        if self.result is not None:
+            return self.result
+        with self._lock:
+            result = self._partial.copy()
+        result.sort()
+        return result
+
+    def _append(self, success, row):
+        with self._lock:
+            self._partial.append(success, row)
+
+
+class JobManager:
+    """
+    Run limit curve sweeps in the background.
+
+    Parameters
+    ----------
+    max_jobs : int, optional
+        Number of jobs running at the same time, further jobs are queued. The
+        default is None (os.cpu_count()).
+    keep : float, optional
+        Finished jobs are removed keep seconds after they have finished. The
+        default is 3600.
+    """
+
+    def __init__(self, max_jobs=None, keep=3600.):
+        self.keep = keep
+        self._jobs = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_jobs or os.cpu_count() or 1, thread_name_prefix='elastomech-job')
+
+    def submit(self, inputs, step, time_budget=None, cache=None, executor=None, max_workers=None, **settings):
+        """
+        Start a sweep in the background and return its job id.
+
+        Parameters
+        ----------
+        inputs : dict or MachineSpec
+            Dict of input values (see limited_reachout).
+        step : float
+            Step size of phi in degrees.
+        time_budget : float, optional
+            Maximum wall time per angle in seconds (SLSQP only). The default
+            is None (no limit).
+        cache : SweepCache, optional
+            Cache of completed sweeps. The default is None.
+        executor : None, str or Executor, optional
+            Pool for the angles of the sweep, see limit_curve. The default is
+            None (serial in the job thread).
+        max_workers : int, optional
+            See limit_curve. The default is None.
+        **settings
+            Further arguments of cached_limit_curve (method, continuation,
+            adaptive, min_step, tol_ro, coarse_to_fine).
+
+        Returns
+        -------
+        job_id : str
+        """
+        self._prune()
+        job = Job(inputs, dict(settings, step=step, time_budget=time_budget))
+        with self._lock:
+            self._jobs[job.id] = job
+        self._executor.submit(self._run, job, cache, executor, max_workers)
+        return job.id
+
+    def job(self, job_id):
+        """Return the Job of job_id or None if it is unknown (or removed)."""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def status(self, job_id):
+        """Return the status dict of a job (see Job.status) or None if it is unknown."""
+        job = self.job(job_id)
+        return None if job is None else job.status()
+
+    def cancel(self, job_id):
+        """
+        Request the cancellation of a job.
+
+        Returns
+        -------
+        cancelled : bool
+            False if the job is unknown or already finished.
+        """
+        job = self.job(job_id)
+        if job is None or job.state in FINISHED:
+            return False
+        job._cancel.set()
+        return True
+
+    def jobs(self):
+        """Return the status dicts of all jobs."""
+        with self._lock:
+            return [job.status() for job in self._jobs.values()]
+
+    def shutdown(self, cancel=True):
+        """Shut the manager down, by default after cancelling all jobs."""
+        if cancel:
+            for job in list(self._jobs.values()):
+                job._cancel.set()
+        self._executor.shutdown(wait=True)
+
+    def _prune(self):
+        now = time.time()
+        with self._lock:
+            for job_id in [k for k, job in self._jobs.items() if job.finished and now - job.finished > self.keep]:
+                del self._jobs[job_id]
+
+    def _run(self, job, cache, executor, max_workers):
+        if job.cancel_requested:
+            job.state, job.finished = CANCELLED, time.time()
+            return
+        job.state, job.started = RUNNING, time.time()
+
+        def progress(j, n, phi, success):
+            job.done, job.total = j, n
+            if job.cancel_requested:
+                # Bricht die Schleife ab, ausstehende Winkel im Pool werden verworfen
+                raise JobCancelled
+
+        try:
+            job.result = cached_limit_curve(job.inputs, cache=cache, executor=executor, max_workers=max_workers,
+                                            progress=progress, on_row=job._append, **job.settings)
+            job.done = job.total = len(job.result) + len(job.result.fails['phi'])
+            job.state = DONE
+        except JobCancelled:
+            job.state = CANCELLED
+        except Exception:
+            job.error = traceback.format_exc()
+            job.state = FAILED
+        job.finished = time.time()
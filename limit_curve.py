@@ -0,0 +1,554 @@
+# -*- coding: utf-8 -*-
+"""Working radius limit curve (Grenzkurve) over the boom angle, independent of the dashboards."""
+import os
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+import numpy as np
+from helpers import (xy_load, case_dependent_results, limited_reachout, load_moment, check_liftoffs, restlast, box_section_stress, active_bound,
+                     reachout_response, max_feasible)
+from influence import geometry_key
+from loadcases import lim_working_radius as lim
+from spec import as_inputs
+from sweep_result import SweepResult, FAIL_KEYS
+
+# Columns of the limit curve (d_ro)
+KEYS = ['phi', 'ro', 'ml', 'mlx', 'mly', 'lift id',
+        'Restlast key', 'Restlast val', 'f12', 'f23', 'f34', 'f14', 'nit', 'active']
+RESULT_KEYS = ['f1', 'f2', 'f3', 'f4', 'ffy', 'fry', 'phi1', 'phi2', 'phi3',
+               's1', 's2', 's3', 's4', 't14x', 't23x', 't14y', 't23y', 'sv14', 'sv23']
+# Columns of the error log (d_fails): sweep_result.FAIL_KEYS
+
+# Version of the solvers, part of the key of cached sweeps (sweep_cache): increase if the results change
+SOLVER_VERSION = 2
+
+# Quantities with lower and upper bound (keys '<name>_lb', '<name>_ub')
+BOUND_KEYS = ['ro', 'rl', 'f1', 'f2', 'f3', 'f4', 't14x', 't23x', 'sv14', 'sv23']
+
+# Loads which, together with the geometry, define the response over ro (see reachout_responses)
+RESPONSE_LOAD_KEYS = ['fl', 'fe', 'xe', 'f_ro']
+
+# Largest working radius of the stored responses
+RESPONSE_RO_MAX = 1e6
+
+# Largest number of angles per task of a process pool: started chunks cannot be
+# cancelled, small chunks keep a shared pool responsive (see jobs.py)
+MAX_CHUNKSIZE = 16
+
+
+def default_inputs(ini, **bounds):
+    """
+    Return complete inputs for limited_reachout from a load case dict.
+
+    Parameters
+    ----------
+    ini : dict or MachineSpec
+        Load case in the form of loadcases.ro_default()[0].
+    **bounds : float
+        Bounds to override, e.g. rl_lb=5000. Bounds which are not given are
+        taken from loadcases.lim_working_radius.
+
+    Returns
+    -------
+    inputs : dict
+        Dict of input values. As on the Working Radius page, the torsion
+        springs are shifted to the middle of the frame (x1 = x23, x3 = x14).
+    """
+    inputs = dict(as_inputs(ini))
+    inputs.setdefault('x1', inputs['x23'])
+    inputs.setdefault('x3', inputs['x14'])
+    for k in BOUND_KEYS:
+        inputs.setdefault(k + '_lb', lim[k + '_min'])
+        inputs.setdefault(k + '_ub', lim[k + '_max'])
+    inputs.update(bounds)
+    return inputs
+
+
+def reachout_at(inputs, phi, method='SLSQP', initial_guess=None, time_budget=None, disp=True):
+    """
+    Maximize the working radius for a single boom angle phi.
+
+    Parameters
+    ----------
+    inputs : dict or MachineSpec
+        Dict of input values (see limited_reachout). It is not modified.
+    phi : float
+        Boom angle in degrees.
+    method : str, optional
+        Solver method of limited_reachout. The default is 'SLSQP'.
+    initial_guess : float, optional
+        Start value of ro (SLSQP only). The default is None (ro_ub).
+    time_budget : float, optional
+        Maximum wall time of the optimization in seconds (SLSQP only). The
+        default is None (no limit).
+    disp : bool, optional
+        Print the convergence message of SLSQP. The default is True.
+
+    Returns
+    -------
+    success : bool
+        True if a working radius was found.
+    row : dict
+        Row of the limit curve (keys KEYS + RESULT_KEYS) if successful,
+        otherwise row of the error log (keys FAIL_KEYS).
+    """
+    i = dict(as_inputs(inputs))
+    i['phi_deg_boom'] = phi
+    i['phi_deg_load'] = phi + 90.
+    res = limited_reachout(i, method=method, initial_guess=initial_guess, time_budget=time_budget, disp=disp)
+    ro = float(res.x[0])  # Sanitize ro before using it further!
+
+    if not res.success:
+        return False, dict(zip(FAIL_KEYS, [phi, res.message, res.nit, res.status]))
+
+    ml = load_moment([(i['f_ro'], ro)])
+    mlx, mly = xy_load(ml, i['phi_deg_load'])
+    # Regime at ro is known from the exact solver
+    results, _, _ = case_dependent_results(i['fl'], mlx, mly, i['fe'], i['y1'], i['y2'], i['y3'], i['y4'],
+                                           i['xe'], i['x14'], i['x23'], i['d14'], i['d23'], i['d1'], i['d2'], i['d3'], i['d4'], x1=i['x1'], x3=i['x3'],
+                                           regime=getattr(res, 'lift', None))
+    return True, _limit_row(i, phi, ro, results, res.nit, getattr(res, 'active', None))
+
+
+def _limit_row(i, phi, ro, results, nit, active=None):
+    """Return the row of the limit curve at ro from the model results."""
+    ml = load_moment([(i['f_ro'], ro)])
+    mlx, mly = xy_load(ml, i['phi_deg_load'])
+
+    # Zusätzlich Spannungen im Rahmen berechnen
+    results['sv14'] = box_section_stress(B=i['B'], H=i['H'], tb=i['tb'], th=i['th'], m_t=results['t14x'], m_by=results['t14y'])
+    results['sv23'] = box_section_stress(B=i['B'], H=i['H'], tb=i['tb'], th=i['th'], m_t=results['t23x'], m_by=results['t23y'])
+
+    _, lift_ids, _ = check_liftoffs(results)
+    rl_min, rl = restlast(results)
+
+    # Governing bound (given by the exact solver, otherwise the smallest slack)
+    active = active or active_bound({**results, **rl}, i, ro)
+
+    vs = [phi, ro, ml, mlx, mly, lift_ids, rl_min[0],
+          rl_min[1], rl['f12'], rl['f23'], rl['f34'], rl['f14'], nit, active]
+    row = dict(zip(KEYS, vs))
+    for k in RESULT_KEYS:
+        row[k] = float(results[k])
+    return row
+
+
+def _reachout_task(args):
+    return reachout_at(*args)
+
+
+def _make_executor(executor, max_workers):
+    """Return (executor, owned) for executor = None, 'thread', 'process' or an Executor instance."""
+    if executor is None or isinstance(executor, Executor):
+        return executor, False
+    if executor == 'thread':
+        return ThreadPoolExecutor(max_workers=max_workers), True
+    if executor == 'process':
+        return ProcessPoolExecutor(max_workers=max_workers), True
+    raise ValueError(f'Unknown executor: {executor}')
+
+
+def _reachout_chunk(chunk):
+    return [reachout_at(*args) for args in chunk]
+
+
+def _bounded_map(pool, tasks, chunksize, max_workers):
+    """Like pool.map, but with at most max_workers chunks on the pool at the same time (in order)."""
+    pending = deque()
+    try:
+        for k in range(0, len(tasks), chunksize):
+            pending.append(pool.submit(_reachout_chunk, tasks[k:k + chunksize]))
+            if len(pending) >= max_workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+    finally:
+        # Abbruch (z.B. JobCancelled): noch nicht gestartete Chunks verwerfen
+        for future in pending:
+            future.cancel()
+
+
+def _map_tasks(tasks, pool, max_workers):
+    """
+    Return an iterator over the outcomes of reachout_at for all tasks, serially or on the pool.
+
+    If max_workers is less than the workers of the pool (e.g. a pool shared by
+    several sweeps), the sweep occupies at most max_workers of them.
+    """
+    if pool is None:
+        return map(_reachout_task, tasks)
+    pool_workers = getattr(pool, '_max_workers', None) or os.cpu_count() or 1
+    workers = min(max_workers or pool_workers, pool_workers)
+    chunksize = min(max(1, len(tasks) // (4 * workers)), MAX_CHUNKSIZE) if isinstance(pool, ProcessPoolExecutor) else 1
+    if workers < pool_workers:
+        return _bounded_map(pool, tasks, chunksize, workers)
+    return pool.map(_reachout_task, tasks, chunksize=chunksize)
+
+
+def coarse_to_fine_order(n, first=8):
+    """
+    Return the indices of an equidistant grid of n angles ordered coarse-to-fine.
+
+    The first level takes every stride-th angle (stride a power of 2, at least
+    first angles on the full circle), each following level halves the stride.
+    A sweep in this order covers the whole circle early and then refines it.
+
+    Parameters
+    ----------
+    n : int
+        Number of angles.
+    first : int, optional
+        Minimum number of angles of the first level. The default is 8.
+
+    Returns
+    -------
+    order : list of int
+        Permutation of range(n).
+    """
+    stride = 1
+    while n // (2 * stride) >= first:
+        stride *= 2
+    order = list(range(0, n, stride))
+    while stride > 1:
+        stride //= 2
+        order += range(stride, n, 2 * stride)
+    return order
+
+
+def _continuation(inputs, phis, method, progress, time_budget=None, disp=True):
+    """Sweep phi serially, warm-starting each angle from the previous solution. Failed angles are retried from their neighbours."""
+    outcomes = []
+    guess = None
+    for j, phi in enumerate(phis, start=1):
+        success, row = reachout_at(inputs, float(phi), method, initial_guess=guess, time_budget=time_budget, disp=disp)
+        if success:
+            guess = row['ro']
+        outcomes.append((success, row))
+        if progress is not None:
+            progress(j, len(phis), row['phi'], success)
+
+    # Retry failed angles, starting from the solutions of the neighbouring
+    # angles (on the full circle) and their mean
+    ros = [row['ro'] if success else None for success, row in outcomes]
+    n = len(outcomes)
+    for k, (success, row) in enumerate(outcomes):
+        if success:
+            continue
+        prev = next((ros[(k - m) % n] for m in range(1, n) if ros[(k - m) % n] is not None), None)
+        nxt = next((ros[(k + m) % n] for m in range(1, n) if ros[(k + m) % n] is not None), None)
+        if prev is None:
+            break  # No successful angle at all
+        guesses = [prev] if prev == nxt else [prev, nxt, (prev + nxt) / 2.]
+        for g in guesses:
+            retry = reachout_at(inputs, row['phi'], method, initial_guess=g, time_budget=time_budget, disp=disp)
+            if retry[0]:
+                outcomes[k] = retry
+                break
+    return outcomes
+
+
+def _collector(n, columnar):
+    """Return (append, result) collecting outcomes either into d_ro, d_fails or into a SweepResult."""
+    if columnar:
+        result = SweepResult(capacity=n)
+        return result.append, result
+
+    d_ro = {k: [] for k in KEYS + RESULT_KEYS}
+    d_fails = {k: [] for k in FAIL_KEYS}
+
+    def append(success, row):
+        target = d_ro if success else d_fails
+        for k in target:
+            target[k].append(row[k])
+    return append, (d_ro, d_fails)
+
+
+def limit_curve(inputs, step, method='SLSQP', executor=None, max_workers=None, progress=None, continuation=False, columnar=False,
+                time_budget=None, coarse_to_fine=False, on_row=None, disp=True):
+    """
+    Compute the working radius limit curve for phi in [0, 360) with the given step.
+
+    The angles can be fanned out over a process or thread pool. Results are
+    collected in the order of phi. Alternatively, with continuation=True,
+    the angles are computed serially and each angle is warm-started from the
+    solution of the previous one; failed angles are retried with start values
+    taken from their neighbours.
+
+    With coarse_to_fine=True the angles are computed in coarse-to-fine order
+    (see coarse_to_fine_order) and passed to on_row as soon as they are
+    available, e.g. to show the whole limit curve early and refine it while
+    the sweep is running. The result is the same.
+
+    Parameters
+    ----------
+    inputs : dict or MachineSpec
+        Dict of input values (see limited_reachout). It is not modified.
+    step : float
+        Step size of phi in degrees.
+    method : str, optional
+        Solver method of limited_reachout. The default is 'SLSQP'.
+    executor : None, str or Executor, optional
+        None (serial), 'process', 'thread' or an existing
+        concurrent.futures.Executor (not shut down). Ignored if continuation
+        is True. The default is None.
+    max_workers : int, optional
+        Number of workers of a newly created pool, with an existing pool the
+        maximum number of its workers used by the sweep. The default is None
+        (os.cpu_count() or all workers of the pool).
+    progress : callable, optional
+        Called as progress(j, n, phi, success) after each angle in the order
+        of computation. The default is None.
+    continuation : bool, optional
+        Warm-start each angle from its predecessor. The default is False.
+    columnar : bool, optional
+        Return a preallocated sweep_result.SweepResult instead of the dicts
+        of lists. The default is False.
+    time_budget : float, optional
+        Maximum wall time per angle in seconds (SLSQP only). Angles which
+        exceed it are logged as failed with status
+        helpers.STATUS_TIME_BUDGET. The default is None (no limit).
+    coarse_to_fine : bool, optional
+        Compute the angles coarse-to-fine. Ignored if continuation is True.
+        The default is False.
+    on_row : callable, optional
+        Called as on_row(success, row) with the outcome of reachout_at of
+        each angle in the order of computation (with continuation after the
+        retries). The default is None.
+    disp : bool, optional
+        Print the convergence messages of SLSQP to stdout (e.g. False if
+        stdout is piped). The default is True.
+
+    Returns
+    -------
+    d_ro : dict
+        Dict of lists with the limit curve (keys KEYS + RESULT_KEYS).
+    d_fails : dict
+        Dict of lists with the error log (keys FAIL_KEYS).
+    or, with columnar=True
+    result : SweepResult
+        Limit curve and error log.
+    """
+    inputs = as_inputs(inputs)
+    phis = np.arange(0., 360., step)
+    append, result = _collector(len(phis), columnar)
+
+    order = coarse_to_fine_order(len(phis)) if coarse_to_fine and not continuation else range(len(phis))
+    outcomes = [None] * len(phis)
+
+    def collect(computed):
+        for j, (k, (success, row)) in enumerate(zip(order, computed), start=1):
+            outcomes[k] = success, row
+            if on_row is not None:
+                on_row(success, row)
+            if progress is not None and not continuation:
+                progress(j, len(phis), row['phi'], success)
+
+    if continuation:
+        collect(_continuation(inputs, phis, method, progress, time_budget, disp))
+    else:
+        tasks = [(inputs, float(phis[k]), method, None, time_budget, disp) for k in order]
+        pool, owned = _make_executor(executor, max_workers)
+        try:
+            collect(_map_tasks(tasks, pool, max_workers))
+        finally:
+            if owned:
+                pool.shutdown()
+
+    for success, row in outcomes:
+        append(success, row)
+    return result
+
+
+def _needs_refinement(a, b, tol_ro):
+    """Check if the interval between the outcomes a and b has to be bisected."""
+    (ok_a, row_a), (ok_b, row_b) = a, b
+    if not ok_a and not ok_b:
+        return False
+    if ok_a != ok_b:
+        return True
+    return (abs(row_a['ro'] - row_b['ro']) > tol_ro
+            or row_a['active'] != row_b['active']
+            or row_a['lift id'] != row_b['lift id'])
+
+
+def limit_curve_adaptive(inputs, step=15., min_step=0.5, tol_ro=0.1, method='SLSQP', executor=None, max_workers=None, progress=None,
+                         columnar=False, time_budget=None, on_row=None, disp=True):
+    """
+    Compute the working radius limit curve on an adaptively refined phi grid.
+
+    Starting with a coarse grid of the given step, every interval is bisected
+    as long as ro changes by more than tol_ro or the active bound, the lift-off
+    ids or the success of the solver differ at its ends. The new angles of
+    each refinement level are computed together (optionally on a pool).
+
+    Parameters
+    ----------
+    inputs : dict or MachineSpec
+        Dict of input values (see limited_reachout). It is not modified.
+    step : float, optional
+        Step size of the initial grid in degrees. The default is 15.
+    min_step : float, optional
+        Intervals smaller than min_step are not bisected any further. The
+        default is 0.5.
+    tol_ro : float, optional
+        Tolerated change of ro within an interval. The default is 0.1.
+    method : str, optional
+        Solver method of limited_reachout. The default is 'SLSQP'.
+    executor : None, str or Executor, optional
+        See limit_curve. The default is None.
+    max_workers : int, optional
+        See limit_curve. The default is None.
+    progress : callable, optional
+        Called as progress(j, n, phi, success) after each angle, n is the
+        number of angles known so far. The default is None.
+    columnar : bool, optional
+        See limit_curve. The default is False.
+    time_budget : float, optional
+        See limit_curve. The default is None.
+    on_row : callable, optional
+        Called as on_row(success, row) with the outcome of each angle as soon
+        as it is available (coarse grid first, then the refinements). The
+        default is None.
+    disp : bool, optional
+        See limit_curve. The default is True.
+
+    Returns
+    -------
+    d_ro : dict
+        Dict of lists with the limit curve (keys KEYS + RESULT_KEYS), sorted
+        by phi.
+    d_fails : dict
+        Dict of lists with the error log (keys FAIL_KEYS), sorted by phi.
+    or, with columnar=True
+    result : SweepResult
+        Limit curve and error log, sorted by phi.
+    """
+    inputs = as_inputs(inputs)
+    outcomes = {}
+    new = [float(phi) for phi in np.arange(0., 360., step)]
+    pool, owned = _make_executor(executor, max_workers)
+    try:
+        while new:
+            n = len(outcomes) + len(new)
+            tasks = [(inputs, phi, method, None, time_budget, disp) for phi in new]
+            for phi, outcome in zip(new, _map_tasks(tasks, pool, max_workers)):
+                outcomes[phi] = outcome
+                if on_row is not None:
+                    on_row(*outcome)
+                if progress is not None:
+                    progress(len(outcomes), n, phi, outcome[0])
+
+            # Bisect the intervals of the closed circle (360° = 0°)
+            phis = sorted(outcomes)
+            new = []
+            for a, b in zip(phis, phis[1:] + [phis[0] + 360.]):
+                if b - a > min_step and _needs_refinement(outcomes[a], outcomes[b % 360.], tol_ro):
+                    new.append((a + b) / 2.)
+    finally:
+        if owned:
+            pool.shutdown()
+
+    append, result = _collector(len(outcomes), columnar)
+    for phi in sorted(outcomes):
+        append(*outcomes[phi])
+    return result
+
+
+def response_key(inputs):
+    """Return a hashable key of the inputs which define the response over ro (everything except the bounds and the box section)."""
+    i = as_inputs(inputs)
+    return geometry_key(i) + tuple(float(i[k]) for k in RESPONSE_LOAD_KEYS)
+
+
+def reachout_responses(inputs, phis):
+    """
+    Return the unconstrained response over ro of each boom angle.
+
+    Parameters
+    ----------
+    inputs : dict or MachineSpec
+        Dict of input values. Bounds are not used.
+    phis : iterable of float
+        Boom angles in degrees.
+
+    Returns
+    -------
+    responses : dict
+        Dict of phi -> regime segments of reachout_response for
+        0 <= ro <= RESPONSE_RO_MAX.
+    """
+    i = dict(as_inputs(inputs), ro_lb=0., ro_ub=RESPONSE_RO_MAX)
+    return {float(phi): reachout_response(i, phi + 90., scale=i['f_ro']) for phi in phis}
+
+
+def _clip_segments(segments, lo, hi):
+    """Regime segments restricted to lo <= t <= hi."""
+    out = []
+    for seg in segments:
+        t_lo, t_hi = max(seg['lo'], lo), min(seg['hi'], hi)
+        if t_lo < t_hi or (lo == hi and seg['lo'] <= lo <= seg['hi']):
+            out.append(dict(seg, lo=t_lo, hi=t_hi))
+            if lo == hi:
+                break
+    return out
+
+
+def reachout_from_response(inputs, phi, segments):
+    """
+    Maximize the working radius for a single boom angle from its stored response.
+
+    Same result as reachout_at with method='exact', but without any model
+    evaluation: the segments are clipped to [ro_lb, ro_ub] and intersected
+    with the bounds.
+
+    Parameters
+    ----------
+    inputs : dict or MachineSpec
+        Dict of input values with the (new) bounds.
+    phi : float
+        Boom angle in degrees.
+    segments : list of dicts
+        Response of the angle, see reachout_responses.
+
+    Returns
+    -------
+    success : bool
+        True if a working radius was found.
+    row : dict
+        See reachout_at.
+    """
+    i = dict(as_inputs(inputs))
+    i['phi_deg_boom'] = phi
+    i['phi_deg_load'] = phi + 90.
+    segments = _clip_segments(segments, i['ro_lb'], i['ro_ub'])
+    ro, active, lift = max_feasible(segments, i)
+    if np.isnan(ro):
+        return False, dict(zip(FAIL_KEYS, [phi, 'No admissible working radius within the bounds', 0, 2]))
+
+    seg = next(seg for seg in reversed(segments) if seg['lift'] == lift and seg['lo'] <= ro <= seg['hi'])
+    results = {k: seg['a'][k] + seg['b'][k] * ro for k in seg['a']}
+    return True, _limit_row(i, phi, float(ro), results, 0, active)
+
+
+def limit_curve_from_responses(inputs, responses, columnar=False):
+    """
+    Compute the limit curve for changed bounds from stored responses (only intersection of the bounds, no model evaluations).
+
+    Parameters
+    ----------
+    inputs : dict or MachineSpec
+        Dict of input values with the (new) bounds. The response key
+        (response_key) must be the same as for the responses.
+    responses : dict
+        Responses of the angles, see reachout_responses.
+    columnar : bool, optional
+        See limit_curve. The default is False.
+
+    Returns
+    -------
+    d_ro, d_fails or result
+        See limit_curve (method 'exact'), sorted by phi.
+    """
+    append, result = _collector(len(responses), columnar)
+    for phi in sorted(responses):
+        append(*reachout_from_response(inputs, phi, responses[phi]))
+    return result
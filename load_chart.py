@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+"""
+Load chart: allowable tip load f_ro over a grid of working radius ro and boom angle phi.
+
+As in limited_reachout, the tip load acts as load moment ml = f_ro * ro in the
+direction phi_deg_load = phi + 90, all other loads (fl, fe) are fixed. Within
+a lift-off regime every result is affine in f_ro, so for all grid cells at
+once the regime breakpoints (first support lifting off, second support lifting
+off = tipping) and the first violated bound of limited_reachout are found in
+closed form. The allowable tip load of a cell is the largest f_ro such that
+every tip load in [0, f_ro] is admissible.
+"""
+import numpy as np
+import pandas as pd
+from helpers import REACHOUT_CONSTRAINTS, second_moment_of_area_box_section, torsional_resistance_moment_box_section
+from influence import influence_matrix
+from spec import as_inputs
+
+FORCE_KEYS = ['f1', 'f2', 'f3', 'f4']
+
+# Stresses of the frame: (key, torsional moment, bending moment)
+STRESS_KEYS = [('sv14', 't14x', 't14y'), ('sv23', 't23x', 't23y')]
+
+
+def _affine(inputs, lift, u, v):
+    """Results a + b * f_ro of one model for all cells, a: dict of numbers, b: dict of arrays."""
+    i = inputs
+    keys, matrix = influence_matrix(i, lift)
+    a = dict(zip(keys, matrix @ np.array([i['fl'], 0., 0., i['fe'], i['fe'] * i['xe']])))
+    b = {k: row[1] * u + row[2] * v for k, row in zip(keys, matrix)}
+    if lift is not None:  # Kraft der abgehobenen Stütze exakt null
+        key = FORCE_KEYS[lift - 1]
+        a[key], b[key] = 0., np.zeros_like(u)
+    for d in (a, b):
+        d['f12'] = d['f1'] + d['f2']
+        d['f23'] = d['f2'] + d['f3']
+        d['f34'] = d['f3'] + d['f4']
+        d['f14'] = d['f1'] + d['f4']
+    return a, b
+
+
+def _first_zero(a, b, keys, lo):
+    """Smallest f >= lo where one of the (positive) support forces a + b * f reaches zero, and its index."""
+    crossings = np.stack([np.where(b[k] < 0, -a[k] / np.where(b[k] < 0, b[k], -1.), np.inf) for k in keys])
+    crossings = np.maximum(crossings, lo)
+    n = np.argmin(crossings, axis=0)
+    return np.take_along_axis(crossings, n[None], axis=0)[0], n
+
+
+def _first_violation(a, b, lo, inputs, kb, kt):
+    """
+    Smallest f >= lo where a bound of limited_reachout is violated.
+
+    Returns the exit values (stacked per bound), the labels of the bounds and
+    a flag per cell if a bound is already violated at lo.
+    """
+    i = inputs
+    exits, labels, violated = [], [], np.zeros(np.shape(lo), dtype=bool)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for key, bound in REACHOUT_CONSTRAINTS:
+            if key.startswith('sv'):
+                continue
+            lb, ub = i[bound + '_lb'], i[bound + '_ub']
+            val = a[key] + b[key] * lo
+            violated |= (val < lb) | (val > ub)
+            exits += [np.where(b[key] > 0, (ub - a[key]) / b[key], np.inf),
+                      np.where(b[key] < 0, (lb - a[key]) / b[key], np.inf)]
+            labels += [key + '_ub', key + '_lb']
+
+        # Equivalent stresses: sv**2 = q2 * f**2 + q1 * f + q0 (convex)
+        for key, mt, mb in STRESS_KEYS:
+            lb, ub = i[key + '_lb'], i[key + '_ub']
+            q2 = kb * b[mb]**2 + kt * b[mt]**2
+            q1 = 2. * (kb * a[mb] * b[mb] + kt * a[mt] * b[mt])
+            q0 = kb * a[mb]**2 + kt * a[mt]**2
+            q = q2 * lo**2 + q1 * lo + q0
+            violated |= (q > ub**2) | (q < max(lb, 0.)**2)
+            disc = q1**2 - 4. * q2 * (q0 - ub**2)
+            exits.append(np.where(q2 > 0, (-q1 + np.sqrt(np.maximum(disc, 0.))) / (2. * q2), np.inf))
+            labels.append(key + '_ub')
+            if lb > 0:
+                disc = q1**2 - 4. * q2 * (q0 - lb**2)
+                r = (-q1 - np.sqrt(np.maximum(disc, 0.))) / (2. * q2)
+                exits.append(np.where((q2 > 0) & (disc > 0) & (r >= lo), r, np.inf))
+                labels.append(key + '_lb')
+
+    exits = np.maximum(np.stack([np.broadcast_to(e, np.shape(lo)) for e in exits]), lo)
+    return exits, labels, violated
+
+
+def _limit(exits, labels, hi, hi_label):
+    """Allowable f of a segment: first bound or the end of the segment (hi)."""
+    n = np.argmin(exits, axis=0)
+    f = np.take_along_axis(exits, n[None], axis=0)[0]
+    label = np.array(labels, dtype=object)[n]
+    end = hi <= f  # A support force reaching f_lb = 0 at the lift-off does not end the curve
+    label = np.where(end, hi_label, np.where(np.isinf(f), '', label))
+    return np.where(end, hi, f), label, ~end
+
+
+def load_chart(inputs, ro, phi):
+    """
+    Return the allowable tip load for each combination of working radius and boom angle.
+
+    Parameters
+    ----------
+    inputs : dict or MachineSpec
+        Dict of input values as for limited_reachout (geometry, stiffness,
+        fl, fe, xe, frame box section and all bounds). f_ro is not used.
+    ro : array
+        Working radii.
+    phi : array
+        Boom angles in degrees.
+
+    Returns
+    -------
+    chart : dict
+        'ro', 'phi' (the grid axes), 'f_ro' (array of shape (len(phi),
+        len(ro)) with the allowable tip load, nan outside of [ro_lb, ro_ub]
+        or if the bounds are violated without tip load) and 'active' (array
+        of the same shape with the governing bound, e.g. 'f1_lb', or
+        'tipover' if a second support lifts off).
+    """
+    i = as_inputs(inputs)
+    ro = np.asarray(ro, dtype=float)
+    phi = np.asarray(phi, dtype=float)
+    grid_ro, grid_phi = np.meshgrid(ro, phi)
+    rad = np.radians(grid_phi.ravel() + 90.)
+    u, v = grid_ro.ravel() * np.cos(rad), grid_ro.ravel() * np.sin(rad)
+    n = u.size
+
+    iy, _ = second_moment_of_area_box_section(i['B'], i['H'], i['tb'], i['th'])
+    wt_h, _ = torsional_resistance_moment_box_section(i['B'], i['H'], i['tb'], i['th'])
+    kb = (i['H'] / 2. / iy)**2
+    kt = 3. / wt_h**2
+
+    models = {lift: _affine(i, lift, u, v) for lift in (None, 1, 2, 3, 4)}
+    zero = np.zeros(n)
+    f_ro = np.full(n, np.nan)
+    active = np.full(n, '', dtype=object)
+
+    # Regime without tip load (the same for all cells, as in case_dependent_results)
+    a0, _ = models[None]
+    lift_ids = [m + 1 for m, k in enumerate(FORCE_KEYS) if a0[k] <= 0]
+    if len(lift_ids) == 1 and all(models[lift_ids[0]][0][k] > 0 for m, k in enumerate(FORCE_KEYS) if m + 1 != lift_ids[0]):
+        start = lift_ids[0]
+    elif lift_ids:
+        return {'ro': ro, 'phi': phi, 'f_ro': f_ro.reshape(grid_ro.shape), 'active': active.reshape(grid_ro.shape)}
+    else:
+        start = None
+
+    if start is None:
+        # Elastostatic model up to the first lift-off
+        a, b = models[None]
+        f_lift, m_lift = _first_zero(a, b, FORCE_KEYS, zero)
+        exits, labels, violated = _first_violation(a, b, zero, i, kb, kt)
+        f, label, done = _limit(exits, labels, f_lift, 'liftoff')
+        f_ro[done], active[done] = f[done], label[done]
+        lift_of_cell = np.where(done, 0, m_lift + 1)
+        lo = f_lift
+    else:
+        violated = np.zeros(n, dtype=bool)
+        lift_of_cell = np.full(n, start)
+        lo = zero
+
+    # Lift-off models up to tipping (second support lifts off)
+    for lift in (1, 2, 3, 4):
+        cells = lift_of_cell == lift
+        if not cells.any():
+            continue
+        a, b = models[lift]
+        b = {k: x[cells] for k, x in b.items()}
+        others = [k for m, k in enumerate(FORCE_KEYS) if m + 1 != lift]
+        f_tip, _ = _first_zero(a, b, others, lo[cells])
+        exits, labels, at_start = _first_violation(a, b, lo[cells], i, kb, kt)
+        f, label, _ = _limit(exits, labels, f_tip, 'tipover')
+        f_ro[cells], active[cells] = f, label
+        if start is not None:
+            violated[cells] = at_start
+
+    outside = violated | (grid_ro.ravel() < i['ro_lb']) | (grid_ro.ravel() > i['ro_ub'])
+    f_ro[outside] = np.nan
+    active[outside] = ''
+    return {'ro': ro, 'phi': phi, 'f_ro': f_ro.reshape(grid_ro.shape), 'active': active.reshape(grid_ro.shape)}
+
+
+def chart_table(chart, long=False):
+    """
+    Return the load chart as DataFrame.
+
+    Parameters
+    ----------
+    chart : dict
+        Result of load_chart.
+    long : bool, optional
+        If True, one row per cell with the columns phi, ro, f_ro, active,
+        otherwise a table of f_ro with phi as index and ro as columns. The
+        default is False.
+
+    Returns
+    -------
+    df : DataFrame
+    """
+    if not long:
+        return pd.DataFrame(chart['f_ro'], index=pd.Index(chart['phi'], name='phi'), columns=pd.Index(chart['ro'], name='ro'))
+    grid_ro, grid_phi = np.meshgrid(chart['ro'], chart['phi'])
+    return pd.DataFrame({'phi': grid_phi.ravel(), 'ro': grid_ro.ravel(), 'f_ro': chart['f_ro'].ravel(), 'active': chart['active'].ravel()})
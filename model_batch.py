@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""Vectorized evaluation of the mechanical models for batches of load cases."""
+import numpy as np
+from model_plain import results_plain, results_liftoff_plain
+from spec import as_inputs
+
+# Positional order of the model inputs (see model_plain.results_plain)
+INPUT_KEYS = ['fl', 'mlx', 'mly', 'fe', 'y1', 'y2', 'y3', 'y4', 'xe', 'x14', 'x23', 'd14', 'd23', 'd1', 'd2', 'd3', 'd4']
+
+# Columns returned by results_batch (t14y, t23y only if x1 and x3 are given)
+OUTPUT_KEYS = ['f1', 'f2', 'f3', 'f4', 't14x', 't23x', 't14y', 't23y', 's1', 's2', 's3', 's4', 'phi1', 'phi2', 'phi3', 'fry', 'ffy']
+
+
+def _column_names(inputs):
+    """Return the column names of a dict, DataFrame or structured array."""
+    names = getattr(getattr(inputs, 'dtype', None), 'names', None)
+    if names is not None:
+        return names
+    if hasattr(inputs, 'columns'):
+        return list(inputs.columns)
+    return list(inputs.keys())
+
+
+def batch_inputs(inputs):
+    """
+    Return the model inputs as broadcast float arrays.
+
+    Parameters
+    ----------
+    inputs : dict, DataFrame, structured array or MachineSpec
+        Input columns named like INPUT_KEYS, optionally 'x1' and 'x3'.
+        Scalars are broadcast against the array columns.
+
+    Returns
+    -------
+    columns : dict
+        Dict of 1-d float arrays of equal length.
+    """
+    inputs = as_inputs(inputs)
+    names = _column_names(inputs)
+    keys = INPUT_KEYS + [k for k in ['x1', 'x3'] if k in names]
+    missing = [k for k in INPUT_KEYS if k not in names]
+    if missing:
+        raise KeyError(f'Missing input columns: {missing}')
+
+    arrays = np.broadcast_arrays(*[np.atleast_1d(np.asarray(inputs[k], dtype=float)) for k in keys])
+    return dict(zip(keys, arrays))
+
+
+def results_batch(inputs, lift=None, outputs=None):
+    """
+    Evaluate the elastostatic or lift-off model for a whole batch of load cases in one pass.
+
+    Parameters
+    ----------
+    inputs : dict, DataFrame or structured array
+        Input columns, see batch_inputs.
+    lift : int, optional
+        Id of the lifted support (1...4). If None, the statically
+        overdetermined elastostatic model is used. The default is None.
+    outputs : set of str, optional
+        Output keys to compute, the other expressions are skipped. The
+        default is None (all outputs).
+
+    Returns
+    -------
+    results : dict
+        Dict of float arrays, one entry per output key (see OUTPUT_KEYS).
+    """
+    cols = batch_inputs(inputs)
+    args = [cols[k] for k in INPUT_KEYS]
+    x1 = cols.get('x1')
+    x3 = cols.get('x3')
+
+    if lift is None:
+        results = results_plain(*args, x1=x1, x3=x3, outputs=outputs)
+    else:
+        results = results_liftoff_plain(*args, lift=lift, x1=x1, x3=x3, outputs=outputs)
+
+    # Constant outputs (e.g. f1 = 0 for lift=1) are expanded to full columns
+    shape = cols['fl'].shape
+    return {k: v if np.shape(v) == shape else np.full(shape, v, dtype=float) for k, v in results.items()}
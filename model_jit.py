@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+"""
+Optional compiled (numba) kernels for large parametric studies.
+
+results_fused evaluates the elastostatic model, the lift-off selection, the
+lift-off models and the equivalent stresses of the frame in one loop over the
+load cases. If numba is not installed, the same results are computed with the
+NumPy batch functions (helpers.case_dependent_results_batch).
+"""
+import numpy as np
+from model_plain import VALUE_KEYS, _results_plain_values, _results_liftoff_plain_values
+from model_batch import batch_inputs
+from spec import as_inputs
+from helpers import (case_dependent_results_batch, box_section_stress, combined_stress, second_moment_of_area_box_section,
+                     torsional_resistance_moment_box_section, REGIME_ELASTIC, REGIME_SEVERAL)
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+JIT_AVAILABLE = njit is not None
+
+# Inputs of the fused loop in addition to model_batch.INPUT_KEYS, x1 and x3
+SECTION_KEYS = ['B', 'H', 'tb', 'th']
+
+# Columns returned by results_fused
+FUSED_KEYS = VALUE_KEYS + ['sv14', 'sv23']
+
+
+if JIT_AVAILABLE:
+    _elasto = njit(cache=True)(_results_plain_values)
+    _liftoff = njit(cache=True)(_results_liftoff_plain_values)
+    _second_moment = njit(cache=True)(second_moment_of_area_box_section)
+    _torsional_resistance = njit(cache=True)(torsional_resistance_moment_box_section)
+    _combined_stress = njit(cache=True)(combined_stress)
+
+    @njit(cache=True)
+    def _box_section_stress(B, H, tb, th, m_t, m_by):
+        # Wie helpers.box_section_stress
+        iy, _ = _second_moment(B, H, tb, th)
+        wt_h, _ = _torsional_resistance(B, H, tb, th)
+        eq_stress_h, _, _ = _combined_stress(wt_h, iy, H / 2, m_t, m_by)
+        return eq_stress_h
+
+    @njit(parallel=True, cache=True)
+    def _fused(x, out, regime):
+        n = x.shape[1]
+        for j in prange(n):
+            fl, mlx, mly, fe = x[0, j], x[1, j], x[2, j], x[3, j]
+            y1, y2, y3, y4, xe = x[4, j], x[5, j], x[6, j], x[7, j], x[8, j]
+            x14, x23, d14, d23 = x[9, j], x[10, j], x[11, j], x[12, j]
+            d1, d2, d3, d4, x1, x3 = x[13, j], x[14, j], x[15, j], x[16, j], x[17, j], x[18, j]
+
+            v = _elasto(fl, mlx, mly, fe, y1, y2, y3, y4, xe, x14, x23, d14, d23, d1, d2, d3, d4, x1, x3)
+            count = 0
+            lift = 0
+            for i in range(4):
+                if v[i] <= 0:
+                    count += 1
+                    lift = i + 1
+            code = REGIME_ELASTIC
+            if count == 1:
+                v = _liftoff(fl, mlx, mly, fe, y1, y2, y3, y4, xe, x14, x23, d14, d23, d1, d2, d3, d4, lift, x1, x3)
+                code = lift
+                for i in range(4):
+                    if i + 1 != lift and v[i] <= 0:
+                        code = REGIME_SEVERAL
+            elif count > 1:
+                code = REGIME_SEVERAL
+
+            for k in range(len(v)):
+                out[k, j] = v[k]
+            out[17, j] = _box_section_stress(x[19, j], x[20, j], x[21, j], x[22, j], v[4], v[6])
+            out[18, j] = _box_section_stress(x[19, j], x[20, j], x[21, j], x[22, j], v[5], v[7])
+            regime[j] = code
+
+
+def _section_columns(inputs, n):
+    return [np.broadcast_to(np.asarray(inputs[k], dtype=float), (n,)) for k in SECTION_KEYS]
+
+
+def results_fused(inputs, backend=None):
+    """
+    Support forces, lift-off regime and equivalent stresses of the frame for a batch of load cases.
+
+    Same selection of the lift-off models as case_dependent_results_batch
+    (mode='regime'), plus the equivalent stresses sv14, sv23 of the box
+    section (helpers.box_section_stress).
+
+    Parameters
+    ----------
+    inputs : dict, DataFrame, structured array or MachineSpec
+        Input columns, see model_batch.batch_inputs, including x1, x3 and
+        the box section B, H, tb, th.
+    backend : str, optional
+        'jit' (compiled loop, requires numba) or 'numpy'. The default is None
+        ('jit' if numba is installed, otherwise 'numpy').
+
+    Returns
+    -------
+    results : dict
+        Dict of float arrays (FUSED_KEYS).
+    regime : array of int8
+        REGIME_ELASTIC, id of the lifted support (1...4) or REGIME_SEVERAL.
+    error : array of bool
+        True where more than one support lifts off (calculation invalid).
+    """
+    if backend is None:
+        backend = 'jit' if JIT_AVAILABLE else 'numpy'
+    inputs = as_inputs(inputs)
+    cols = batch_inputs(inputs)
+    if 'x1' not in cols or 'x3' not in cols:
+        raise KeyError("Missing input columns: ['x1', 'x3']")
+    n = cols['fl'].size
+    B, H, tb, th = _section_columns(inputs, n)
+
+    if backend == 'numpy':
+        results, regime, error = case_dependent_results_batch(cols)
+        results['sv14'] = box_section_stress(B=B, H=H, tb=tb, th=th, m_t=results['t14x'], m_by=results['t14y'])
+        results['sv23'] = box_section_stress(B=B, H=H, tb=tb, th=th, m_t=results['t23x'], m_by=results['t23y'])
+        return {k: results[k] for k in FUSED_KEYS}, regime, error
+    if backend != 'jit':
+        raise ValueError(f'Unknown backend: {backend}')
+    if not JIT_AVAILABLE:
+        raise ImportError('numba is required for the jit backend')
+
+    x = np.stack(list(cols.values()) + [B, H, tb, th])
+    out = np.empty((len(FUSED_KEYS), n))
+    regime = np.empty(n, dtype=np.int8)
+    _fused(x, out, regime)
+    return dict(zip(FUSED_KEYS, out)), regime, regime == REGIME_SEVERAL
@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+"""
+Solutions of the basic mechanical models by solving the linear equation system.
+
+Alternative to the closed-form solutions in model_plain. The 17 equations of
+resources/solve_equations/stuetzkraft_solve_eqs.py are assembled as a stack of
+17x17 matrices (one per load case) and solved with numpy.linalg.solve.
+"""
+import numpy as np
+from model_batch import INPUT_KEYS, batch_inputs
+
+# Order of the unknowns (columns of the system matrix)
+UNKNOWNS = ['f1', 'f2', 'f3', 'f4', 't14x', 't23x', 't14y', 't23y', 's1', 's2', 's3', 's4', 'phi1', 'phi2', 'phi3', 'fry', 'ffy']
+
+# Row of the spring equation of each support. For a lifted support this row
+# is replaced by f_i = 0.
+SPRING_ROWS = {1: 9, 2: 11, 3: 12, 4: 10}
+
+# Order of the result dict (same as model_plain)
+RESULT_KEYS = ['f1', 'f2', 'f3', 'f4', 't14x', 't23x', 's1', 's2', 's3', 's4', 'phi1', 'phi2', 'phi3', 'fry', 'ffy']
+
+
+def assemble_system(cols, lift=None):
+    """
+    Assemble the equation system A @ u = b for a batch of load cases.
+
+    Parameters
+    ----------
+    cols : dict
+        Dict of 1-d float arrays (see model_batch.batch_inputs).
+    lift : int, optional
+        Id of the lifted support (1...4). The default is None.
+
+    Returns
+    -------
+    a : array
+        System matrices, shape (n, 17, 17).
+    b : array
+        Right hand sides, shape (n, 17).
+    """
+    n = cols['fl'].size
+    zeros = np.zeros(n)
+    x1 = cols.get('x1', zeros)
+    x3 = cols.get('x3', zeros)
+    u = {k: i for i, k in enumerate(UNKNOWNS)}
+    a = np.zeros((n, 17, 17))
+    b = np.zeros((n, 17))
+
+    def row(i, coeffs, rhs=None):
+        for k, v in coeffs.items():
+            a[:, i, u[k]] = v
+        if rhs is not None:
+            b[:, i] = rhs
+
+    # Rigid Body I
+    row(0, {'f2': 1., 'f3': 1., 'fry': 1.})
+    row(1, {'f2': cols['y2'], 'f3': -cols['y3'], 't23x': 1.})
+    row(2, {'f2': x1, 'f3': x1, 't23y': 1.})
+    # Rigid Body II
+    row(3, {'fry': -1., 'ffy': 1.}, cols['fl'] + cols['fe'])
+    row(4, {'t14x': 1., 't23x': -1.}, -cols['mlx'])
+    row(5, {'t14y': 1., 't23y': -1., 'fry': x1 - cols['x23'], 'ffy': x3 - cols['x14']}, -cols['mly'] - cols['fe'] * cols['xe'])
+    # Rigid Body III
+    row(6, {'f1': 1., 'f4': 1., 'ffy': -1.})
+    row(7, {'f1': cols['y1'], 'f4': -cols['y4'], 't14x': -1.})
+    row(8, {'f1': -x3, 'f4': -x3, 't14y': -1.})
+    # Compression Springs
+    row(9, {'s1': cols['d1'], 'f1': -1.})
+    row(10, {'s4': cols['d4'], 'f4': -1.})
+    row(11, {'s2': cols['d2'], 'f2': -1.})
+    row(12, {'s3': cols['d3'], 'f3': -1.})
+    # Torsion Springs
+    row(13, {'phi1': cols['d23'], 'phi2': -cols['d23'], 't23x': -1.})
+    row(14, {'phi2': cols['d14'], 'phi3': -cols['d14'], 't14x': -1.})
+    # Kinematic constraints (multiplied by the support distance)
+    row(15, {'s2': 1., 's3': -1., 'phi1': -(cols['y2'] + cols['y3'])})
+    row(16, {'s1': 1., 's4': -1., 'phi3': -(cols['y1'] + cols['y4'])})
+
+    if lift is not None:
+        i = SPRING_ROWS[lift]
+        a[:, i, :] = 0.
+        a[:, i, u['f%d' % lift]] = 1.
+
+    return a, b
+
+
+def solve_system(a, b):
+    """Solve a stack of equation systems. Rows are scaled to unit max norm first."""
+    scale = np.abs(a).max(axis=2)
+    return np.linalg.solve(a / scale[:, :, None], (b / scale)[:, :, None])[:, :, 0]
+
+
+def results_linear_batch(inputs, lift=None, outputs=None):
+    """
+    Solve the elastostatic or lift-off model for a whole batch of load cases.
+
+    Same interface as model_batch.results_batch.
+
+    Parameters
+    ----------
+    inputs : dict, DataFrame or structured array
+        Input columns, see model_batch.batch_inputs.
+    lift : int, optional
+        Id of the lifted support (1...4). The default is None.
+    outputs : set of str, optional
+        Output keys to return. The whole system is solved anyway. The
+        default is None (all outputs).
+
+    Returns
+    -------
+    results : dict
+        Dict of float arrays.
+    """
+    cols = batch_inputs(inputs)
+    a, b = assemble_system(cols, lift)
+    sol = solve_system(a, b)
+    keys = RESULT_KEYS + (['t14y', 't23y'] if 'x1' in cols and 'x3' in cols else [])
+    if outputs is not None:
+        keys = [k for k in keys if k in outputs]
+    return {k: sol[:, UNKNOWNS.index(k)] for k in keys}
+
+
+def _results_scalar(args, lift, x1, x3, outputs):
+    inputs = dict(zip(INPUT_KEYS, args))
+    if x1 is not None and x3 is not None:
+        inputs['x1'] = x1
+        inputs['x3'] = x3
+    results = results_linear_batch(inputs, lift, outputs)
+    if all(np.ndim(v) == 0 for v in inputs.values()):
+        return {k: float(v[0]) for k, v in results.items()}
+    return results
+
+
+def results_linear(fl, mlx, mly, fe, y1, y2, y3, y4, xe, x14, x23, d14, d23, d1, d2, d3, d4, x1=None, x3=None, outputs=None):
+    """Solutions of the Elastostatic model (Statically overdetermined). Drop-in replacement for model_plain.results_plain."""
+    return _results_scalar((fl, mlx, mly, fe, y1, y2, y3, y4, xe, x14, x23, d14, d23, d1, d2, d3, d4), None, x1, x3, outputs)
+
+
+def results_liftoff_linear(fl, mlx, mly, fe, y1, y2, y3, y4, xe, x14, x23, d14, d23, d1, d2, d3, d4, lift, x1=None, x3=None, outputs=None):
+    """Solutions of the Static model (Statically determined). Drop-in replacement for model_plain.results_liftoff_plain."""
+    return _results_scalar((fl, mlx, mly, fe, y1, y2, y3, y4, xe, x14, x23, d14, d23, d1, d2, d3, d4), lift, x1, x3, outputs)
@@ -1,141 +1,3891 @@
 # -*- coding: utf-8 -*-
-"""Solutions of the basic mechanical models in plain python.."""
-
-
-def results_plain(fl, mlx, mly, fe, y1, y2, y3, y4, xe, x14, x23, d14, d23, d1, d2, d3, d4, x1=None, x3=None):
-    """Solutions of the Elastostatic model (Statically overdetermined)."""
-    f1 = (d1 * d14 * d2 * d23 * d3 * fe * x23 * y2**2 + 2 * d1 * d14 * d2 * d23 * d3 * fe * x23 * y2 * y3 + d1 * d14 * d2 * d23 * d3 * fe * x23 * y3**2 + d1 * d14 * d2 * d23 * d3 * fe * xe * y2**2 + 2 * d1 * d14 * d2 * d23 * d3 * fe * xe * y2 * y3 + d1 * d14 * d2 * d23 * d3 * fe * xe * y3**2 + d1 * d14 * d2 * d23 * d3 * fl * x23 * y2**2 + 2 * d1 * d14 * d2 * d23 * d3 * fl * x23 * y2 * y3 + d1 * d14 * d2 * d23 * d3 * fl * x23 * y3**2 + d1 * d14 * d2 * d23 * d3 * mly * y2**2 + 2 * d1 * d14 * d2 * d23 * d3 * mly * y2 * y3 + d1 * d14 * d2 * d23 * d3 * mly * y3**2 - d1 * d14 * d2 * d23 * d4 * fe * x14 * y1 * y2 - d1 * d14 * d2 * d23 * d4 * fe * x14 * y2 * y4 + d1 * d14 * d2 * d23 * d4 * fe * x23 * y1 * y4 + d1 * d14 * d2 * d23 * d4 * fe * x23 * y4**2 + d1 * d14 * d2 * d23 * d4 * fe * xe * y1 * y2 + d1 * d14 * d2 * d23 * d4 * fe * xe * y1 * y4 + d1 * d14 * d2 * d23 * d4 * fe * xe * y2 * y4 + d1 * d14 * d2 * d23 * d4 * fe * xe * y4**2 - d1 * d14 * d2 * d23 * d4 * fl * x14 * y1 * y2 - d1 * d14 * d2 * d23 * d4 * fl * x14 * y2 * y4 + d1 * d14 * d2 * d23 * d4 * fl * x23 * y1 * y4 + d1 * d14 * d2 * d23 * d4 * fl * x23 * y4**2 - d1 * d14 * d2 * d23 * d4 * mlx * x14 * y1 - d1 * d14 * d2 * d23 * d4 * mlx * x14 * y4 - d1 * d14 * d2 * d23 * d4 * mlx * x23 * y1 - d1 * d14 * d2 * d23 * d4 * mlx * x23 * y4 + d1 * d14 * d2 * d23 * d4 * mly * y1 * y2 + d1 * d14 * d2 * d23 * d4 * mly * y1 * y4 + d1 * d14 * d2 * d23 * d4 * mly * y2 * y4 + d1 * d14 * d2 * d23 * d4 * mly * y4**2 + d1 * d14 * d2 * d3 * d4 * fe * x23 * y1 * y2**2 * y4 + 2 * d1 * d14 * d2 * d3 * d4 * fe * x23 * y1 * y2 * y3 * y4 + d1 * d14 * d2 * d3 * d4 * fe * x23 * y1 * y3**2 * y4 + d1 * d14 * d2 * d3 * d4 * fe * x23 * y2**2 * y4**2 + 2 * d1 * d14 * d2 * d3 * d4 * fe * x23 * y2 * y3 * y4**2 + d1 * d14 * d2 * d3 * d4 * fe * x23 * y3**2 * y4**2 + d1 * d14 * d2 * d3 * d4 * fe * xe * y1 * y2**2 * y4 + 2 * d1 * d14 * d2 * d3 * d4 * fe * xe * y1 * y2 * y3 * y4 + d1 * d14 * d2 * d3 * d4 * fe * xe * y1 * y3**2 * y4 + d1 * d14 * d2 * d3 * d4 * fe * xe * y2**2 * y4**2 + 2 * d1 * d14 * d2 * d3 * d4 * fe * xe * y2 * y3 * y4**2 + d1 * d14 * d2 * d3 * d4 * fe * xe * y3**2 * y4**2 + d1 * d14 * d2 * d3 * d4 * fl * x23 * y1 * y2**2 * y4 + 2 * d1 * d14 * d2 * d3 * d4 * fl * x23 * y1 * y2 * y3 * y4 + d1 * d14 * d2 * d3 * d4 * fl * x23 * y1 * y3**2 * y4 + d1 * d14 * d2 * d3 * d4 * fl * x23 * y2**2 * y4**2 + 2 * d1 * d14 * d2 * d3 * d4 * fl * x23 * y2 * y3 * y4**2 + d1 * d14 * d2 * d3 * d4 * fl * x23 * y3**2 * y4**2 - d1 * d14 * d2 * d3 * d4 * mlx * x14 * y1 * y2**2 - 2 * d1 * d14 * d2 * d3 * d4 * mlx * x14 * y1 * y2 * y3 - d1 * d14 * d2 * d3 * d4 * mlx * x14 * y1 * y3**2 - d1 * d14 * d2 * d3 * d4 * mlx * x14 * y2**2 * y4 - 2 * d1 * d14 * d2 * d3 * d4 * mlx * x14 * y2 * y3 * y4 - d1 * d14 * d2 * d3 * d4 * mlx * x14 * y3**2 * y4 - d1 * d14 * d2 * d3 * d4 * mlx * x23 * y1 * y2**2 - 2 * d1 * d14 * d2 * d3 * d4 * mlx * x23 * y1 * y2 * y3 - d1 * d14 * d2 * d3 * d4 * mlx * x23 * y1 * y3**2 - d1 * d14 * d2 * d3 * d4 * mlx * x23 * y2**2 * y4 - 2 * d1 * d14 * d2 * d3 * d4 * mlx * x23 * y2 * y3 * y4 - d1 * d14 * d2 * d3 * d4 * mlx * x23 * y3**2 * y4 + d1 * d14 * d2 * d3 * d4 * mly * y1 * y2**2 * y4 + 2 * d1 * d14 * d2 * d3 * d4 * mly * y1 * y2 * y3 * y4 + d1 * d14 * d2 * d3 * d4 * mly * y1 * y3**2 * y4 + d1 * d14 * d2 * d3 * d4 * mly * y2**2 * y4**2 + 2 * d1 * d14 * d2 * d3 * d4 * mly * y2 * y3 * y4**2 + d1 * d14 * d2 * d3 * d4 * mly * y3**2 * y4**2 + d1 * d14 * d23 * d3 * d4 * fe * x14 * y1 * y3 + d1 * d14 * d23 * d3 * d4 * fe * x14 * y3 * y4 + d1 * d14 * d23 * d3 * d4 * fe * x23 * y1 * y4 + d1 * d14 * d23 * d3 * d4 * fe * x23 * y4**2 - d1 * d14 * d23 * d3 * d4 * fe * xe * y1 * y3 + d1 * d14 * d23 * d3 * d4 * fe * xe * y1 * y4 - d1 * d14 * d23 * d3 * d4 * fe * xe * y3 * y4 + d1 * d14 * d23 * d3 * d4 * fe * xe * y4**2 + d1 * d14 * d23 * d3 * d4 * fl * x14 * y1 * y3 + d1 * d14 * d23 * d3 * d4 * fl * x14 * y3 * y4 + d1 * d14 * d23 * d3 * d4 * fl * x23 * y1 * y4 + d1 * d14 * d23 * d3 * d4 * fl * x23 * y4**2 - d1 * d14 * d23 * d3 * d4 * mlx * x14 * y1 - d1 * d14 * d23 * d3 * d4 * mlx * x14 * y4 - d1 * d14 * d23 * d3 * d4 * mlx * x23 * y1 - d1 * d14 * d23 * d3 * d4 * mlx * x23 * y4 - d1 * d14 * d23 * d3 * d4 * mly * y1 * y3 + d1 * d14 * d23 * d3 * d4 * mly * y1 * y4 - d1 * d14 * d23 * d3 * d4 * mly * y3 * y4 + d1 * d14 * d23 * d3 * d4 * mly * y4**2 + d1 * d2 * d23 * d3 * d4 * fe * x23 * y1 * y2**2 * y4 + 2 * d1 * d2 * d23 * d3 * d4 * fe * x23 * y1 * y2 * y3 * y4 + d1 * d2 * d23 * d3 * d4 * fe * x23 * y1 * y3**2 * y4 + d1 * d2 * d23 * d3 * d4 * fe * x23 * y2**2 * y4**2 + 2 * d1 * d2 * d23 * d3 * d4 * fe * x23 * y2 * y3 * y4**2 + d1 * d2 * d23 * d3 * d4 * fe * x23 * y3**2 * y4**2 + d1 * d2 * d23 * d3 * d4 * fe * xe * y1 * y2**2 * y4 + 2 * d1 * d2 * d23 * d3 * d4 * fe * xe * y1 * y2 * y3 * y4 + d1 * d2 * d23 * d3 * d4 * fe * xe * y1 * y3**2 * y4 + d1 * d2 * d23 * d3 * d4 * fe * xe * y2**2 * y4**2 + 2 * d1 * d2 * d23 * d3 * d4 * fe * xe * y2 * y3 * y4**2 + d1 * d2 * d23 * d3 * d4 * fe * xe * y3**2 * y4**2 + d1 * d2 * d23 * d3 * d4 * fl * x23 * y1 * y2**2 * y4 + 2 * d1 * d2 * d23 * d3 * d4 * fl * x23 * y1 * y2 * y3 * y4 + d1 * d2 * d23 * d3 * d4 * fl * x23 * y1 * y3**2 * y4 + d1 * d2 * d23 * d3 * d4 * fl * x23 * y2**2 * y4**2 + 2 * d1 * d2 * d23 * d3 * d4 * fl * x23 * y2 * y3 * y4**2 + d1 * d2 * d23 * d3 * d4 * fl * x23 * y3**2 * y4**2 + d1 * d2 * d23 * d3 * d4 * mly * y1 * y2**2 * y4 + 2 * d1 * d2 * d23 * d3 * d4 * mly * y1 * y2 * y3 * y4 + d1 * d2 * d23 * d3 * d4 * mly * y1 * y3**2 * y4 + d1 * d2 * d23 * d3 * d4 * mly * y2**2 * y4**2 + 2 * d1 * d2 * d23 * d3 * d4 * mly * y2 * y3 * y4**2 + d1 * d2 * d23 * d3 * d4 * mly * y3**2 * y4**2) / (d1 * d14 * d2 * d23 * d3 * x14 * y2**2 + 2 * d1 * d14 * d2 * d23 * d3 * x14 * y2 * y3 + d1 * d14 * d2 * d23 * d3 * x14 * y3**2 + d1 * d14 * d2 * d23 * d3 * x23 * y2**2 + 2 * d1 * d14 * d2 * d23 * d3 * x23 * y2 * y3 + d1 * d14 * d2 * d23 * d3 * x23 * y3**2 + d1 * d14 * d2 * d23 * d4 * x14 * y1**2 + 2 * d1 * d14 * d2 * d23 * d4 * x14 * y1 * y4 + d1 * d14 * d2 * d23 * d4 * x14 * y4**2 + d1 * d14 * d2 * d23 * d4 * x23 * y1**2 + 2 * d1 * d14 * d2 * d23 * d4 * x23 * y1 * y4 + d1 * d14 * d2 * d23 * d4 * x23 * y4**2 + d1 * d14 * d2 * d3 * d4 * x14 * y1**2 * y2**2 + 2 * d1 * d14 * d2 * d3 * d4 * x14 * y1**2 * y2 * y3 + d1 * d14 * d2 * d3 * d4 * x14 * y1**2 * y3**2 + 2 * d1 * d14 * d2 * d3 * d4 * x14 * y1 * y2**2 * y4 + 4 * d1 * d14 * d2 * d3 * d4 * x14 * y1 * y2 * y3 * y4 + 2 * d1 * d14 * d2 * d3 * d4 * x14 * y1 * y3**2 * y4 + d1 * d14 * d2 * d3 * d4 * x14 * y2**2 * y4**2 + 2 * d1 * d14 * d2 * d3 * d4 * x14 * y2 * y3 * y4**2 + d1 * d14 * d2 * d3 * d4 * x14 * y3**2 * y4**2 + d1 * d14 * d2 * d3 * d4 * x23 * y1**2 * y2**2 + 2 * d1 * d14 * d2 * d3 * d4 * x23 * y1**2 * y2 * y3 + d1 * d14 * d2 * d3 * d4 * x23 * y1**2 * y3**2 + 2 * d1 * d14 * d2 * d3 * d4 * x23 * y1 * y2**2 * y4 + 4 * d1 * d14 * d2 * d3 * d4 * x23 * y1 * y2 * y3 * y4 + 2 * d1 * d14 * d2 * d3 * d4 * x23 * y1 * y3**2 * y4 + d1 * d14 * d2 * d3 * d4 * x23 * y2**2 * y4**2 + 2 * d1 * d14 * d2 * d3 * d4 * x23 * y2 * y3 * y4**2 + d1 * d14 * d2 * d3 * d4 * x23 * y3**2 * y4**2 + d1 * d14 * d23 * d3 * d4 * x14 * y1**2 + 2 * d1 * d14 * d23 * d3 * d4 * x14 * y1 * y4 + d1 * d14 * d23 * d3 * d4 * x14 * y4**2 + d1 * d14 * d23 * d3 * d4 * x23 * y1**2 + 2 * d1 * d14 * d23 * d3 * d4 * x23 * y1 * y4 + d1 * d14 * d23 * d3 * d4 * x23 * y4**2 + d1 * d2 * d23 * d3 * d4 * x14 * y1**2 * y2**2 + 2 * d1 * d2 * d23 * d3 * d4 * x14 * y1**2 * y2 * y3 + d1 * d2 * d23 * d3 * d4 * x14 * y1**2 * y3**2 + 2 * d1 * d2 * d23 * d3 * d4 * x14 * y1 * y2**2 * y4 + 4 * d1 * d2 * d23 * d3 * d4 * x14 * y1 * y2 * y3 * y4 + 2 * d1 * d2 * d23 * d3 * d4 * x14 * y1 * y3**2 * y4 + d1 * d2 * d23 * d3 * d4 * x14 * y2**2 * y4**2 + 2 * d1 * d2 * d23 * d3 * d4 * x14 * y2 * y3 * y4**2 + d1 * d2 * d23 * d3 * d4 * x14 * y3**2 * y4**2 + d1 * d2 * d23 * d3 * d4 * x23 * y1**2 * y2**2 + 2 * d1 * d2 * d23 * d3 * d4 * x23 * y1**2 * y2 * y3 + d1 * d2 * d23 * d3 * d4 * x23 * y1**2 * y3**2 + 2 * d1 * d2 * d23 * d3 * d4 * x23 * y1 * y2**2 * y4 + 4 * d1 * d2 * d23 * d3 * d4 * x23 * y1 * y2 * y3 * y4 + 2 * d1 * d2 * d23 * d3 * d4 * x23 * y1 * y3**2 * y4 + d1 * d2 * d23 * d3 * d4 * x23 * y2**2 * y4**2 + 2 * d1 * d2 * d23 * d3 * d4 * x23 * y2 * y3 * y4**2 + d1 * d2 * d23 * d3 * d4 * x23 * y3**2 * y4**2 + d14 * d2 * d23 * d3 * d4 * x14 * y2**2 + 2 * d14 * d2 * d23 * d3 * d4 * x14 * y2 * y3 + d14 * d2 * d23 * d3 * d4 * x14 * y3**2 + d14 * d2 * d23 * d3 * d4 * x23 * y2**2 + 2 * d14 * d2 * d23 * d3 * d4 * x23 * y2 * y3 + d14 * d2 * d23 * d3 * d4 * x23 * y3**2)
-    f2 = (d1 * d14 * d2 * d23 * d3 * fe * x14 * y2 * y3 + d1 * d14 * d2 * d23 * d3 * fe * x14 * y3**2 - d1 * d14 * d2 * d23 * d3 * fe * x23 * y1 * y2 - d1 * d14 * d2 * d23 * d3 * fe * x23 * y1 * y3 - d1 * d14 * d2 * d23 * d3 * fe * xe * y1 * y2 - d1 * d14 * d2 * d23 * d3 * fe * xe * y1 * y3 - d1 * d14 * d2 * d23 * d3 * fe * xe * y2 * y3 - d1 * d14 * d2 * d23 * d3 * fe * xe * y3**2 + d1 * d14 * d2 * d23 * d3 * fl * x14 * y2 * y3 + d1 * d14 * d2 * d23 * d3 * fl * x14 * y3**2 - d1 * d14 * d2 * d23 * d3 * fl * x23 * y1 * y2 - d1 * d14 * d2 * d23 * d3 * fl * x23 * y1 * y3 - d1 * d14 * d2 * d23 * d3 * mlx * x14 * y2 - d1 * d14 * d2 * d23 * d3 * mlx * x14 * y3 - d1 * d14 * d2 * d23 * d3 * mlx * x23 * y2 - d1 * d14 * d2 * d23 * d3 * mlx * x23 * y3 - d1 * d14 * d2 * d23 * d3 * mly * y1 * y2 - d1 * d14 * d2 * d23 * d3 * mly * y1 * y3 - d1 * d14 * d2 * d23 * d3 * mly * y2 * y3 - d1 * d14 * d2 * d23 * d3 * mly * y3**2 + d1 * d14 * d2 * d23 * d4 * fe * x14 * y1**2 + 2 * d1 * d14 * d2 * d23 * d4 * fe * x14 * y1 * y4 + d1 * d14 * d2 * d23 * d4 * fe * x14 * y4**2 - d1 * d14 * d2 * d23 * d4 * fe * xe * y1**2 - 2 * d1 * d14 * d2 * d23 * d4 * fe * xe * y1 * y4 - d1 * d14 * d2 * d23 * d4 * fe * xe * y4**2 + d1 * d14 * d2 * d23 * d4 * fl * x14 * y1**2 + 2 * d1 * d14 * d2 * d23 * d4 * fl * x14 * y1 * y4 + d1 * d14 * d2 * d23 * d4 * fl * x14 * y4**2 - d1 * d14 * d2 * d23 * d4 * mly * y1**2 - 2 * d1 * d14 * d2 * d23 * d4 * mly * y1 * y4 - d1 * d14 * d2 * d23 * d4 * mly * y4**2 + d1 * d14 * d2 * d3 * d4 * fe * x14 * y1**2 * y2 * y3 + d1 * d14 * d2 * d3 * d4 * fe * x14 * y1**2 * y3**2 + 2 * d1 * d14 * d2 * d3 * d4 * fe * x14 * y1 * y2 * y3 * y4 + 2 * d1 * d14 * d2 * d3 * d4 * fe * x14 * y1 * y3**2 * y4 + d1 * d14 * d2 * d3 * d4 * fe * x14 * y2 * y3 * y4**2 + d1 * d14 * d2 * d3 * d4 * fe * x14 * y3**2 * y4**2 - d1 * d14 * d2 * d3 * d4 * fe * xe * y1**2 * y2 * y3 - d1 * d14 * d2 * d3 * d4 * fe * xe * y1**2 * y3**2 - 2 * d1 * d14 * d2 * d3 * d4 * fe * xe * y1 * y2 * y3 * y4 - 2 * d1 * d14 * d2 * d3 * d4 * fe * xe * y1 * y3**2 * y4 - d1 * d14 * d2 * d3 * d4 * fe * xe * y2 * y3 * y4**2 - d1 * d14 * d2 * d3 * d4 * fe * xe * y3**2 * y4**2 + d1 * d14 * d2 * d3 * d4 * fl * x14 * y1**2 * y2 * y3 + d1 * d14 * d2 * d3 * d4 * fl * x14 * y1**2 * y3**2 + 2 * d1 * d14 * d2 * d3 * d4 * fl * x14 * y1 * y2 * y3 * y4 + 2 * d1 * d14 * d2 * d3 * d4 * fl * x14 * y1 * y3**2 * y4 + d1 * d14 * d2 * d3 * d4 * fl * x14 * y2 * y3 * y4**2 + d1 * d14 * d2 * d3 * d4 * fl * x14 * y3**2 * y4**2 - d1 * d14 * d2 * d3 * d4 * mly * y1**2 * y2 * y3 - d1 * d14 * d2 * d3 * d4 * mly * y1**2 * y3**2 - 2 * d1 * d14 * d2 * d3 * d4 * mly * y1 * y2 * y3 * y4 - 2 * d1 * d14 * d2 * d3 * d4 * mly * y1 * y3**2 * y4 - d1 * d14 * d2 * d3 * d4 * mly * y2 * y3 * y4**2 - d1 * d14 * d2 * d3 * d4 * mly * y3**2 * y4**2 + d1 * d2 * d23 * d3 * d4 * fe * x14 * y1**2 * y2 * y3 + d1 * d2 * d23 * d3 * d4 * fe * x14 * y1**2 * y3**2 + 2 * d1 * d2 * d23 * d3 * d4 * fe * x14 * y1 * y2 * y3 * y4 + 2 * d1 * d2 * d23 * d3 * d4 * fe * x14 * y1 * y3**2 * y4 + d1 * d2 * d23 * d3 * d4 * fe * x14 * y2 * y3 * y4**2 + d1 * d2 * d23 * d3 * d4 * fe * x14 * y3**2 * y4**2 - d1 * d2 * d23 * d3 * d4 * fe * xe * y1**2 * y2 * y3 - d1 * d2 * d23 * d3 * d4 * fe * xe * y1**2 * y3**2 - 2 * d1 * d2 * d23 * d3 * d4 * fe * xe * y1 * y2 * y3 * y4 - 2 * d1 * d2 * d23 * d3 * d4 * fe * xe * y1 * y3**2 * y4 - d1 * d2 * d23 * d3 * d4 * fe * xe * y2 * y3 * y4**2 - d1 * d2 * d23 * d3 * d4 * fe * xe * y3**2 * y4**2 + d1 * d2 * d23 * d3 * d4 * fl * x14 * y1**2 * y2 * y3 + d1 * d2 * d23 * d3 * d4 * fl * x14 * y1**2 * y3**2 + 2 * d1 * d2 * d23 * d3 * d4 * fl * x14 * y1 * y2 * y3 * y4 + 2 * d1 * d2 * d23 * d3 * d4 * fl * x14 * y1 * y3**2 * y4 + d1 * d2 * d23 * d3 * d4 * fl * x14 * y2 * y3 * y4**2 + d1 * d2 * d23 * d3 * d4 * fl * x14 * y3**2 * y4**2 - d1 * d2 * d23 * d3 * d4 * mlx * x14 * y1**2 * y2 - d1 * d2 * d23 * d3 * d4 * mlx * x14 * y1**2 * y3 - 2 * d1 * d2 * d23 * d3 * d4 * mlx * x14 * y1 * y2 * y4 - 2 * d1 * d2 * d23 * d3 * d4 * mlx * x14 * y1 * y3 * y4 - d1 * d2 * d23 * d3 * d4 * mlx * x14 * y2 * y4**2 - d1 * d2 * d23 * d3 * d4 * mlx * x14 * y3 * y4**2 - d1 * d2 * d23 * d3 * d4 * mlx * x23 * y1**2 * y2 - d1 * d2 * d23 * d3 * d4 * mlx * x23 * y1**2 * y3 - 2 * d1 * d2 * d23 * d3 * d4 * mlx * x23 * y1 * y2 * y4 - 2 * d1 * d2 * d23 * d3 * d4 * mlx * x23 * y1 * y3 * y4 - d1 * d2 * d23 * d3 * d4 * mlx * x23 * y2 * y4**2 - d1 * d2 * d23 * d3 * d4 * mlx * x23 * y3 * y4**2 - d1 * d2 * d23 * d3 * d4 * mly * y1**2 * y2 * y3 - d1 * d2 * d23 * d3 * d4 * mly * y1**2 * y3**2 - 2 * d1 * d2 * d23 * d3 * d4 * mly * y1 * y2 * y3 * y4 - 2 * d1 * d2 * d23 * d3 * d4 * mly * y1 * y3**2 * y4 - d1 * d2 * d23 * d3 * d4 * mly * y2 * y3 * y4**2 - d1 * d2 * d23 * d3 * d4 * mly * y3**2 * y4**2 + d14 * d2 * d23 * d3 * d4 * fe * x14 * y2 * y3 + d14 * d2 * d23 * d3 * d4 * fe * x14 * y3**2 + d14 * d2 * d23 * d3 * d4 * fe * x23 * y2 * y4 + d14 * d2 * d23 * d3 * d4 * fe * x23 * y3 * y4 - d14 * d2 * d23 * d3 * d4 * fe * xe * y2 * y3 + d14 * d2 * d23 * d3 * d4 * fe * xe * y2 * y4 - d14 * d2 * d23 * d3 * d4 * fe * xe * y3**2 + d14 * d2 * d23 * d3 * d4 * fe * xe * y3 * y4 + d14 * d2 * d23 * d3 * d4 * fl * x14 * y2 * y3 + d14 * d2 * d23 * d3 * d4 * fl * x14 * y3**2 + d14 * d2 * d23 * d3 * d4 * fl * x23 * y2 * y4 + d14 * d2 * d23 * d3 * d4 * fl * x23 * y3 * y4 - d14 * d2 * d23 * d3 * d4 * mlx * x14 * y2 - d14 * d2 * d23 * d3 * d4 * mlx * x14 * y3 - d14 * d2 * d23 * d3 * d4 * mlx * x23 * y2 - d14 * d2 * d23 * d3 * d4 * mlx * x23 * y3 - d14 * d2 * d23 * d3 * d4 * mly * y2 * y3 + d14 * d2 * d23 * d3 * d4 * mly * y2 * y4 - d14 * d2 * d23 * d3 * d4 * mly * y3**2 + d14 * d2 * d23 * d3 * d4 * mly * y3 * y4) / (d1 * d14 * d2 * d23 * d3 * x14 * y2**2 + 2 * d1 * d14 * d2 * d23 * d3 * x14 * y2 * y3 + d1 * d14 * d2 * d23 * d3 * x14 * y3**2 + d1 * d14 * d2 * d23 * d3 * x23 * y2**2 + 2 * d1 * d14 * d2 * d23 * d3 * x23 * y2 * y3 + d1 * d14 * d2 * d23 * d3 * x23 * y3**2 + d1 * d14 * d2 * d23 * d4 * x14 * y1**2 + 2 * d1 * d14 * d2 * d23 * d4 * x14 * y1 * y4 + d1 * d14 * d2 * d23 * d4 * x14 * y4**2 + d1 * d14 * d2 * d23 * d4 * x23 * y1**2 + 2 * d1 * d14 * d2 * d23 * d4 * x23 * y1 * y4 + d1 * d14 * d2 * d23 * d4 * x23 * y4**2 + d1 * d14 * d2 * d3 * d4 * x14 * y1**2 * y2**2 + 2 * d1 * d14 * d2 * d3 * d4 * x14 * y1**2 * y2 * y3 + d1 * d14 * d2 * d3 * d4 * x14 * y1**2 * y3**2 + 2 * d1 * d14 * d2 * d3 * d4 * x14 * y1 * y2**2 * y4 + 4 * d1 * d14 * d2 * d3 * d4 * x14 * y1 * y2 * y3 * y4 + 2 * d1 * d14 * d2 * d3 * d4 * x14 * y1 * y3**2 * y4 + d1 * d14 * d2 * d3 * d4 * x14 * y2**2 * y4**2 + 2 * d1 * d14 * d2 * d3 * d4 * x14 * y2 * y3 * y4**2 + d1 * d14 * d2 * d3 * d4 * x14 * y3**2 * y4**2 + d1 * d14 * d2 * d3 * d4 * x23 * y1**2 * y2**2 + 2 * d1 * d14 * d2 * d3 * d4 * x23 * y1**2 * y2 * y3 + d1 * d14 * d2 * d3 * d4 * x23 * y1**2 * y3**2 + 2 * d1 * d14 * d2 * d3 * d4 * x23 * y1 * y2**2 * y4 + 4 * d1 * d14 * d2 * d3 * d4 * x23 * y1 * y2 * y3 * y4 + 2 * d1 * d14 * d2 * d3 * d4 * x23 * y1 * y3**2 * y4 + d1 * d14 * d2 * d3 * d4 * x23 * y2**2 * y4**2 + 2 * d1 * d14 * d2 * d3 * d4 * x23 * y2 * y3 * y4**2 + d1 * d14 * d2 * d3 * d4 * x23 * y3**2 * y4**2 + d1 * d14 * d23 * d3 * d4 * x14 * y1**2 + 2 * d1 * d14 * d23 * d3 * d4 * x14 * y1 * y4 + d1 * d14 * d23 * d3 * d4 * x14 * y4**2 + d1 * d14 * d23 * d3 * d4 * x23 * y1**2 + 2 * d1 * d14 * d23 * d3 * d4 * x23 * y1 * y4 + d1 * d14 * d23 * d3 * d4 * x23 * y4**2 + d1 * d2 * d23 * d3 * d4 * x14 * y1**2 * y2**2 + 2 * d1 * d2 * d23 * d3 * d4 * x14 * y1**2 * y2 * y3 + d1 * d2 * d23 * d3 * d4 * x14 * y1**2 * y3**2 + 2 * d1 * d2 * d23 * d3 * d4 * x14 * y1 * y2**2 * y4 + 4 * d1 * d2 * d23 * d3 * d4 * x14 * y1 * y2 * y3 * y4 + 2 * d1 * d2 * d23 * d3 * d4 * x14 * y1 * y3**2 * y4 + d1 * d2 * d23 * d3 * d4 * x14 * y2**2 * y4**2 + 2 * d1 * d2 * d23 * d3 * d4 * x14 * y2 * y3 * y4**2 + d1 * d2 * d23 * d3 * d4 * x14 * y3**2 * y4**2 + d1 * d2 * d23 * d3 * d4 * x23 * y1**2 * y2**2 + 2 * d1 * d2 * d23 * d3 * d4 * x23 * y1**2 * y2 * y3 + d1 * d2 * d23 * d3 * d4 * x23 * y1**2 * y3**2 + 2 * d1 * d2 * d23 * d3 * d4 * x23 * y1 * y2**2 * y4 + 4 * d1 * d2 * d23 * d3 * d4 * x23 * y1 * y2 * y3 * y4 + 2 * d1 * d2 * d23 * d3 * d4 * x23 * y1 * y3**2 * y4 + d1 * d2 * d23 * d3 * d4 * x23 * y2**2 * y4**2 + 2 * d1 * d2 * d23 * d3 * d4 * x23 * y2 * y3 * y4**2 + d1 * d2 * d23 * d3 * d4 * x23 * y3**2 * y4**2 + d14 * d2 * d23 * d3 * d4 * x14 * y2**2 + 2 * d14 * d2 * d23 * d3 * d4 * x14 * y2 * y3 + d14 * d2 * d23 * d3 * d4 * x14 * y3**2 + d14 * d2 * d23 * d3 * d4 * x23 * y2**2 + 2 * d14 * d2 * d23 * d3 * d4 * x23 * y2 * y3 + d14 * d2 * d23 * d3 * d4 * x23 * y3**2)
-    f3 = (d1 * d14 * d2 * d23 * d3 * fe * x14 * y2**2 + d1 * d14 * d2 * d23 * d3 * fe * x14 * y2 * y3 + d1 * d14 * d2 * d23 * d3 * fe * x23 * y1 * y2 + d1 * d14 * d2 * d23 * d3 * fe * x23 * y1 * y3 + d1 * d14 * d2 * d23 * d3 * fe * xe * y1 * y2 + d1 * d14 * d2 * d23 * d3 * fe * xe * y1 * y3 - d1 * d14 * d2 * d23 * d3 * fe * xe * y2**2 - d1 * d14 * d2 * d23 * d3 * fe * xe * y2 * y3 + d1 * d14 * d2 * d23 * d3 * fl * x14 * y2**2 + d1 * d14 * d2 * d23 * d3 * fl * x14 * y2 * y3 + d1 * d14 * d2 * d23 * d3 * fl * x23 * y1 * y2 + d1 * d14 * d2 * d23 * d3 * fl * x23 * y1 * y3 + d1 * d14 * d2 * d23 * d3 * mlx * x14 * y2 + d1 * d14 * d2 * d23 * d3 * mlx * x14 * y3 + d1 * d14 * d2 * d23 * d3 * mlx * x23 * y2 + d1 * d14 * d2 * d23 * d3 * mlx * x23 * y3 + d1 * d14 * d2 * d23 * d3 * mly * y1 * y2 + d1 * d14 * d2 * d23 * d3 * mly * y1 * y3 - d1 * d14 * d2 * d23 * d3 * mly * y2**2 - d1 * d14 * d2 * d23 * d3 * mly * y2 * y3 + d1 * d14 * d2 * d3 * d4 * fe * x14 * y1**2 * y2**2 + d1 * d14 * d2 * d3 * d4 * fe * x14 * y1**2 * y2 * y3 + 2 * d1 * d14 * d2 * d3 * d4 * fe * x14 * y1 * y2**2 * y4 + 2 * d1 * d14 * d2 * d3 * d4 * fe * x14 * y1 * y2 * y3 * y4 + d1 * d14 * d2 * d3 * d4 * fe * x14 * y2**2 * y4**2 + d1 * d14 * d2 * d3 * d4 * fe * x14 * y2 * y3 * y4**2 - d1 * d14 * d2 * d3 * d4 * fe * xe * y1**2 * y2**2 - d1 * d14 * d2 * d3 * d4 * fe * xe * y1**2 * y2 * y3 - 2 * d1 * d14 * d2 * d3 * d4 * fe * xe * y1 * y2**2 * y4 - 2 * d1 * d14 * d2 * d3 * d4 * fe * xe * y1 * y2 * y3 * y4 - d1 * d14 * d2 * d3 * d4 * fe * xe * y2**2 * y4**2 - d1 * d14 * d2 * d3 * d4 * fe * xe * y2 * y3 * y4**2 + d1 * d14 * d2 * d3 * d4 * fl * x14 * y1**2 * y2**2 + d1 * d14 * d2 * d3 * d4 * fl * x14 * y1**2 * y2 * y3 + 2 * d1 * d14 * d2 * d3 * d4 * fl * x14 * y1 * y2**2 * y4 + 2 * d1 * d14 * d2 * d3 * d4 * fl * x14 * y1 * y2 * y3 * y4 + d1 * d14 * d2 * d3 * d4 * fl * x14 * y2**2 * y4**2 + d1 * d14 * d2 * d3 * d4 * fl * x14 * y2 * y3 * y4**2 - d1 * d14 * d2 * d3 * d4 * mly * y1**2 * y2**2 - d1 * d14 * d2 * d3 * d4 * mly * y1**2 * y2 * y3 - 2 * d1 * d14 * d2 * d3 * d4 * mly * y1 * y2**2 * y4 - 2 * d1 * d14 * d2 * d3 * d4 * mly * y1 * y2 * y3 * y4 - d1 * d14 * d2 * d3 * d4 * mly * y2**2 * y4**2 - d1 * d14 * d2 * d3 * d4 * mly * y2 * y3 * y4**2 + d1 * d14 * d23 * d3 * d4 * fe * x14 * y1**2 + 2 * d1 * d14 * d23 * d3 * d4 * fe * x14 * y1 * y4 + d1 * d14 * d23 * d3 * d4 * fe * x14 * y4**2 - d1 * d14 * d23 * d3 * d4 * fe * xe * y1**2 - 2 * d1 * d14 * d23 * d3 * d4 * fe * xe * y1 * y4 - d1 * d14 * d23 * d3 * d4 * fe * xe * y4**2 + d1 * d14 * d23 * d3 * d4 * fl * x14 * y1**2 + 2 * d1 * d14 * d23 * d3 * d4 * fl * x14 * y1 * y4 + d1 * d14 * d23 * d3 * d4 * fl * x14 * y4**2 - d1 * d14 * d23 * d3 * d4 * mly * y1**2 - 2 * d1 * d14 * d23 * d3 * d4 * mly * y1 * y4 - d1 * d14 * d23 * d3 * d4 * mly * y4**2 + d1 * d2 * d23 * d3 * d4 * fe * x14 * y1**2 * y2**2 + d1 * d2 * d23 * d3 * d4 * fe * x14 * y1**2 * y2 * y3 + 2 * d1 * d2 * d23 * d3 * d4 * fe * x14 * y1 * y2**2 * y4 + 2 * d1 * d2 * d23 * d3 * d4 * fe * x14 * y1 * y2 * y3 * y4 + d1 * d2 * d23 * d3 * d4 * fe * x14 * y2**2 * y4**2 + d1 * d2 * d23 * d3 * d4 * fe * x14 * y2 * y3 * y4**2 - d1 * d2 * d23 * d3 * d4 * fe * xe * y1**2 * y2**2 - d1 * d2 * d23 * d3 * d4 * fe * xe * y1**2 * y2 * y3 - 2 * d1 * d2 * d23 * d3 * d4 * fe * xe * y1 * y2**2 * y4 - 2 * d1 * d2 * d23 * d3 * d4 * fe * xe * y1 * y2 * y3 * y4 - d1 * d2 * d23 * d3 * d4 * fe * xe * y2**2 * y4**2 - d1 * d2 * d23 * d3 * d4 * fe * xe * y2 * y3 * y4**2 + d1 * d2 * d23 * d3 * d4 * fl * x14 * y1**2 * y2**2 + d1 * d2 * d23 * d3 * d4 * fl * x14 * y1**2 * y2 * y3 + 2 * d1 * d2 * d23 * d3 * d4 * fl * x14 * y1 * y2**2 * y4 + 2 * d1 * d2 * d23 * d3 * d4 * fl * x14 * y1 * y2 * y3 * y4 + d1 * d2 * d23 * d3 * d4 * fl * x14 * y2**2 * y4**2 + d1 * d2 * d23 * d3 * d4 * fl * x14 * y2 * y3 * y4**2 + d1 * d2 * d23 * d3 * d4 * mlx * x14 * y1**2 * y2 + d1 * d2 * d23 * d3 * d4 * mlx * x14 * y1**2 * y3 + 2 * d1 * d2 * d23 * d3 * d4 * mlx * x14 * y1 * y2 * y4 + 2 * d1 * d2 * d23 * d3 * d4 * mlx * x14 * y1 * y3 * y4 + d1 * d2 * d23 * d3 * d4 * mlx * x14 * y2 * y4**2 + d1 * d2 * d23 * d3 * d4 * mlx * x14 * y3 * y4**2 + d1 * d2 * d23 * d3 * d4 * mlx * x23 * y1**2 * y2 + d1 * d2 * d23 * d3 * d4 * mlx * x23 * y1**2 * y3 + 2 * d1 * d2 * d23 * d3 * d4 * mlx * x23 * y1 * y2 * y4 + 2 * d1 * d2 * d23 * d3 * d4 * mlx * x23 * y1 * y3 * y4 + d1 * d2 * d23 * d3 * d4 * mlx * x23 * y2 * y4**2 + d1 * d2 * d23 * d3 * d4 * mlx * x23 * y3 * y4**2 - d1 * d2 * d23 * d3 * d4 * mly * y1**2 * y2**2 - d1 * d2 * d23 * d3 * d4 * mly * y1**2 * y2 * y3 - 2 * d1 * d2 * d23 * d3 * d4 * mly * y1 * y2**2 * y4 - 2 * d1 * d2 * d23 * d3 * d4 * mly * y1 * y2 * y3 * y4 - d1 * d2 * d23 * d3 * d4 * mly * y2**2 * y4**2 - d1 * d2 * d23 * d3 * d4 * mly * y2 * y3 * y4**2 + d14 * d2 * d23 * d3 * d4 * fe * x14 * y2**2 + d14 * d2 * d23 * d3 * d4 * fe * x14 * y2 * y3 - d14 * d2 * d23 * d3 * d4 * fe * x23 * y2 * y4 - d14 * d2 * d23 * d3 * d4 * fe * x23 * y3 * y4 - d14 * d2 * d23 * d3 * d4 * fe * xe * y2**2 - d14 * d2 * d23 * d3 * d4 * fe * xe * y2 * y3 - d14 * d2 * d23 * d3 * d4 * fe * xe * y2 * y4 - d14 * d2 * d23 * d3 * d4 * fe * xe * y3 * y4 + d14 * d2 * d23 * d3 * d4 * fl * x14 * y2**2 + d14 * d2 * d23 * d3 * d4 * fl * x14 * y2 * y3 - d14 * d2 * d23 * d3 * d4 * fl * x23 * y2 * y4 - d14 * d2 * d23 * d3 * d4 * fl * x23 * y3 * y4 + d14 * d2 * d23 * d3 * d4 * mlx * x14 * y2 + d14 * d2 * d23 * d3 * d4 * mlx * x14 * y3 + d14 * d2 * d23 * d3 * d4 * mlx * x23 * y2 + d14 * d2 * d23 * d3 * d4 * mlx * x23 * y3 - d14 * d2 * d23 * d3 * d4 * mly * y2**2 - d14 * d2 * d23 * d3 * d4 * mly * y2 * y3 - d14 * d2 * d23 * d3 * d4 * mly * y2 * y4 - d14 * d2 * d23 * d3 * d4 * mly * y3 * y4) / (d1 * d14 * d2 * d23 * d3 * x14 * y2**2 + 2 * d1 * d14 * d2 * d23 * d3 * x14 * y2 * y3 + d1 * d14 * d2 * d23 * d3 * x14 * y3**2 + d1 * d14 * d2 * d23 * d3 * x23 * y2**2 + 2 * d1 * d14 * d2 * d23 * d3 * x23 * y2 * y3 + d1 * d14 * d2 * d23 * d3 * x23 * y3**2 + d1 * d14 * d2 * d23 * d4 * x14 * y1**2 + 2 * d1 * d14 * d2 * d23 * d4 * x14 * y1 * y4 + d1 * d14 * d2 * d23 * d4 * x14 * y4**2 + d1 * d14 * d2 * d23 * d4 * x23 * y1**2 + 2 * d1 * d14 * d2 * d23 * d4 * x23 * y1 * y4 + d1 * d14 * d2 * d23 * d4 * x23 * y4**2 + d1 * d14 * d2 * d3 * d4 * x14 * y1**2 * y2**2 + 2 * d1 * d14 * d2 * d3 * d4 * x14 * y1**2 * y2 * y3 + d1 * d14 * d2 * d3 * d4 * x14 * y1**2 * y3**2 + 2 * d1 * d14 * d2 * d3 * d4 * x14 * y1 * y2**2 * y4 + 4 * d1 * d14 * d2 * d3 * d4 * x14 * y1 * y2 * y3 * y4 + 2 * d1 * d14 * d2 * d3 * d4 * x14 * y1 * y3**2 * y4 + d1 * d14 * d2 * d3 * d4 * x14 * y2**2 * y4**2 + 2 * d1 * d14 * d2 * d3 * d4 * x14 * y2 * y3 * y4**2 + d1 * d14 * d2 * d3 * d4 * x14 * y3**2 * y4**2 + d1 * d14 * d2 * d3 * d4 * x23 * y1**2 * y2**2 + 2 * d1 * d14 * d2 * d3 * d4 * x23 * y1**2 * y2 * y3 + d1 * d14 * d2 * d3 * d4 * x23 * y1**2 * y3**2 + 2 * d1 * d14 * d2 * d3 * d4 * x23 * y1 * y2**2 * y4 + 4 * d1 * d14 * d2 * d3 * d4 * x23 * y1 * y2 * y3 * y4 + 2 * d1 * d14 * d2 * d3 * d4 * x23 * y1 * y3**2 * y4 + d1 * d14 * d2 * d3 * d4 * x23 * y2**2 * y4**2 + 2 * d1 * d14 * d2 * d3 * d4 * x23 * y2 * y3 * y4**2 + d1 * d14 * d2 * d3 * d4 * x23 * y3**2 * y4**2 + d1 * d14 * d23 * d3 * d4 * x14 * y1**2 + 2 * d1 * d14 * d23 * d3 * d4 * x14 * y1 * y4 + d1 * d14 * d23 * d3 * d4 * x14 * y4**2 + d1 * d14 * d23 * d3 * d4 * x23 * y1**2 + 2 * d1 * d14 * d23 * d3 * d4 * x23 * y1 * y4 + d1 * d14 * d23 * d3 * d4 * x23 * y4**2 + d1 * d2 * d23 * d3 * d4 * x14 * y1**2 * y2**2 + 2 * d1 * d2 * d23 * d3 * d4 * x14 * y1**2 * y2 * y3 + d1 * d2 * d23 * d3 * d4 * x14 * y1**2 * y3**2 + 2 * d1 * d2 * d23 * d3 * d4 * x14 * y1 * y2**2 * y4 + 4 * d1 * d2 * d23 * d3 * d4 * x14 * y1 * y2 * y3 * y4 + 2 * d1 * d2 * d23 * d3 * d4 * x14 * y1 * y3**2 * y4 + d1 * d2 * d23 * d3 * d4 * x14 * y2**2 * y4**2 + 2 * d1 * d2 * d23 * d3 * d4 * x14 * y2 * y3 * y4**2 + d1 * d2 * d23 * d3 * d4 * x14 * y3**2 * y4**2 + d1 * d2 * d23 * d3 * d4 * x23 * y1**2 * y2**2 + 2 * d1 * d2 * d23 * d3 * d4 * x23 * y1**2 * y2 * y3 + d1 * d2 * d23 * d3 * d4 * x23 * y1**2 * y3**2 + 2 * d1 * d2 * d23 * d3 * d4 * x23 * y1 * y2**2 * y4 + 4 * d1 * d2 * d23 * d3 * d4 * x23 * y1 * y2 * y3 * y4 + 2 * d1 * d2 * d23 * d3 * d4 * x23 * y1 * y3**2 * y4 + d1 * d2 * d23 * d3 * d4 * x23 * y2**2 * y4**2 + 2 * d1 * d2 * d23 * d3 * d4 * x23 * y2 * y3 * y4**2 + d1 * d2 * d23 * d3 * d4 * x23 * y3**2 * y4**2 + d14 * d2 * d23 * d3 * d4 * x14 * y2**2 + 2 * d14 * d2 * d23 * d3 * d4 * x14 * y2 * y3 + d14 * d2 * d23 * d3 * d4 * x14 * y3**2 + d14 * d2 * d23 * d3 * d4 * x23 * y2**2 + 2 * d14 * d2 * d23 * d3 * d4 * x23 * y2 * y3 + d14 * d2 * d23 * d3 * d4 * x23 * y3**2)
-    f4 = (d1 * d14 * d2 * d23 * d4 * fe * x14 * y1 * y2 + d1 * d14 * d2 * d23 * d4 * fe * x14 * y2 * y4 + d1 * d14 * d2 * d23 * d4 * fe * x23 * y1**2 + d1 * d14 * d2 * d23 * d4 * fe * x23 * y1 * y4 + d1 * d14 * d2 * d23 * d4 * fe * xe * y1**2 - d1 * d14 * d2 * d23 * d4 * fe * xe * y1 * y2 + d1 * d14 * d2 * d23 * d4 * fe * xe * y1 * y4 - d1 * d14 * d2 * d23 * d4 * fe * xe * y2 * y4 + d1 * d14 * d2 * d23 * d4 * fl * x14 * y1 * y2 + d1 * d14 * d2 * d23 * d4 * fl * x14 * y2 * y4 + d1 * d14 * d2 * d23 * d4 * fl * x23 * y1**2 + d1 * d14 * d2 * d23 * d4 * fl * x23 * y1 * y4 + d1 * d14 * d2 * d23 * d4 * mlx * x14 * y1 + d1 * d14 * d2 * d23 * d4 * mlx * x14 * y4 + d1 * d14 * d2 * d23 * d4 * mlx * x23 * y1 + d1 * d14 * d2 * d23 * d4 * mlx * x23 * y4 + d1 * d14 * d2 * d23 * d4 * mly * y1**2 - d1 * d14 * d2 * d23 * d4 * mly * y1 * y2 + d1 * d14 * d2 * d23 * d4 * mly * y1 * y4 - d1 * d14 * d2 * d23 * d4 * mly * y2 * y4 + d1 * d14 * d2 * d3 * d4 * fe * x23 * y1**2 * y2**2 + 2 * d1 * d14 * d2 * d3 * d4 * fe * x23 * y1**2 * y2 * y3 + d1 * d14 * d2 * d3 * d4 * fe * x23 * y1**2 * y3**2 + d1 * d14 * d2 * d3 * d4 * fe * x23 * y1 * y2**2 * y4 + 2 * d1 * d14 * d2 * d3 * d4 * fe * x23 * y1 * y2 * y3 * y4 + d1 * d14 * d2 * d3 * d4 * fe * x23 * y1 * y3**2 * y4 + d1 * d14 * d2 * d3 * d4 * fe * xe * y1**2 * y2**2 + 2 * d1 * d14 * d2 * d3 * d4 * fe * xe * y1**2 * y2 * y3 + d1 * d14 * d2 * d3 * d4 * fe * xe * y1**2 * y3**2 + d1 * d14 * d2 * d3 * d4 * fe * xe * y1 * y2**2 * y4 + 2 * d1 * d14 * d2 * d3 * d4 * fe * xe * y1 * y2 * y3 * y4 + d1 * d14 * d2 * d3 * d4 * fe * xe * y1 * y3**2 * y4 + d1 * d14 * d2 * d3 * d4 * fl * x23 * y1**2 * y2**2 + 2 * d1 * d14 * d2 * d3 * d4 * fl * x23 * y1**2 * y2 * y3 + d1 * d14 * d2 * d3 * d4 * fl * x23 * y1**2 * y3**2 + d1 * d14 * d2 * d3 * d4 * fl * x23 * y1 * y2**2 * y4 + 2 * d1 * d14 * d2 * d3 * d4 * fl * x23 * y1 * y2 * y3 * y4 + d1 * d14 * d2 * d3 * d4 * fl * x23 * y1 * y3**2 * y4 + d1 * d14 * d2 * d3 * d4 * mlx * x14 * y1 * y2**2 + 2 * d1 * d14 * d2 * d3 * d4 * mlx * x14 * y1 * y2 * y3 + d1 * d14 * d2 * d3 * d4 * mlx * x14 * y1 * y3**2 + d1 * d14 * d2 * d3 * d4 * mlx * x14 * y2**2 * y4 + 2 * d1 * d14 * d2 * d3 * d4 * mlx * x14 * y2 * y3 * y4 + d1 * d14 * d2 * d3 * d4 * mlx * x14 * y3**2 * y4 + d1 * d14 * d2 * d3 * d4 * mlx * x23 * y1 * y2**2 + 2 * d1 * d14 * d2 * d3 * d4 * mlx * x23 * y1 * y2 * y3 + d1 * d14 * d2 * d3 * d4 * mlx * x23 * y1 * y3**2 + d1 * d14 * d2 * d3 * d4 * mlx * x23 * y2**2 * y4 + 2 * d1 * d14 * d2 * d3 * d4 * mlx * x23 * y2 * y3 * y4 + d1 * d14 * d2 * d3 * d4 * mlx * x23 * y3**2 * y4 + d1 * d14 * d2 * d3 * d4 * mly * y1**2 * y2**2 + 2 * d1 * d14 * d2 * d3 * d4 * mly * y1**2 * y2 * y3 + d1 * d14 * d2 * d3 * d4 * mly * y1**2 * y3**2 + d1 * d14 * d2 * d3 * d4 * mly * y1 * y2**2 * y4 + 2 * d1 * d14 * d2 * d3 * d4 * mly * y1 * y2 * y3 * y4 + d1 * d14 * d2 * d3 * d4 * mly * y1 * y3**2 * y4 - d1 * d14 * d23 * d3 * d4 * fe * x14 * y1 * y3 - d1 * d14 * d23 * d3 * d4 * fe * x14 * y3 * y4 + d1 * d14 * d23 * d3 * d4 * fe * x23 * y1**2 + d1 * d14 * d23 * d3 * d4 * fe * x23 * y1 * y4 + d1 * d14 * d23 * d3 * d4 * fe * xe * y1**2 + d1 * d14 * d23 * d3 * d4 * fe * xe * y1 * y3 + d1 * d14 * d23 * d3 * d4 * fe * xe * y1 * y4 + d1 * d14 * d23 * d3 * d4 * fe * xe * y3 * y4 - d1 * d14 * d23 * d3 * d4 * fl * x14 * y1 * y3 - d1 * d14 * d23 * d3 * d4 * fl * x14 * y3 * y4 + d1 * d14 * d23 * d3 * d4 * fl * x23 * y1**2 + d1 * d14 * d23 * d3 * d4 * fl * x23 * y1 * y4 + d1 * d14 * d23 * d3 * d4 * mlx * x14 * y1 + d1 * d14 * d23 * d3 * d4 * mlx * x14 * y4 + d1 * d14 * d23 * d3 * d4 * mlx * x23 * y1 + d1 * d14 * d23 * d3 * d4 * mlx * x23 * y4 + d1 * d14 * d23 * d3 * d4 * mly * y1**2 + d1 * d14 * d23 * d3 * d4 * mly * y1 * y3 + d1 * d14 * d23 * d3 * d4 * mly * y1 * y4 + d1 * d14 * d23 * d3 * d4 * mly * y3 * y4 + d1 * d2 * d23 * d3 * d4 * fe * x23 * y1**2 * y2**2 + 2 * d1 * d2 * d23 * d3 * d4 * fe * x23 * y1**2 * y2 * y3 + d1 * d2 * d23 * d3 * d4 * fe * x23 * y1**2 * y3**2 + d1 * d2 * d23 * d3 * d4 * fe * x23 * y1 * y2**2 * y4 + 2 * d1 * d2 * d23 * d3 * d4 * fe * x23 * y1 * y2 * y3 * y4 + d1 * d2 * d23 * d3 * d4 * fe * x23 * y1 * y3**2 * y4 + d1 * d2 * d23 * d3 * d4 * fe * xe * y1**2 * y2**2 + 2 * d1 * d2 * d23 * d3 * d4 * fe * xe * y1**2 * y2 * y3 + d1 * d2 * d23 * d3 * d4 * fe * xe * y1**2 * y3**2 + d1 * d2 * d23 * d3 * d4 * fe * xe * y1 * y2**2 * y4 + 2 * d1 * d2 * d23 * d3 * d4 * fe * xe * y1 * y2 * y3 * y4 + d1 * d2 * d23 * d3 * d4 * fe * xe * y1 * y3**2 * y4 + d1 * d2 * d23 * d3 * d4 * fl * x23 * y1**2 * y2**2 + 2 * d1 * d2 * d23 * d3 * d4 * fl * x23 * y1**2 * y2 * y3 + d1 * d2 * d23 * d3 * d4 * fl * x23 * y1**2 * y3**2 + d1 * d2 * d23 * d3 * d4 * fl * x23 * y1 * y2**2 * y4 + 2 * d1 * d2 * d23 * d3 * d4 * fl * x23 * y1 * y2 * y3 * y4 + d1 * d2 * d23 * d3 * d4 * fl * x23 * y1 * y3**2 * y4 + d1 * d2 * d23 * d3 * d4 * mly * y1**2 * y2**2 + 2 * d1 * d2 * d23 * d3 * d4 * mly * y1**2 * y2 * y3 + d1 * d2 * d23 * d3 * d4 * mly * y1**2 * y3**2 + d1 * d2 * d23 * d3 * d4 * mly * y1 * y2**2 * y4 + 2 * d1 * d2 * d23 * d3 * d4 * mly * y1 * y2 * y3 * y4 + d1 * d2 * d23 * d3 * d4 * mly * y1 * y3**2 * y4 + d14 * d2 * d23 * d3 * d4 * fe * x23 * y2**2 + 2 * d14 * d2 * d23 * d3 * d4 * fe * x23 * y2 * y3 + d14 * d2 * d23 * d3 * d4 * fe * x23 * y3**2 + d14 * d2 * d23 * d3 * d4 * fe * xe * y2**2 + 2 * d14 * d2 * d23 * d3 * d4 * fe * xe * y2 * y3 + d14 * d2 * d23 * d3 * d4 * fe * xe * y3**2 + d14 * d2 * d23 * d3 * d4 * fl * x23 * y2**2 + 2 * d14 * d2 * d23 * d3 * d4 * fl * x23 * y2 * y3 + d14 * d2 * d23 * d3 * d4 * fl * x23 * y3**2 + d14 * d2 * d23 * d3 * d4 * mly * y2**2 + 2 * d14 * d2 * d23 * d3 * d4 * mly * y2 * y3 + d14 * d2 * d23 * d3 * d4 * mly * y3**2) / (d1 * d14 * d2 * d23 * d3 * x14 * y2**2 + 2 * d1 * d14 * d2 * d23 * d3 * x14 * y2 * y3 + d1 * d14 * d2 * d23 * d3 * x14 * y3**2 + d1 * d14 * d2 * d23 * d3 * x23 * y2**2 + 2 * d1 * d14 * d2 * d23 * d3 * x23 * y2 * y3 + d1 * d14 * d2 * d23 * d3 * x23 * y3**2 + d1 * d14 * d2 * d23 * d4 * x14 * y1**2 + 2 * d1 * d14 * d2 * d23 * d4 * x14 * y1 * y4 + d1 * d14 * d2 * d23 * d4 * x14 * y4**2 + d1 * d14 * d2 * d23 * d4 * x23 * y1**2 + 2 * d1 * d14 * d2 * d23 * d4 * x23 * y1 * y4 + d1 * d14 * d2 * d23 * d4 * x23 * y4**2 + d1 * d14 * d2 * d3 * d4 * x14 * y1**2 * y2**2 + 2 * d1 * d14 * d2 * d3 * d4 * x14 * y1**2 * y2 * y3 + d1 * d14 * d2 * d3 * d4 * x14 * y1**2 * y3**2 + 2 * d1 * d14 * d2 * d3 * d4 * x14 * y1 * y2**2 * y4 + 4 * d1 * d14 * d2 * d3 * d4 * x14 * y1 * y2 * y3 * y4 + 2 * d1 * d14 * d2 * d3 * d4 * x14 * y1 * y3**2 * y4 + d1 * d14 * d2 * d3 * d4 * x14 * y2**2 * y4**2 + 2 * d1 * d14 * d2 * d3 * d4 * x14 * y2 * y3 * y4**2 + d1 * d14 * d2 * d3 * d4 * x14 * y3**2 * y4**2 + d1 * d14 * d2 * d3 * d4 * x23 * y1**2 * y2**2 + 2 * d1 * d14 * d2 * d3 * d4 * x23 * y1**2 * y2 * y3 + d1 * d14 * d2 * d3 * d4 * x23 * y1**2 * y3**2 + 2 * d1 * d14 * d2 * d3 * d4 * x23 * y1 * y2**2 * y4 + 4 * d1 * d14 * d2 * d3 * d4 * x23 * y1 * y2 * y3 * y4 + 2 * d1 * d14 * d2 * d3 * d4 * x23 * y1 * y3**2 * y4 + d1 * d14 * d2 * d3 * d4 * x23 * y2**2 * y4**2 + 2 * d1 * d14 * d2 * d3 * d4 * x23 * y2 * y3 * y4**2 + d1 * d14 * d2 * d3 * d4 * x23 * y3**2 * y4**2 + d1 * d14 * d23 * d3 * d4 * x14 * y1**2 + 2 * d1 * d14 * d23 * d3 * d4 * x14 * y1 * y4 + d1 * d14 * d23 * d3 * d4 * x14 * y4**2 + d1 * d14 * d23 * d3 * d4 * x23 * y1**2 + 2 * d1 * d14 * d23 * d3 * d4 * x23 * y1 * y4 + d1 * d14 * d23 * d3 * d4 * x23 * y4**2 + d1 * d2 * d23 * d3 * d4 * x14 * y1**2 * y2**2 + 2 * d1 * d2 * d23 * d3 * d4 * x14 * y1**2 * y2 * y3 + d1 * d2 * d23 * d3 * d4 * x14 * y1**2 * y3**2 + 2 * d1 * d2 * d23 * d3 * d4 * x14 * y1 * y2**2 * y4 + 4 * d1 * d2 * d23 * d3 * d4 * x14 * y1 * y2 * y3 * y4 + 2 * d1 * d2 * d23 * d3 * d4 * x14 * y1 * y3**2 * y4 + d1 * d2 * d23 * d3 * d4 * x14 * y2**2 * y4**2 + 2 * d1 * d2 * d23 * d3 * d4 * x14 * y2 * y3 * y4**2 + d1 * d2 * d23 * d3 * d4 * x14 * y3**2 * y4**2 + d1 * d2 * d23 * d3 * d4 * x23 * y1**2 * y2**2 + 2 * d1 * d2 * d23 * d3 * d4 * x23 * y1**2 * y2 * y3 + d1 * d2 * d23 * d3 * d4 * x23 * y1**2 * y3**2 + 2 * d1 * d2 * d23 * d3 * d4 * x23 * y1 * y2**2 * y4 + 4 * d1 * d2 * d23 * d3 * d4 * x23 * y1 * y2 * y3 * y4 + 2 * d1 * d2 * d23 * d3 * d4 * x23 * y1 * y3**2 * y4 + d1 * d2 * d23 * d3 * d4 * x23 * y2**2 * y4**2 + 2 * d1 * d2 * d23 * d3 * d4 * x23 * y2 * y3 * y4**2 + d1 * d2 * d23 * d3 * d4 * x23 * y3**2 * y4**2 + d14 * d2 * d23 * d3 * d4 * x14 * y2**2 + 2 * d14 * d2 * d23 * d3 * d4 * x14 * y2 * y3 + d14 * d2 * d23 * d3 * d4 * x14 * y3**2 + d14 * d2 * d23 * d3 * d4 * x23 * y2**2 + 2 * d14 * d2 * d23 * d3 * d4 * x23 * y2 * y3 + d14 * d2 * d23 * d3 * d4 * x23 * y3**2)
-    t14x = (d1 * d14 * d2 * d23 * d3 * fe * x23 * y1 * y2**2 + 2 * d1 * d14 * d2 * d23 * d3 * fe * x23 * y1 * y2 * y3 + d1 * d14 * d2 * d23 * d3 * fe * x23 * y1 * y3**2 + d1 * d14 * d2 * d23 * d3 * fe * xe * y1 * y2**2 + 2 * d1 * d14 * d2 * d23 * d3 * fe * xe * y1 * y2 * y3 + d1 * d14 * d2 * d23 * d3 * fe * xe * y1 * y3**2 + d1 * d14 * d2 * d23 * d3 * fl * x23 * y1 * y2**2 + 2 * d1 * d14 * d2 * d23 * d3 * fl * x23 * y1 * y2 * y3 + d1 * d14 * d2 * d23 * d3 * fl * x23 * y1 * y3**2 + d1 * d14 * d2 * d23 * d3 * mly * y1 * y2**2 + 2 * d1 * d14 * d2 * d23 * d3 * mly * y1 * y2 * y3 + d1 * d14 * d2 * d23 * d3 * mly * y1 * y3**2 - d1 * d14 * d2 * d23 * d4 * fe * x14 * y1**2 * y2 - 2 * d1 * d14 * d2 * d23 * d4 * fe * x14 * y1 * y2 * y4 - d1 * d14 * d2 * d23 * d4 * fe * x14 * y2 * y4**2 + d1 * d14 * d2 * d23 * d4 * fe * xe * y1**2 * y2 + 2 * d1 * d14 * d2 * d23 * d4 * fe * xe * y1 * y2 * y4 + d1 * d14 * d2 * d23 * d4 * fe * xe * y2 * y4**2 - d1 * d14 * d2 * d23 * d4 * fl * x14 * y1**2 * y2 - 2 * d1 * d14 * d2 * d23 * d4 * fl * x14 * y1 * y2 * y4 - d1 * d14 * d2 * d23 * d4 * fl * x14 * y2 * y4**2 - d1 * d14 * d2 * d23 * d4 * mlx * x14 * y1**2 - 2 * d1 * d14 * d2 * d23 * d4 * mlx * x14 * y1 * y4 - d1 * d14 * d2 * d23 * d4 * mlx * x14 * y4**2 - d1 * d14 * d2 * d23 * d4 * mlx * x23 * y1**2 - 2 * d1 * d14 * d2 * d23 * d4 * mlx * x23 * y1 * y4 - d1 * d14 * d2 * d23 * d4 * mlx * x23 * y4**2 + d1 * d14 * d2 * d23 * d4 * mly * y1**2 * y2 + 2 * d1 * d14 * d2 * d23 * d4 * mly * y1 * y2 * y4 + d1 * d14 * d2 * d23 * d4 * mly * y2 * y4**2 - d1 * d14 * d2 * d3 * d4 * mlx * x14 * y1**2 * y2**2 - 2 * d1 * d14 * d2 * d3 * d4 * mlx * x14 * y1**2 * y2 * y3 - d1 * d14 * d2 * d3 * d4 * mlx * x14 * y1**2 * y3**2 - 2 * d1 * d14 * d2 * d3 * d4 * mlx * x14 * y1 * y2**2 * y4 - 4 * d1 * d14 * d2 * d3 * d4 * mlx * x14 * y1 * y2 * y3 * y4 - 2 * d1 * d14 * d2 * d3 * d4 * mlx * x14 * y1 * y3**2 * y4 - d1 * d14 * d2 * d3 * d4 * mlx * x14 * y2**2 * y4**2 - 2 * d1 * d14 * d2 * d3 * d4 * mlx * x14 * y2 * y3 * y4**2 - d1 * d14 * d2 * d3 * d4 * mlx * x14 * y3**2 * y4**2 - d1 * d14 * d2 * d3 * d4 * mlx * x23 * y1**2 * y2**2 - 2 * d1 * d14 * d2 * d3 * d4 * mlx * x23 * y1**2 * y2 * y3 - d1 * d14 * d2 * d3 * d4 * mlx * x23 * y1**2 * y3**2 - 2 * d1 * d14 * d2 * d3 * d4 * mlx * x23 * y1 * y2**2 * y4 - 4 * d1 * d14 * d2 * d3 * d4 * mlx * x23 * y1 * y2 * y3 * y4 - 2 * d1 * d14 * d2 * d3 * d4 * mlx * x23 * y1 * y3**2 * y4 - d1 * d14 * d2 * d3 * d4 * mlx * x23 * y2**2 * y4**2 - 2 * d1 * d14 * d2 * d3 * d4 * mlx * x23 * y2 * y3 * y4**2 - d1 * d14 * d2 * d3 * d4 * mlx * x23 * y3**2 * y4**2 + d1 * d14 * d23 * d3 * d4 * fe * x14 * y1**2 * y3 + 2 * d1 * d14 * d23 * d3 * d4 * fe * x14 * y1 * y3 * y4 + d1 * d14 * d23 * d3 * d4 * fe * x14 * y3 * y4**2 - d1 * d14 * d23 * d3 * d4 * fe * xe * y1**2 * y3 - 2 * d1 * d14 * d23 * d3 * d4 * fe * xe * y1 * y3 * y4 - d1 * d14 * d23 * d3 * d4 * fe * xe * y3 * y4**2 + d1 * d14 * d23 * d3 * d4 * fl * x14 * y1**2 * y3 + 2 * d1 * d14 * d23 * d3 * d4 * fl * x14 * y1 * y3 * y4 + d1 * d14 * d23 * d3 * d4 * fl * x14 * y3 * y4**2 - d1 * d14 * d23 * d3 * d4 * mlx * x14 * y1**2 - 2 * d1 * d14 * d23 * d3 * d4 * mlx * x14 * y1 * y4 - d1 * d14 * d23 * d3 * d4 * mlx * x14 * y4**2 - d1 * d14 * d23 * d3 * d4 * mlx * x23 * y1**2 - 2 * d1 * d14 * d23 * d3 * d4 * mlx * x23 * y1 * y4 - d1 * d14 * d23 * d3 * d4 * mlx * x23 * y4**2 - d1 * d14 * d23 * d3 * d4 * mly * y1**2 * y3 - 2 * d1 * d14 * d23 * d3 * d4 * mly * y1 * y3 * y4 - d1 * d14 * d23 * d3 * d4 * mly * y3 * y4**2 - d14 * d2 * d23 * d3 * d4 * fe * x23 * y2**2 * y4 - 2 * d14 * d2 * d23 * d3 * d4 * fe * x23 * y2 * y3 * y4 - d14 * d2 * d23 * d3 * d4 * fe * x23 * y3**2 * y4 - d14 * d2 * d23 * d3 * d4 * fe * xe * y2**2 * y4 - 2 * d14 * d2 * d23 * d3 * d4 * fe * xe * y2 * y3 * y4 - d14 * d2 * d23 * d3 * d4 * fe * xe * y3**2 * y4 - d14 * d2 * d23 * d3 * d4 * fl * x23 * y2**2 * y4 - 2 * d14 * d2 * d23 * d3 * d4 * fl * x23 * y2 * y3 * y4 - d14 * d2 * d23 * d3 * d4 * fl * x23 * y3**2 * y4 - d14 * d2 * d23 * d3 * d4 * mly * y2**2 * y4 - 2 * d14 * d2 * d23 * d3 * d4 * mly * y2 * y3 * y4 - d14 * d2 * d23 * d3 * d4 * mly * y3**2 * y4) / (d1 * d14 * d2 * d23 * d3 * x14 * y2**2 + 2 * d1 * d14 * d2 * d23 * d3 * x14 * y2 * y3 + d1 * d14 * d2 * d23 * d3 * x14 * y3**2 + d1 * d14 * d2 * d23 * d3 * x23 * y2**2 + 2 * d1 * d14 * d2 * d23 * d3 * x23 * y2 * y3 + d1 * d14 * d2 * d23 * d3 * x23 * y3**2 + d1 * d14 * d2 * d23 * d4 * x14 * y1**2 + 2 * d1 * d14 * d2 * d23 * d4 * x14 * y1 * y4 + d1 * d14 * d2 * d23 * d4 * x14 * y4**2 + d1 * d14 * d2 * d23 * d4 * x23 * y1**2 + 2 * d1 * d14 * d2 * d23 * d4 * x23 * y1 * y4 + d1 * d14 * d2 * d23 * d4 * x23 * y4**2 + d1 * d14 * d2 * d3 * d4 * x14 * y1**2 * y2**2 + 2 * d1 * d14 * d2 * d3 * d4 * x14 * y1**2 * y2 * y3 + d1 * d14 * d2 * d3 * d4 * x14 * y1**2 * y3**2 + 2 * d1 * d14 * d2 * d3 * d4 * x14 * y1 * y2**2 * y4 + 4 * d1 * d14 * d2 * d3 * d4 * x14 * y1 * y2 * y3 * y4 + 2 * d1 * d14 * d2 * d3 * d4 * x14 * y1 * y3**2 * y4 + d1 * d14 * d2 * d3 * d4 * x14 * y2**2 * y4**2 + 2 * d1 * d14 * d2 * d3 * d4 * x14 * y2 * y3 * y4**2 + d1 * d14 * d2 * d3 * d4 * x14 * y3**2 * y4**2 + d1 * d14 * d2 * d3 * d4 * x23 * y1**2 * y2**2 + 2 * d1 * d14 * d2 * d3 * d4 * x23 * y1**2 * y2 * y3 + d1 * d14 * d2 * d3 * d4 * x23 * y1**2 * y3**2 + 2 * d1 * d14 * d2 * d3 * d4 * x23 * y1 * y2**2 * y4 + 4 * d1 * d14 * d2 * d3 * d4 * x23 * y1 * y2 * y3 * y4 + 2 * d1 * d14 * d2 * d3 * d4 * x23 * y1 * y3**2 * y4 + d1 * d14 * d2 * d3 * d4 * x23 * y2**2 * y4**2 + 2 * d1 * d14 * d2 * d3 * d4 * x23 * y2 * y3 * y4**2 + d1 * d14 * d2 * d3 * d4 * x23 * y3**2 * y4**2 + d1 * d14 * d23 * d3 * d4 * x14 * y1**2 + 2 * d1 * d14 * d23 * d3 * d4 * x14 * y1 * y4 + d1 * d14 * d23 * d3 * d4 * x14 * y4**2 + d1 * d14 * d23 * d3 * d4 * x23 * y1**2 + 2 * d1 * d14 * d23 * d3 * d4 * x23 * y1 * y4 + d1 * d14 * d23 * d3 * d4 * x23 * y4**2 + d1 * d2 * d23 * d3 * d4 * x14 * y1**2 * y2**2 + 2 * d1 * d2 * d23 * d3 * d4 * x14 * y1**2 * y2 * y3 + d1 * d2 * d23 * d3 * d4 * x14 * y1**2 * y3**2 + 2 * d1 * d2 * d23 * d3 * d4 * x14 * y1 * y2**2 * y4 + 4 * d1 * d2 * d23 * d3 * d4 * x14 * y1 * y2 * y3 * y4 + 2 * d1 * d2 * d23 * d3 * d4 * x14 * y1 * y3**2 * y4 + d1 * d2 * d23 * d3 * d4 * x14 * y2**2 * y4**2 + 2 * d1 * d2 * d23 * d3 * d4 * x14 * y2 * y3 * y4**2 + d1 * d2 * d23 * d3 * d4 * x14 * y3**2 * y4**2 + d1 * d2 * d23 * d3 * d4 * x23 * y1**2 * y2**2 + 2 * d1 * d2 * d23 * d3 * d4 * x23 * y1**2 * y2 * y3 + d1 * d2 * d23 * d3 * d4 * x23 * y1**2 * y3**2 + 2 * d1 * d2 * d23 * d3 * d4 * x23 * y1 * y2**2 * y4 + 4 * d1 * d2 * d23 * d3 * d4 * x23 * y1 * y2 * y3 * y4 + 2 * d1 * d2 * d23 * d3 * d4 * x23 * y1 * y3**2 * y4 + d1 * d2 * d23 * d3 * d4 * x23 * y2**2 * y4**2 + 2 * d1 * d2 * d23 * d3 * d4 * x23 * y2 * y3 * y4**2 + d1 * d2 * d23 * d3 * d4 * x23 * y3**2 * y4**2 + d14 * d2 * d23 * d3 * d4 * x14 * y2**2 + 2 * d14 * d2 * d23 * d3 * d4 * x14 * y2 * y3 + d14 * d2 * d23 * d3 * d4 * x14 * y3**2 + d14 * d2 * d23 * d3 * d4 * x23 * y2**2 + 2 * d14 * d2 * d23 * d3 * d4 * x23 * y2 * y3 + d14 * d2 * d23 * d3 * d4 * x23 * y3**2)
-    t23x = (d1 * d14 * d2 * d23 * d3 * fe * x23 * y1 * y2**2 + 2 * d1 * d14 * d2 * d23 * d3 * fe * x23 * y1 * y2 * y3 + d1 * d14 * d2 * d23 * d3 * fe * x23 * y1 * y3**2 + d1 * d14 * d2 * d23 * d3 * fe * xe * y1 * y2**2 + 2 * d1 * d14 * d2 * d23 * d3 * fe * xe * y1 * y2 * y3 + d1 * d14 * d2 * d23 * d3 * fe * xe * y1 * y3**2 + d1 * d14 * d2 * d23 * d3 * fl * x23 * y1 * y2**2 + 2 * d1 * d14 * d2 * d23 * d3 * fl * x23 * y1 * y2 * y3 + d1 * d14 * d2 * d23 * d3 * fl * x23 * y1 * y3**2 + d1 * d14 * d2 * d23 * d3 * mlx * x14 * y2**2 + 2 * d1 * d14 * d2 * d23 * d3 * mlx * x14 * y2 * y3 + d1 * d14 * d2 * d23 * d3 * mlx * x14 * y3**2 + d1 * d14 * d2 * d23 * d3 * mlx * x23 * y2**2 + 2 * d1 * d14 * d2 * d23 * d3 * mlx * x23 * y2 * y3 + d1 * d14 * d2 * d23 * d3 * mlx * x23 * y3**2 + d1 * d14 * d2 * d23 * d3 * mly * y1 * y2**2 + 2 * d1 * d14 * d2 * d23 * d3 * mly * y1 * y2 * y3 + d1 * d14 * d2 * d23 * d3 * mly * y1 * y3**2 - d1 * d14 * d2 * d23 * d4 * fe * x14 * y1**2 * y2 - 2 * d1 * d14 * d2 * d23 * d4 * fe * x14 * y1 * y2 * y4 - d1 * d14 * d2 * d23 * d4 * fe * x14 * y2 * y4**2 + d1 * d14 * d2 * d23 * d4 * fe * xe * y1**2 * y2 + 2 * d1 * d14 * d2 * d23 * d4 * fe * xe * y1 * y2 * y4 + d1 * d14 * d2 * d23 * d4 * fe * xe * y2 * y4**2 - d1 * d14 * d2 * d23 * d4 * fl * x14 * y1**2 * y2 - 2 * d1 * d14 * d2 * d23 * d4 * fl * x14 * y1 * y2 * y4 - d1 * d14 * d2 * d23 * d4 * fl * x14 * y2 * y4**2 + d1 * d14 * d2 * d23 * d4 * mly * y1**2 * y2 + 2 * d1 * d14 * d2 * d23 * d4 * mly * y1 * y2 * y4 + d1 * d14 * d2 * d23 * d4 * mly * y2 * y4**2 + d1 * d14 * d23 * d3 * d4 * fe * x14 * y1**2 * y3 + 2 * d1 * d14 * d23 * d3 * d4 * fe * x14 * y1 * y3 * y4 + d1 * d14 * d23 * d3 * d4 * fe * x14 * y3 * y4**2 - d1 * d14 * d23 * d3 * d4 * fe * xe * y1**2 * y3 - 2 * d1 * d14 * d23 * d3 * d4 * fe * xe * y1 * y3 * y4 - d1 * d14 * d23 * d3 * d4 * fe * xe * y3 * y4**2 + d1 * d14 * d23 * d3 * d4 * fl * x14 * y1**2 * y3 + 2 * d1 * d14 * d23 * d3 * d4 * fl * x14 * y1 * y3 * y4 + d1 * d14 * d23 * d3 * d4 * fl * x14 * y3 * y4**2 - d1 * d14 * d23 * d3 * d4 * mly * y1**2 * y3 - 2 * d1 * d14 * d23 * d3 * d4 * mly * y1 * y3 * y4 - d1 * d14 * d23 * d3 * d4 * mly * y3 * y4**2 + d1 * d2 * d23 * d3 * d4 * mlx * x14 * y1**2 * y2**2 + 2 * d1 * d2 * d23 * d3 * d4 * mlx * x14 * y1**2 * y2 * y3 + d1 * d2 * d23 * d3 * d4 * mlx * x14 * y1**2 * y3**2 + 2 * d1 * d2 * d23 * d3 * d4 * mlx * x14 * y1 * y2**2 * y4 + 4 * d1 * d2 * d23 * d3 * d4 * mlx * x14 * y1 * y2 * y3 * y4 + 2 * d1 * d2 * d23 * d3 * d4 * mlx * x14 * y1 * y3**2 * y4 + d1 * d2 * d23 * d3 * d4 * mlx * x14 * y2**2 * y4**2 + 2 * d1 * d2 * d23 * d3 * d4 * mlx * x14 * y2 * y3 * y4**2 + d1 * d2 * d23 * d3 * d4 * mlx * x14 * y3**2 * y4**2 + d1 * d2 * d23 * d3 * d4 * mlx * x23 * y1**2 * y2**2 + 2 * d1 * d2 * d23 * d3 * d4 * mlx * x23 * y1**2 * y2 * y3 + d1 * d2 * d23 * d3 * d4 * mlx * x23 * y1**2 * y3**2 + 2 * d1 * d2 * d23 * d3 * d4 * mlx * x23 * y1 * y2**2 * y4 + 4 * d1 * d2 * d23 * d3 * d4 * mlx * x23 * y1 * y2 * y3 * y4 + 2 * d1 * d2 * d23 * d3 * d4 * mlx * x23 * y1 * y3**2 * y4 + d1 * d2 * d23 * d3 * d4 * mlx * x23 * y2**2 * y4**2 + 2 * d1 * d2 * d23 * d3 * d4 * mlx * x23 * y2 * y3 * y4**2 + d1 * d2 * d23 * d3 * d4 * mlx * x23 * y3**2 * y4**2 - d14 * d2 * d23 * d3 * d4 * fe * x23 * y2**2 * y4 - 2 * d14 * d2 * d23 * d3 * d4 * fe * x23 * y2 * y3 * y4 - d14 * d2 * d23 * d3 * d4 * fe * x23 * y3**2 * y4 - d14 * d2 * d23 * d3 * d4 * fe * xe * y2**2 * y4 - 2 * d14 * d2 * d23 * d3 * d4 * fe * xe * y2 * y3 * y4 - d14 * d2 * d23 * d3 * d4 * fe * xe * y3**2 * y4 - d14 * d2 * d23 * d3 * d4 * fl * x23 * y2**2 * y4 - 2 * d14 * d2 * d23 * d3 * d4 * fl * x23 * y2 * y3 * y4 - d14 * d2 * d23 * d3 * d4 * fl * x23 * y3**2 * y4 + d14 * d2 * d23 * d3 * d4 * mlx * x14 * y2**2 + 2 * d14 * d2 * d23 * d3 * d4 * mlx * x14 * y2 * y3 + d14 * d2 * d23 * d3 * d4 * mlx * x14 * y3**2 + d14 * d2 * d23 * d3 * d4 * mlx * x23 * y2**2 + 2 * d14 * d2 * d23 * d3 * d4 * mlx * x23 * y2 * y3 + d14 * d2 * d23 * d3 * d4 * mlx * x23 * y3**2 - d14 * d2 * d23 * d3 * d4 * mly * y2**2 * y4 - 2 * d14 * d2 * d23 * d3 * d4 * mly * y2 * y3 * y4 - d14 * d2 * d23 * d3 * d4 * mly * y3**2 * y4) / (d1 * d14 * d2 * d23 * d3 * x14 * y2**2 + 2 * d1 * d14 * d2 * d23 * d3 * x14 * y2 * y3 + d1 * d14 * d2 * d23 * d3 * x14 * y3**2 + d1 * d14 * d2 * d23 * d3 * x23 * y2**2 + 2 * d1 * d14 * d2 * d23 * d3 * x23 * y2 * y3 + d1 * d14 * d2 * d23 * d3 * x23 * y3**2 + d1 * d14 * d2 * d23 * d4 * x14 * y1**2 + 2 * d1 * d14 * d2 * d23 * d4 * x14 * y1 * y4 + d1 * d14 * d2 * d23 * d4 * x14 * y4**2 + d1 * d14 * d2 * d23 * d4 * x23 * y1**2 + 2 * d1 * d14 * d2 * d23 * d4 * x23 * y1 * y4 + d1 * d14 * d2 * d23 * d4 * x23 * y4**2 + d1 * d14 * d2 * d3 * d4 * x14 * y1**2 * y2**2 + 2 * d1 * d14 * d2 * d3 * d4 * x14 * y1**2 * y2 * y3 + d1 * d14 * d2 * d3 * d4 * x14 * y1**2 * y3**2 + 2 * d1 * d14 * d2 * d3 * d4 * x14 * y1 * y2**2 * y4 + 4 * d1 * d14 * d2 * d3 * d4 * x14 * y1 * y2 * y3 * y4 + 2 * d1 * d14 * d2 * d3 * d4 * x14 * y1 * y3**2 * y4 + d1 * d14 * d2 * d3 * d4 * x14 * y2**2 * y4**2 + 2 * d1 * d14 * d2 * d3 * d4 * x14 * y2 * y3 * y4**2 + d1 * d14 * d2 * d3 * d4 * x14 * y3**2 * y4**2 + d1 * d14 * d2 * d3 * d4 * x23 * y1**2 * y2**2 + 2 * d1 * d14 * d2 * d3 * d4 * x23 * y1**2 * y2 * y3 + d1 * d14 * d2 * d3 * d4 * x23 * y1**2 * y3**2 + 2 * d1 * d14 * d2 * d3 * d4 * x23 * y1 * y2**2 * y4 + 4 * d1 * d14 * d2 * d3 * d4 * x23 * y1 * y2 * y3 * y4 + 2 * d1 * d14 * d2 * d3 * d4 * x23 * y1 * y3**2 * y4 + d1 * d14 * d2 * d3 * d4 * x23 * y2**2 * y4**2 + 2 * d1 * d14 * d2 * d3 * d4 * x23 * y2 * y3 * y4**2 + d1 * d14 * d2 * d3 * d4 * x23 * y3**2 * y4**2 + d1 * d14 * d23 * d3 * d4 * x14 * y1**2 + 2 * d1 * d14 * d23 * d3 * d4 * x14 * y1 * y4 + d1 * d14 * d23 * d3 * d4 * x14 * y4**2 + d1 * d14 * d23 * d3 * d4 * x23 * y1**2 + 2 * d1 * d14 * d23 * d3 * d4 * x23 * y1 * y4 + d1 * d14 * d23 * d3 * d4 * x23 * y4**2 + d1 * d2 * d23 * d3 * d4 * x14 * y1**2 * y2**2 + 2 * d1 * d2 * d23 * d3 * d4 * x14 * y1**2 * y2 * y3 + d1 * d2 * d23 * d3 * d4 * x14 * y1**2 * y3**2 + 2 * d1 * d2 * d23 * d3 * d4 * x14 * y1 * y2**2 * y4 + 4 * d1 * d2 * d23 * d3 * d4 * x14 * y1 * y2 * y3 * y4 + 2 * d1 * d2 * d23 * d3 * d4 * x14 * y1 * y3**2 * y4 + d1 * d2 * d23 * d3 * d4 * x14 * y2**2 * y4**2 + 2 * d1 * d2 * d23 * d3 * d4 * x14 * y2 * y3 * y4**2 + d1 * d2 * d23 * d3 * d4 * x14 * y3**2 * y4**2 + d1 * d2 * d23 * d3 * d4 * x23 * y1**2 * y2**2 + 2 * d1 * d2 * d23 * d3 * d4 * x23 * y1**2 * y2 * y3 + d1 * d2 * d23 * d3 * d4 * x23 * y1**2 * y3**2 + 2 * d1 * d2 * d23 * d3 * d4 * x23 * y1 * y2**2 * y4 + 4 * d1 * d2 * d23 * d3 * d4 * x23 * y1 * y2 * y3 * y4 + 2 * d1 * d2 * d23 * d3 * d4 * x23 * y1 * y3**2 * y4 + d1 * d2 * d23 * d3 * d4 * x23 * y2**2 * y4**2 + 2 * d1 * d2 * d23 * d3 * d4 * x23 * y2 * y3 * y4**2 + d1 * d2 * d23 * d3 * d4 * x23 * y3**2 * y4**2 + d14 * d2 * d23 * d3 * d4 * x14 * y2**2 + 2 * d14 * d2 * d23 * d3 * d4 * x14 * y2 * y3 + d14 * d2 * d23 * d3 * d4 * x14 * y3**2 + d14 * d2 * d23 * d3 * d4 * x23 * y2**2 + 2 * d14 * d2 * d23 * d3 * d4 * x23 * y2 * y3 + d14 * d2 * d23 * d3 * d4 * x23 * y3**2)
-    s1 = (d14 * d2 * d23 * d3 * fe * x23 * y2**2 + 2 * d14 * d2 * d23 * d3 * fe * x23 * y2 * y3 + d14 * d2 * d23 * d3 * fe * x23 * y3**2 + d14 * d2 * d23 * d3 * fe * xe * y2**2 + 2 * d14 * d2 * d23 * d3 * fe * xe * y2 * y3 + d14 * d2 * d23 * d3 * fe * xe * y3**2 + d14 * d2 * d23 * d3 * fl * x23 * y2**2 + 2 * d14 * d2 * d23 * d3 * fl * x23 * y2 * y3 + d14 * d2 * d23 * d3 * fl * x23 * y3**2 + d14 * d2 * d23 * d3 * mly * y2**2 + 2 * d14 * d2 * d23 * d3 * mly * y2 * y3 + d14 * d2 * d23 * d3 * mly * y3**2 - d14 * d2 * d23 * d4 * fe * x14 * y1 * y2 - d14 * d2 * d23 * d4 * fe * x14 * y2 * y4 + d14 * d2 * d23 * d4 * fe * x23 * y1 * y4 + d14 * d2 * d23 * d4 * fe * x23 * y4**2 + d14 * d2 * d23 * d4 * fe * xe * y1 * y2 + d14 * d2 * d23 * d4 * fe * xe * y1 * y4 + d14 * d2 * d23 * d4 * fe * xe * y2 * y4 + d14 * d2 * d23 * d4 * fe * xe * y4**2 - d14 * d2 * d23 * d4 * fl * x14 * y1 * y2 - d14 * d2 * d23 * d4 * fl * x14 * y2 * y4 + d14 * d2 * d23 * d4 * fl * x23 * y1 * y4 + d14 * d2 * d23 * d4 * fl * x23 * y4**2 - d14 * d2 * d23 * d4 * mlx * x14 * y1 - d14 * d2 * d23 * d4 * mlx * x14 * y4 - d14 * d2 * d23 * d4 * mlx * x23 * y1 - d14 * d2 * d23 * d4 * mlx * x23 * y4 + d14 * d2 * d23 * d4 * mly * y1 * y2 + d14 * d2 * d23 * d4 * mly * y1 * y4 + d14 * d2 * d23 * d4 * mly * y2 * y4 + d14 * d2 * d23 * d4 * mly * y4**2 + d14 * d2 * d3 * d4 * fe * x23 * y1 * y2**2 * y4 + 2 * d14 * d2 * d3 * d4 * fe * x23 * y1 * y2 * y3 * y4 + d14 * d2 * d3 * d4 * fe * x23 * y1 * y3**2 * y4 + d14 * d2 * d3 * d4 * fe * x23 * y2**2 * y4**2 + 2 * d14 * d2 * d3 * d4 * fe * x23 * y2 * y3 * y4**2 + d14 * d2 * d3 * d4 * fe * x23 * y3**2 * y4**2 + d14 * d2 * d3 * d4 * fe * xe * y1 * y2**2 * y4 + 2 * d14 * d2 * d3 * d4 * fe * xe * y1 * y2 * y3 * y4 + d14 * d2 * d3 * d4 * fe * xe * y1 * y3**2 * y4 + d14 * d2 * d3 * d4 * fe * xe * y2**2 * y4**2 + 2 * d14 * d2 * d3 * d4 * fe * xe * y2 * y3 * y4**2 + d14 * d2 * d3 * d4 * fe * xe * y3**2 * y4**2 + d14 * d2 * d3 * d4 * fl * x23 * y1 * y2**2 * y4 + 2 * d14 * d2 * d3 * d4 * fl * x23 * y1 * y2 * y3 * y4 + d14 * d2 * d3 * d4 * fl * x23 * y1 * y3**2 * y4 + d14 * d2 * d3 * d4 * fl * x23 * y2**2 * y4**2 + 2 * d14 * d2 * d3 * d4 * fl * x23 * y2 * y3 * y4**2 + d14 * d2 * d3 * d4 * fl * x23 * y3**2 * y4**2 - d14 * d2 * d3 * d4 * mlx * x14 * y1 * y2**2 - 2 * d14 * d2 * d3 * d4 * mlx * x14 * y1 * y2 * y3 - d14 * d2 * d3 * d4 * mlx * x14 * y1 * y3**2 - d14 * d2 * d3 * d4 * mlx * x14 * y2**2 * y4 - 2 * d14 * d2 * d3 * d4 * mlx * x14 * y2 * y3 * y4 - d14 * d2 * d3 * d4 * mlx * x14 * y3**2 * y4 - d14 * d2 * d3 * d4 * mlx * x23 * y1 * y2**2 - 2 * d14 * d2 * d3 * d4 * mlx * x23 * y1 * y2 * y3 - d14 * d2 * d3 * d4 * mlx * x23 * y1 * y3**2 - d14 * d2 * d3 * d4 * mlx * x23 * y2**2 * y4 - 2 * d14 * d2 * d3 * d4 * mlx * x23 * y2 * y3 * y4 - d14 * d2 * d3 * d4 * mlx * x23 * y3**2 * y4 + d14 * d2 * d3 * d4 * mly * y1 * y2**2 * y4 + 2 * d14 * d2 * d3 * d4 * mly * y1 * y2 * y3 * y4 + d14 * d2 * d3 * d4 * mly * y1 * y3**2 * y4 + d14 * d2 * d3 * d4 * mly * y2**2 * y4**2 + 2 * d14 * d2 * d3 * d4 * mly * y2 * y3 * y4**2 + d14 * d2 * d3 * d4 * mly * y3**2 * y4**2 + d14 * d23 * d3 * d4 * fe * x14 * y1 * y3 + d14 * d23 * d3 * d4 * fe * x14 * y3 * y4 + d14 * d23 * d3 * d4 * fe * x23 * y1 * y4 + d14 * d23 * d3 * d4 * fe * x23 * y4**2 - d14 * d23 * d3 * d4 * fe * xe * y1 * y3 + d14 * d23 * d3 * d4 * fe * xe * y1 * y4 - d14 * d23 * d3 * d4 * fe * xe * y3 * y4 + d14 * d23 * d3 * d4 * fe * xe * y4**2 + d14 * d23 * d3 * d4 * fl * x14 * y1 * y3 + d14 * d23 * d3 * d4 * fl * x14 * y3 * y4 + d14 * d23 * d3 * d4 * fl * x23 * y1 * y4 + d14 * d23 * d3 * d4 * fl * x23 * y4**2 - d14 * d23 * d3 * d4 * mlx * x14 * y1 - d14 * d23 * d3 * d4 * mlx * x14 * y4 - d14 * d23 * d3 * d4 * mlx * x23 * y1 - d14 * d23 * d3 * d4 * mlx * x23 * y4 - d14 * d23 * d3 * d4 * mly * y1 * y3 + d14 * d23 * d3 * d4 * mly * y1 * y4 - d14 * d23 * d3 * d4 * mly * y3 * y4 + d14 * d23 * d3 * d4 * mly * y4**2 + d2 * d23 * d3 * d4 * fe * x23 * y1 * y2**2 * y4 + 2 * d2 * d23 * d3 * d4 * fe * x23 * y1 * y2 * y3 * y4 + d2 * d23 * d3 * d4 * fe * x23 * y1 * y3**2 * y4 + d2 * d23 * d3 * d4 * fe * x23 * y2**2 * y4**2 + 2 * d2 * d23 * d3 * d4 * fe * x23 * y2 * y3 * y4**2 + d2 * d23 * d3 * d4 * fe * x23 * y3**2 * y4**2 + d2 * d23 * d3 * d4 * fe * xe * y1 * y2**2 * y4 + 2 * d2 * d23 * d3 * d4 * fe * xe * y1 * y2 * y3 * y4 + d2 * d23 * d3 * d4 * fe * xe * y1 * y3**2 * y4 + d2 * d23 * d3 * d4 * fe * xe * y2**2 * y4**2 + 2 * d2 * d23 * d3 * d4 * fe * xe * y2 * y3 * y4**2 + d2 * d23 * d3 * d4 * fe * xe * y3**2 * y4**2 + d2 * d23 * d3 * d4 * fl * x23 * y1 * y2**2 * y4 + 2 * d2 * d23 * d3 * d4 * fl * x23 * y1 * y2 * y3 * y4 + d2 * d23 * d3 * d4 * fl * x23 * y1 * y3**2 * y4 + d2 * d23 * d3 * d4 * fl * x23 * y2**2 * y4**2 + 2 * d2 * d23 * d3 * d4 * fl * x23 * y2 * y3 * y4**2 + d2 * d23 * d3 * d4 * fl * x23 * y3**2 * y4**2 + d2 * d23 * d3 * d4 * mly * y1 * y2**2 * y4 + 2 * d2 * d23 * d3 * d4 * mly * y1 * y2 * y3 * y4 + d2 * d23 * d3 * d4 * mly * y1 * y3**2 * y4 + d2 * d23 * d3 * d4 * mly * y2**2 * y4**2 + 2 * d2 * d23 * d3 * d4 * mly * y2 * y3 * y4**2 + d2 * d23 * d3 * d4 * mly * y3**2 * y4**2) / (d1 * d14 * d2 * d23 * d3 * x14 * y2**2 + 2 * d1 * d14 * d2 * d23 * d3 * x14 * y2 * y3 + d1 * d14 * d2 * d23 * d3 * x14 * y3**2 + d1 * d14 * d2 * d23 * d3 * x23 * y2**2 + 2 * d1 * d14 * d2 * d23 * d3 * x23 * y2 * y3 + d1 * d14 * d2 * d23 * d3 * x23 * y3**2 + d1 * d14 * d2 * d23 * d4 * x14 * y1**2 + 2 * d1 * d14 * d2 * d23 * d4 * x14 * y1 * y4 + d1 * d14 * d2 * d23 * d4 * x14 * y4**2 + d1 * d14 * d2 * d23 * d4 * x23 * y1**2 + 2 * d1 * d14 * d2 * d23 * d4 * x23 * y1 * y4 + d1 * d14 * d2 * d23 * d4 * x23 * y4**2 + d1 * d14 * d2 * d3 * d4 * x14 * y1**2 * y2**2 + 2 * d1 * d14 * d2 * d3 * d4 * x14 * y1**2 * y2 * y3 + d1 * d14 * d2 * d3 * d4 * x14 * y1**2 * y3**2 + 2 * d1 * d14 * d2 * d3 * d4 * x14 * y1 * y2**2 * y4 + 4 * d1 * d14 * d2 * d3 * d4 * x14 * y1 * y2 * y3 * y4 + 2 * d1 * d14 * d2 * d3 * d4 * x14 * y1 * y3**2 * y4 + d1 * d14 * d2 * d3 * d4 * x14 * y2**2 * y4**2 + 2 * d1 * d14 * d2 * d3 * d4 * x14 * y2 * y3 * y4**2 + d1 * d14 * d2 * d3 * d4 * x14 * y3**2 * y4**2 + d1 * d14 * d2 * d3 * d4 * x23 * y1**2 * y2**2 + 2 * d1 * d14 * d2 * d3 * d4 * x23 * y1**2 * y2 * y3 + d1 * d14 * d2 * d3 * d4 * x23 * y1**2 * y3**2 + 2 * d1 * d14 * d2 * d3 * d4 * x23 * y1 * y2**2 * y4 + 4 * d1 * d14 * d2 * d3 * d4 * x23 * y1 * y2 * y3 * y4 + 2 * d1 * d14 * d2 * d3 * d4 * x23 * y1 * y3**2 * y4 + d1 * d14 * d2 * d3 * d4 * x23 * y2**2 * y4**2 + 2 * d1 * d14 * d2 * d3 * d4 * x23 * y2 * y3 * y4**2 + d1 * d14 * d2 * d3 * d4 * x23 * y3**2 * y4**2 + d1 * d14 * d23 * d3 * d4 * x14 * y1**2 + 2 * d1 * d14 * d23 * d3 * d4 * x14 * y1 * y4 + d1 * d14 * d23 * d3 * d4 * x14 * y4**2 + d1 * d14 * d23 * d3 * d4 * x23 * y1**2 + 2 * d1 * d14 * d23 * d3 * d4 * x23 * y1 * y4 + d1 * d14 * d23 * d3 * d4 * x23 * y4**2 + d1 * d2 * d23 * d3 * d4 * x14 * y1**2 * y2**2 + 2 * d1 * d2 * d23 * d3 * d4 * x14 * y1**2 * y2 * y3 + d1 * d2 * d23 * d3 * d4 * x14 * y1**2 * y3**2 + 2 * d1 * d2 * d23 * d3 * d4 * x14 * y1 * y2**2 * y4 + 4 * d1 * d2 * d23 * d3 * d4 * x14 * y1 * y2 * y3 * y4 + 2 * d1 * d2 * d23 * d3 * d4 * x14 * y1 * y3**2 * y4 + d1 * d2 * d23 * d3 * d4 * x14 * y2**2 * y4**2 + 2 * d1 * d2 * d23 * d3 * d4 * x14 * y2 * y3 * y4**2 + d1 * d2 * d23 * d3 * d4 * x14 * y3**2 * y4**2 + d1 * d2 * d23 * d3 * d4 * x23 * y1**2 * y2**2 + 2 * d1 * d2 * d23 * d3 * d4 * x23 * y1**2 * y2 * y3 + d1 * d2 * d23 * d3 * d4 * x23 * y1**2 * y3**2 + 2 * d1 * d2 * d23 * d3 * d4 * x23 * y1 * y2**2 * y4 + 4 * d1 * d2 * d23 * d3 * d4 * x23 * y1 * y2 * y3 * y4 + 2 * d1 * d2 * d23 * d3 * d4 * x23 * y1 * y3**2 * y4 + d1 * d2 * d23 * d3 * d4 * x23 * y2**2 * y4**2 + 2 * d1 * d2 * d23 * d3 * d4 * x23 * y2 * y3 * y4**2 + d1 * d2 * d23 * d3 * d4 * x23 * y3**2 * y4**2 + d14 * d2 * d23 * d3 * d4 * x14 * y2**2 + 2 * d14 * d2 * d23 * d3 * d4 * x14 * y2 * y3 + d14 * d2 * d23 * d3 * d4 * x14 * y3**2 + d14 * d2 * d23 * d3 * d4 * x23 * y2**2 + 2 * d14 * d2 * d23 * d3 * d4 * x23 * y2 * y3 + d14 * d2 * d23 * d3 * d4 * x23 * y3**2)
-    s2 = (d1 * d14 * d23 * d3 * fe * x14 * y2 * y3 + d1 * d14 * d23 * d3 * fe * x14 * y3**2 - d1 * d14 * d23 * d3 * fe * x23 * y1 * y2 - d1 * d14 * d23 * d3 * fe * x23 * y1 * y3 - d1 * d14 * d23 * d3 * fe * xe * y1 * y2 - d1 * d14 * d23 * d3 * fe * xe * y1 * y3 - d1 * d14 * d23 * d3 * fe * xe * y2 * y3 - d1 * d14 * d23 * d3 * fe * xe * y3**2 + d1 * d14 * d23 * d3 * fl * x14 * y2 * y3 + d1 * d14 * d23 * d3 * fl * x14 * y3**2 - d1 * d14 * d23 * d3 * fl * x23 * y1 * y2 - d1 * d14 * d23 * d3 * fl * x23 * y1 * y3 - d1 * d14 * d23 * d3 * mlx * x14 * y2 - d1 * d14 * d23 * d3 * mlx * x14 * y3 - d1 * d14 * d23 * d3 * mlx * x23 * y2 - d1 * d14 * d23 * d3 * mlx * x23 * y3 - d1 * d14 * d23 * d3 * mly * y1 * y2 - d1 * d14 * d23 * d3 * mly * y1 * y3 - d1 * d14 * d23 * d3 * mly * y2 * y3 - d1 * d14 * d23 * d3 * mly * y3**2 + d1 * d14 * d23 * d4 * fe * x14 * y1**2 + 2 * d1 * d14 * d23 * d4 * fe * x14 * y1 * y4 + d1 * d14 * d23 * d4 * fe * x14 * y4**2 - d1 * d14 * d23 * d4 * fe * xe * y1**2 - 2 * d1 * d14 * d23 * d4 * fe * xe * y1 * y4 - d1 * d14 * d23 * d4 * fe * xe * y4**2 + d1 * d14 * d23 * d4 * fl * x14 * y1**2 + 2 * d1 * d14 * d23 * d4 * fl * x14 * y1 * y4 + d1 * d14 * d23 * d4 * fl * x14 * y4**2 - d1 * d14 * d23 * d4 * mly * y1**2 - 2 * d1 * d14 * d23 * d4 * mly * y1 * y4 - d1 * d14 * d23 * d4 * mly * y4**2 + d1 * d14 * d3 * d4 * fe * x14 * y1**2 * y2 * y3 + d1 * d14 * d3 * d4 * fe * x14 * y1**2 * y3**2 + 2 * d1 * d14 * d3 * d4 * fe * x14 * y1 * y2 * y3 * y4 + 2 * d1 * d14 * d3 * d4 * fe * x14 * y1 * y3**2 * y4 + d1 * d14 * d3 * d4 * fe * x14 * y2 * y3 * y4**2 + d1 * d14 * d3 * d4 * fe * x14 * y3**2 * y4**2 - d1 * d14 * d3 * d4 * fe * xe * y1**2 * y2 * y3 - d1 * d14 * d3 * d4 * fe * xe * y1**2 * y3**2 - 2 * d1 * d14 * d3 * d4 * fe * xe * y1 * y2 * y3 * y4 - 2 * d1 * d14 * d3 * d4 * fe * xe * y1 * y3**2 * y4 - d1 * d14 * d3 * d4 * fe * xe * y2 * y3 * y4**2 - d1 * d14 * d3 * d4 * fe * xe * y3**2 * y4**2 + d1 * d14 * d3 * d4 * fl * x14 * y1**2 * y2 * y3 + d1 * d14 * d3 * d4 * fl * x14 * y1**2 * y3**2 + 2 * d1 * d14 * d3 * d4 * fl * x14 * y1 * y2 * y3 * y4 + 2 * d1 * d14 * d3 * d4 * fl * x14 * y1 * y3**2 * y4 + d1 * d14 * d3 * d4 * fl * x14 * y2 * y3 * y4**2 + d1 * d14 * d3 * d4 * fl * x14 * y3**2 * y4**2 - d1 * d14 * d3 * d4 * mly * y1**2 * y2 * y3 - d1 * d14 * d3 * d4 * mly * y1**2 * y3**2 - 2 * d1 * d14 * d3 * d4 * mly * y1 * y2 * y3 * y4 - 2 * d1 * d14 * d3 * d4 * mly * y1 * y3**2 * y4 - d1 * d14 * d3 * d4 * mly * y2 * y3 * y4**2 - d1 * d14 * d3 * d4 * mly * y3**2 * y4**2 + d1 * d23 * d3 * d4 * fe * x14 * y1**2 * y2 * y3 + d1 * d23 * d3 * d4 * fe * x14 * y1**2 * y3**2 + 2 * d1 * d23 * d3 * d4 * fe * x14 * y1 * y2 * y3 * y4 + 2 * d1 * d23 * d3 * d4 * fe * x14 * y1 * y3**2 * y4 + d1 * d23 * d3 * d4 * fe * x14 * y2 * y3 * y4**2 + d1 * d23 * d3 * d4 * fe * x14 * y3**2 * y4**2 - d1 * d23 * d3 * d4 * fe * xe * y1**2 * y2 * y3 - d1 * d23 * d3 * d4 * fe * xe * y1**2 * y3**2 - 2 * d1 * d23 * d3 * d4 * fe * xe * y1 * y2 * y3 * y4 - 2 * d1 * d23 * d3 * d4 * fe * xe * y1 * y3**2 * y4 - d1 * d23 * d3 * d4 * fe * xe * y2 * y3 * y4**2 - d1 * d23 * d3 * d4 * fe * xe * y3**2 * y4**2 + d1 * d23 * d3 * d4 * fl * x14 * y1**2 * y2 * y3 + d1 * d23 * d3 * d4 * fl * x14 * y1**2 * y3**2 + 2 * d1 * d23 * d3 * d4 * fl * x14 * y1 * y2 * y3 * y4 + 2 * d1 * d23 * d3 * d4 * fl * x14 * y1 * y3**2 * y4 + d1 * d23 * d3 * d4 * fl * x14 * y2 * y3 * y4**2 + d1 * d23 * d3 * d4 * fl * x14 * y3**2 * y4**2 - d1 * d23 * d3 * d4 * mlx * x14 * y1**2 * y2 - d1 * d23 * d3 * d4 * mlx * x14 * y1**2 * y3 - 2 * d1 * d23 * d3 * d4 * mlx * x14 * y1 * y2 * y4 - 2 * d1 * d23 * d3 * d4 * mlx * x14 * y1 * y3 * y4 - d1 * d23 * d3 * d4 * mlx * x14 * y2 * y4**2 - d1 * d23 * d3 * d4 * mlx * x14 * y3 * y4**2 - d1 * d23 * d3 * d4 * mlx * x23 * y1**2 * y2 - d1 * d23 * d3 * d4 * mlx * x23 * y1**2 * y3 - 2 * d1 * d23 * d3 * d4 * mlx * x23 * y1 * y2 * y4 - 2 * d1 * d23 * d3 * d4 * mlx * x23 * y1 * y3 * y4 - d1 * d23 * d3 * d4 * mlx * x23 * y2 * y4**2 - d1 * d23 * d3 * d4 * mlx * x23 * y3 * y4**2 - d1 * d23 * d3 * d4 * mly * y1**2 * y2 * y3 - d1 * d23 * d3 * d4 * mly * y1**2 * y3**2 - 2 * d1 * d23 * d3 * d4 * mly * y1 * y2 * y3 * y4 - 2 * d1 * d23 * d3 * d4 * mly * y1 * y3**2 * y4 - d1 * d23 * d3 * d4 * mly * y2 * y3 * y4**2 - d1 * d23 * d3 * d4 * mly * y3**2 * y4**2 + d14 * d23 * d3 * d4 * fe * x14 * y2 * y3 + d14 * d23 * d3 * d4 * fe * x14 * y3**2 + d14 * d23 * d3 * d4 * fe * x23 * y2 * y4 + d14 * d23 * d3 * d4 * fe * x23 * y3 * y4 - d14 * d23 * d3 * d4 * fe * xe * y2 * y3 + d14 * d23 * d3 * d4 * fe * xe * y2 * y4 - d14 * d23 * d3 * d4 * fe * xe * y3**2 + d14 * d23 * d3 * d4 * fe * xe * y3 * y4 + d14 * d23 * d3 * d4 * fl * x14 * y2 * y3 + d14 * d23 * d3 * d4 * fl * x14 * y3**2 + d14 * d23 * d3 * d4 * fl * x23 * y2 * y4 + d14 * d23 * d3 * d4 * fl * x23 * y3 * y4 - d14 * d23 * d3 * d4 * mlx * x14 * y2 - d14 * d23 * d3 * d4 * mlx * x14 * y3 - d14 * d23 * d3 * d4 * mlx * x23 * y2 - d14 * d23 * d3 * d4 * mlx * x23 * y3 - d14 * d23 * d3 * d4 * mly * y2 * y3 + d14 * d23 * d3 * d4 * mly * y2 * y4 - d14 * d23 * d3 * d4 * mly * y3**2 + d14 * d23 * d3 * d4 * mly * y3 * y4) / (d1 * d14 * d2 * d23 * d3 * x14 * y2**2 + 2 * d1 * d14 * d2 * d23 * d3 * x14 * y2 * y3 + d1 * d14 * d2 * d23 * d3 * x14 * y3**2 + d1 * d14 * d2 * d23 * d3 * x23 * y2**2 + 2 * d1 * d14 * d2 * d23 * d3 * x23 * y2 * y3 + d1 * d14 * d2 * d23 * d3 * x23 * y3**2 + d1 * d14 * d2 * d23 * d4 * x14 * y1**2 + 2 * d1 * d14 * d2 * d23 * d4 * x14 * y1 * y4 + d1 * d14 * d2 * d23 * d4 * x14 * y4**2 + d1 * d14 * d2 * d23 * d4 * x23 * y1**2 + 2 * d1 * d14 * d2 * d23 * d4 * x23 * y1 * y4 + d1 * d14 * d2 * d23 * d4 * x23 * y4**2 + d1 * d14 * d2 * d3 * d4 * x14 * y1**2 * y2**2 + 2 * d1 * d14 * d2 * d3 * d4 * x14 * y1**2 * y2 * y3 + d1 * d14 * d2 * d3 * d4 * x14 * y1**2 * y3**2 + 2 * d1 * d14 * d2 * d3 * d4 * x14 * y1 * y2**2 * y4 + 4 * d1 * d14 * d2 * d3 * d4 * x14 * y1 * y2 * y3 * y4 + 2 * d1 * d14 * d2 * d3 * d4 * x14 * y1 * y3**2 * y4 + d1 * d14 * d2 * d3 * d4 * x14 * y2**2 * y4**2 + 2 * d1 * d14 * d2 * d3 * d4 * x14 * y2 * y3 * y4**2 + d1 * d14 * d2 * d3 * d4 * x14 * y3**2 * y4**2 + d1 * d14 * d2 * d3 * d4 * x23 * y1**2 * y2**2 + 2 * d1 * d14 * d2 * d3 * d4 * x23 * y1**2 * y2 * y3 + d1 * d14 * d2 * d3 * d4 * x23 * y1**2 * y3**2 + 2 * d1 * d14 * d2 * d3 * d4 * x23 * y1 * y2**2 * y4 + 4 * d1 * d14 * d2 * d3 * d4 * x23 * y1 * y2 * y3 * y4 + 2 * d1 * d14 * d2 * d3 * d4 * x23 * y1 * y3**2 * y4 + d1 * d14 * d2 * d3 * d4 * x23 * y2**2 * y4**2 + 2 * d1 * d14 * d2 * d3 * d4 * x23 * y2 * y3 * y4**2 + d1 * d14 * d2 * d3 * d4 * x23 * y3**2 * y4**2 + d1 * d14 * d23 * d3 * d4 * x14 * y1**2 + 2 * d1 * d14 * d23 * d3 * d4 * x14 * y1 * y4 + d1 * d14 * d23 * d3 * d4 * x14 * y4**2 + d1 * d14 * d23 * d3 * d4 * x23 * y1**2 + 2 * d1 * d14 * d23 * d3 * d4 * x23 * y1 * y4 + d1 * d14 * d23 * d3 * d4 * x23 * y4**2 + d1 * d2 * d23 * d3 * d4 * x14 * y1**2 * y2**2 + 2 * d1 * d2 * d23 * d3 * d4 * x14 * y1**2 * y2 * y3 + d1 * d2 * d23 * d3 * d4 * x14 * y1**2 * y3**2 + 2 * d1 * d2 * d23 * d3 * d4 * x14 * y1 * y2**2 * y4 + 4 * d1 * d2 * d23 * d3 * d4 * x14 * y1 * y2 * y3 * y4 + 2 * d1 * d2 * d23 * d3 * d4 * x14 * y1 * y3**2 * y4 + d1 * d2 * d23 * d3 * d4 * x14 * y2**2 * y4**2 + 2 * d1 * d2 * d23 * d3 * d4 * x14 * y2 * y3 * y4**2 + d1 * d2 * d23 * d3 * d4 * x14 * y3**2 * y4**2 + d1 * d2 * d23 * d3 * d4 * x23 * y1**2 * y2**2 + 2 * d1 * d2 * d23 * d3 * d4 * x23 * y1**2 * y2 * y3 + d1 * d2 * d23 * d3 * d4 * x23 * y1**2 * y3**2 + 2 * d1 * d2 * d23 * d3 * d4 * x23 * y1 * y2**2 * y4 + 4 * d1 * d2 * d23 * d3 * d4 * x23 * y1 * y2 * y3 * y4 + 2 * d1 * d2 * d23 * d3 * d4 * x23 * y1 * y3**2 * y4 + d1 * d2 * d23 * d3 * d4 * x23 * y2**2 * y4**2 + 2 * d1 * d2 * d23 * d3 * d4 * x23 * y2 * y3 * y4**2 + d1 * d2 * d23 * d3 * d4 * x23 * y3**2 * y4**2 + d14 * d2 * d23 * d3 * d4 * x14 * y2**2 + 2 * d14 * d2 * d23 * d3 * d4 * x14 * y2 * y3 + d14 * d2 * d23 * d3 * d4 * x14 * y3**2 + d14 * d2 * d23 * d3 * d4 * x23 * y2**2 + 2 * d14 * d2 * d23 * d3 * d4 * x23 * y2 * y3 + d14 * d2 * d23 * d3 * d4 * x23 * y3**2)
-    s3 = (d1 * d14 * d2 * d23 * fe * x14 * y2**2 + d1 * d14 * d2 * d23 * fe * x14 * y2 * y3 + d1 * d14 * d2 * d23 * fe * x23 * y1 * y2 + d1 * d14 * d2 * d23 * fe * x23 * y1 * y3 + d1 * d14 * d2 * d23 * fe * xe * y1 * y2 + d1 * d14 * d2 * d23 * fe * xe * y1 * y3 - d1 * d14 * d2 * d23 * fe * xe * y2**2 - d1 * d14 * d2 * d23 * fe * xe * y2 * y3 + d1 * d14 * d2 * d23 * fl * x14 * y2**2 + d1 * d14 * d2 * d23 * fl * x14 * y2 * y3 + d1 * d14 * d2 * d23 * fl * x23 * y1 * y2 + d1 * d14 * d2 * d23 * fl * x23 * y1 * y3 + d1 * d14 * d2 * d23 * mlx * x14 * y2 + d1 * d14 * d2 * d23 * mlx * x14 * y3 + d1 * d14 * d2 * d23 * mlx * x23 * y2 + d1 * d14 * d2 * d23 * mlx * x23 * y3 + d1 * d14 * d2 * d23 * mly * y1 * y2 + d1 * d14 * d2 * d23 * mly * y1 * y3 - d1 * d14 * d2 * d23 * mly * y2**2 - d1 * d14 * d2 * d23 * mly * y2 * y3 + d1 * d14 * d2 * d4 * fe * x14 * y1**2 * y2**2 + d1 * d14 * d2 * d4 * fe * x14 * y1**2 * y2 * y3 + 2 * d1 * d14 * d2 * d4 * fe * x14 * y1 * y2**2 * y4 + 2 * d1 * d14 * d2 * d4 * fe * x14 * y1 * y2 * y3 * y4 + d1 * d14 * d2 * d4 * fe * x14 * y2**2 * y4**2 + d1 * d14 * d2 * d4 * fe * x14 * y2 * y3 * y4**2 - d1 * d14 * d2 * d4 * fe * xe * y1**2 * y2**2 - d1 * d14 * d2 * d4 * fe * xe * y1**2 * y2 * y3 - 2 * d1 * d14 * d2 * d4 * fe * xe * y1 * y2**2 * y4 - 2 * d1 * d14 * d2 * d4 * fe * xe * y1 * y2 * y3 * y4 - d1 * d14 * d2 * d4 * fe * xe * y2**2 * y4**2 - d1 * d14 * d2 * d4 * fe * xe * y2 * y3 * y4**2 + d1 * d14 * d2 * d4 * fl * x14 * y1**2 * y2**2 + d1 * d14 * d2 * d4 * fl * x14 * y1**2 * y2 * y3 + 2 * d1 * d14 * d2 * d4 * fl * x14 * y1 * y2**2 * y4 + 2 * d1 * d14 * d2 * d4 * fl * x14 * y1 * y2 * y3 * y4 + d1 * d14 * d2 * d4 * fl * x14 * y2**2 * y4**2 + d1 * d14 * d2 * d4 * fl * x14 * y2 * y3 * y4**2 - d1 * d14 * d2 * d4 * mly * y1**2 * y2**2 - d1 * d14 * d2 * d4 * mly * y1**2 * y2 * y3 - 2 * d1 * d14 * d2 * d4 * mly * y1 * y2**2 * y4 - 2 * d1 * d14 * d2 * d4 * mly * y1 * y2 * y3 * y4 - d1 * d14 * d2 * d4 * mly * y2**2 * y4**2 - d1 * d14 * d2 * d4 * mly * y2 * y3 * y4**2 + d1 * d14 * d23 * d4 * fe * x14 * y1**2 + 2 * d1 * d14 * d23 * d4 * fe * x14 * y1 * y4 + d1 * d14 * d23 * d4 * fe * x14 * y4**2 - d1 * d14 * d23 * d4 * fe * xe * y1**2 - 2 * d1 * d14 * d23 * d4 * fe * xe * y1 * y4 - d1 * d14 * d23 * d4 * fe * xe * y4**2 + d1 * d14 * d23 * d4 * fl * x14 * y1**2 + 2 * d1 * d14 * d23 * d4 * fl * x14 * y1 * y4 + d1 * d14 * d23 * d4 * fl * x14 * y4**2 - d1 * d14 * d23 * d4 * mly * y1**2 - 2 * d1 * d14 * d23 * d4 * mly * y1 * y4 - d1 * d14 * d23 * d4 * mly * y4**2 + d1 * d2 * d23 * d4 * fe * x14 * y1**2 * y2**2 + d1 * d2 * d23 * d4 * fe * x14 * y1**2 * y2 * y3 + 2 * d1 * d2 * d23 * d4 * fe * x14 * y1 * y2**2 * y4 + 2 * d1 * d2 * d23 * d4 * fe * x14 * y1 * y2 * y3 * y4 + d1 * d2 * d23 * d4 * fe * x14 * y2**2 * y4**2 + d1 * d2 * d23 * d4 * fe * x14 * y2 * y3 * y4**2 - d1 * d2 * d23 * d4 * fe * xe * y1**2 * y2**2 - d1 * d2 * d23 * d4 * fe * xe * y1**2 * y2 * y3 - 2 * d1 * d2 * d23 * d4 * fe * xe * y1 * y2**2 * y4 - 2 * d1 * d2 * d23 * d4 * fe * xe * y1 * y2 * y3 * y4 - d1 * d2 * d23 * d4 * fe * xe * y2**2 * y4**2 - d1 * d2 * d23 * d4 * fe * xe * y2 * y3 * y4**2 + d1 * d2 * d23 * d4 * fl * x14 * y1**2 * y2**2 + d1 * d2 * d23 * d4 * fl * x14 * y1**2 * y2 * y3 + 2 * d1 * d2 * d23 * d4 * fl * x14 * y1 * y2**2 * y4 + 2 * d1 * d2 * d23 * d4 * fl * x14 * y1 * y2 * y3 * y4 + d1 * d2 * d23 * d4 * fl * x14 * y2**2 * y4**2 + d1 * d2 * d23 * d4 * fl * x14 * y2 * y3 * y4**2 + d1 * d2 * d23 * d4 * mlx * x14 * y1**2 * y2 + d1 * d2 * d23 * d4 * mlx * x14 * y1**2 * y3 + 2 * d1 * d2 * d23 * d4 * mlx * x14 * y1 * y2 * y4 + 2 * d1 * d2 * d23 * d4 * mlx * x14 * y1 * y3 * y4 + d1 * d2 * d23 * d4 * mlx * x14 * y2 * y4**2 + d1 * d2 * d23 * d4 * mlx * x14 * y3 * y4**2 + d1 * d2 * d23 * d4 * mlx * x23 * y1**2 * y2 + d1 * d2 * d23 * d4 * mlx * x23 * y1**2 * y3 + 2 * d1 * d2 * d23 * d4 * mlx * x23 * y1 * y2 * y4 + 2 * d1 * d2 * d23 * d4 * mlx * x23 * y1 * y3 * y4 + d1 * d2 * d23 * d4 * mlx * x23 * y2 * y4**2 + d1 * d2 * d23 * d4 * mlx * x23 * y3 * y4**2 - d1 * d2 * d23 * d4 * mly * y1**2 * y2**2 - d1 * d2 * d23 * d4 * mly * y1**2 * y2 * y3 - 2 * d1 * d2 * d23 * d4 * mly * y1 * y2**2 * y4 - 2 * d1 * d2 * d23 * d4 * mly * y1 * y2 * y3 * y4 - d1 * d2 * d23 * d4 * mly * y2**2 * y4**2 - d1 * d2 * d23 * d4 * mly * y2 * y3 * y4**2 + d14 * d2 * d23 * d4 * fe * x14 * y2**2 + d14 * d2 * d23 * d4 * fe * x14 * y2 * y3 - d14 * d2 * d23 * d4 * fe * x23 * y2 * y4 - d14 * d2 * d23 * d4 * fe * x23 * y3 * y4 - d14 * d2 * d23 * d4 * fe * xe * y2**2 - d14 * d2 * d23 * d4 * fe * xe * y2 * y3 - d14 * d2 * d23 * d4 * fe * xe * y2 * y4 - d14 * d2 * d23 * d4 * fe * xe * y3 * y4 + d14 * d2 * d23 * d4 * fl * x14 * y2**2 + d14 * d2 * d23 * d4 * fl * x14 * y2 * y3 - d14 * d2 * d23 * d4 * fl * x23 * y2 * y4 - d14 * d2 * d23 * d4 * fl * x23 * y3 * y4 + d14 * d2 * d23 * d4 * mlx * x14 * y2 + d14 * d2 * d23 * d4 * mlx * x14 * y3 + d14 * d2 * d23 * d4 * mlx * x23 * y2 + d14 * d2 * d23 * d4 * mlx * x23 * y3 - d14 * d2 * d23 * d4 * mly * y2**2 - d14 * d2 * d23 * d4 * mly * y2 * y3 - d14 * d2 * d23 * d4 * mly * y2 * y4 - d14 * d2 * d23 * d4 * mly * y3 * y4) / (d1 * d14 * d2 * d23 * d3 * x14 * y2**2 + 2 * d1 * d14 * d2 * d23 * d3 * x14 * y2 * y3 + d1 * d14 * d2 * d23 * d3 * x14 * y3**2 + d1 * d14 * d2 * d23 * d3 * x23 * y2**2 + 2 * d1 * d14 * d2 * d23 * d3 * x23 * y2 * y3 + d1 * d14 * d2 * d23 * d3 * x23 * y3**2 + d1 * d14 * d2 * d23 * d4 * x14 * y1**2 + 2 * d1 * d14 * d2 * d23 * d4 * x14 * y1 * y4 + d1 * d14 * d2 * d23 * d4 * x14 * y4**2 + d1 * d14 * d2 * d23 * d4 * x23 * y1**2 + 2 * d1 * d14 * d2 * d23 * d4 * x23 * y1 * y4 + d1 * d14 * d2 * d23 * d4 * x23 * y4**2 + d1 * d14 * d2 * d3 * d4 * x14 * y1**2 * y2**2 + 2 * d1 * d14 * d2 * d3 * d4 * x14 * y1**2 * y2 * y3 + d1 * d14 * d2 * d3 * d4 * x14 * y1**2 * y3**2 + 2 * d1 * d14 * d2 * d3 * d4 * x14 * y1 * y2**2 * y4 + 4 * d1 * d14 * d2 * d3 * d4 * x14 * y1 * y2 * y3 * y4 + 2 * d1 * d14 * d2 * d3 * d4 * x14 * y1 * y3**2 * y4 + d1 * d14 * d2 * d3 * d4 * x14 * y2**2 * y4**2 + 2 * d1 * d14 * d2 * d3 * d4 * x14 * y2 * y3 * y4**2 + d1 * d14 * d2 * d3 * d4 * x14 * y3**2 * y4**2 + d1 * d14 * d2 * d3 * d4 * x23 * y1**2 * y2**2 + 2 * d1 * d14 * d2 * d3 * d4 * x23 * y1**2 * y2 * y3 + d1 * d14 * d2 * d3 * d4 * x23 * y1**2 * y3**2 + 2 * d1 * d14 * d2 * d3 * d4 * x23 * y1 * y2**2 * y4 + 4 * d1 * d14 * d2 * d3 * d4 * x23 * y1 * y2 * y3 * y4 + 2 * d1 * d14 * d2 * d3 * d4 * x23 * y1 * y3**2 * y4 + d1 * d14 * d2 * d3 * d4 * x23 * y2**2 * y4**2 + 2 * d1 * d14 * d2 * d3 * d4 * x23 * y2 * y3 * y4**2 + d1 * d14 * d2 * d3 * d4 * x23 * y3**2 * y4**2 + d1 * d14 * d23 * d3 * d4 * x14 * y1**2 + 2 * d1 * d14 * d23 * d3 * d4 * x14 * y1 * y4 + d1 * d14 * d23 * d3 * d4 * x14 * y4**2 + d1 * d14 * d23 * d3 * d4 * x23 * y1**2 + 2 * d1 * d14 * d23 * d3 * d4 * x23 * y1 * y4 + d1 * d14 * d23 * d3 * d4 * x23 * y4**2 + d1 * d2 * d23 * d3 * d4 * x14 * y1**2 * y2**2 + 2 * d1 * d2 * d23 * d3 * d4 * x14 * y1**2 * y2 * y3 + d1 * d2 * d23 * d3 * d4 * x14 * y1**2 * y3**2 + 2 * d1 * d2 * d23 * d3 * d4 * x14 * y1 * y2**2 * y4 + 4 * d1 * d2 * d23 * d3 * d4 * x14 * y1 * y2 * y3 * y4 + 2 * d1 * d2 * d23 * d3 * d4 * x14 * y1 * y3**2 * y4 + d1 * d2 * d23 * d3 * d4 * x14 * y2**2 * y4**2 + 2 * d1 * d2 * d23 * d3 * d4 * x14 * y2 * y3 * y4**2 + d1 * d2 * d23 * d3 * d4 * x14 * y3**2 * y4**2 + d1 * d2 * d23 * d3 * d4 * x23 * y1**2 * y2**2 + 2 * d1 * d2 * d23 * d3 * d4 * x23 * y1**2 * y2 * y3 + d1 * d2 * d23 * d3 * d4 * x23 * y1**2 * y3**2 + 2 * d1 * d2 * d23 * d3 * d4 * x23 * y1 * y2**2 * y4 + 4 * d1 * d2 * d23 * d3 * d4 * x23 * y1 * y2 * y3 * y4 + 2 * d1 * d2 * d23 * d3 * d4 * x23 * y1 * y3**2 * y4 + d1 * d2 * d23 * d3 * d4 * x23 * y2**2 * y4**2 + 2 * d1 * d2 * d23 * d3 * d4 * x23 * y2 * y3 * y4**2 + d1 * d2 * d23 * d3 * d4 * x23 * y3**2 * y4**2 + d14 * d2 * d23 * d3 * d4 * x14 * y2**2 + 2 * d14 * d2 * d23 * d3 * d4 * x14 * y2 * y3 + d14 * d2 * d23 * d3 * d4 * x14 * y3**2 + d14 * d2 * d23 * d3 * d4 * x23 * y2**2 + 2 * d14 * d2 * d23 * d3 * d4 * x23 * y2 * y3 + d14 * d2 * d23 * d3 * d4 * x23 * y3**2)
-    s4 = (d1 * d14 * d2 * d23 * fe * x14 * y1 * y2 + d1 * d14 * d2 * d23 * fe * x14 * y2 * y4 + d1 * d14 * d2 * d23 * fe * x23 * y1**2 + d1 * d14 * d2 * d23 * fe * x23 * y1 * y4 + d1 * d14 * d2 * d23 * fe * xe * y1**2 - d1 * d14 * d2 * d23 * fe * xe * y1 * y2 + d1 * d14 * d2 * d23 * fe * xe * y1 * y4 - d1 * d14 * d2 * d23 * fe * xe * y2 * y4 + d1 * d14 * d2 * d23 * fl * x14 * y1 * y2 + d1 * d14 * d2 * d23 * fl * x14 * y2 * y4 + d1 * d14 * d2 * d23 * fl * x23 * y1**2 + d1 * d14 * d2 * d23 * fl * x23 * y1 * y4 + d1 * d14 * d2 * d23 * mlx * x14 * y1 + d1 * d14 * d2 * d23 * mlx * x14 * y4 + d1 * d14 * d2 * d23 * mlx * x23 * y1 + d1 * d14 * d2 * d23 * mlx * x23 * y4 + d1 * d14 * d2 * d23 * mly * y1**2 - d1 * d14 * d2 * d23 * mly * y1 * y2 + d1 * d14 * d2 * d23 * mly * y1 * y4 - d1 * d14 * d2 * d23 * mly * y2 * y4 + d1 * d14 * d2 * d3 * fe * x23 * y1**2 * y2**2 + 2 * d1 * d14 * d2 * d3 * fe * x23 * y1**2 * y2 * y3 + d1 * d14 * d2 * d3 * fe * x23 * y1**2 * y3**2 + d1 * d14 * d2 * d3 * fe * x23 * y1 * y2**2 * y4 + 2 * d1 * d14 * d2 * d3 * fe * x23 * y1 * y2 * y3 * y4 + d1 * d14 * d2 * d3 * fe * x23 * y1 * y3**2 * y4 + d1 * d14 * d2 * d3 * fe * xe * y1**2 * y2**2 + 2 * d1 * d14 * d2 * d3 * fe * xe * y1**2 * y2 * y3 + d1 * d14 * d2 * d3 * fe * xe * y1**2 * y3**2 + d1 * d14 * d2 * d3 * fe * xe * y1 * y2**2 * y4 + 2 * d1 * d14 * d2 * d3 * fe * xe * y1 * y2 * y3 * y4 + d1 * d14 * d2 * d3 * fe * xe * y1 * y3**2 * y4 + d1 * d14 * d2 * d3 * fl * x23 * y1**2 * y2**2 + 2 * d1 * d14 * d2 * d3 * fl * x23 * y1**2 * y2 * y3 + d1 * d14 * d2 * d3 * fl * x23 * y1**2 * y3**2 + d1 * d14 * d2 * d3 * fl * x23 * y1 * y2**2 * y4 + 2 * d1 * d14 * d2 * d3 * fl * x23 * y1 * y2 * y3 * y4 + d1 * d14 * d2 * d3 * fl * x23 * y1 * y3**2 * y4 + d1 * d14 * d2 * d3 * mlx * x14 * y1 * y2**2 + 2 * d1 * d14 * d2 * d3 * mlx * x14 * y1 * y2 * y3 + d1 * d14 * d2 * d3 * mlx * x14 * y1 * y3**2 + d1 * d14 * d2 * d3 * mlx * x14 * y2**2 * y4 + 2 * d1 * d14 * d2 * d3 * mlx * x14 * y2 * y3 * y4 + d1 * d14 * d2 * d3 * mlx * x14 * y3**2 * y4 + d1 * d14 * d2 * d3 * mlx * x23 * y1 * y2**2 + 2 * d1 * d14 * d2 * d3 * mlx * x23 * y1 * y2 * y3 + d1 * d14 * d2 * d3 * mlx * x23 * y1 * y3**2 + d1 * d14 * d2 * d3 * mlx * x23 * y2**2 * y4 + 2 * d1 * d14 * d2 * d3 * mlx * x23 * y2 * y3 * y4 + d1 * d14 * d2 * d3 * mlx * x23 * y3**2 * y4 + d1 * d14 * d2 * d3 * mly * y1**2 * y2**2 + 2 * d1 * d14 * d2 * d3 * mly * y1**2 * y2 * y3 + d1 * d14 * d2 * d3 * mly * y1**2 * y3**2 + d1 * d14 * d2 * d3 * mly * y1 * y2**2 * y4 + 2 * d1 * d14 * d2 * d3 * mly * y1 * y2 * y3 * y4 + d1 * d14 * d2 * d3 * mly * y1 * y3**2 * y4 - d1 * d14 * d23 * d3 * fe * x14 * y1 * y3 - d1 * d14 * d23 * d3 * fe * x14 * y3 * y4 + d1 * d14 * d23 * d3 * fe * x23 * y1**2 + d1 * d14 * d23 * d3 * fe * x23 * y1 * y4 + d1 * d14 * d23 * d3 * fe * xe * y1**2 + d1 * d14 * d23 * d3 * fe * xe * y1 * y3 + d1 * d14 * d23 * d3 * fe * xe * y1 * y4 + d1 * d14 * d23 * d3 * fe * xe * y3 * y4 - d1 * d14 * d23 * d3 * fl * x14 * y1 * y3 - d1 * d14 * d23 * d3 * fl * x14 * y3 * y4 + d1 * d14 * d23 * d3 * fl * x23 * y1**2 + d1 * d14 * d23 * d3 * fl * x23 * y1 * y4 + d1 * d14 * d23 * d3 * mlx * x14 * y1 + d1 * d14 * d23 * d3 * mlx * x14 * y4 + d1 * d14 * d23 * d3 * mlx * x23 * y1 + d1 * d14 * d23 * d3 * mlx * x23 * y4 + d1 * d14 * d23 * d3 * mly * y1**2 + d1 * d14 * d23 * d3 * mly * y1 * y3 + d1 * d14 * d23 * d3 * mly * y1 * y4 + d1 * d14 * d23 * d3 * mly * y3 * y4 + d1 * d2 * d23 * d3 * fe * x23 * y1**2 * y2**2 + 2 * d1 * d2 * d23 * d3 * fe * x23 * y1**2 * y2 * y3 + d1 * d2 * d23 * d3 * fe * x23 * y1**2 * y3**2 + d1 * d2 * d23 * d3 * fe * x23 * y1 * y2**2 * y4 + 2 * d1 * d2 * d23 * d3 * fe * x23 * y1 * y2 * y3 * y4 + d1 * d2 * d23 * d3 * fe * x23 * y1 * y3**2 * y4 + d1 * d2 * d23 * d3 * fe * xe * y1**2 * y2**2 + 2 * d1 * d2 * d23 * d3 * fe * xe * y1**2 * y2 * y3 + d1 * d2 * d23 * d3 * fe * xe * y1**2 * y3**2 + d1 * d2 * d23 * d3 * fe * xe * y1 * y2**2 * y4 + 2 * d1 * d2 * d23 * d3 * fe * xe * y1 * y2 * y3 * y4 + d1 * d2 * d23 * d3 * fe * xe * y1 * y3**2 * y4 + d1 * d2 * d23 * d3 * fl * x23 * y1**2 * y2**2 + 2 * d1 * d2 * d23 * d3 * fl * x23 * y1**2 * y2 * y3 + d1 * d2 * d23 * d3 * fl * x23 * y1**2 * y3**2 + d1 * d2 * d23 * d3 * fl * x23 * y1 * y2**2 * y4 + 2 * d1 * d2 * d23 * d3 * fl * x23 * y1 * y2 * y3 * y4 + d1 * d2 * d23 * d3 * fl * x23 * y1 * y3**2 * y4 + d1 * d2 * d23 * d3 * mly * y1**2 * y2**2 + 2 * d1 * d2 * d23 * d3 * mly * y1**2 * y2 * y3 + d1 * d2 * d23 * d3 * mly * y1**2 * y3**2 + d1 * d2 * d23 * d3 * mly * y1 * y2**2 * y4 + 2 * d1 * d2 * d23 * d3 * mly * y1 * y2 * y3 * y4 + d1 * d2 * d23 * d3 * mly * y1 * y3**2 * y4 + d14 * d2 * d23 * d3 * fe * x23 * y2**2 + 2 * d14 * d2 * d23 * d3 * fe * x23 * y2 * y3 + d14 * d2 * d23 * d3 * fe * x23 * y3**2 + d14 * d2 * d23 * d3 * fe * xe * y2**2 + 2 * d14 * d2 * d23 * d3 * fe * xe * y2 * y3 + d14 * d2 * d23 * d3 * fe * xe * y3**2 + d14 * d2 * d23 * d3 * fl * x23 * y2**2 + 2 * d14 * d2 * d23 * d3 * fl * x23 * y2 * y3 + d14 * d2 * d23 * d3 * fl * x23 * y3**2 + d14 * d2 * d23 * d3 * mly * y2**2 + 2 * d14 * d2 * d23 * d3 * mly * y2 * y3 + d14 * d2 * d23 * d3 * mly * y3**2) / (d1 * d14 * d2 * d23 * d3 * x14 * y2**2 + 2 * d1 * d14 * d2 * d23 * d3 * x14 * y2 * y3 + d1 * d14 * d2 * d23 * d3 * x14 * y3**2 + d1 * d14 * d2 * d23 * d3 * x23 * y2**2 + 2 * d1 * d14 * d2 * d23 * d3 * x23 * y2 * y3 + d1 * d14 * d2 * d23 * d3 * x23 * y3**2 + d1 * d14 * d2 * d23 * d4 * x14 * y1**2 + 2 * d1 * d14 * d2 * d23 * d4 * x14 * y1 * y4 + d1 * d14 * d2 * d23 * d4 * x14 * y4**2 + d1 * d14 * d2 * d23 * d4 * x23 * y1**2 + 2 * d1 * d14 * d2 * d23 * d4 * x23 * y1 * y4 + d1 * d14 * d2 * d23 * d4 * x23 * y4**2 + d1 * d14 * d2 * d3 * d4 * x14 * y1**2 * y2**2 + 2 * d1 * d14 * d2 * d3 * d4 * x14 * y1**2 * y2 * y3 + d1 * d14 * d2 * d3 * d4 * x14 * y1**2 * y3**2 + 2 * d1 * d14 * d2 * d3 * d4 * x14 * y1 * y2**2 * y4 + 4 * d1 * d14 * d2 * d3 * d4 * x14 * y1 * y2 * y3 * y4 + 2 * d1 * d14 * d2 * d3 * d4 * x14 * y1 * y3**2 * y4 + d1 * d14 * d2 * d3 * d4 * x14 * y2**2 * y4**2 + 2 * d1 * d14 * d2 * d3 * d4 * x14 * y2 * y3 * y4**2 + d1 * d14 * d2 * d3 * d4 * x14 * y3**2 * y4**2 + d1 * d14 * d2 * d3 * d4 * x23 * y1**2 * y2**2 + 2 * d1 * d14 * d2 * d3 * d4 * x23 * y1**2 * y2 * y3 + d1 * d14 * d2 * d3 * d4 * x23 * y1**2 * y3**2 + 2 * d1 * d14 * d2 * d3 * d4 * x23 * y1 * y2**2 * y4 + 4 * d1 * d14 * d2 * d3 * d4 * x23 * y1 * y2 * y3 * y4 + 2 * d1 * d14 * d2 * d3 * d4 * x23 * y1 * y3**2 * y4 + d1 * d14 * d2 * d3 * d4 * x23 * y2**2 * y4**2 + 2 * d1 * d14 * d2 * d3 * d4 * x23 * y2 * y3 * y4**2 + d1 * d14 * d2 * d3 * d4 * x23 * y3**2 * y4**2 + d1 * d14 * d23 * d3 * d4 * x14 * y1**2 + 2 * d1 * d14 * d23 * d3 * d4 * x14 * y1 * y4 + d1 * d14 * d23 * d3 * d4 * x14 * y4**2 + d1 * d14 * d23 * d3 * d4 * x23 * y1**2 + 2 * d1 * d14 * d23 * d3 * d4 * x23 * y1 * y4 + d1 * d14 * d23 * d3 * d4 * x23 * y4**2 + d1 * d2 * d23 * d3 * d4 * x14 * y1**2 * y2**2 + 2 * d1 * d2 * d23 * d3 * d4 * x14 * y1**2 * y2 * y3 + d1 * d2 * d23 * d3 * d4 * x14 * y1**2 * y3**2 + 2 * d1 * d2 * d23 * d3 * d4 * x14 * y1 * y2**2 * y4 + 4 * d1 * d2 * d23 * d3 * d4 * x14 * y1 * y2 * y3 * y4 + 2 * d1 * d2 * d23 * d3 * d4 * x14 * y1 * y3**2 * y4 + d1 * d2 * d23 * d3 * d4 * x14 * y2**2 * y4**2 + 2 * d1 * d2 * d23 * d3 * d4 * x14 * y2 * y3 * y4**2 + d1 * d2 * d23 * d3 * d4 * x14 * y3**2 * y4**2 + d1 * d2 * d23 * d3 * d4 * x23 * y1**2 * y2**2 + 2 * d1 * d2 * d23 * d3 * d4 * x23 * y1**2 * y2 * y3 + d1 * d2 * d23 * d3 * d4 * x23 * y1**2 * y3**2 + 2 * d1 * d2 * d23 * d3 * d4 * x23 * y1 * y2**2 * y4 + 4 * d1 * d2 * d23 * d3 * d4 * x23 * y1 * y2 * y3 * y4 + 2 * d1 * d2 * d23 * d3 * d4 * x23 * y1 * y3**2 * y4 + d1 * d2 * d23 * d3 * d4 * x23 * y2**2 * y4**2 + 2 * d1 * d2 * d23 * d3 * d4 * x23 * y2 * y3 * y4**2 + d1 * d2 * d23 * d3 * d4 * x23 * y3**2 * y4**2 + d14 * d2 * d23 * d3 * d4 * x14 * y2**2 + 2 * d14 * d2 * d23 * d3 * d4 * x14 * y2 * y3 + d14 * d2 * d23 * d3 * d4 * x14 * y3**2 + d14 * d2 * d23 * d3 * d4 * x23 * y2**2 + 2 * d14 * d2 * d23 * d3 * d4 * x23 * y2 * y3 + d14 * d2 * d23 * d3 * d4 * x23 * y3**2)
-    phi1 = (-d1 * d14 * d2 * d23 * fe * x14 * y2 - d1 * d14 * d2 * d23 * fe * x23 * y1 - d1 * d14 * d2 * d23 * fe * xe * y1 + d1 * d14 * d2 * d23 * fe * xe * y2 - d1 * d14 * d2 * d23 * fl * x14 * y2 - d1 * d14 * d2 * d23 * fl * x23 * y1 - d1 * d14 * d2 * d23 * mlx * x14 - d1 * d14 * d2 * d23 * mlx * x23 - d1 * d14 * d2 * d23 * mly * y1 + d1 * d14 * d2 * d23 * mly * y2 - d1 * d14 * d2 * d4 * fe * x14 * y1**2 * y2 - 2 * d1 * d14 * d2 * d4 * fe * x14 * y1 * y2 * y4 - d1 * d14 * d2 * d4 * fe * x14 * y2 * y4**2 + d1 * d14 * d2 * d4 * fe * xe * y1**2 * y2 + 2 * d1 * d14 * d2 * d4 * fe * xe * y1 * y2 * y4 + d1 * d14 * d2 * d4 * fe * xe * y2 * y4**2 - d1 * d14 * d2 * d4 * fl * x14 * y1**2 * y2 - 2 * d1 * d14 * d2 * d4 * fl * x14 * y1 * y2 * y4 - d1 * d14 * d2 * d4 * fl * x14 * y2 * y4**2 + d1 * d14 * d2 * d4 * mly * y1**2 * y2 + 2 * d1 * d14 * d2 * d4 * mly * y1 * y2 * y4 + d1 * d14 * d2 * d4 * mly * y2 * y4**2 + d1 * d14 * d23 * d3 * fe * x14 * y3 - d1 * d14 * d23 * d3 * fe * x23 * y1 - d1 * d14 * d23 * d3 * fe * xe * y1 - d1 * d14 * d23 * d3 * fe * xe * y3 + d1 * d14 * d23 * d3 * fl * x14 * y3 - d1 * d14 * d23 * d3 * fl * x23 * y1 - d1 * d14 * d23 * d3 * mlx * x14 - d1 * d14 * d23 * d3 * mlx * x23 - d1 * d14 * d23 * d3 * mly * y1 - d1 * d14 * d23 * d3 * mly * y3 + d1 * d14 * d3 * d4 * fe * x14 * y1**2 * y3 + 2 * d1 * d14 * d3 * d4 * fe * x14 * y1 * y3 * y4 + d1 * d14 * d3 * d4 * fe * x14 * y3 * y4**2 - d1 * d14 * d3 * d4 * fe * xe * y1**2 * y3 - 2 * d1 * d14 * d3 * d4 * fe * xe * y1 * y3 * y4 - d1 * d14 * d3 * d4 * fe * xe * y3 * y4**2 + d1 * d14 * d3 * d4 * fl * x14 * y1**2 * y3 + 2 * d1 * d14 * d3 * d4 * fl * x14 * y1 * y3 * y4 + d1 * d14 * d3 * d4 * fl * x14 * y3 * y4**2 - d1 * d14 * d3 * d4 * mly * y1**2 * y3 - 2 * d1 * d14 * d3 * d4 * mly * y1 * y3 * y4 - d1 * d14 * d3 * d4 * mly * y3 * y4**2 - d1 * d2 * d23 * d4 * fe * x14 * y1**2 * y2 - 2 * d1 * d2 * d23 * d4 * fe * x14 * y1 * y2 * y4 - d1 * d2 * d23 * d4 * fe * x14 * y2 * y4**2 + d1 * d2 * d23 * d4 * fe * xe * y1**2 * y2 + 2 * d1 * d2 * d23 * d4 * fe * xe * y1 * y2 * y4 + d1 * d2 * d23 * d4 * fe * xe * y2 * y4**2 - d1 * d2 * d23 * d4 * fl * x14 * y1**2 * y2 - 2 * d1 * d2 * d23 * d4 * fl * x14 * y1 * y2 * y4 - d1 * d2 * d23 * d4 * fl * x14 * y2 * y4**2 - d1 * d2 * d23 * d4 * mlx * x14 * y1**2 - 2 * d1 * d2 * d23 * d4 * mlx * x14 * y1 * y4 - d1 * d2 * d23 * d4 * mlx * x14 * y4**2 - d1 * d2 * d23 * d4 * mlx * x23 * y1**2 - 2 * d1 * d2 * d23 * d4 * mlx * x23 * y1 * y4 - d1 * d2 * d23 * d4 * mlx * x23 * y4**2 + d1 * d2 * d23 * d4 * mly * y1**2 * y2 + 2 * d1 * d2 * d23 * d4 * mly * y1 * y2 * y4 + d1 * d2 * d23 * d4 * mly * y2 * y4**2 + d1 * d23 * d3 * d4 * fe * x14 * y1**2 * y3 + 2 * d1 * d23 * d3 * d4 * fe * x14 * y1 * y3 * y4 + d1 * d23 * d3 * d4 * fe * x14 * y3 * y4**2 - d1 * d23 * d3 * d4 * fe * xe * y1**2 * y3 - 2 * d1 * d23 * d3 * d4 * fe * xe * y1 * y3 * y4 - d1 * d23 * d3 * d4 * fe * xe * y3 * y4**2 + d1 * d23 * d3 * d4 * fl * x14 * y1**2 * y3 + 2 * d1 * d23 * d3 * d4 * fl * x14 * y1 * y3 * y4 + d1 * d23 * d3 * d4 * fl * x14 * y3 * y4**2 - d1 * d23 * d3 * d4 * mlx * x14 * y1**2 - 2 * d1 * d23 * d3 * d4 * mlx * x14 * y1 * y4 - d1 * d23 * d3 * d4 * mlx * x14 * y4**2 - d1 * d23 * d3 * d4 * mlx * x23 * y1**2 - 2 * d1 * d23 * d3 * d4 * mlx * x23 * y1 * y4 - d1 * d23 * d3 * d4 * mlx * x23 * y4**2 - d1 * d23 * d3 * d4 * mly * y1**2 * y3 - 2 * d1 * d23 * d3 * d4 * mly * y1 * y3 * y4 - d1 * d23 * d3 * d4 * mly * y3 * y4**2 - d14 * d2 * d23 * d4 * fe * x14 * y2 + d14 * d2 * d23 * d4 * fe * x23 * y4 + d14 * d2 * d23 * d4 * fe * xe * y2 + d14 * d2 * d23 * d4 * fe * xe * y4 - d14 * d2 * d23 * d4 * fl * x14 * y2 + d14 * d2 * d23 * d4 * fl * x23 * y4 - d14 * d2 * d23 * d4 * mlx * x14 - d14 * d2 * d23 * d4 * mlx * x23 + d14 * d2 * d23 * d4 * mly * y2 + d14 * d2 * d23 * d4 * mly * y4 + d14 * d23 * d3 * d4 * fe * x14 * y3 + d14 * d23 * d3 * d4 * fe * x23 * y4 - d14 * d23 * d3 * d4 * fe * xe * y3 + d14 * d23 * d3 * d4 * fe * xe * y4 + d14 * d23 * d3 * d4 * fl * x14 * y3 + d14 * d23 * d3 * d4 * fl * x23 * y4 - d14 * d23 * d3 * d4 * mlx * x14 - d14 * d23 * d3 * d4 * mlx * x23 - d14 * d23 * d3 * d4 * mly * y3 + d14 * d23 * d3 * d4 * mly * y4) / (d1 * d14 * d2 * d23 * d3 * x14 * y2**2 + 2 * d1 * d14 * d2 * d23 * d3 * x14 * y2 * y3 + d1 * d14 * d2 * d23 * d3 * x14 * y3**2 + d1 * d14 * d2 * d23 * d3 * x23 * y2**2 + 2 * d1 * d14 * d2 * d23 * d3 * x23 * y2 * y3 + d1 * d14 * d2 * d23 * d3 * x23 * y3**2 + d1 * d14 * d2 * d23 * d4 * x14 * y1**2 + 2 * d1 * d14 * d2 * d23 * d4 * x14 * y1 * y4 + d1 * d14 * d2 * d23 * d4 * x14 * y4**2 + d1 * d14 * d2 * d23 * d4 * x23 * y1**2 + 2 * d1 * d14 * d2 * d23 * d4 * x23 * y1 * y4 + d1 * d14 * d2 * d23 * d4 * x23 * y4**2 + d1 * d14 * d2 * d3 * d4 * x14 * y1**2 * y2**2 + 2 * d1 * d14 * d2 * d3 * d4 * x14 * y1**2 * y2 * y3 + d1 * d14 * d2 * d3 * d4 * x14 * y1**2 * y3**2 + 2 * d1 * d14 * d2 * d3 * d4 * x14 * y1 * y2**2 * y4 + 4 * d1 * d14 * d2 * d3 * d4 * x14 * y1 * y2 * y3 * y4 + 2 * d1 * d14 * d2 * d3 * d4 * x14 * y1 * y3**2 * y4 + d1 * d14 * d2 * d3 * d4 * x14 * y2**2 * y4**2 + 2 * d1 * d14 * d2 * d3 * d4 * x14 * y2 * y3 * y4**2 + d1 * d14 * d2 * d3 * d4 * x14 * y3**2 * y4**2 + d1 * d14 * d2 * d3 * d4 * x23 * y1**2 * y2**2 + 2 * d1 * d14 * d2 * d3 * d4 * x23 * y1**2 * y2 * y3 + d1 * d14 * d2 * d3 * d4 * x23 * y1**2 * y3**2 + 2 * d1 * d14 * d2 * d3 * d4 * x23 * y1 * y2**2 * y4 + 4 * d1 * d14 * d2 * d3 * d4 * x23 * y1 * y2 * y3 * y4 + 2 * d1 * d14 * d2 * d3 * d4 * x23 * y1 * y3**2 * y4 + d1 * d14 * d2 * d3 * d4 * x23 * y2**2 * y4**2 + 2 * d1 * d14 * d2 * d3 * d4 * x23 * y2 * y3 * y4**2 + d1 * d14 * d2 * d3 * d4 * x23 * y3**2 * y4**2 + d1 * d14 * d23 * d3 * d4 * x14 * y1**2 + 2 * d1 * d14 * d23 * d3 * d4 * x14 * y1 * y4 + d1 * d14 * d23 * d3 * d4 * x14 * y4**2 + d1 * d14 * d23 * d3 * d4 * x23 * y1**2 + 2 * d1 * d14 * d23 * d3 * d4 * x23 * y1 * y4 + d1 * d14 * d23 * d3 * d4 * x23 * y4**2 + d1 * d2 * d23 * d3 * d4 * x14 * y1**2 * y2**2 + 2 * d1 * d2 * d23 * d3 * d4 * x14 * y1**2 * y2 * y3 + d1 * d2 * d23 * d3 * d4 * x14 * y1**2 * y3**2 + 2 * d1 * d2 * d23 * d3 * d4 * x14 * y1 * y2**2 * y4 + 4 * d1 * d2 * d23 * d3 * d4 * x14 * y1 * y2 * y3 * y4 + 2 * d1 * d2 * d23 * d3 * d4 * x14 * y1 * y3**2 * y4 + d1 * d2 * d23 * d3 * d4 * x14 * y2**2 * y4**2 + 2 * d1 * d2 * d23 * d3 * d4 * x14 * y2 * y3 * y4**2 + d1 * d2 * d23 * d3 * d4 * x14 * y3**2 * y4**2 + d1 * d2 * d23 * d3 * d4 * x23 * y1**2 * y2**2 + 2 * d1 * d2 * d23 * d3 * d4 * x23 * y1**2 * y2 * y3 + d1 * d2 * d23 * d3 * d4 * x23 * y1**2 * y3**2 + 2 * d1 * d2 * d23 * d3 * d4 * x23 * y1 * y2**2 * y4 + 4 * d1 * d2 * d23 * d3 * d4 * x23 * y1 * y2 * y3 * y4 + 2 * d1 * d2 * d23 * d3 * d4 * x23 * y1 * y3**2 * y4 + d1 * d2 * d23 * d3 * d4 * x23 * y2**2 * y4**2 + 2 * d1 * d2 * d23 * d3 * d4 * x23 * y2 * y3 * y4**2 + d1 * d2 * d23 * d3 * d4 * x23 * y3**2 * y4**2 + d14 * d2 * d23 * d3 * d4 * x14 * y2**2 + 2 * d14 * d2 * d23 * d3 * d4 * x14 * y2 * y3 + d14 * d2 * d23 * d3 * d4 * x14 * y3**2 + d14 * d2 * d23 * d3 * d4 * x23 * y2**2 + 2 * d14 * d2 * d23 * d3 * d4 * x23 * y2 * y3 + d14 * d2 * d23 * d3 * d4 * x23 * y3**2)
-    phi2 = (-d1 * d14 * d2 * d23 * fe * x14 * y2 - d1 * d14 * d2 * d23 * fe * x23 * y1 - d1 * d14 * d2 * d23 * fe * xe * y1 + d1 * d14 * d2 * d23 * fe * xe * y2 - d1 * d14 * d2 * d23 * fl * x14 * y2 - d1 * d14 * d2 * d23 * fl * x23 * y1 - d1 * d14 * d2 * d23 * mlx * x14 - d1 * d14 * d2 * d23 * mlx * x23 - d1 * d14 * d2 * d23 * mly * y1 + d1 * d14 * d2 * d23 * mly * y2 - d1 * d14 * d2 * d3 * fe * x23 * y1 * y2**2 - 2 * d1 * d14 * d2 * d3 * fe * x23 * y1 * y2 * y3 - d1 * d14 * d2 * d3 * fe * x23 * y1 * y3**2 - d1 * d14 * d2 * d3 * fe * xe * y1 * y2**2 - 2 * d1 * d14 * d2 * d3 * fe * xe * y1 * y2 * y3 - d1 * d14 * d2 * d3 * fe * xe * y1 * y3**2 - d1 * d14 * d2 * d3 * fl * x23 * y1 * y2**2 - 2 * d1 * d14 * d2 * d3 * fl * x23 * y1 * y2 * y3 - d1 * d14 * d2 * d3 * fl * x23 * y1 * y3**2 - d1 * d14 * d2 * d3 * mlx * x14 * y2**2 - 2 * d1 * d14 * d2 * d3 * mlx * x14 * y2 * y3 - d1 * d14 * d2 * d3 * mlx * x14 * y3**2 - d1 * d14 * d2 * d3 * mlx * x23 * y2**2 - 2 * d1 * d14 * d2 * d3 * mlx * x23 * y2 * y3 - d1 * d14 * d2 * d3 * mlx * x23 * y3**2 - d1 * d14 * d2 * d3 * mly * y1 * y2**2 - 2 * d1 * d14 * d2 * d3 * mly * y1 * y2 * y3 - d1 * d14 * d2 * d3 * mly * y1 * y3**2 + d1 * d14 * d23 * d3 * fe * x14 * y3 - d1 * d14 * d23 * d3 * fe * x23 * y1 - d1 * d14 * d23 * d3 * fe * xe * y1 - d1 * d14 * d23 * d3 * fe * xe * y3 + d1 * d14 * d23 * d3 * fl * x14 * y3 - d1 * d14 * d23 * d3 * fl * x23 * y1 - d1 * d14 * d23 * d3 * mlx * x14 - d1 * d14 * d23 * d3 * mlx * x23 - d1 * d14 * d23 * d3 * mly * y1 - d1 * d14 * d23 * d3 * mly * y3 - d1 * d2 * d23 * d4 * fe * x14 * y1**2 * y2 - 2 * d1 * d2 * d23 * d4 * fe * x14 * y1 * y2 * y4 - d1 * d2 * d23 * d4 * fe * x14 * y2 * y4**2 + d1 * d2 * d23 * d4 * fe * xe * y1**2 * y2 + 2 * d1 * d2 * d23 * d4 * fe * xe * y1 * y2 * y4 + d1 * d2 * d23 * d4 * fe * xe * y2 * y4**2 - d1 * d2 * d23 * d4 * fl * x14 * y1**2 * y2 - 2 * d1 * d2 * d23 * d4 * fl * x14 * y1 * y2 * y4 - d1 * d2 * d23 * d4 * fl * x14 * y2 * y4**2 - d1 * d2 * d23 * d4 * mlx * x14 * y1**2 - 2 * d1 * d2 * d23 * d4 * mlx * x14 * y1 * y4 - d1 * d2 * d23 * d4 * mlx * x14 * y4**2 - d1 * d2 * d23 * d4 * mlx * x23 * y1**2 - 2 * d1 * d2 * d23 * d4 * mlx * x23 * y1 * y4 - d1 * d2 * d23 * d4 * mlx * x23 * y4**2 + d1 * d2 * d23 * d4 * mly * y1**2 * y2 + 2 * d1 * d2 * d23 * d4 * mly * y1 * y2 * y4 + d1 * d2 * d23 * d4 * mly * y2 * y4**2 - d1 * d2 * d3 * d4 * mlx * x14 * y1**2 * y2**2 - 2 * d1 * d2 * d3 * d4 * mlx * x14 * y1**2 * y2 * y3 - d1 * d2 * d3 * d4 * mlx * x14 * y1**2 * y3**2 - 2 * d1 * d2 * d3 * d4 * mlx * x14 * y1 * y2**2 * y4 - 4 * d1 * d2 * d3 * d4 * mlx * x14 * y1 * y2 * y3 * y4 - 2 * d1 * d2 * d3 * d4 * mlx * x14 * y1 * y3**2 * y4 - d1 * d2 * d3 * d4 * mlx * x14 * y2**2 * y4**2 - 2 * d1 * d2 * d3 * d4 * mlx * x14 * y2 * y3 * y4**2 - d1 * d2 * d3 * d4 * mlx * x14 * y3**2 * y4**2 - d1 * d2 * d3 * d4 * mlx * x23 * y1**2 * y2**2 - 2 * d1 * d2 * d3 * d4 * mlx * x23 * y1**2 * y2 * y3 - d1 * d2 * d3 * d4 * mlx * x23 * y1**2 * y3**2 - 2 * d1 * d2 * d3 * d4 * mlx * x23 * y1 * y2**2 * y4 - 4 * d1 * d2 * d3 * d4 * mlx * x23 * y1 * y2 * y3 * y4 - 2 * d1 * d2 * d3 * d4 * mlx * x23 * y1 * y3**2 * y4 - d1 * d2 * d3 * d4 * mlx * x23 * y2**2 * y4**2 - 2 * d1 * d2 * d3 * d4 * mlx * x23 * y2 * y3 * y4**2 - d1 * d2 * d3 * d4 * mlx * x23 * y3**2 * y4**2 + d1 * d23 * d3 * d4 * fe * x14 * y1**2 * y3 + 2 * d1 * d23 * d3 * d4 * fe * x14 * y1 * y3 * y4 + d1 * d23 * d3 * d4 * fe * x14 * y3 * y4**2 - d1 * d23 * d3 * d4 * fe * xe * y1**2 * y3 - 2 * d1 * d23 * d3 * d4 * fe * xe * y1 * y3 * y4 - d1 * d23 * d3 * d4 * fe * xe * y3 * y4**2 + d1 * d23 * d3 * d4 * fl * x14 * y1**2 * y3 + 2 * d1 * d23 * d3 * d4 * fl * x14 * y1 * y3 * y4 + d1 * d23 * d3 * d4 * fl * x14 * y3 * y4**2 - d1 * d23 * d3 * d4 * mlx * x14 * y1**2 - 2 * d1 * d23 * d3 * d4 * mlx * x14 * y1 * y4 - d1 * d23 * d3 * d4 * mlx * x14 * y4**2 - d1 * d23 * d3 * d4 * mlx * x23 * y1**2 - 2 * d1 * d23 * d3 * d4 * mlx * x23 * y1 * y4 - d1 * d23 * d3 * d4 * mlx * x23 * y4**2 - d1 * d23 * d3 * d4 * mly * y1**2 * y3 - 2 * d1 * d23 * d3 * d4 * mly * y1 * y3 * y4 - d1 * d23 * d3 * d4 * mly * y3 * y4**2 - d14 * d2 * d23 * d4 * fe * x14 * y2 + d14 * d2 * d23 * d4 * fe * x23 * y4 + d14 * d2 * d23 * d4 * fe * xe * y2 + d14 * d2 * d23 * d4 * fe * xe * y4 - d14 * d2 * d23 * d4 * fl * x14 * y2 + d14 * d2 * d23 * d4 * fl * x23 * y4 - d14 * d2 * d23 * d4 * mlx * x14 - d14 * d2 * d23 * d4 * mlx * x23 + d14 * d2 * d23 * d4 * mly * y2 + d14 * d2 * d23 * d4 * mly * y4 + d14 * d2 * d3 * d4 * fe * x23 * y2**2 * y4 + 2 * d14 * d2 * d3 * d4 * fe * x23 * y2 * y3 * y4 + d14 * d2 * d3 * d4 * fe * x23 * y3**2 * y4 + d14 * d2 * d3 * d4 * fe * xe * y2**2 * y4 + 2 * d14 * d2 * d3 * d4 * fe * xe * y2 * y3 * y4 + d14 * d2 * d3 * d4 * fe * xe * y3**2 * y4 + d14 * d2 * d3 * d4 * fl * x23 * y2**2 * y4 + 2 * d14 * d2 * d3 * d4 * fl * x23 * y2 * y3 * y4 + d14 * d2 * d3 * d4 * fl * x23 * y3**2 * y4 - d14 * d2 * d3 * d4 * mlx * x14 * y2**2 - 2 * d14 * d2 * d3 * d4 * mlx * x14 * y2 * y3 - d14 * d2 * d3 * d4 * mlx * x14 * y3**2 - d14 * d2 * d3 * d4 * mlx * x23 * y2**2 - 2 * d14 * d2 * d3 * d4 * mlx * x23 * y2 * y3 - d14 * d2 * d3 * d4 * mlx * x23 * y3**2 + d14 * d2 * d3 * d4 * mly * y2**2 * y4 + 2 * d14 * d2 * d3 * d4 * mly * y2 * y3 * y4 + d14 * d2 * d3 * d4 * mly * y3**2 * y4 + d14 * d23 * d3 * d4 * fe * x14 * y3 + d14 * d23 * d3 * d4 * fe * x23 * y4 - d14 * d23 * d3 * d4 * fe * xe * y3 + d14 * d23 * d3 * d4 * fe * xe * y4 + d14 * d23 * d3 * d4 * fl * x14 * y3 + d14 * d23 * d3 * d4 * fl * x23 * y4 - d14 * d23 * d3 * d4 * mlx * x14 - d14 * d23 * d3 * d4 * mlx * x23 - d14 * d23 * d3 * d4 * mly * y3 + d14 * d23 * d3 * d4 * mly * y4) / (d1 * d14 * d2 * d23 * d3 * x14 * y2**2 + 2 * d1 * d14 * d2 * d23 * d3 * x14 * y2 * y3 + d1 * d14 * d2 * d23 * d3 * x14 * y3**2 + d1 * d14 * d2 * d23 * d3 * x23 * y2**2 + 2 * d1 * d14 * d2 * d23 * d3 * x23 * y2 * y3 + d1 * d14 * d2 * d23 * d3 * x23 * y3**2 + d1 * d14 * d2 * d23 * d4 * x14 * y1**2 + 2 * d1 * d14 * d2 * d23 * d4 * x14 * y1 * y4 + d1 * d14 * d2 * d23 * d4 * x14 * y4**2 + d1 * d14 * d2 * d23 * d4 * x23 * y1**2 + 2 * d1 * d14 * d2 * d23 * d4 * x23 * y1 * y4 + d1 * d14 * d2 * d23 * d4 * x23 * y4**2 + d1 * d14 * d2 * d3 * d4 * x14 * y1**2 * y2**2 + 2 * d1 * d14 * d2 * d3 * d4 * x14 * y1**2 * y2 * y3 + d1 * d14 * d2 * d3 * d4 * x14 * y1**2 * y3**2 + 2 * d1 * d14 * d2 * d3 * d4 * x14 * y1 * y2**2 * y4 + 4 * d1 * d14 * d2 * d3 * d4 * x14 * y1 * y2 * y3 * y4 + 2 * d1 * d14 * d2 * d3 * d4 * x14 * y1 * y3**2 * y4 + d1 * d14 * d2 * d3 * d4 * x14 * y2**2 * y4**2 + 2 * d1 * d14 * d2 * d3 * d4 * x14 * y2 * y3 * y4**2 + d1 * d14 * d2 * d3 * d4 * x14 * y3**2 * y4**2 + d1 * d14 * d2 * d3 * d4 * x23 * y1**2 * y2**2 + 2 * d1 * d14 * d2 * d3 * d4 * x23 * y1**2 * y2 * y3 + d1 * d14 * d2 * d3 * d4 * x23 * y1**2 * y3**2 + 2 * d1 * d14 * d2 * d3 * d4 * x23 * y1 * y2**2 * y4 + 4 * d1 * d14 * d2 * d3 * d4 * x23 * y1 * y2 * y3 * y4 + 2 * d1 * d14 * d2 * d3 * d4 * x23 * y1 * y3**2 * y4 + d1 * d14 * d2 * d3 * d4 * x23 * y2**2 * y4**2 + 2 * d1 * d14 * d2 * d3 * d4 * x23 * y2 * y3 * y4**2 + d1 * d14 * d2 * d3 * d4 * x23 * y3**2 * y4**2 + d1 * d14 * d23 * d3 * d4 * x14 * y1**2 + 2 * d1 * d14 * d23 * d3 * d4 * x14 * y1 * y4 + d1 * d14 * d23 * d3 * d4 * x14 * y4**2 + d1 * d14 * d23 * d3 * d4 * x23 * y1**2 + 2 * d1 * d14 * d23 * d3 * d4 * x23 * y1 * y4 + d1 * d14 * d23 * d3 * d4 * x23 * y4**2 + d1 * d2 * d23 * d3 * d4 * x14 * y1**2 * y2**2 + 2 * d1 * d2 * d23 * d3 * d4 * x14 * y1**2 * y2 * y3 + d1 * d2 * d23 * d3 * d4 * x14 * y1**2 * y3**2 + 2 * d1 * d2 * d23 * d3 * d4 * x14 * y1 * y2**2 * y4 + 4 * d1 * d2 * d23 * d3 * d4 * x14 * y1 * y2 * y3 * y4 + 2 * d1 * d2 * d23 * d3 * d4 * x14 * y1 * y3**2 * y4 + d1 * d2 * d23 * d3 * d4 * x14 * y2**2 * y4**2 + 2 * d1 * d2 * d23 * d3 * d4 * x14 * y2 * y3 * y4**2 + d1 * d2 * d23 * d3 * d4 * x14 * y3**2 * y4**2 + d1 * d2 * d23 * d3 * d4 * x23 * y1**2 * y2**2 + 2 * d1 * d2 * d23 * d3 * d4 * x23 * y1**2 * y2 * y3 + d1 * d2 * d23 * d3 * d4 * x23 * y1**2 * y3**2 + 2 * d1 * d2 * d23 * d3 * d4 * x23 * y1 * y2**2 * y4 + 4 * d1 * d2 * d23 * d3 * d4 * x23 * y1 * y2 * y3 * y4 + 2 * d1 * d2 * d23 * d3 * d4 * x23 * y1 * y3**2 * y4 + d1 * d2 * d23 * d3 * d4 * x23 * y2**2 * y4**2 + 2 * d1 * d2 * d23 * d3 * d4 * x23 * y2 * y3 * y4**2 + d1 * d2 * d23 * d3 * d4 * x23 * y3**2 * y4**2 + d14 * d2 * d23 * d3 * d4 * x14 * y2**2 + 2 * d14 * d2 * d23 * d3 * d4 * x14 * y2 * y3 + d14 * d2 * d23 * d3 * d4 * x14 * y3**2 + d14 * d2 * d23 * d3 * d4 * x23 * y2**2 + 2 * d14 * d2 * d23 * d3 * d4 * x23 * y2 * y3 + d14 * d2 * d23 * d3 * d4 * x23 * y3**2)
-    phi3 = (-d1 * d14 * d2 * d23 * fe * x14 * y2 - d1 * d14 * d2 * d23 * fe * x23 * y1 - d1 * d14 * d2 * d23 * fe * xe * y1 + d1 * d14 * d2 * d23 * fe * xe * y2 - d1 * d14 * d2 * d23 * fl * x14 * y2 - d1 * d14 * d2 * d23 * fl * x23 * y1 - d1 * d14 * d2 * d23 * mlx * x14 - d1 * d14 * d2 * d23 * mlx * x23 - d1 * d14 * d2 * d23 * mly * y1 + d1 * d14 * d2 * d23 * mly * y2 - d1 * d14 * d2 * d3 * fe * x23 * y1 * y2**2 - 2 * d1 * d14 * d2 * d3 * fe * x23 * y1 * y2 * y3 - d1 * d14 * d2 * d3 * fe * x23 * y1 * y3**2 - d1 * d14 * d2 * d3 * fe * xe * y1 * y2**2 - 2 * d1 * d14 * d2 * d3 * fe * xe * y1 * y2 * y3 - d1 * d14 * d2 * d3 * fe * xe * y1 * y3**2 - d1 * d14 * d2 * d3 * fl * x23 * y1 * y2**2 - 2 * d1 * d14 * d2 * d3 * fl * x23 * y1 * y2 * y3 - d1 * d14 * d2 * d3 * fl * x23 * y1 * y3**2 - d1 * d14 * d2 * d3 * mlx * x14 * y2**2 - 2 * d1 * d14 * d2 * d3 * mlx * x14 * y2 * y3 - d1 * d14 * d2 * d3 * mlx * x14 * y3**2 - d1 * d14 * d2 * d3 * mlx * x23 * y2**2 - 2 * d1 * d14 * d2 * d3 * mlx * x23 * y2 * y3 - d1 * d14 * d2 * d3 * mlx * x23 * y3**2 - d1 * d14 * d2 * d3 * mly * y1 * y2**2 - 2 * d1 * d14 * d2 * d3 * mly * y1 * y2 * y3 - d1 * d14 * d2 * d3 * mly * y1 * y3**2 + d1 * d14 * d23 * d3 * fe * x14 * y3 - d1 * d14 * d23 * d3 * fe * x23 * y1 - d1 * d14 * d23 * d3 * fe * xe * y1 - d1 * d14 * d23 * d3 * fe * xe * y3 + d1 * d14 * d23 * d3 * fl * x14 * y3 - d1 * d14 * d23 * d3 * fl * x23 * y1 - d1 * d14 * d23 * d3 * mlx * x14 - d1 * d14 * d23 * d3 * mlx * x23 - d1 * d14 * d23 * d3 * mly * y1 - d1 * d14 * d23 * d3 * mly * y3 - d1 * d2 * d23 * d3 * fe * x23 * y1 * y2**2 - 2 * d1 * d2 * d23 * d3 * fe * x23 * y1 * y2 * y3 - d1 * d2 * d23 * d3 * fe * x23 * y1 * y3**2 - d1 * d2 * d23 * d3 * fe * xe * y1 * y2**2 - 2 * d1 * d2 * d23 * d3 * fe * xe * y1 * y2 * y3 - d1 * d2 * d23 * d3 * fe * xe * y1 * y3**2 - d1 * d2 * d23 * d3 * fl * x23 * y1 * y2**2 - 2 * d1 * d2 * d23 * d3 * fl * x23 * y1 * y2 * y3 - d1 * d2 * d23 * d3 * fl * x23 * y1 * y3**2 - d1 * d2 * d23 * d3 * mly * y1 * y2**2 - 2 * d1 * d2 * d23 * d3 * mly * y1 * y2 * y3 - d1 * d2 * d23 * d3 * mly * y1 * y3**2 - d14 * d2 * d23 * d4 * fe * x14 * y2 + d14 * d2 * d23 * d4 * fe * x23 * y4 + d14 * d2 * d23 * d4 * fe * xe * y2 + d14 * d2 * d23 * d4 * fe * xe * y4 - d14 * d2 * d23 * d4 * fl * x14 * y2 + d14 * d2 * d23 * d4 * fl * x23 * y4 - d14 * d2 * d23 * d4 * mlx * x14 - d14 * d2 * d23 * d4 * mlx * x23 + d14 * d2 * d23 * d4 * mly * y2 + d14 * d2 * d23 * d4 * mly * y4 + d14 * d2 * d3 * d4 * fe * x23 * y2**2 * y4 + 2 * d14 * d2 * d3 * d4 * fe * x23 * y2 * y3 * y4 + d14 * d2 * d3 * d4 * fe * x23 * y3**2 * y4 + d14 * d2 * d3 * d4 * fe * xe * y2**2 * y4 + 2 * d14 * d2 * d3 * d4 * fe * xe * y2 * y3 * y4 + d14 * d2 * d3 * d4 * fe * xe * y3**2 * y4 + d14 * d2 * d3 * d4 * fl * x23 * y2**2 * y4 + 2 * d14 * d2 * d3 * d4 * fl * x23 * y2 * y3 * y4 + d14 * d2 * d3 * d4 * fl * x23 * y3**2 * y4 - d14 * d2 * d3 * d4 * mlx * x14 * y2**2 - 2 * d14 * d2 * d3 * d4 * mlx * x14 * y2 * y3 - d14 * d2 * d3 * d4 * mlx * x14 * y3**2 - d14 * d2 * d3 * d4 * mlx * x23 * y2**2 - 2 * d14 * d2 * d3 * d4 * mlx * x23 * y2 * y3 - d14 * d2 * d3 * d4 * mlx * x23 * y3**2 + d14 * d2 * d3 * d4 * mly * y2**2 * y4 + 2 * d14 * d2 * d3 * d4 * mly * y2 * y3 * y4 + d14 * d2 * d3 * d4 * mly * y3**2 * y4 + d14 * d23 * d3 * d4 * fe * x14 * y3 + d14 * d23 * d3 * d4 * fe * x23 * y4 - d14 * d23 * d3 * d4 * fe * xe * y3 + d14 * d23 * d3 * d4 * fe * xe * y4 + d14 * d23 * d3 * d4 * fl * x14 * y3 + d14 * d23 * d3 * d4 * fl * x23 * y4 - d14 * d23 * d3 * d4 * mlx * x14 - d14 * d23 * d3 * d4 * mlx * x23 - d14 * d23 * d3 * d4 * mly * y3 + d14 * d23 * d3 * d4 * mly * y4 + d2 * d23 * d3 * d4 * fe * x23 * y2**2 * y4 + 2 * d2 * d23 * d3 * d4 * fe * x23 * y2 * y3 * y4 + d2 * d23 * d3 * d4 * fe * x23 * y3**2 * y4 + d2 * d23 * d3 * d4 * fe * xe * y2**2 * y4 + 2 * d2 * d23 * d3 * d4 * fe * xe * y2 * y3 * y4 + d2 * d23 * d3 * d4 * fe * xe * y3**2 * y4 + d2 * d23 * d3 * d4 * fl * x23 * y2**2 * y4 + 2 * d2 * d23 * d3 * d4 * fl * x23 * y2 * y3 * y4 + d2 * d23 * d3 * d4 * fl * x23 * y3**2 * y4 + d2 * d23 * d3 * d4 * mly * y2**2 * y4 + 2 * d2 * d23 * d3 * d4 * mly * y2 * y3 * y4 + d2 * d23 * d3 * d4 * mly * y3**2 * y4) / (d1 * d14 * d2 * d23 * d3 * x14 * y2**2 + 2 * d1 * d14 * d2 * d23 * d3 * x14 * y2 * y3 + d1 * d14 * d2 * d23 * d3 * x14 * y3**2 + d1 * d14 * d2 * d23 * d3 * x23 * y2**2 + 2 * d1 * d14 * d2 * d23 * d3 * x23 * y2 * y3 + d1 * d14 * d2 * d23 * d3 * x23 * y3**2 + d1 * d14 * d2 * d23 * d4 * x14 * y1**2 + 2 * d1 * d14 * d2 * d23 * d4 * x14 * y1 * y4 + d1 * d14 * d2 * d23 * d4 * x14 * y4**2 + d1 * d14 * d2 * d23 * d4 * x23 * y1**2 + 2 * d1 * d14 * d2 * d23 * d4 * x23 * y1 * y4 + d1 * d14 * d2 * d23 * d4 * x23 * y4**2 + d1 * d14 * d2 * d3 * d4 * x14 * y1**2 * y2**2 + 2 * d1 * d14 * d2 * d3 * d4 * x14 * y1**2 * y2 * y3 + d1 * d14 * d2 * d3 * d4 * x14 * y1**2 * y3**2 + 2 * d1 * d14 * d2 * d3 * d4 * x14 * y1 * y2**2 * y4 + 4 * d1 * d14 * d2 * d3 * d4 * x14 * y1 * y2 * y3 * y4 + 2 * d1 * d14 * d2 * d3 * d4 * x14 * y1 * y3**2 * y4 + d1 * d14 * d2 * d3 * d4 * x14 * y2**2 * y4**2 + 2 * d1 * d14 * d2 * d3 * d4 * x14 * y2 * y3 * y4**2 + d1 * d14 * d2 * d3 * d4 * x14 * y3**2 * y4**2 + d1 * d14 * d2 * d3 * d4 * x23 * y1**2 * y2**2 + 2 * d1 * d14 * d2 * d3 * d4 * x23 * y1**2 * y2 * y3 + d1 * d14 * d2 * d3 * d4 * x23 * y1**2 * y3**2 + 2 * d1 * d14 * d2 * d3 * d4 * x23 * y1 * y2**2 * y4 + 4 * d1 * d14 * d2 * d3 * d4 * x23 * y1 * y2 * y3 * y4 + 2 * d1 * d14 * d2 * d3 * d4 * x23 * y1 * y3**2 * y4 + d1 * d14 * d2 * d3 * d4 * x23 * y2**2 * y4**2 + 2 * d1 * d14 * d2 * d3 * d4 * x23 * y2 * y3 * y4**2 + d1 * d14 * d2 * d3 * d4 * x23 * y3**2 * y4**2 + d1 * d14 * d23 * d3 * d4 * x14 * y1**2 + 2 * d1 * d14 * d23 * d3 * d4 * x14 * y1 * y4 + d1 * d14 * d23 * d3 * d4 * x14 * y4**2 + d1 * d14 * d23 * d3 * d4 * x23 * y1**2 + 2 * d1 * d14 * d23 * d3 * d4 * x23 * y1 * y4 + d1 * d14 * d23 * d3 * d4 * x23 * y4**2 + d1 * d2 * d23 * d3 * d4 * x14 * y1**2 * y2**2 + 2 * d1 * d2 * d23 * d3 * d4 * x14 * y1**2 * y2 * y3 + d1 * d2 * d23 * d3 * d4 * x14 * y1**2 * y3**2 + 2 * d1 * d2 * d23 * d3 * d4 * x14 * y1 * y2**2 * y4 + 4 * d1 * d2 * d23 * d3 * d4 * x14 * y1 * y2 * y3 * y4 + 2 * d1 * d2 * d23 * d3 * d4 * x14 * y1 * y3**2 * y4 + d1 * d2 * d23 * d3 * d4 * x14 * y2**2 * y4**2 + 2 * d1 * d2 * d23 * d3 * d4 * x14 * y2 * y3 * y4**2 + d1 * d2 * d23 * d3 * d4 * x14 * y3**2 * y4**2 + d1 * d2 * d23 * d3 * d4 * x23 * y1**2 * y2**2 + 2 * d1 * d2 * d23 * d3 * d4 * x23 * y1**2 * y2 * y3 + d1 * d2 * d23 * d3 * d4 * x23 * y1**2 * y3**2 + 2 * d1 * d2 * d23 * d3 * d4 * x23 * y1 * y2**2 * y4 + 4 * d1 * d2 * d23 * d3 * d4 * x23 * y1 * y2 * y3 * y4 + 2 * d1 * d2 * d23 * d3 * d4 * x23 * y1 * y3**2 * y4 + d1 * d2 * d23 * d3 * d4 * x23 * y2**2 * y4**2 + 2 * d1 * d2 * d23 * d3 * d4 * x23 * y2 * y3 * y4**2 + d1 * d2 * d23 * d3 * d4 * x23 * y3**2 * y4**2 + d14 * d2 * d23 * d3 * d4 * x14 * y2**2 + 2 * d14 * d2 * d23 * d3 * d4 * x14 * y2 * y3 + d14 * d2 * d23 * d3 * d4 * x14 * y3**2 + d14 * d2 * d23 * d3 * d4 * x23 * y2**2 + 2 * d14 * d2 * d23 * d3 * d4 * x23 * y2 * y3 + d14 * d2 * d23 * d3 * d4 * x23 * y3**2)
-    fry = (-fe * x14 + fe * xe - fl * x14 + mly) / (x14 + x23)
-    ffy = (fe * x23 + fe * xe + fl * x23 + mly) / (x14 + x23)
+"""
+Solutions of the basic mechanical models in plain python.
+
+Generated by resources/solve_equations/stuetzkraft_codegen.py, do not edit.
+"""
+import numpy as np
+
+# Order of the outputs of the _values kernels
+VALUE_KEYS = ['f1', 'f2', 'f3', 'f4', 't14x', 't23x', 't14y', 't23y', 's1', 's2', 's3', 's4', 'phi1', 'phi2', 'phi3', 'fry', 'ffy']
+
+
+def results_plain(fl, mlx, mly, fe, y1, y2, y3, y4, xe, x14, x23, d14, d23, d1, d2, d3, d4, x1=None, x3=None, outputs=None):
+    """Solutions of the Elastostatic model (Statically overdetermined). If outputs (set of keys) is given, only these results are computed."""
+    if _symmetric(y1, y2, y3, y4, d1, d2, d3, d4):
+        return _results_plain_symmetric(fl, mlx, mly, fe, y1, xe, x14, x23, d14, d23, d1, x1, x3, outputs)
+    return _results_plain_general(fl, mlx, mly, fe, y1, y2, y3, y4, xe, x14, x23, d14, d23, d1, d2, d3, d4, x1, x3, outputs)
+
+
+def results_liftoff_plain(fl, mlx, mly, fe, y1, y2, y3, y4, xe, x14, x23, d14, d23, d1, d2, d3, d4, lift, x1=None, x3=None, outputs=None):
+    """Solutions of the Static model (Statically determined). A lift index (int) must be passed to indicate which support is lifted from the ground. If outputs (set of keys) is given, only these results are computed."""
+    if _symmetric(y1, y2, y3, y4, d1, d2, d3, d4):
+        return _results_liftoff_plain_symmetric(fl, mlx, mly, fe, y1, xe, x14, x23, d14, d23, d1, lift, x1, x3, outputs)
+    return _results_liftoff_plain_general(fl, mlx, mly, fe, y1, y2, y3, y4, xe, x14, x23, d14, d23, d1, d2, d3, d4, lift, x1, x3, outputs)
+
+
+def _symmetric(y1, y2, y3, y4, d1, d2, d3, d4):
+    """True if all supports have the same distance y and stiffness d (numbers or equal arrays)."""
+    try:
+        return bool(y1 == y2 == y3 == y4 and d1 == d2 == d3 == d4)
+    except ValueError:  # Arrays
+        return all(np.array_equal(a, b) for a, b in [(y1, y2), (y1, y3), (y1, y4), (d1, d2), (d1, d3), (d1, d4)])
+
+
+def _results_plain_general(fl, mlx, mly, fe, y1, y2, y3, y4, xe, x14, x23, d14, d23, d1, d2, d3, d4, x1, x3, outputs):
+    """Elastostatic model, general geometry."""
+    if outputs is not None:
+        return _results_plain_general_selected(fl, mlx, mly, fe, y1, y2, y3, y4, xe, x14, x23, d14, d23, d1, d2, d3, d4, x1, x3, outputs)
+    c0 = x14 + x23
+    c1 = d1*d14
+    c2 = y2**2
+    c3 = d2*d23
+    c4 = c2*c3
+    c5 = c1*c4
+    c6 = y3**2
+    c7 = c3*c6
+    c8 = c7*d3
+    c9 = y1**2
+    c10 = c1*c9
+    c11 = c10*c3
+    c12 = y4**2
+    c13 = c1*c12
+    c14 = c13*d4
+    c15 = d23*d3
+    c16 = c10*c15
+    c17 = d14*d4
+    c18 = c17*c4
+    c19 = y2*y3
+    c20 = 2*c19
+    c21 = c20*c3
+    c22 = c21*d3
+    c23 = y1*y4
+    c24 = 2*c23
+    c25 = c1*c24
+    c26 = c25*d4
+    c27 = d2*d3
+    c28 = c1*c23
+    c29 = c28*d4
+    c30 = c19*c3
+    c31 = d1*d4
+    c32 = c23*c31
+    c33 = c2*c27
+    c34 = c10*d4
+    c35 = c27*c6
+    c36 = c31*c9
+    c37 = c4*d3
+    c38 = c12*c31
+    c39 = c20*c27
+    c40 = c24*c31
+    c41 = y1 + y4
+    c42 = c15 + c3 + c33 + c35 + c39
+    c43 = c0*c42*mlx
+    c44 = c41*c43
+    c45 = c1*c44
+    c46 = c45*d4
+    c47 = c12*c17
+    c48 = c3*c47
+    c49 = c15*c47
+    c50 = c3*y2
+    c51 = c17*c50
+    c52 = c51*y1
+    c53 = c17*c23
+    c54 = c3*c53
+    c55 = c51*y4
+    c56 = c33*c47
+    c57 = c35*c47
+    c58 = c15*c53
+    c59 = c12*d4
+    c60 = c37*c59
+    c61 = c59*c8
+    c62 = c15*y3
+    c63 = c17*c62
+    c64 = c63*y1
+    c65 = c17*y4
+    c66 = c15*c65
+    c67 = c66*y3
+    c68 = -c67
+    c69 = c33*c53
+    c70 = c35*c53
+    c71 = c23*d4
+    c72 = c37*c71
+    c73 = c71*c8
+    c74 = c39*c47
+    c75 = c22*c59
+    c76 = c39*c53
+    c77 = c22*c71
+    c78 = d14*d3
+    c79 = c4*c78
+    c80 = c7*c78
+    c81 = c21*c78
+    c82 = c79 + c80 + c81
+    c83 = c48 + c49 + c52 + c54 + c55 + c56 + c57 + c58 + c60 + c61 - c64 + c68 + c69 + c70 + c72 + c73 + c74 + c75 + c76 + c77 + c82
+    c84 = c79*x23 + c80*x23 + c81*x23
+    c85 = c48*x23 + c49*x23 + c54*x23 + c56*x23 + c57*x23 + c58*x23 + c60*x23 + c61*x23 + c64*x14 + c67*x14 + c69*x23 + c70*x23 + c72*x23 + c73*x23 + c74*x23 + c75*x23 + c76*x23 + c77*x23 + c84 - d14*d2*d23*d4*x14*y1*y2 - d14*d2*d23*d4*x14*y2*y4
+    c86 = c55*xe
+    c87 = c79*xe + c80*xe + c81*xe
+    c88 = c48*xe + c49*xe + c52*xe + c54*xe + c56*xe + c57*xe + c58*xe + c60*xe + c61*xe + c69*xe + c70*xe + c72*xe + c73*xe + c74*xe + c75*xe + c76*xe + c77*xe + c85 + c86 + c87 - d14*d23*d3*d4*xe*y1*y3 - d14*d23*d3*d4*xe*y3*y4
+    c89 = y2 + y3
+    c90 = c1 + c17 + c36 + c38 + c40
+    c91 = c0*c90*mlx
+    c92 = c89*c91
+    c93 = c3*c92
+    c94 = c93*d3
+    c95 = c15*c6
+    c96 = c1*c95
+    c97 = c17*c95
+    c98 = c1*y1
+    c99 = c15*c98
+    c100 = c99*y2
+    c101 = c99*y3
+    c102 = c15*c19
+    c103 = c1*c102
+    c104 = c6*d3
+    c105 = c104*c34
+    c106 = c104*c14
+    c107 = c36*c95
+    c108 = c38*c95
+    c109 = c102*c17
+    c110 = c66*y2
+    c111 = c19*d3
+    c112 = c111*c34
+    c113 = c111*c14
+    c114 = c102*c36
+    c115 = c102*c38
+    c116 = c104*c26
+    c117 = c40*c95
+    c118 = c20*c29
+    c119 = c118*d3
+    c120 = c15*c20*c32
+    c121 = d23*d4
+    c122 = c10*c121
+    c123 = c121*c13
+    c124 = c121*c25
+    c125 = c122 + c123 + c124
+    c126 = c100 + c101 + c103 + c105 + c106 + c107 + c108 + c109 - c110 + c112 + c113 + c114 + c115 + c116 + c117 + c119 + c120 + c125 + c68 + c96 + c97
+    c127 = c122*x14 + c123*x14 + c124*x14
+    c128 = -c100*x23 - c101*x23 + c103*x14 + c105*x14 + c106*x14 + c107*x14 + c108*x14 + c109*x14 + c110*x23 + c112*x14 + c113*x14 + c114*x14 + c115*x14 + c116*x14 + c117*x14 + c119*x14 + c120*x14 + c127 + c67*x23 + c96*x14 + c97*x14
+    c129 = c101*xe
+    c130 = -c122*xe - c123*xe - c124*xe
+    c131 = -c100*xe - c103*xe - c105*xe - c106*xe - c107*xe - c108*xe - c109*xe + c110*xe - c112*xe - c113*xe - c114*xe - c115*xe - c116*xe - c117*xe - c119*xe - c120*xe + c128 - c129 + c130 + c67*xe - c96*xe - c97*xe
+    c132 = c1*c30
+    c133 = c2*d2
+    c134 = c133*c34
+    c135 = c133*c14
+    c136 = c36*c4
+    c137 = c38*c4
+    c138 = c17*c30
+    c139 = c3*c65*y3
+    c140 = c1*c50
+    c141 = c140*y1
+    c142 = -c141
+    c143 = c3*c98
+    c144 = c143*y3
+    c145 = c19*d2
+    c146 = c145*c34
+    c147 = c14*c145
+    c148 = c30*c36
+    c149 = c30*c38
+    c150 = c133*c26
+    c151 = c4*c40
+    c152 = c118*d2
+    c153 = c21*c32
+    c154 = c125 + c132 + c134 + c135 + c136 + c137 + c138 + c139 + c142 - c144 + c146 + c147 + c148 + c149 + c150 + c151 + c152 + c153 + c18 + c5 + c55
+    c155 = c127 + c132*x14 + c134*x14 + c135*x14 + c136*x14 + c137*x14 + c138*x14 - c139*x23 + c141*x23 + c144*x23 + c146*x14 + c147*x14 + c148*x14 + c149*x14 + c150*x14 + c151*x14 + c152*x14 + c153*x14 + c18*x14 + c5*x14 - c55*x23
+    c156 = c155*fl
+    c157 = c141*xe
+    c158 = fe*(c130 - c132*xe - c134*xe - c135*xe - c136*xe - c137*xe - c138*xe - c139*xe + c144*xe - c146*xe - c147*xe - c148*xe - c149*xe - c150*xe - c151*xe - c152*xe - c153*xe + c155 + c157 - c18*xe - c5*xe - c86)
+    c159 = c28*c3
+    c160 = c10*c33
+    c161 = c10*c35
+    c162 = c15*c28
+    c163 = c1*c62
+    c164 = c163*y4
+    c165 = c9*d1
+    c166 = c165*c37
+    c167 = c165*c8
+    c168 = c140*y4
+    c169 = c28*c33
+    c170 = c28*c35
+    c171 = c23*d1
+    c172 = c171*c37
+    c173 = c171*c8
+    c174 = c10*c39
+    c175 = c165*c22
+    c176 = c28*c39
+    c177 = c171*c22
+    c178 = mly*(c101 + c11 + c142 + c159 + c16 + c160 + c161 + c162 + c164 + c166 + c167 - c168 + c169 + c170 + c172 + c173 + c174 + c175 + c176 + c177 + c82)
+    c179 = -c101*x14 + c11*x23 + c141*x14 + c159*x23 + c16*x23 + c160*x23 + c161*x23 + c162*x23 - c164*x14 + c166*x23 + c167*x23 + c168*x14 + c169*x23 + c170*x23 + c172*x23 + c173*x23 + c174*x23 + c175*x23 + c176*x23 + c177*x23 + c84
+    c180 = c179*fl
+    c181 = fe*(c11*xe + c129 - c157 + c159*xe + c16*xe + c160*xe + c161*xe + c162*xe + c164*xe + c166*xe + c167*xe - c168*xe + c169*xe + c170*xe + c172*xe + c173*xe + c174*xe + c175*xe + c176*xe + c177*xe + c179 + c87)
+    c182 = d1*y1
+    c183 = c182*c33
+    c184 = c182*c35
+    c185 = d2*y2
+    c186 = c185*c36
+    c187 = c185*c38
+    c188 = c182*c39
+    c189 = c185*c40
+    c190 = d3*y3
+    c191 = c190*c36
+    c192 = c190*c38
+    c193 = c190*c40
+    c194 = -c12*d1*d2*d4*x14*y2 + c183*x23 + c184*x23 + c188*x23 + c191*x14 + c192*x14 + c193*x14 - c2*d2*d3*d4*x23*y4 - c6*d2*d3*d4*x23*y4 - c9*d1*d2*d4*x14*y2 - 2*d1*d2*d4*x14*y1*y2*y4 - 2*d2*d3*d4*x23*y2*y3*y4
+    c195 = d14*d23
+    c196 = d4*y4
+    c197 = -c194*c195*fl + c195*fe*(c12*d1*d3*d4*xe*y3 - c183*xe - c184*xe - c186*xe - c187*xe - c188*xe - c189*xe - c194 + c2*d2*d3*d4*xe*y4 + c6*d2*d3*d4*xe*y4 + c9*d1*d3*d4*xe*y3 + 2*d1*d3*d4*xe*y1*y3*y4 + 2*d2*d3*d4*xe*y2*y3*y4) - d14*d23*mly*(c183 + c184 + c186 + c187 + c188 + c189 - c191 - c192 - c193 - c196*c33 - c196*c35 - c196*c39)
+    c198 = c190*c34
+    c199 = c14*c190
+    c200 = c190*c26
+    c201 = c36*c62
+    c202 = c38*c62
+    c203 = c40*c62
+    c204 = c143 + c163 + c63 + c99 - d1*d14*d2*d23*y2 - d14*d2*d23*d4*y2 - d14*d2*d23*d4*y4 - d14*d23*d3*d4*y4
+    c205 = -c12*d1*d2*d23*d4*y2 + c201 + c202 + c203 + c204 - c9*d1*d2*d23*d4*y2 - 2*d1*d2*d23*d4*y1*y2*y4
+    c206 = c140*x14 + c143*x23 + c51*x14 + c99*x23 - d1*d14*d23*d3*x14*y3 - d14*d2*d23*d4*x23*y4 - d14*d23*d3*d4*x14*y3 - d14*d23*d3*d4*x23*y4
+    c207 = -c12*d1*d23*d3*d4*x14*y3 + c206 + c36*c50*x14 + c38*c50*x14 + c40*c50*x14 - c9*d1*d23*d3*d4*x14*y3 - 2*d1*d23*d3*d4*x14*y1*y3*y4
+    c208 = -c12*d1*d14*d3*d4*x14*y3 + c14*c185*x14 + c185*c26*x14 + c185*c34*x14 + c207 - c9*d1*d14*d3*d4*x14*y3 - 2*d1*d14*d3*d4*x14*y1*y3*y4
+    c209 = c143*xe + c163*xe + c63*xe + c99*xe - d1*d14*d2*d23*xe*y2 - d14*d2*d23*d4*xe*y2 - d14*d2*d23*d4*xe*y4 - d14*d23*d3*d4*xe*y4
+    c210 = -c12*d1*d2*d23*d4*xe*y2 + c201*xe + c202*xe + c203*xe + c209 - c9*d1*d2*d23*d4*xe*y2 - 2*d1*d2*d23*d4*xe*y1*y2*y4
+    c211 = c33*c98
+    c212 = c35*c98
+    c213 = c39*c98
+    c214 = -c2*d14*d2*d3*d4*y4 + c211 + c212 + c213 - c6*d14*d2*d3*d4*y4 - 2*d14*d2*d3*d4*y2*y3*y4
+    c215 = -c2*d14*d2*d3*d4*x23*y4 + c211*x23 + c212*x23 + c213*x23 - c6*d14*d2*d3*d4*x23*y4 - 2*d14*d2*d3*d4*x23*y2*y3*y4
+    c216 = c207 + c215
+    c217 = -c2*d14*d2*d3*d4*xe*y4 + c211*xe + c212*xe + c213*xe - c6*d14*d2*d3*d4*xe*y4 - 2*d14*d2*d3*d4*xe*y2*y3*y4
+    c218 = c182*c37
+    c219 = c182*c8
+    c220 = c182*c22
+    c221 = -c2*d2*d23*d3*d4*x23*y4 + c206 + c215 + c218*x23 + c219*x23 + c220*x23 - c6*d2*d23*d3*d4*x23*y4 - 2*d2*d23*d3*d4*x23*y2*y3*y4
+    den0 = c0*(c1*c22 + c1*c8 + c11*d4 + c14*c15 + c14*c3 + c14*c33 + c14*c35 + c14*c39 + c15*c26 + c16*d4 + c17*c22 + c17*c8 + c18*d3 + 4*c19*c27*c29 + c22*c36 + c22*c38 + c26*c3 + c26*c33 + c26*c35 + 4*c30*c32*d3 + c33*c34 + c34*c35 + c34*c39 + c36*c37 + c36*c8 + c37*c38 + c37*c40 + c38*c8 + c40*c8 + c5*d3)
+    den1 = c0
+    f1 = (-c46 + c83*d1*mly + c85*d1*fl + c88*d1*fe) / den0
+    f2 = (-c126*d2*mly + c128*d2*fl + c131*d2*fe - c94) / den0
+    f3 = (-c154*d3*mly + c156*d3 + c158*d3 + c94) / den0
+    f4 = (c178*d4 + c180*d4 + c181*d4 + c46) / den0
+    t14x = (-c1*c41**2*c43*d4 - c197) / den0
+    t23x = (c0*c89**2*c90*d2*d23*d3*mlx - c197) / den0
+    s1 = (-c17*c44 + c83*mly + c85*fl + c88*fe) / den0
+    s2 = (-c126*mly + c128*fl + c131*fe - c15*c92) / den0
+    s3 = (-c154*mly + c156 + c158 + c93) / den0
+    s4 = (c178 + c180 + c181 + c45) / den0
+    phi1 = (-c208*fl - c91*d23*(d2 + d3) + fe*(c12*d1*d14*d2*d4*xe*y2 - c198*xe - c199*xe - c200*xe - c208 - c210 + c9*d1*d14*d2*d4*xe*y2 + 2*d1*d14*d2*d4*xe*y1*y2*y4) + mly*(c12*d1*d14*d2*d4*y2 - c198 - c199 - c200 - c205 + c9*d1*d14*d2*d4*y2 + 2*d1*d14*d2*d4*y1*y2*y4)) / den0
+    phi2 = (-c216*fl - c42*c91 + fe*(-c210 - c216 - c217) + mly*(-c205 - c214)) / den0
+    phi3 = (-c221*fl - c43*d14*(d1 + d4) + fe*(c2*d2*d23*d3*d4*xe*y4 - c209 - c217 - c218*xe - c219*xe - c220*xe - c221 + c6*d2*d23*d3*d4*xe*y4 + 2*d2*d23*d3*d4*xe*y2*y3*y4) + mly*(c2*d2*d23*d3*d4*y4 - c204 - c214 - c218 - c219 - c220 + c6*d2*d23*d3*d4*y4 + 2*d2*d23*d3*d4*y2*y3*y4)) / den0
+    fry = (fe*(-x14 + xe) - fl*x14 + mly) / den1
+    ffy = (fe*(x23 + xe) + fl*x23 + mly) / den1
     results = {'f1': f1, 'f2': f2, 'f3': f3, 'f4': f4, 't14x': t14x, 't23x': t23x, 's1': s1, 's2': s2, 's3': s3, 's4': s4, 'phi1': phi1, 'phi2': phi2, 'phi3': phi3, 'fry': fry, 'ffy': ffy}
-    if x1 and x3:
-        t14y = (-fe * x23 * x3 - fe * x3 * xe - fl * x23 * x3 - mly * x3) / (x14 + x23)
-        t23y = (-fe * x1 * x14 + fe * x1 * xe - fl * x1 * x14 + mly * x1) / (x14 + x23)
+    if x1 is not None and x3 is not None:
+        t14y = (-fe*x23*x3 - fe*x3*xe - fl*x23*x3 - mly*x3) / (x14 + x23)
         results['t14y'] = t14y
+        t23y = (-fe*x1*x14 + fe*x1*xe - fl*x1*x14 + mly*x1) / (x14 + x23)
         results['t23y'] = t23y
     return results
 
 
-def results_liftoff_plain(fl, mlx, mly, fe, y1, y2, y3, y4, xe, x14, x23, d14, d23, d1, d2, d3, d4, lift, x1=None, x3=None):
-    """Solutions of the Static model (Statically determined). A lift index (int) must be passed to indicate which support is lifted from the ground."""
+def _results_plain_general_selected(fl, mlx, mly, fe, y1, y2, y3, y4, xe, x14, x23, d14, d23, d1, d2, d3, d4, x1, x3, outputs):
+    """Elastostatic model, general geometry. Only the outputs in the set outputs."""
+    want_f1 = 'f1' in outputs
+    want_f2 = 'f2' in outputs
+    want_f3 = 'f3' in outputs
+    want_f4 = 'f4' in outputs
+    want_t14x = 't14x' in outputs
+    want_t23x = 't23x' in outputs
+    want_s1 = 's1' in outputs
+    want_s2 = 's2' in outputs
+    want_s3 = 's3' in outputs
+    want_s4 = 's4' in outputs
+    want_phi1 = 'phi1' in outputs
+    want_phi2 = 'phi2' in outputs
+    want_phi3 = 'phi3' in outputs
+    want_fry = 'fry' in outputs
+    want_ffy = 'ffy' in outputs
+    want_t14y = 't14y' in outputs
+    want_t23y = 't23y' in outputs
+    results = {}
+    if want_f1 or want_f2 or want_f3 or want_f4 or want_t14x or want_t23x or want_s1 or want_s2 or want_s3 or want_s4 or want_phi1 or want_phi2 or want_phi3 or want_fry or want_ffy:
+        c0 = x14 + x23
+    if want_f1 or want_f2 or want_f3 or want_f4 or want_t14x or want_t23x or want_s1 or want_s2 or want_s3 or want_s4 or want_phi1 or want_phi2 or want_phi3:
+        c1 = d1*d14
+        c2 = y2**2
+        c3 = d2*d23
+        c4 = c2*c3
+        c5 = c1*c4
+        c6 = y3**2
+        c7 = c3*c6
+        c8 = c7*d3
+        c9 = y1**2
+        c10 = c1*c9
+        c11 = c10*c3
+        c12 = y4**2
+        c13 = c1*c12
+        c14 = c13*d4
+        c15 = d23*d3
+        c16 = c10*c15
+        c17 = d14*d4
+        c18 = c17*c4
+        c19 = y2*y3
+        c20 = 2*c19
+        c21 = c20*c3
+        c22 = c21*d3
+        c23 = y1*y4
+        c24 = 2*c23
+        c25 = c1*c24
+        c26 = c25*d4
+        c27 = d2*d3
+        c28 = c1*c23
+        c29 = c28*d4
+        c30 = c19*c3
+        c31 = d1*d4
+        c32 = c23*c31
+        c33 = c2*c27
+        c34 = c10*d4
+        c35 = c27*c6
+        c36 = c31*c9
+        c37 = c4*d3
+        c38 = c12*c31
+        c39 = c20*c27
+        c40 = c24*c31
+    if want_f1 or want_f4 or want_t14x or want_s1 or want_s4:
+        c41 = y1 + y4
+    if want_f1 or want_f4 or want_t14x or want_s1 or want_s4 or want_phi2 or want_phi3:
+        c42 = c15 + c3 + c33 + c35 + c39
+    if want_f1 or want_f4 or want_t14x or want_s1 or want_s4 or want_phi3:
+        c43 = c0*c42*mlx
+    if want_f1 or want_f4 or want_s1 or want_s4:
+        c44 = c41*c43
+    if want_f1 or want_f4 or want_s4:
+        c45 = c1*c44
+    if want_f1 or want_f4:
+        c46 = c45*d4
+    if want_f1 or want_s1:
+        c47 = c12*c17
+        c48 = c3*c47
+        c49 = c15*c47
+    if want_f1 or want_f3 or want_f4 or want_s1 or want_s3 or want_s4 or want_phi1 or want_phi2 or want_phi3:
+        c50 = c3*y2
+    if want_f1 or want_f3 or want_s1 or want_s3 or want_phi1 or want_phi2 or want_phi3:
+        c51 = c17*c50
+    if want_f1 or want_s1:
+        c52 = c51*y1
+        c53 = c17*c23
+        c54 = c3*c53
+    if want_f1 or want_f3 or want_s1 or want_s3:
+        c55 = c51*y4
+    if want_f1 or want_s1:
+        c56 = c33*c47
+        c57 = c35*c47
+        c58 = c15*c53
+        c59 = c12*d4
+        c60 = c37*c59
+        c61 = c59*c8
+    if want_f1 or want_f4 or want_s1 or want_s4 or want_phi1 or want_phi2 or want_phi3:
+        c62 = c15*y3
+    if want_f1 or want_s1 or want_phi1 or want_phi2 or want_phi3:
+        c63 = c17*c62
+    if want_f1 or want_s1:
+        c64 = c63*y1
+    if want_f1 or want_f2 or want_f3 or want_s1 or want_s2 or want_s3:
+        c65 = c17*y4
+    if want_f1 or want_f2 or want_s1 or want_s2:
+        c66 = c15*c65
+        c67 = c66*y3
+        c68 = -c67
+    if want_f1 or want_s1:
+        c69 = c33*c53
+        c70 = c35*c53
+        c71 = c23*d4
+        c72 = c37*c71
+        c73 = c71*c8
+        c74 = c39*c47
+        c75 = c22*c59
+        c76 = c39*c53
+        c77 = c22*c71
+    if want_f1 or want_f4 or want_s1 or want_s4:
+        c78 = d14*d3
+        c79 = c4*c78
+        c80 = c7*c78
+        c81 = c21*c78
+        c82 = c79 + c80 + c81
+    if want_f1 or want_s1:
+        c83 = c48 + c49 + c52 + c54 + c55 + c56 + c57 + c58 + c60 + c61 - c64 + c68 + c69 + c70 + c72 + c73 + c74 + c75 + c76 + c77 + c82
+    if want_f1 or want_f4 or want_s1 or want_s4:
+        c84 = c79*x23 + c80*x23 + c81*x23
+    if want_f1 or want_s1:
+        c85 = c48*x23 + c49*x23 + c54*x23 + c56*x23 + c57*x23 + c58*x23 + c60*x23 + c61*x23 + c64*x14 + c67*x14 + c69*x23 + c70*x23 + c72*x23 + c73*x23 + c74*x23 + c75*x23 + c76*x23 + c77*x23 + c84 - d14*d2*d23*d4*x14*y1*y2 - d14*d2*d23*d4*x14*y2*y4
+    if want_f1 or want_f3 or want_s1 or want_s3:
+        c86 = c55*xe
+    if want_f1 or want_f4 or want_s1 or want_s4:
+        c87 = c79*xe + c80*xe + c81*xe
+    if want_f1 or want_s1:
+        c88 = c48*xe + c49*xe + c52*xe + c54*xe + c56*xe + c57*xe + c58*xe + c60*xe + c61*xe + c69*xe + c70*xe + c72*xe + c73*xe + c74*xe + c75*xe + c76*xe + c77*xe + c85 + c86 + c87 - d14*d23*d3*d4*xe*y1*y3 - d14*d23*d3*d4*xe*y3*y4
+    if want_f2 or want_f3 or want_t23x or want_s2 or want_s3:
+        c89 = y2 + y3
+    if want_f2 or want_f3 or want_t23x or want_s2 or want_s3 or want_phi1 or want_phi2:
+        c90 = c1 + c17 + c36 + c38 + c40
+    if want_f2 or want_f3 or want_s2 or want_s3 or want_phi1 or want_phi2:
+        c91 = c0*c90*mlx
+    if want_f2 or want_f3 or want_s2 or want_s3:
+        c92 = c89*c91
+    if want_f2 or want_f3 or want_s3:
+        c93 = c3*c92
+    if want_f2 or want_f3:
+        c94 = c93*d3
+    if want_f2 or want_s2:
+        c95 = c15*c6
+        c96 = c1*c95
+        c97 = c17*c95
+    if want_f2 or want_f3 or want_f4 or want_s2 or want_s3 or want_s4 or want_phi1 or want_phi2 or want_phi3:
+        c98 = c1*y1
+    if want_f2 or want_f4 or want_s2 or want_s4 or want_phi1 or want_phi2 or want_phi3:
+        c99 = c15*c98
+    if want_f2 or want_s2:
+        c100 = c99*y2
+    if want_f2 or want_f4 or want_s2 or want_s4:
+        c101 = c99*y3
+    if want_f2 or want_s2:
+        c102 = c15*c19
+        c103 = c1*c102
+        c104 = c6*d3
+        c105 = c104*c34
+        c106 = c104*c14
+        c107 = c36*c95
+        c108 = c38*c95
+        c109 = c102*c17
+        c110 = c66*y2
+        c111 = c19*d3
+        c112 = c111*c34
+        c113 = c111*c14
+        c114 = c102*c36
+        c115 = c102*c38
+        c116 = c104*c26
+        c117 = c40*c95
+    if want_f2 or want_f3 or want_s2 or want_s3:
+        c118 = c20*c29
+    if want_f2 or want_s2:
+        c119 = c118*d3
+        c120 = c15*c20*c32
+    if want_f2 or want_f3 or want_s2 or want_s3:
+        c121 = d23*d4
+        c122 = c10*c121
+        c123 = c121*c13
+        c124 = c121*c25
+        c125 = c122 + c123 + c124
+    if want_f2 or want_s2:
+        c126 = c100 + c101 + c103 + c105 + c106 + c107 + c108 + c109 - c110 + c112 + c113 + c114 + c115 + c116 + c117 + c119 + c120 + c125 + c68 + c96 + c97
+    if want_f2 or want_f3 or want_s2 or want_s3:
+        c127 = c122*x14 + c123*x14 + c124*x14
+    if want_f2 or want_s2:
+        c128 = -c100*x23 - c101*x23 + c103*x14 + c105*x14 + c106*x14 + c107*x14 + c108*x14 + c109*x14 + c110*x23 + c112*x14 + c113*x14 + c114*x14 + c115*x14 + c116*x14 + c117*x14 + c119*x14 + c120*x14 + c127 + c67*x23 + c96*x14 + c97*x14
+    if want_f2 or want_f4 or want_s2 or want_s4:
+        c129 = c101*xe
+    if want_f2 or want_f3 or want_s2 or want_s3:
+        c130 = -c122*xe - c123*xe - c124*xe
+    if want_f2 or want_s2:
+        c131 = -c100*xe - c103*xe - c105*xe - c106*xe - c107*xe - c108*xe - c109*xe + c110*xe - c112*xe - c113*xe - c114*xe - c115*xe - c116*xe - c117*xe - c119*xe - c120*xe + c128 - c129 + c130 + c67*xe - c96*xe - c97*xe
+    if want_f3 or want_s3:
+        c132 = c1*c30
+        c133 = c2*d2
+        c134 = c133*c34
+        c135 = c133*c14
+        c136 = c36*c4
+        c137 = c38*c4
+        c138 = c17*c30
+        c139 = c3*c65*y3
+    if want_f3 or want_f4 or want_s3 or want_s4 or want_phi1 or want_phi2 or want_phi3:
+        c140 = c1*c50
+    if want_f3 or want_f4 or want_s3 or want_s4:
+        c141 = c140*y1
+        c142 = -c141
+    if want_f3 or want_s3 or want_phi1 or want_phi2 or want_phi3:
+        c143 = c3*c98
+    if want_f3 or want_s3:
+        c144 = c143*y3
+        c145 = c19*d2
+        c146 = c145*c34
+        c147 = c14*c145
+        c148 = c30*c36
+        c149 = c30*c38
+        c150 = c133*c26
+        c151 = c4*c40
+        c152 = c118*d2
+        c153 = c21*c32
+        c154 = c125 + c132 + c134 + c135 + c136 + c137 + c138 + c139 + c142 - c144 + c146 + c147 + c148 + c149 + c150 + c151 + c152 + c153 + c18 + c5 + c55
+        c155 = c127 + c132*x14 + c134*x14 + c135*x14 + c136*x14 + c137*x14 + c138*x14 - c139*x23 + c141*x23 + c144*x23 + c146*x14 + c147*x14 + c148*x14 + c149*x14 + c150*x14 + c151*x14 + c152*x14 + c153*x14 + c18*x14 + c5*x14 - c55*x23
+        c156 = c155*fl
+    if want_f3 or want_f4 or want_s3 or want_s4:
+        c157 = c141*xe
+    if want_f3 or want_s3:
+        c158 = fe*(c130 - c132*xe - c134*xe - c135*xe - c136*xe - c137*xe - c138*xe - c139*xe + c144*xe - c146*xe - c147*xe - c148*xe - c149*xe - c150*xe - c151*xe - c152*xe - c153*xe + c155 + c157 - c18*xe - c5*xe - c86)
+    if want_f4 or want_s4:
+        c159 = c28*c3
+        c160 = c10*c33
+        c161 = c10*c35
+        c162 = c15*c28
+    if want_f4 or want_s4 or want_phi1 or want_phi2 or want_phi3:
+        c163 = c1*c62
+    if want_f4 or want_s4:
+        c164 = c163*y4
+        c165 = c9*d1
+        c166 = c165*c37
+        c167 = c165*c8
+        c168 = c140*y4
+        c169 = c28*c33
+        c170 = c28*c35
+        c171 = c23*d1
+        c172 = c171*c37
+        c173 = c171*c8
+        c174 = c10*c39
+        c175 = c165*c22
+        c176 = c28*c39
+        c177 = c171*c22
+        c178 = mly*(c101 + c11 + c142 + c159 + c16 + c160 + c161 + c162 + c164 + c166 + c167 - c168 + c169 + c170 + c172 + c173 + c174 + c175 + c176 + c177 + c82)
+        c179 = -c101*x14 + c11*x23 + c141*x14 + c159*x23 + c16*x23 + c160*x23 + c161*x23 + c162*x23 - c164*x14 + c166*x23 + c167*x23 + c168*x14 + c169*x23 + c170*x23 + c172*x23 + c173*x23 + c174*x23 + c175*x23 + c176*x23 + c177*x23 + c84
+        c180 = c179*fl
+        c181 = fe*(c11*xe + c129 - c157 + c159*xe + c16*xe + c160*xe + c161*xe + c162*xe + c164*xe + c166*xe + c167*xe - c168*xe + c169*xe + c170*xe + c172*xe + c173*xe + c174*xe + c175*xe + c176*xe + c177*xe + c179 + c87)
+    if want_t14x or want_t23x or want_phi3:
+        c182 = d1*y1
+    if want_t14x or want_t23x:
+        c183 = c182*c33
+        c184 = c182*c35
+    if want_t14x or want_t23x or want_phi1:
+        c185 = d2*y2
+    if want_t14x or want_t23x:
+        c186 = c185*c36
+        c187 = c185*c38
+        c188 = c182*c39
+        c189 = c185*c40
+    if want_t14x or want_t23x or want_phi1:
+        c190 = d3*y3
+    if want_t14x or want_t23x:
+        c191 = c190*c36
+        c192 = c190*c38
+        c193 = c190*c40
+        c194 = -c12*d1*d2*d4*x14*y2 + c183*x23 + c184*x23 + c188*x23 + c191*x14 + c192*x14 + c193*x14 - c2*d2*d3*d4*x23*y4 - c6*d2*d3*d4*x23*y4 - c9*d1*d2*d4*x14*y2 - 2*d1*d2*d4*x14*y1*y2*y4 - 2*d2*d3*d4*x23*y2*y3*y4
+        c195 = d14*d23
+        c196 = d4*y4
+        c197 = -c194*c195*fl + c195*fe*(c12*d1*d3*d4*xe*y3 - c183*xe - c184*xe - c186*xe - c187*xe - c188*xe - c189*xe - c194 + c2*d2*d3*d4*xe*y4 + c6*d2*d3*d4*xe*y4 + c9*d1*d3*d4*xe*y3 + 2*d1*d3*d4*xe*y1*y3*y4 + 2*d2*d3*d4*xe*y2*y3*y4) - d14*d23*mly*(c183 + c184 + c186 + c187 + c188 + c189 - c191 - c192 - c193 - c196*c33 - c196*c35 - c196*c39)
+    if want_phi1:
+        c198 = c190*c34
+        c199 = c14*c190
+        c200 = c190*c26
+    if want_phi1 or want_phi2:
+        c201 = c36*c62
+        c202 = c38*c62
+        c203 = c40*c62
+    if want_phi1 or want_phi2 or want_phi3:
+        c204 = c143 + c163 + c63 + c99 - d1*d14*d2*d23*y2 - d14*d2*d23*d4*y2 - d14*d2*d23*d4*y4 - d14*d23*d3*d4*y4
+    if want_phi1 or want_phi2:
+        c205 = -c12*d1*d2*d23*d4*y2 + c201 + c202 + c203 + c204 - c9*d1*d2*d23*d4*y2 - 2*d1*d2*d23*d4*y1*y2*y4
+    if want_phi1 or want_phi2 or want_phi3:
+        c206 = c140*x14 + c143*x23 + c51*x14 + c99*x23 - d1*d14*d23*d3*x14*y3 - d14*d2*d23*d4*x23*y4 - d14*d23*d3*d4*x14*y3 - d14*d23*d3*d4*x23*y4
+    if want_phi1 or want_phi2:
+        c207 = -c12*d1*d23*d3*d4*x14*y3 + c206 + c36*c50*x14 + c38*c50*x14 + c40*c50*x14 - c9*d1*d23*d3*d4*x14*y3 - 2*d1*d23*d3*d4*x14*y1*y3*y4
+    if want_phi1:
+        c208 = -c12*d1*d14*d3*d4*x14*y3 + c14*c185*x14 + c185*c26*x14 + c185*c34*x14 + c207 - c9*d1*d14*d3*d4*x14*y3 - 2*d1*d14*d3*d4*x14*y1*y3*y4
+    if want_phi1 or want_phi2 or want_phi3:
+        c209 = c143*xe + c163*xe + c63*xe + c99*xe - d1*d14*d2*d23*xe*y2 - d14*d2*d23*d4*xe*y2 - d14*d2*d23*d4*xe*y4 - d14*d23*d3*d4*xe*y4
+    if want_phi1 or want_phi2:
+        c210 = -c12*d1*d2*d23*d4*xe*y2 + c201*xe + c202*xe + c203*xe + c209 - c9*d1*d2*d23*d4*xe*y2 - 2*d1*d2*d23*d4*xe*y1*y2*y4
+    if want_phi2 or want_phi3:
+        c211 = c33*c98
+        c212 = c35*c98
+        c213 = c39*c98
+        c214 = -c2*d14*d2*d3*d4*y4 + c211 + c212 + c213 - c6*d14*d2*d3*d4*y4 - 2*d14*d2*d3*d4*y2*y3*y4
+        c215 = -c2*d14*d2*d3*d4*x23*y4 + c211*x23 + c212*x23 + c213*x23 - c6*d14*d2*d3*d4*x23*y4 - 2*d14*d2*d3*d4*x23*y2*y3*y4
+    if want_phi2:
+        c216 = c207 + c215
+    if want_phi2 or want_phi3:
+        c217 = -c2*d14*d2*d3*d4*xe*y4 + c211*xe + c212*xe + c213*xe - c6*d14*d2*d3*d4*xe*y4 - 2*d14*d2*d3*d4*xe*y2*y3*y4
+    if want_phi3:
+        c218 = c182*c37
+        c219 = c182*c8
+        c220 = c182*c22
+        c221 = -c2*d2*d23*d3*d4*x23*y4 + c206 + c215 + c218*x23 + c219*x23 + c220*x23 - c6*d2*d23*d3*d4*x23*y4 - 2*d2*d23*d3*d4*x23*y2*y3*y4
+    if want_f1 or want_f2 or want_f3 or want_f4 or want_t14x or want_t23x or want_s1 or want_s2 or want_s3 or want_s4 or want_phi1 or want_phi2 or want_phi3:
+        den0 = c0*(c1*c22 + c1*c8 + c11*d4 + c14*c15 + c14*c3 + c14*c33 + c14*c35 + c14*c39 + c15*c26 + c16*d4 + c17*c22 + c17*c8 + c18*d3 + 4*c19*c27*c29 + c22*c36 + c22*c38 + c26*c3 + c26*c33 + c26*c35 + 4*c30*c32*d3 + c33*c34 + c34*c35 + c34*c39 + c36*c37 + c36*c8 + c37*c38 + c37*c40 + c38*c8 + c40*c8 + c5*d3)
+    if want_fry or want_ffy:
+        den1 = c0
+    if want_f1:
+        results['f1'] = (-c46 + c83*d1*mly + c85*d1*fl + c88*d1*fe) / den0
+    if want_f2:
+        results['f2'] = (-c126*d2*mly + c128*d2*fl + c131*d2*fe - c94) / den0
+    if want_f3:
+        results['f3'] = (-c154*d3*mly + c156*d3 + c158*d3 + c94) / den0
+    if want_f4:
+        results['f4'] = (c178*d4 + c180*d4 + c181*d4 + c46) / den0
+    if want_t14x:
+        results['t14x'] = (-c1*c41**2*c43*d4 - c197) / den0
+    if want_t23x:
+        results['t23x'] = (c0*c89**2*c90*d2*d23*d3*mlx - c197) / den0
+    if want_s1:
+        results['s1'] = (-c17*c44 + c83*mly + c85*fl + c88*fe) / den0
+    if want_s2:
+        results['s2'] = (-c126*mly + c128*fl + c131*fe - c15*c92) / den0
+    if want_s3:
+        results['s3'] = (-c154*mly + c156 + c158 + c93) / den0
+    if want_s4:
+        results['s4'] = (c178 + c180 + c181 + c45) / den0
+    if want_phi1:
+        results['phi1'] = (-c208*fl - c91*d23*(d2 + d3) + fe*(c12*d1*d14*d2*d4*xe*y2 - c198*xe - c199*xe - c200*xe - c208 - c210 + c9*d1*d14*d2*d4*xe*y2 + 2*d1*d14*d2*d4*xe*y1*y2*y4) + mly*(c12*d1*d14*d2*d4*y2 - c198 - c199 - c200 - c205 + c9*d1*d14*d2*d4*y2 + 2*d1*d14*d2*d4*y1*y2*y4)) / den0
+    if want_phi2:
+        results['phi2'] = (-c216*fl - c42*c91 + fe*(-c210 - c216 - c217) + mly*(-c205 - c214)) / den0
+    if want_phi3:
+        results['phi3'] = (-c221*fl - c43*d14*(d1 + d4) + fe*(c2*d2*d23*d3*d4*xe*y4 - c209 - c217 - c218*xe - c219*xe - c220*xe - c221 + c6*d2*d23*d3*d4*xe*y4 + 2*d2*d23*d3*d4*xe*y2*y3*y4) + mly*(c2*d2*d23*d3*d4*y4 - c204 - c214 - c218 - c219 - c220 + c6*d2*d23*d3*d4*y4 + 2*d2*d23*d3*d4*y2*y3*y4)) / den0
+    if want_fry:
+        results['fry'] = (fe*(-x14 + xe) - fl*x14 + mly) / den1
+    if want_ffy:
+        results['ffy'] = (fe*(x23 + xe) + fl*x23 + mly) / den1
+    if x1 is not None and x3 is not None:
+        if want_t14y:
+            results['t14y'] = (-fe*x23*x3 - fe*x3*xe - fl*x23*x3 - mly*x3) / (x14 + x23)
+        if want_t23y:
+            results['t23y'] = (-fe*x1*x14 + fe*x1*xe - fl*x1*x14 + mly*x1) / (x14 + x23)
+    return results
+
+
+def _results_liftoff_plain_general(fl, mlx, mly, fe, y1, y2, y3, y4, xe, x14, x23, d14, d23, d1, d2, d3, d4, lift, x1, x3, outputs):
+    """Lift-off models, general geometry."""
+    if outputs is not None:
+        return _results_liftoff_plain_general_selected(fl, mlx, mly, fe, y1, y2, y3, y4, xe, x14, x23, d14, d23, d1, d2, d3, d4, lift, x1, x3, outputs)
     if lift == 1:
+        c0 = x14 + x23
+        c1 = y2 + y3
+        c2 = c0*c1
+        c3 = c1**2
+        c4 = c0*d4
+        c5 = d2*d23
+        c6 = c5*d3
+        c7 = c6*d14
+        c8 = d2*d3
+        c9 = c0*c3
+        c10 = c6*c9
+        c11 = x14*y3
+        c12 = x23*y4
+        c13 = c11 + c12
+        c14 = xe*y4
+        c15 = xe*y3
+        c16 = -c0*mlx + c13*fl + fe*(c13 + c14 - c15) + mly*(-y3 + y4)
+        c17 = c0*mlx
+        c18 = x14*y2
+        c19 = xe*y2
+        c20 = c17 + fe*(-c12 - c14 - c19 + x14*y2) + fl*(-c12 + c18) + mly*(-y2 - y4)
+        c21 = fe*(x23 + xe)
+        c22 = c21 + fl*x23 + mly
+        c23 = c12*fl + c21*y4 + mly*y4
+        c24 = d23*d3
+        c25 = y2**2
+        c26 = c25*c8
+        c27 = y3**2
+        c28 = c27*c8
+        c29 = d3*y3
+        c30 = d2*y2
+        c31 = 2*c30
+        c32 = c29*c31
+        c33 = c24 + c26 + c28 + c32 + c5
+        c34 = c5*y2
+        c35 = c34*d14
+        c36 = d4*y1
+        c37 = c5*y4
+        c38 = c37*d14
+        c39 = c35*d4
+        c40 = c24*y4
+        c41 = c40*d14
+        c42 = c25*c7
+        c43 = c27*c7
+        c44 = d4*y4**2
+        c45 = c44*d14
+        c46 = c45*c5
+        c47 = c24*c45
+        c48 = 2*c35
+        c49 = c29*c48
+        c50 = c24*y3
+        c51 = c50*d14
+        c52 = c41*d4
+        c53 = d2*y4
+        c54 = c53*d3
+        c55 = c25*c54
+        c56 = c55*d14
+        c57 = c27*c54
+        c58 = c57*d14
+        c59 = d3*y4
+        c60 = c5*c59
+        c61 = c25*c60
+        c62 = c27*c60
+        c63 = c59*y3
+        c64 = c31*c63
+        c65 = c64*d14
+        c66 = 2*c34
+        c67 = c63*c66
+        c68 = c26*c45
+        c69 = c28*c45
+        c70 = c44*c6
+        c71 = c25*c70
+        c72 = c27*c70
+        c73 = c32*c45
+        c74 = c29*c66
+        c75 = c44*c74
+        c76 = c12*c5
+        c77 = c76*d14
+        c78 = c11*c24
+        c79 = c78*d14
+        c80 = c12*c24
+        c81 = c80*d14
+        c82 = c18*c5
+        c83 = c82*d14
+        c84 = c12*c26
+        c85 = c84*d14
+        c86 = c12*c28
+        c87 = c86*d14
+        c88 = c12*d3
+        c89 = c5*c88
+        c90 = c25*c89
+        c91 = c27*c89
+        c92 = c12*c32
+        c93 = c92*d14
+        c94 = c12*c74
+        c95 = c11*c52 - c18*c38*d4 + c36*c77 + c36*c79 + c36*c81 - c36*c83 + c36*c85 + c36*c87 + c36*c90 + c36*c91 + c36*c93 + c36*c94 + c42*x23 + c43*x23 + c46*x23 + c47*x23 + c49*x23 + c68*x23 + c69*x23 + c71*x23 + c72*x23 + c73*x23 + c75*x23
+        c96 = c19*c5
+        c97 = c96*d14
+        c98 = c14*c5
+        c99 = c98*d14
+        c100 = c14*c24
+        c101 = c100*d14
+        c102 = c15*c24
+        c103 = c102*d14
+        c104 = c15*d3
+        c105 = c14*c26
+        c106 = c105*d14
+        c107 = c14*c28
+        c108 = c107*d14
+        c109 = c14*d3
+        c110 = c109*c5
+        c111 = c110*c25
+        c112 = c110*c27
+        c113 = c14*c32
+        c114 = c113*d14
+        c115 = c14*c74
+        c116 = c11*d3 + c12*d2 - c18*d2 + c88
+        c117 = c17*c33
+        c118 = c76 + c78 + c80 - c82 + c84 + c86 + c92
+        c119 = c77 + c79 + c81 - c83 + c85 + c87 + c90 + c91 + c93 + c94
+        den0 = c2
+        den1 = c0
+        den2 = c3*c4*c7
+        den3 = c2*d2
+        den4 = c2*d3
+        den5 = c4
+        den6 = c8*c9
+        den7 = c10
+        den8 = c10*d14
         f1 = 0
-        f2 = (fe * x14 * y3 + fe * x23 * y4 - fe * xe * y3 + fe * xe * y4 + fl * x14 * y3 + fl * x23 * y4 - mlx * x14 - mlx * x23 - mly * y3 + mly * y4) / (x14 * y2 + x14 * y3 + x23 * y2 + x23 * y3)
-        f3 = (fe * x14 * y2 - fe * x23 * y4 - fe * xe * y2 - fe * xe * y4 + fl * x14 * y2 - fl * x23 * y4 + mlx * x14 + mlx * x23 - mly * y2 - mly * y4) / (x14 * y2 + x14 * y3 + x23 * y2 + x23 * y3)
-        f4 = (fe * x23 + fe * xe + fl * x23 + mly) / (x14 + x23)
-        t14x = (-fe * x23 * y4 - fe * xe * y4 - fl * x23 * y4 - mly * y4) / (x14 + x23)
-        t23x = (-fe * x23 * y4 - fe * xe * y4 - fl * x23 * y4 + mlx * x14 + mlx * x23 - mly * y4) / (x14 + x23)
-        s1 = (d14 * d2 * d23 * d3 * fe * x23 * y2**2 + 2 * d14 * d2 * d23 * d3 * fe * x23 * y2 * y3 + d14 * d2 * d23 * d3 * fe * x23 * y3**2 + d14 * d2 * d23 * d3 * fe * xe * y2**2 + 2 * d14 * d2 * d23 * d3 * fe * xe * y2 * y3 + d14 * d2 * d23 * d3 * fe * xe * y3**2 + d14 * d2 * d23 * d3 * fl * x23 * y2**2 + 2 * d14 * d2 * d23 * d3 * fl * x23 * y2 * y3 + d14 * d2 * d23 * d3 * fl * x23 * y3**2 + d14 * d2 * d23 * d3 * mly * y2**2 + 2 * d14 * d2 * d23 * d3 * mly * y2 * y3 + d14 * d2 * d23 * d3 * mly * y3**2 - d14 * d2 * d23 * d4 * fe * x14 * y1 * y2 - d14 * d2 * d23 * d4 * fe * x14 * y2 * y4 + d14 * d2 * d23 * d4 * fe * x23 * y1 * y4 + d14 * d2 * d23 * d4 * fe * x23 * y4**2 + d14 * d2 * d23 * d4 * fe * xe * y1 * y2 + d14 * d2 * d23 * d4 * fe * xe * y1 * y4 + d14 * d2 * d23 * d4 * fe * xe * y2 * y4 + d14 * d2 * d23 * d4 * fe * xe * y4**2 - d14 * d2 * d23 * d4 * fl * x14 * y1 * y2 - d14 * d2 * d23 * d4 * fl * x14 * y2 * y4 + d14 * d2 * d23 * d4 * fl * x23 * y1 * y4 + d14 * d2 * d23 * d4 * fl * x23 * y4**2 - d14 * d2 * d23 * d4 * mlx * x14 * y1 - d14 * d2 * d23 * d4 * mlx * x14 * y4 - d14 * d2 * d23 * d4 * mlx * x23 * y1 - d14 * d2 * d23 * d4 * mlx * x23 * y4 + d14 * d2 * d23 * d4 * mly * y1 * y2 + d14 * d2 * d23 * d4 * mly * y1 * y4 + d14 * d2 * d23 * d4 * mly * y2 * y4 + d14 * d2 * d23 * d4 * mly * y4**2 + d14 * d2 * d3 * d4 * fe * x23 * y1 * y2**2 * y4 + 2 * d14 * d2 * d3 * d4 * fe * x23 * y1 * y2 * y3 * y4 + d14 * d2 * d3 * d4 * fe * x23 * y1 * y3**2 * y4 + d14 * d2 * d3 * d4 * fe * x23 * y2**2 * y4**2 + 2 * d14 * d2 * d3 * d4 * fe * x23 * y2 * y3 * y4**2 + d14 * d2 * d3 * d4 * fe * x23 * y3**2 * y4**2 + d14 * d2 * d3 * d4 * fe * xe * y1 * y2**2 * y4 + 2 * d14 * d2 * d3 * d4 * fe * xe * y1 * y2 * y3 * y4 + d14 * d2 * d3 * d4 * fe * xe * y1 * y3**2 * y4 + d14 * d2 * d3 * d4 * fe * xe * y2**2 * y4**2 + 2 * d14 * d2 * d3 * d4 * fe * xe * y2 * y3 * y4**2 + d14 * d2 * d3 * d4 * fe * xe * y3**2 * y4**2 + d14 * d2 * d3 * d4 * fl * x23 * y1 * y2**2 * y4 + 2 * d14 * d2 * d3 * d4 * fl * x23 * y1 * y2 * y3 * y4 + d14 * d2 * d3 * d4 * fl * x23 * y1 * y3**2 * y4 + d14 * d2 * d3 * d4 * fl * x23 * y2**2 * y4**2 + 2 * d14 * d2 * d3 * d4 * fl * x23 * y2 * y3 * y4**2 + d14 * d2 * d3 * d4 * fl * x23 * y3**2 * y4**2 - d14 * d2 * d3 * d4 * mlx * x14 * y1 * y2**2 - 2 * d14 * d2 * d3 * d4 * mlx * x14 * y1 * y2 * y3 - d14 * d2 * d3 * d4 * mlx * x14 * y1 * y3**2 - d14 * d2 * d3 * d4 * mlx * x14 * y2**2 * y4 - 2 * d14 * d2 * d3 * d4 * mlx * x14 * y2 * y3 * y4 - d14 * d2 * d3 * d4 * mlx * x14 * y3**2 * y4 - d14 * d2 * d3 * d4 * mlx * x23 * y1 * y2**2 - 2 * d14 * d2 * d3 * d4 * mlx * x23 * y1 * y2 * y3 - d14 * d2 * d3 * d4 * mlx * x23 * y1 * y3**2 - d14 * d2 * d3 * d4 * mlx * x23 * y2**2 * y4 - 2 * d14 * d2 * d3 * d4 * mlx * x23 * y2 * y3 * y4 - d14 * d2 * d3 * d4 * mlx * x23 * y3**2 * y4 + d14 * d2 * d3 * d4 * mly * y1 * y2**2 * y4 + 2 * d14 * d2 * d3 * d4 * mly * y1 * y2 * y3 * y4 + d14 * d2 * d3 * d4 * mly * y1 * y3**2 * y4 + d14 * d2 * d3 * d4 * mly * y2**2 * y4**2 + 2 * d14 * d2 * d3 * d4 * mly * y2 * y3 * y4**2 + d14 * d2 * d3 * d4 * mly * y3**2 * y4**2 + d14 * d23 * d3 * d4 * fe * x14 * y1 * y3 + d14 * d23 * d3 * d4 * fe * x14 * y3 * y4 + d14 * d23 * d3 * d4 * fe * x23 * y1 * y4 + d14 * d23 * d3 * d4 * fe * x23 * y4**2 - d14 * d23 * d3 * d4 * fe * xe * y1 * y3 + d14 * d23 * d3 * d4 * fe * xe * y1 * y4 - d14 * d23 * d3 * d4 * fe * xe * y3 * y4 + d14 * d23 * d3 * d4 * fe * xe * y4**2 + d14 * d23 * d3 * d4 * fl * x14 * y1 * y3 + d14 * d23 * d3 * d4 * fl * x14 * y3 * y4 + d14 * d23 * d3 * d4 * fl * x23 * y1 * y4 + d14 * d23 * d3 * d4 * fl * x23 * y4**2 - d14 * d23 * d3 * d4 * mlx * x14 * y1 - d14 * d23 * d3 * d4 * mlx * x14 * y4 - d14 * d23 * d3 * d4 * mlx * x23 * y1 - d14 * d23 * d3 * d4 * mlx * x23 * y4 - d14 * d23 * d3 * d4 * mly * y1 * y3 + d14 * d23 * d3 * d4 * mly * y1 * y4 - d14 * d23 * d3 * d4 * mly * y3 * y4 + d14 * d23 * d3 * d4 * mly * y4**2 + d2 * d23 * d3 * d4 * fe * x23 * y1 * y2**2 * y4 + 2 * d2 * d23 * d3 * d4 * fe * x23 * y1 * y2 * y3 * y4 + d2 * d23 * d3 * d4 * fe * x23 * y1 * y3**2 * y4 + d2 * d23 * d3 * d4 * fe * x23 * y2**2 * y4**2 + 2 * d2 * d23 * d3 * d4 * fe * x23 * y2 * y3 * y4**2 + d2 * d23 * d3 * d4 * fe * x23 * y3**2 * y4**2 + d2 * d23 * d3 * d4 * fe * xe * y1 * y2**2 * y4 + 2 * d2 * d23 * d3 * d4 * fe * xe * y1 * y2 * y3 * y4 + d2 * d23 * d3 * d4 * fe * xe * y1 * y3**2 * y4 + d2 * d23 * d3 * d4 * fe * xe * y2**2 * y4**2 + 2 * d2 * d23 * d3 * d4 * fe * xe * y2 * y3 * y4**2 + d2 * d23 * d3 * d4 * fe * xe * y3**2 * y4**2 + d2 * d23 * d3 * d4 * fl * x23 * y1 * y2**2 * y4 + 2 * d2 * d23 * d3 * d4 * fl * x23 * y1 * y2 * y3 * y4 + d2 * d23 * d3 * d4 * fl * x23 * y1 * y3**2 * y4 + d2 * d23 * d3 * d4 * fl * x23 * y2**2 * y4**2 + 2 * d2 * d23 * d3 * d4 * fl * x23 * y2 * y3 * y4**2 + d2 * d23 * d3 * d4 * fl * x23 * y3**2 * y4**2 + d2 * d23 * d3 * d4 * mly * y1 * y2**2 * y4 + 2 * d2 * d23 * d3 * d4 * mly * y1 * y2 * y3 * y4 + d2 * d23 * d3 * d4 * mly * y1 * y3**2 * y4 + d2 * d23 * d3 * d4 * mly * y2**2 * y4**2 + 2 * d2 * d23 * d3 * d4 * mly * y2 * y3 * y4**2 + d2 * d23 * d3 * d4 * mly * y3**2 * y4**2) / (d14 * d2 * d23 * d3 * d4 * x14 * y2**2 + 2 * d14 * d2 * d23 * d3 * d4 * x14 * y2 * y3 + d14 * d2 * d23 * d3 * d4 * x14 * y3**2 + d14 * d2 * d23 * d3 * d4 * x23 * y2**2 + 2 * d14 * d2 * d23 * d3 * d4 * x23 * y2 * y3 + d14 * d2 * d23 * d3 * d4 * x23 * y3**2)
-        s2 = (fe * x14 * y3 + fe * x23 * y4 - fe * xe * y3 + fe * xe * y4 + fl * x14 * y3 + fl * x23 * y4 - mlx * x14 - mlx * x23 - mly * y3 + mly * y4) / (d2 * x14 * y2 + d2 * x14 * y3 + d2 * x23 * y2 + d2 * x23 * y3)
-        s3 = (fe * x14 * y2 - fe * x23 * y4 - fe * xe * y2 - fe * xe * y4 + fl * x14 * y2 - fl * x23 * y4 + mlx * x14 + mlx * x23 - mly * y2 - mly * y4) / (d3 * x14 * y2 + d3 * x14 * y3 + d3 * x23 * y2 + d3 * x23 * y3)
-        s4 = (fe * x23 + fe * xe + fl * x23 + mly) / (d4 * x14 + d4 * x23)
-        phi1 = (-d2 * fe * x14 * y2 + d2 * fe * x23 * y4 + d2 * fe * xe * y2 + d2 * fe * xe * y4 - d2 * fl * x14 * y2 + d2 * fl * x23 * y4 - d2 * mlx * x14 - d2 * mlx * x23 + d2 * mly * y2 + d2 * mly * y4 + d3 * fe * x14 * y3 + d3 * fe * x23 * y4 - d3 * fe * xe * y3 + d3 * fe * xe * y4 + d3 * fl * x14 * y3 + d3 * fl * x23 * y4 - d3 * mlx * x14 - d3 * mlx * x23 - d3 * mly * y3 + d3 * mly * y4) / (d2 * d3 * x14 * y2**2 + 2 * d2 * d3 * x14 * y2 * y3 + d2 * d3 * x14 * y3**2 + d2 * d3 * x23 * y2**2 + 2 * d2 * d3 * x23 * y2 * y3 + d2 * d3 * x23 * y3**2)
-        phi2 = (-d2 * d23 * fe * x14 * y2 + d2 * d23 * fe * x23 * y4 + d2 * d23 * fe * xe * y2 + d2 * d23 * fe * xe * y4 - d2 * d23 * fl * x14 * y2 + d2 * d23 * fl * x23 * y4 - d2 * d23 * mlx * x14 - d2 * d23 * mlx * x23 + d2 * d23 * mly * y2 + d2 * d23 * mly * y4 + d2 * d3 * fe * x23 * y2**2 * y4 + 2 * d2 * d3 * fe * x23 * y2 * y3 * y4 + d2 * d3 * fe * x23 * y3**2 * y4 + d2 * d3 * fe * xe * y2**2 * y4 + 2 * d2 * d3 * fe * xe * y2 * y3 * y4 + d2 * d3 * fe * xe * y3**2 * y4 + d2 * d3 * fl * x23 * y2**2 * y4 + 2 * d2 * d3 * fl * x23 * y2 * y3 * y4 + d2 * d3 * fl * x23 * y3**2 * y4 - d2 * d3 * mlx * x14 * y2**2 - 2 * d2 * d3 * mlx * x14 * y2 * y3 - d2 * d3 * mlx * x14 * y3**2 - d2 * d3 * mlx * x23 * y2**2 - 2 * d2 * d3 * mlx * x23 * y2 * y3 - d2 * d3 * mlx * x23 * y3**2 + d2 * d3 * mly * y2**2 * y4 + 2 * d2 * d3 * mly * y2 * y3 * y4 + d2 * d3 * mly * y3**2 * y4 + d23 * d3 * fe * x14 * y3 + d23 * d3 * fe * x23 * y4 - d23 * d3 * fe * xe * y3 + d23 * d3 * fe * xe * y4 + d23 * d3 * fl * x14 * y3 + d23 * d3 * fl * x23 * y4 - d23 * d3 * mlx * x14 - d23 * d3 * mlx * x23 - d23 * d3 * mly * y3 + d23 * d3 * mly * y4) / (d2 * d23 * d3 * x14 * y2**2 + 2 * d2 * d23 * d3 * x14 * y2 * y3 + d2 * d23 * d3 * x14 * y3**2 + d2 * d23 * d3 * x23 * y2**2 + 2 * d2 * d23 * d3 * x23 * y2 * y3 + d2 * d23 * d3 * x23 * y3**2)
-        phi3 = (-d14 * d2 * d23 * fe * x14 * y2 + d14 * d2 * d23 * fe * x23 * y4 + d14 * d2 * d23 * fe * xe * y2 + d14 * d2 * d23 * fe * xe * y4 - d14 * d2 * d23 * fl * x14 * y2 + d14 * d2 * d23 * fl * x23 * y4 - d14 * d2 * d23 * mlx * x14 - d14 * d2 * d23 * mlx * x23 + d14 * d2 * d23 * mly * y2 + d14 * d2 * d23 * mly * y4 + d14 * d2 * d3 * fe * x23 * y2**2 * y4 + 2 * d14 * d2 * d3 * fe * x23 * y2 * y3 * y4 + d14 * d2 * d3 * fe * x23 * y3**2 * y4 + d14 * d2 * d3 * fe * xe * y2**2 * y4 + 2 * d14 * d2 * d3 * fe * xe * y2 * y3 * y4 + d14 * d2 * d3 * fe * xe * y3**2 * y4 + d14 * d2 * d3 * fl * x23 * y2**2 * y4 + 2 * d14 * d2 * d3 * fl * x23 * y2 * y3 * y4 + d14 * d2 * d3 * fl * x23 * y3**2 * y4 - d14 * d2 * d3 * mlx * x14 * y2**2 - 2 * d14 * d2 * d3 * mlx * x14 * y2 * y3 - d14 * d2 * d3 * mlx * x14 * y3**2 - d14 * d2 * d3 * mlx * x23 * y2**2 - 2 * d14 * d2 * d3 * mlx * x23 * y2 * y3 - d14 * d2 * d3 * mlx * x23 * y3**2 + d14 * d2 * d3 * mly * y2**2 * y4 + 2 * d14 * d2 * d3 * mly * y2 * y3 * y4 + d14 * d2 * d3 * mly * y3**2 * y4 + d14 * d23 * d3 * fe * x14 * y3 + d14 * d23 * d3 * fe * x23 * y4 - d14 * d23 * d3 * fe * xe * y3 + d14 * d23 * d3 * fe * xe * y4 + d14 * d23 * d3 * fl * x14 * y3 + d14 * d23 * d3 * fl * x23 * y4 - d14 * d23 * d3 * mlx * x14 - d14 * d23 * d3 * mlx * x23 - d14 * d23 * d3 * mly * y3 + d14 * d23 * d3 * mly * y4 + d2 * d23 * d3 * fe * x23 * y2**2 * y4 + 2 * d2 * d23 * d3 * fe * x23 * y2 * y3 * y4 + d2 * d23 * d3 * fe * x23 * y3**2 * y4 + d2 * d23 * d3 * fe * xe * y2**2 * y4 + 2 * d2 * d23 * d3 * fe * xe * y2 * y3 * y4 + d2 * d23 * d3 * fe * xe * y3**2 * y4 + d2 * d23 * d3 * fl * x23 * y2**2 * y4 + 2 * d2 * d23 * d3 * fl * x23 * y2 * y3 * y4 + d2 * d23 * d3 * fl * x23 * y3**2 * y4 + d2 * d23 * d3 * mly * y2**2 * y4 + 2 * d2 * d23 * d3 * mly * y2 * y3 * y4 + d2 * d23 * d3 * mly * y3**2 * y4) / (d14 * d2 * d23 * d3 * x14 * y2**2 + 2 * d14 * d2 * d23 * d3 * x14 * y2 * y3 + d14 * d2 * d23 * d3 * x14 * y3**2 + d14 * d2 * d23 * d3 * x23 * y2**2 + 2 * d14 * d2 * d23 * d3 * x23 * y2 * y3 + d14 * d2 * d23 * d3 * x23 * y3**2)
-        fry = (-fe * x14 + fe * xe - fl * x14 + mly) / (x14 + x23)
-        ffy = (fe * x23 + fe * xe + fl * x23 + mly) / (x14 + x23)
+        f2 = (c16) / den0
+        f3 = (c20) / den0
+        f4 = (c22) / den1
+        t14x = (-c23) / den1
+        t23x = (c0*mlx - c23) / den1
+        s1 = (-c33*c4*d14*mlx*(y1 + y4) + c95*fl + fe*(c101*c36 - c103*c36 + c104*c31*c45 + c104*c44*c66 + c104*c48 + c106*c36 + c108*c36 + c111*c36 + c112*c36 + c114*c36 + c115*c36 + c14*c39 - c14*c51*d4 + c36*c97 + c36*c99 + c42*xe + c43*xe + c46*xe + c47*xe + c68*xe + c69*xe + c71*xe + c72*xe + c95) + mly*(c35*c36 + c36*c38 + c36*c41 - c36*c51 + c36*c56 + c36*c58 + c36*c61 + c36*c62 + c36*c65 + c36*c67 + c39*y4 + c42 + c43 + c46 + c47 + c49 - c52*y3 + c68 + c69 + c71 + c72 + c73 + c75)) / den2
+        s2 = (c16) / den3
+        s3 = (c20) / den4
+        s4 = (c22) / den5
+        phi1 = (c116*fl - c17*(d2 + d3) + fe*(-c104 + c109 + c116 + c14*d2 + c19*d2) + mly*(-c29 + c30 + c53 + c59)) / den6
+        phi2 = (-c117 + c118*fl + fe*(c100 - c102 + c105 + c107 + c113 + c118 + c96 + c98) + mly*(c34 + c37 + c40 - c50 + c55 + c57 + c64)) / den7
+        phi3 = (-c117*d14 + c119*fl + fe*(c101 - c103 + c106 + c108 + c111 + c112 + c114 + c115 + c119 + c97 + c99) + mly*(c35 + c38 + c41 - c51 + c56 + c58 + c61 + c62 + c65 + c67)) / den8
+        fry = (fe*(-x14 + xe) - fl*x14 + mly) / den1
+        ffy = (c22) / den1
 
     if lift == 2:
-        f1 = (fe * x14 * y3 + fe * x23 * y4 - fe * xe * y3 + fe * xe * y4 + fl * x14 * y3 + fl * x23 * y4 - mlx * x14 - mlx * x23 - mly * y3 + mly * y4) / (x14 * y1 + x14 * y4 + x23 * y1 + x23 * y4)
+        c0 = x14 + x23
+        c1 = y1 + y4
+        c2 = c0*c1
+        c3 = c1**2
+        c4 = c0*d3
+        c5 = d1*d14
+        c6 = c5*d4
+        c7 = c6*d23
+        c8 = c0*c3
+        c9 = c6*c8
+        c10 = d1*d4
+        c11 = x14*y3
+        c12 = x23*y4
+        c13 = c11 + c12
+        c14 = -c0*mlx
+        c15 = xe*y4
+        c16 = xe*y3
+        c17 = c13*fl + c14 + fe*(c13 + c15 - c16) + mly*(-y3 + y4)
+        c18 = fl*x14
+        c19 = x14 - xe
+        c20 = c19*fe
+        c21 = c18 + c20 - mly
+        c22 = c0*mlx
+        c23 = x23*y1
+        c24 = xe*y1
+        c25 = c22 + fe*(-c11 + c16 + c23 + c24) + fl*(-c11 + x23*y1) + mly*(y1 + y3)
+        c26 = c11*fl + c20*y3 - mly*y3
+        c27 = d14*d4
+        c28 = y1**2
+        c29 = c10*c28
+        c30 = y4**2
+        c31 = c10*c30
+        c32 = d1*y1
+        c33 = 2*d4*y4
+        c34 = c32*c33
+        c35 = c27 + c29 + c31 + c34 + c5
+        c36 = c5*y1
+        c37 = c36*d23
+        c38 = c37*d3
+        c39 = c5*y3
+        c40 = c39*d23
+        c41 = d3*y2
+        c42 = c27*y3
+        c43 = c42*d23
+        c44 = d3*y3**2
+        c45 = c44*d23
+        c46 = c45*c5
+        c47 = c28*c7
+        c48 = c30*c7
+        c49 = c27*c45
+        c50 = c33*c37
+        c51 = d4*y3
+        c52 = c5*c51
+        c53 = c28*c52
+        c54 = c30*c52
+        c55 = d1*y3
+        c56 = c55*d4
+        c57 = c28*c56
+        c58 = c57*d23
+        c59 = c30*c56
+        c60 = c59*d23
+        c61 = c33*c36
+        c62 = c61*y3
+        c63 = c34*y3
+        c64 = c63*d23
+        c65 = c44*c6
+        c66 = c28*c65
+        c67 = c30*c65
+        c68 = c29*c45
+        c69 = c31*c45
+        c70 = c44*c61
+        c71 = c34*c45
+        c72 = c11*c5
+        c73 = c72*d23
+        c74 = c11*c27
+        c75 = c74*d23
+        c76 = c12*c27
+        c77 = c76*d23
+        c78 = c43*d3
+        c79 = c23*c5
+        c80 = c79*d23
+        c81 = c11*d4
+        c82 = c5*c81
+        c83 = c28*c82
+        c84 = c30*c82
+        c85 = c11*c29
+        c86 = c85*d23
+        c87 = c11*c31
+        c88 = c87*d23
+        c89 = c11*c61
+        c90 = c11*c34
+        c91 = c90*d23
+        c92 = c12*c78 - c23*c40*d3 + c41*c73 + c41*c75 + c41*c77 - c41*c80 + c41*c83 + c41*c84 + c41*c86 + c41*c88 + c41*c89 + c41*c91 + c46*x14 + c47*x14 + c48*x14 + c49*x14 + c50*x14 + c66*x14 + c67*x14 + c68*x14 + c69*x14 + c70*x14 + c71*x14
+        c93 = c15*c27
+        c94 = c93*d23
+        c95 = c24*c5
+        c96 = c95*d23
+        c97 = c16*c5
+        c98 = c97*d23
+        c99 = c16*c27
+        c100 = c99*d23
+        c101 = c15*d4
+        c102 = 2*c101
+        c103 = c16*d4
+        c104 = c103*c5
+        c105 = c104*c28
+        c106 = c104*c30
+        c107 = c16*c29
+        c108 = c107*d23
+        c109 = c16*c31
+        c110 = c109*d23
+        c111 = 2*c32
+        c112 = c15*c51
+        c113 = 2*c112*c36
+        c114 = c111*c112
+        c115 = c114*d23
+        c116 = c22*c35
+        c117 = c73 + c75 + c77 - c80 + c83 + c84 + c86 + c88 + c89 + c91
+        c118 = c72 + c74 + c76 - c79 + c85 + c87 + c90
+        c119 = c11*d1 + c12*d4 - c23*d1 + c81
+        den0 = c2
+        den1 = c0
+        den2 = c2*d1
+        den3 = c3*c4*c7
+        den4 = c4
+        den5 = c2*d4
+        den6 = c9*d23
+        den7 = c9
+        den8 = c10*c8
+        f1 = (c17) / den0
         f2 = 0
-        f3 = (fe * x14 - fe * xe + fl * x14 - mly) / (x14 + x23)
-        f4 = (-fe * x14 * y3 + fe * x23 * y1 + fe * xe * y1 + fe * xe * y3 - fl * x14 * y3 + fl * x23 * y1 + mlx * x14 + mlx * x23 + mly * y1 + mly * y3) / (x14 * y1 + x14 * y4 + x23 * y1 + x23 * y4)
-        t14x = (fe * x14 * y3 - fe * xe * y3 + fl * x14 * y3 - mlx * x14 - mlx * x23 - mly * y3) / (x14 + x23)
-        t23x = (fe * x14 * y3 - fe * xe * y3 + fl * x14 * y3 - mly * y3) / (x14 + x23)
-        s1 = (fe * x14 * y3 + fe * x23 * y4 - fe * xe * y3 + fe * xe * y4 + fl * x14 * y3 + fl * x23 * y4 - mlx * x14 - mlx * x23 - mly * y3 + mly * y4) / (d1 * x14 * y1 + d1 * x14 * y4 + d1 * x23 * y1 + d1 * x23 * y4)
-        s2 = (d1 * d14 * d23 * d3 * fe * x14 * y2 * y3 + d1 * d14 * d23 * d3 * fe * x14 * y3**2 - d1 * d14 * d23 * d3 * fe * x23 * y1 * y2 - d1 * d14 * d23 * d3 * fe * x23 * y1 * y3 - d1 * d14 * d23 * d3 * fe * xe * y1 * y2 - d1 * d14 * d23 * d3 * fe * xe * y1 * y3 - d1 * d14 * d23 * d3 * fe * xe * y2 * y3 - d1 * d14 * d23 * d3 * fe * xe * y3**2 + d1 * d14 * d23 * d3 * fl * x14 * y2 * y3 + d1 * d14 * d23 * d3 * fl * x14 * y3**2 - d1 * d14 * d23 * d3 * fl * x23 * y1 * y2 - d1 * d14 * d23 * d3 * fl * x23 * y1 * y3 - d1 * d14 * d23 * d3 * mlx * x14 * y2 - d1 * d14 * d23 * d3 * mlx * x14 * y3 - d1 * d14 * d23 * d3 * mlx * x23 * y2 - d1 * d14 * d23 * d3 * mlx * x23 * y3 - d1 * d14 * d23 * d3 * mly * y1 * y2 - d1 * d14 * d23 * d3 * mly * y1 * y3 - d1 * d14 * d23 * d3 * mly * y2 * y3 - d1 * d14 * d23 * d3 * mly * y3**2 + d1 * d14 * d23 * d4 * fe * x14 * y1**2 + 2 * d1 * d14 * d23 * d4 * fe * x14 * y1 * y4 + d1 * d14 * d23 * d4 * fe * x14 * y4**2 - d1 * d14 * d23 * d4 * fe * xe * y1**2 - 2 * d1 * d14 * d23 * d4 * fe * xe * y1 * y4 - d1 * d14 * d23 * d4 * fe * xe * y4**2 + d1 * d14 * d23 * d4 * fl * x14 * y1**2 + 2 * d1 * d14 * d23 * d4 * fl * x14 * y1 * y4 + d1 * d14 * d23 * d4 * fl * x14 * y4**2 - d1 * d14 * d23 * d4 * mly * y1**2 - 2 * d1 * d14 * d23 * d4 * mly * y1 * y4 - d1 * d14 * d23 * d4 * mly * y4**2 + d1 * d14 * d3 * d4 * fe * x14 * y1**2 * y2 * y3 + d1 * d14 * d3 * d4 * fe * x14 * y1**2 * y3**2 + 2 * d1 * d14 * d3 * d4 * fe * x14 * y1 * y2 * y3 * y4 + 2 * d1 * d14 * d3 * d4 * fe * x14 * y1 * y3**2 * y4 + d1 * d14 * d3 * d4 * fe * x14 * y2 * y3 * y4**2 + d1 * d14 * d3 * d4 * fe * x14 * y3**2 * y4**2 - d1 * d14 * d3 * d4 * fe * xe * y1**2 * y2 * y3 - d1 * d14 * d3 * d4 * fe * xe * y1**2 * y3**2 - 2 * d1 * d14 * d3 * d4 * fe * xe * y1 * y2 * y3 * y4 - 2 * d1 * d14 * d3 * d4 * fe * xe * y1 * y3**2 * y4 - d1 * d14 * d3 * d4 * fe * xe * y2 * y3 * y4**2 - d1 * d14 * d3 * d4 * fe * xe * y3**2 * y4**2 + d1 * d14 * d3 * d4 * fl * x14 * y1**2 * y2 * y3 + d1 * d14 * d3 * d4 * fl * x14 * y1**2 * y3**2 + 2 * d1 * d14 * d3 * d4 * fl * x14 * y1 * y2 * y3 * y4 + 2 * d1 * d14 * d3 * d4 * fl * x14 * y1 * y3**2 * y4 + d1 * d14 * d3 * d4 * fl * x14 * y2 * y3 * y4**2 + d1 * d14 * d3 * d4 * fl * x14 * y3**2 * y4**2 - d1 * d14 * d3 * d4 * mly * y1**2 * y2 * y3 - d1 * d14 * d3 * d4 * mly * y1**2 * y3**2 - 2 * d1 * d14 * d3 * d4 * mly * y1 * y2 * y3 * y4 - 2 * d1 * d14 * d3 * d4 * mly * y1 * y3**2 * y4 - d1 * d14 * d3 * d4 * mly * y2 * y3 * y4**2 - d1 * d14 * d3 * d4 * mly * y3**2 * y4**2 + d1 * d23 * d3 * d4 * fe * x14 * y1**2 * y2 * y3 + d1 * d23 * d3 * d4 * fe * x14 * y1**2 * y3**2 + 2 * d1 * d23 * d3 * d4 * fe * x14 * y1 * y2 * y3 * y4 + 2 * d1 * d23 * d3 * d4 * fe * x14 * y1 * y3**2 * y4 + d1 * d23 * d3 * d4 * fe * x14 * y2 * y3 * y4**2 + d1 * d23 * d3 * d4 * fe * x14 * y3**2 * y4**2 - d1 * d23 * d3 * d4 * fe * xe * y1**2 * y2 * y3 - d1 * d23 * d3 * d4 * fe * xe * y1**2 * y3**2 - 2 * d1 * d23 * d3 * d4 * fe * xe * y1 * y2 * y3 * y4 - 2 * d1 * d23 * d3 * d4 * fe * xe * y1 * y3**2 * y4 - d1 * d23 * d3 * d4 * fe * xe * y2 * y3 * y4**2 - d1 * d23 * d3 * d4 * fe * xe * y3**2 * y4**2 + d1 * d23 * d3 * d4 * fl * x14 * y1**2 * y2 * y3 + d1 * d23 * d3 * d4 * fl * x14 * y1**2 * y3**2 + 2 * d1 * d23 * d3 * d4 * fl * x14 * y1 * y2 * y3 * y4 + 2 * d1 * d23 * d3 * d4 * fl * x14 * y1 * y3**2 * y4 + d1 * d23 * d3 * d4 * fl * x14 * y2 * y3 * y4**2 + d1 * d23 * d3 * d4 * fl * x14 * y3**2 * y4**2 - d1 * d23 * d3 * d4 * mlx * x14 * y1**2 * y2 - d1 * d23 * d3 * d4 * mlx * x14 * y1**2 * y3 - 2 * d1 * d23 * d3 * d4 * mlx * x14 * y1 * y2 * y4 - 2 * d1 * d23 * d3 * d4 * mlx * x14 * y1 * y3 * y4 - d1 * d23 * d3 * d4 * mlx * x14 * y2 * y4**2 - d1 * d23 * d3 * d4 * mlx * x14 * y3 * y4**2 - d1 * d23 * d3 * d4 * mlx * x23 * y1**2 * y2 - d1 * d23 * d3 * d4 * mlx * x23 * y1**2 * y3 - 2 * d1 * d23 * d3 * d4 * mlx * x23 * y1 * y2 * y4 - 2 * d1 * d23 * d3 * d4 * mlx * x23 * y1 * y3 * y4 - d1 * d23 * d3 * d4 * mlx * x23 * y2 * y4**2 - d1 * d23 * d3 * d4 * mlx * x23 * y3 * y4**2 - d1 * d23 * d3 * d4 * mly * y1**2 * y2 * y3 - d1 * d23 * d3 * d4 * mly * y1**2 * y3**2 - 2 * d1 * d23 * d3 * d4 * mly * y1 * y2 * y3 * y4 - 2 * d1 * d23 * d3 * d4 * mly * y1 * y3**2 * y4 - d1 * d23 * d3 * d4 * mly * y2 * y3 * y4**2 - d1 * d23 * d3 * d4 * mly * y3**2 * y4**2 + d14 * d23 * d3 * d4 * fe * x14 * y2 * y3 + d14 * d23 * d3 * d4 * fe * x14 * y3**2 + d14 * d23 * d3 * d4 * fe * x23 * y2 * y4 + d14 * d23 * d3 * d4 * fe * x23 * y3 * y4 - d14 * d23 * d3 * d4 * fe * xe * y2 * y3 + d14 * d23 * d3 * d4 * fe * xe * y2 * y4 - d14 * d23 * d3 * d4 * fe * xe * y3**2 + d14 * d23 * d3 * d4 * fe * xe * y3 * y4 + d14 * d23 * d3 * d4 * fl * x14 * y2 * y3 + d14 * d23 * d3 * d4 * fl * x14 * y3**2 + d14 * d23 * d3 * d4 * fl * x23 * y2 * y4 + d14 * d23 * d3 * d4 * fl * x23 * y3 * y4 - d14 * d23 * d3 * d4 * mlx * x14 * y2 - d14 * d23 * d3 * d4 * mlx * x14 * y3 - d14 * d23 * d3 * d4 * mlx * x23 * y2 - d14 * d23 * d3 * d4 * mlx * x23 * y3 - d14 * d23 * d3 * d4 * mly * y2 * y3 + d14 * d23 * d3 * d4 * mly * y2 * y4 - d14 * d23 * d3 * d4 * mly * y3**2 + d14 * d23 * d3 * d4 * mly * y3 * y4) / (d1 * d14 * d23 * d3 * d4 * x14 * y1**2 + 2 * d1 * d14 * d23 * d3 * d4 * x14 * y1 * y4 + d1 * d14 * d23 * d3 * d4 * x14 * y4**2 + d1 * d14 * d23 * d3 * d4 * x23 * y1**2 + 2 * d1 * d14 * d23 * d3 * d4 * x23 * y1 * y4 + d1 * d14 * d23 * d3 * d4 * x23 * y4**2)
-        s3 = (fe * x14 - fe * xe + fl * x14 - mly) / (d3 * x14 + d3 * x23)
-        s4 = (-fe * x14 * y3 + fe * x23 * y1 + fe * xe * y1 + fe * xe * y3 - fl * x14 * y3 + fl * x23 * y1 + mlx * x14 + mlx * x23 + mly * y1 + mly * y3) / (d4 * x14 * y1 + d4 * x14 * y4 + d4 * x23 * y1 + d4 * x23 * y4)
-        phi1 = (d1 * d14 * d23 * fe * x14 * y3 - d1 * d14 * d23 * fe * x23 * y1 - d1 * d14 * d23 * fe * xe * y1 - d1 * d14 * d23 * fe * xe * y3 + d1 * d14 * d23 * fl * x14 * y3 - d1 * d14 * d23 * fl * x23 * y1 - d1 * d14 * d23 * mlx * x14 - d1 * d14 * d23 * mlx * x23 - d1 * d14 * d23 * mly * y1 - d1 * d14 * d23 * mly * y3 + d1 * d14 * d4 * fe * x14 * y1**2 * y3 + 2 * d1 * d14 * d4 * fe * x14 * y1 * y3 * y4 + d1 * d14 * d4 * fe * x14 * y3 * y4**2 - d1 * d14 * d4 * fe * xe * y1**2 * y3 - 2 * d1 * d14 * d4 * fe * xe * y1 * y3 * y4 - d1 * d14 * d4 * fe * xe * y3 * y4**2 + d1 * d14 * d4 * fl * x14 * y1**2 * y3 + 2 * d1 * d14 * d4 * fl * x14 * y1 * y3 * y4 + d1 * d14 * d4 * fl * x14 * y3 * y4**2 - d1 * d14 * d4 * mly * y1**2 * y3 - 2 * d1 * d14 * d4 * mly * y1 * y3 * y4 - d1 * d14 * d4 * mly * y3 * y4**2 + d1 * d23 * d4 * fe * x14 * y1**2 * y3 + 2 * d1 * d23 * d4 * fe * x14 * y1 * y3 * y4 + d1 * d23 * d4 * fe * x14 * y3 * y4**2 - d1 * d23 * d4 * fe * xe * y1**2 * y3 - 2 * d1 * d23 * d4 * fe * xe * y1 * y3 * y4 - d1 * d23 * d4 * fe * xe * y3 * y4**2 + d1 * d23 * d4 * fl * x14 * y1**2 * y3 + 2 * d1 * d23 * d4 * fl * x14 * y1 * y3 * y4 + d1 * d23 * d4 * fl * x14 * y3 * y4**2 - d1 * d23 * d4 * mlx * x14 * y1**2 - 2 * d1 * d23 * d4 * mlx * x14 * y1 * y4 - d1 * d23 * d4 * mlx * x14 * y4**2 - d1 * d23 * d4 * mlx * x23 * y1**2 - 2 * d1 * d23 * d4 * mlx * x23 * y1 * y4 - d1 * d23 * d4 * mlx * x23 * y4**2 - d1 * d23 * d4 * mly * y1**2 * y3 - 2 * d1 * d23 * d4 * mly * y1 * y3 * y4 - d1 * d23 * d4 * mly * y3 * y4**2 + d14 * d23 * d4 * fe * x14 * y3 + d14 * d23 * d4 * fe * x23 * y4 - d14 * d23 * d4 * fe * xe * y3 + d14 * d23 * d4 * fe * xe * y4 + d14 * d23 * d4 * fl * x14 * y3 + d14 * d23 * d4 * fl * x23 * y4 - d14 * d23 * d4 * mlx * x14 - d14 * d23 * d4 * mlx * x23 - d14 * d23 * d4 * mly * y3 + d14 * d23 * d4 * mly * y4) / (d1 * d14 * d23 * d4 * x14 * y1**2 + 2 * d1 * d14 * d23 * d4 * x14 * y1 * y4 + d1 * d14 * d23 * d4 * x14 * y4**2 + d1 * d14 * d23 * d4 * x23 * y1**2 + 2 * d1 * d14 * d23 * d4 * x23 * y1 * y4 + d1 * d14 * d23 * d4 * x23 * y4**2)
-        phi2 = (d1 * d14 * fe * x14 * y3 - d1 * d14 * fe * x23 * y1 - d1 * d14 * fe * xe * y1 - d1 * d14 * fe * xe * y3 + d1 * d14 * fl * x14 * y3 - d1 * d14 * fl * x23 * y1 - d1 * d14 * mlx * x14 - d1 * d14 * mlx * x23 - d1 * d14 * mly * y1 - d1 * d14 * mly * y3 + d1 * d4 * fe * x14 * y1**2 * y3 + 2 * d1 * d4 * fe * x14 * y1 * y3 * y4 + d1 * d4 * fe * x14 * y3 * y4**2 - d1 * d4 * fe * xe * y1**2 * y3 - 2 * d1 * d4 * fe * xe * y1 * y3 * y4 - d1 * d4 * fe * xe * y3 * y4**2 + d1 * d4 * fl * x14 * y1**2 * y3 + 2 * d1 * d4 * fl * x14 * y1 * y3 * y4 + d1 * d4 * fl * x14 * y3 * y4**2 - d1 * d4 * mlx * x14 * y1**2 - 2 * d1 * d4 * mlx * x14 * y1 * y4 - d1 * d4 * mlx * x14 * y4**2 - d1 * d4 * mlx * x23 * y1**2 - 2 * d1 * d4 * mlx * x23 * y1 * y4 - d1 * d4 * mlx * x23 * y4**2 - d1 * d4 * mly * y1**2 * y3 - 2 * d1 * d4 * mly * y1 * y3 * y4 - d1 * d4 * mly * y3 * y4**2 + d14 * d4 * fe * x14 * y3 + d14 * d4 * fe * x23 * y4 - d14 * d4 * fe * xe * y3 + d14 * d4 * fe * xe * y4 + d14 * d4 * fl * x14 * y3 + d14 * d4 * fl * x23 * y4 - d14 * d4 * mlx * x14 - d14 * d4 * mlx * x23 - d14 * d4 * mly * y3 + d14 * d4 * mly * y4) / (d1 * d14 * d4 * x14 * y1**2 + 2 * d1 * d14 * d4 * x14 * y1 * y4 + d1 * d14 * d4 * x14 * y4**2 + d1 * d14 * d4 * x23 * y1**2 + 2 * d1 * d14 * d4 * x23 * y1 * y4 + d1 * d14 * d4 * x23 * y4**2)
-        phi3 = (d1 * fe * x14 * y3 - d1 * fe * x23 * y1 - d1 * fe * xe * y1 - d1 * fe * xe * y3 + d1 * fl * x14 * y3 - d1 * fl * x23 * y1 - d1 * mlx * x14 - d1 * mlx * x23 - d1 * mly * y1 - d1 * mly * y3 + d4 * fe * x14 * y3 + d4 * fe * x23 * y4 - d4 * fe * xe * y3 + d4 * fe * xe * y4 + d4 * fl * x14 * y3 + d4 * fl * x23 * y4 - d4 * mlx * x14 - d4 * mlx * x23 - d4 * mly * y3 + d4 * mly * y4) / (d1 * d4 * x14 * y1**2 + 2 * d1 * d4 * x14 * y1 * y4 + d1 * d4 * x14 * y4**2 + d1 * d4 * x23 * y1**2 + 2 * d1 * d4 * x23 * y1 * y4 + d1 * d4 * x23 * y4**2)
-        fry = (-fe * x14 + fe * xe - fl * x14 + mly) / (x14 + x23)
-        ffy = (fe * x23 + fe * xe + fl * x23 + mly) / (x14 + x23)
+        f3 = (c21) / den1
+        f4 = (c25) / den0
+        t14x = (c14 + c26) / den1
+        t23x = (c26) / den1
+        s1 = (c17) / den2
+        s2 = (-c35*c4*d23*mlx*(y2 + y3) + c92*fl + fe*(-c100*c41 - c101*c111*c45 - c102*c36*c44 - c102*c37 - c105*c41 - c106*c41 - c108*c41 - c110*c41 - c113*c41 - c115*c41 + c15*c78 - c16*c38 + c41*c94 - c41*c96 - c41*c98 - c46*xe - c47*xe - c48*xe - c49*xe - c66*xe - c67*xe - c68*xe - c69*xe + c92) + mly*(-c38*y2 - c38*y3 - c40*c41 - c41*c43 - c41*c53 - c41*c54 - c41*c58 - c41*c60 - c41*c62 - c41*c64 - c46 - c47 - c48 - c49 - c50 - c66 - c67 - c68 - c69 - c70 - c71 + d14*d23*d3*d4*y2*y4 + d14*d23*d3*d4*y3*y4)) / den3
+        s3 = (c21) / den4
+        s4 = (c25) / den5
+        phi1 = (-c116*d23 + c117*fl + fe*(-c100 - c105 - c106 - c108 - c110 - c113 - c115 + c117 + c94 - c96 - c98) + mly*(-c37 - c40 - c43 - c53 - c54 - c58 - c60 - c62 - c64 + d14*d23*d4*y4)) / den6
+        phi2 = (-c116 + c118*fl + fe*(-c107 - c109 - c114 + c118 + c93 - c95 - c97 - c99) + mly*(-c36 - c39 - c42 - c57 - c59 - c63 + d14*d4*y4)) / den7
+        phi3 = (c119*fl - c22*(d1 + d4) + fe*(c101 - c103 + c119 - c16*d1 - c24*d1) + mly*(-c32 - c51 - c55 + d4*y4)) / den8
+        fry = (-c18 - c19*fe + mly) / den1
+        ffy = (fe*(x23 + xe) + fl*x23 + mly) / den1
 
     if lift == 3:
-        f1 = (-fe * x14 * y2 + fe * x23 * y4 + fe * xe * y2 + fe * xe * y4 - fl * x14 * y2 + fl * x23 * y4 - mlx * x14 - mlx * x23 + mly * y2 + mly * y4) / (x14 * y1 + x14 * y4 + x23 * y1 + x23 * y4)
-        f2 = (fe * x14 - fe * xe + fl * x14 - mly) / (x14 + x23)
+        c0 = x14 + x23
+        c1 = y1 + y4
+        c2 = c0*c1
+        c3 = c0*d2
+        c4 = c1**2
+        c5 = d1*d14
+        c6 = c5*d4
+        c7 = c6*d23
+        c8 = c0*c4
+        c9 = c6*c8
+        c10 = d1*d4
+        c11 = -c0
+        c12 = x14*y2
+        c13 = x23*y4
+        c14 = xe*y2
+        c15 = xe*y4
+        c16 = c11*mlx + fe*(-c12 + c13 + c14 + c15) + fl*(-c12 + x23*y4) + mly*(y2 + y4)
+        c17 = fl*x14
+        c18 = x14 - xe
+        c19 = c18*fe
+        c20 = c17 + c19 - mly
+        c21 = c0*mlx
+        c22 = x23*y1
+        c23 = c12 + c22
+        c24 = xe*y1
+        c25 = c21 + c23*fl + fe*(-c14 + c23 + c24) + mly*(y1 - y2)
+        c26 = c12*fl + c19*y2 - mly*y2
+        c27 = d14*d4
+        c28 = y1**2
+        c29 = c10*c28
+        c30 = y4**2
+        c31 = c10*c30
+        c32 = d1*y1
+        c33 = d4*y4
+        c34 = 2*c33
+        c35 = c32*c34
+        c36 = c27 + c29 + c31 + c35 + c5
+        c37 = c5*y2
+        c38 = c37*d23
+        c39 = c38*d2
+        c40 = c27*y2
+        c41 = c40*d23
+        c42 = d2*y3
+        c43 = c41*d2
+        c44 = c27*y4
+        c45 = c44*d23
+        c46 = d2*y2**2
+        c47 = c46*d23
+        c48 = c47*c5
+        c49 = c28*c7
+        c50 = c30*c7
+        c51 = c27*c47
+        c52 = c5*y1
+        c53 = c52*d23
+        c54 = c34*c53
+        c55 = d4*y2
+        c56 = c5*c55
+        c57 = c28*c56
+        c58 = c30*c56
+        c59 = d1*y2
+        c60 = c59*d4
+        c61 = c28*c60
+        c62 = c61*d23
+        c63 = c30*c60
+        c64 = c63*d23
+        c65 = 2*c52
+        c66 = c55*c65*y4
+        c67 = c34*c59*y1
+        c68 = c67*d23
+        c69 = c46*c6
+        c70 = c28*c69
+        c71 = c30*c69
+        c72 = c29*c47
+        c73 = c31*c47
+        c74 = c34*c52
+        c75 = c46*c74
+        c76 = c35*c47
+        c77 = c12*c5
+        c78 = c77*d23
+        c79 = c22*c5
+        c80 = c79*d23
+        c81 = c12*c27
+        c82 = c81*d23
+        c83 = c12*d4
+        c84 = c5*c83
+        c85 = c28*c84
+        c86 = c30*c84
+        c87 = c12*c29
+        c88 = c87*d23
+        c89 = c12*c31
+        c90 = c89*d23
+        c91 = c12*c74
+        c92 = c12*c35
+        c93 = c92*d23
+        c94 = -c13*c27*c42*d23 - c13*c43 + c22*c39 + c42*c78 + c42*c80 + c42*c82 + c42*c85 + c42*c86 + c42*c88 + c42*c90 + c42*c91 + c42*c93 + c48*x14 + c49*x14 + c50*x14 + c51*x14 + c54*x14 + c70*x14 + c71*x14 + c72*x14 + c73*x14 + c75*x14 + c76*x14
+        c95 = c14*d2
+        c96 = c24*c5
+        c97 = c96*d23
+        c98 = c15*d4
+        c99 = 2*c98
+        c100 = c14*c5*d4
+        c101 = c21*c36
+        c102 = c78 + c80 + c82 + c85 + c86 + c88 + c90 + c91 + c93 - d14*d23*d4*x23*y4
+        c103 = c77 + c79 + c81 + c87 + c89 + c92 - d14*d4*x23*y4
+        c104 = c12*d1 + c22*d1 + c83 - d4*x23*y4
+        den0 = c2
+        den1 = c0
+        den2 = c2*d1
+        den3 = c3
+        den4 = c3*c4*c7
+        den5 = c2*d4
+        den6 = c9*d23
+        den7 = c9
+        den8 = c10*c8
+        f1 = (c16) / den0
+        f2 = (c20) / den1
         f3 = 0
-        f4 = (fe * x14 * y2 + fe * x23 * y1 + fe * xe * y1 - fe * xe * y2 + fl * x14 * y2 + fl * x23 * y1 + mlx * x14 + mlx * x23 + mly * y1 - mly * y2) / (x14 * y1 + x14 * y4 + x23 * y1 + x23 * y4)
-        t14x = (-fe * x14 * y2 + fe * xe * y2 - fl * x14 * y2 - mlx * x14 - mlx * x23 + mly * y2) / (x14 + x23)
-        t23x = (-fe * x14 * y2 + fe * xe * y2 - fl * x14 * y2 + mly * y2) / (x14 + x23)
-        s1 = (-fe * x14 * y2 + fe * x23 * y4 + fe * xe * y2 + fe * xe * y4 - fl * x14 * y2 + fl * x23 * y4 - mlx * x14 - mlx * x23 + mly * y2 + mly * y4) / (d1 * x14 * y1 + d1 * x14 * y4 + d1 * x23 * y1 + d1 * x23 * y4)
-        s2 = (fe * x14 - fe * xe + fl * x14 - mly) / (d2 * x14 + d2 * x23)
-        s3 = (d1 * d14 * d2 * d23 * fe * x14 * y2**2 + d1 * d14 * d2 * d23 * fe * x14 * y2 * y3 + d1 * d14 * d2 * d23 * fe * x23 * y1 * y2 + d1 * d14 * d2 * d23 * fe * x23 * y1 * y3 + d1 * d14 * d2 * d23 * fe * xe * y1 * y2 + d1 * d14 * d2 * d23 * fe * xe * y1 * y3 - d1 * d14 * d2 * d23 * fe * xe * y2**2 - d1 * d14 * d2 * d23 * fe * xe * y2 * y3 + d1 * d14 * d2 * d23 * fl * x14 * y2**2 + d1 * d14 * d2 * d23 * fl * x14 * y2 * y3 + d1 * d14 * d2 * d23 * fl * x23 * y1 * y2 + d1 * d14 * d2 * d23 * fl * x23 * y1 * y3 + d1 * d14 * d2 * d23 * mlx * x14 * y2 + d1 * d14 * d2 * d23 * mlx * x14 * y3 + d1 * d14 * d2 * d23 * mlx * x23 * y2 + d1 * d14 * d2 * d23 * mlx * x23 * y3 + d1 * d14 * d2 * d23 * mly * y1 * y2 + d1 * d14 * d2 * d23 * mly * y1 * y3 - d1 * d14 * d2 * d23 * mly * y2**2 - d1 * d14 * d2 * d23 * mly * y2 * y3 + d1 * d14 * d2 * d4 * fe * x14 * y1**2 * y2**2 + d1 * d14 * d2 * d4 * fe * x14 * y1**2 * y2 * y3 + 2 * d1 * d14 * d2 * d4 * fe * x14 * y1 * y2**2 * y4 + 2 * d1 * d14 * d2 * d4 * fe * x14 * y1 * y2 * y3 * y4 + d1 * d14 * d2 * d4 * fe * x14 * y2**2 * y4**2 + d1 * d14 * d2 * d4 * fe * x14 * y2 * y3 * y4**2 - d1 * d14 * d2 * d4 * fe * xe * y1**2 * y2**2 - d1 * d14 * d2 * d4 * fe * xe * y1**2 * y2 * y3 - 2 * d1 * d14 * d2 * d4 * fe * xe * y1 * y2**2 * y4 - 2 * d1 * d14 * d2 * d4 * fe * xe * y1 * y2 * y3 * y4 - d1 * d14 * d2 * d4 * fe * xe * y2**2 * y4**2 - d1 * d14 * d2 * d4 * fe * xe * y2 * y3 * y4**2 + d1 * d14 * d2 * d4 * fl * x14 * y1**2 * y2**2 + d1 * d14 * d2 * d4 * fl * x14 * y1**2 * y2 * y3 + 2 * d1 * d14 * d2 * d4 * fl * x14 * y1 * y2**2 * y4 + 2 * d1 * d14 * d2 * d4 * fl * x14 * y1 * y2 * y3 * y4 + d1 * d14 * d2 * d4 * fl * x14 * y2**2 * y4**2 + d1 * d14 * d2 * d4 * fl * x14 * y2 * y3 * y4**2 - d1 * d14 * d2 * d4 * mly * y1**2 * y2**2 - d1 * d14 * d2 * d4 * mly * y1**2 * y2 * y3 - 2 * d1 * d14 * d2 * d4 * mly * y1 * y2**2 * y4 - 2 * d1 * d14 * d2 * d4 * mly * y1 * y2 * y3 * y4 - d1 * d14 * d2 * d4 * mly * y2**2 * y4**2 - d1 * d14 * d2 * d4 * mly * y2 * y3 * y4**2 + d1 * d14 * d23 * d4 * fe * x14 * y1**2 + 2 * d1 * d14 * d23 * d4 * fe * x14 * y1 * y4 + d1 * d14 * d23 * d4 * fe * x14 * y4**2 - d1 * d14 * d23 * d4 * fe * xe * y1**2 - 2 * d1 * d14 * d23 * d4 * fe * xe * y1 * y4 - d1 * d14 * d23 * d4 * fe * xe * y4**2 + d1 * d14 * d23 * d4 * fl * x14 * y1**2 + 2 * d1 * d14 * d23 * d4 * fl * x14 * y1 * y4 + d1 * d14 * d23 * d4 * fl * x14 * y4**2 - d1 * d14 * d23 * d4 * mly * y1**2 - 2 * d1 * d14 * d23 * d4 * mly * y1 * y4 - d1 * d14 * d23 * d4 * mly * y4**2 + d1 * d2 * d23 * d4 * fe * x14 * y1**2 * y2**2 + d1 * d2 * d23 * d4 * fe * x14 * y1**2 * y2 * y3 + 2 * d1 * d2 * d23 * d4 * fe * x14 * y1 * y2**2 * y4 + 2 * d1 * d2 * d23 * d4 * fe * x14 * y1 * y2 * y3 * y4 + d1 * d2 * d23 * d4 * fe * x14 * y2**2 * y4**2 + d1 * d2 * d23 * d4 * fe * x14 * y2 * y3 * y4**2 - d1 * d2 * d23 * d4 * fe * xe * y1**2 * y2**2 - d1 * d2 * d23 * d4 * fe * xe * y1**2 * y2 * y3 - 2 * d1 * d2 * d23 * d4 * fe * xe * y1 * y2**2 * y4 - 2 * d1 * d2 * d23 * d4 * fe * xe * y1 * y2 * y3 * y4 - d1 * d2 * d23 * d4 * fe * xe * y2**2 * y4**2 - d1 * d2 * d23 * d4 * fe * xe * y2 * y3 * y4**2 + d1 * d2 * d23 * d4 * fl * x14 * y1**2 * y2**2 + d1 * d2 * d23 * d4 * fl * x14 * y1**2 * y2 * y3 + 2 * d1 * d2 * d23 * d4 * fl * x14 * y1 * y2**2 * y4 + 2 * d1 * d2 * d23 * d4 * fl * x14 * y1 * y2 * y3 * y4 + d1 * d2 * d23 * d4 * fl * x14 * y2**2 * y4**2 + d1 * d2 * d23 * d4 * fl * x14 * y2 * y3 * y4**2 + d1 * d2 * d23 * d4 * mlx * x14 * y1**2 * y2 + d1 * d2 * d23 * d4 * mlx * x14 * y1**2 * y3 + 2 * d1 * d2 * d23 * d4 * mlx * x14 * y1 * y2 * y4 + 2 * d1 * d2 * d23 * d4 * mlx * x14 * y1 * y3 * y4 + d1 * d2 * d23 * d4 * mlx * x14 * y2 * y4**2 + d1 * d2 * d23 * d4 * mlx * x14 * y3 * y4**2 + d1 * d2 * d23 * d4 * mlx * x23 * y1**2 * y2 + d1 * d2 * d23 * d4 * mlx * x23 * y1**2 * y3 + 2 * d1 * d2 * d23 * d4 * mlx * x23 * y1 * y2 * y4 + 2 * d1 * d2 * d23 * d4 * mlx * x23 * y1 * y3 * y4 + d1 * d2 * d23 * d4 * mlx * x23 * y2 * y4**2 + d1 * d2 * d23 * d4 * mlx * x23 * y3 * y4**2 - d1 * d2 * d23 * d4 * mly * y1**2 * y2**2 - d1 * d2 * d23 * d4 * mly * y1**2 * y2 * y3 - 2 * d1 * d2 * d23 * d4 * mly * y1 * y2**2 * y4 - 2 * d1 * d2 * d23 * d4 * mly * y1 * y2 * y3 * y4 - d1 * d2 * d23 * d4 * mly * y2**2 * y4**2 - d1 * d2 * d23 * d4 * mly * y2 * y3 * y4**2 + d14 * d2 * d23 * d4 * fe * x14 * y2**2 + d14 * d2 * d23 * d4 * fe * x14 * y2 * y3 - d14 * d2 * d23 * d4 * fe * x23 * y2 * y4 - d14 * d2 * d23 * d4 * fe * x23 * y3 * y4 - d14 * d2 * d23 * d4 * fe * xe * y2**2 - d14 * d2 * d23 * d4 * fe * xe * y2 * y3 - d14 * d2 * d23 * d4 * fe * xe * y2 * y4 - d14 * d2 * d23 * d4 * fe * xe * y3 * y4 + d14 * d2 * d23 * d4 * fl * x14 * y2**2 + d14 * d2 * d23 * d4 * fl * x14 * y2 * y3 - d14 * d2 * d23 * d4 * fl * x23 * y2 * y4 - d14 * d2 * d23 * d4 * fl * x23 * y3 * y4 + d14 * d2 * d23 * d4 * mlx * x14 * y2 + d14 * d2 * d23 * d4 * mlx * x14 * y3 + d14 * d2 * d23 * d4 * mlx * x23 * y2 + d14 * d2 * d23 * d4 * mlx * x23 * y3 - d14 * d2 * d23 * d4 * mly * y2**2 - d14 * d2 * d23 * d4 * mly * y2 * y3 - d14 * d2 * d23 * d4 * mly * y2 * y4 - d14 * d2 * d23 * d4 * mly * y3 * y4) / (d1 * d14 * d2 * d23 * d4 * x14 * y1**2 + 2 * d1 * d14 * d2 * d23 * d4 * x14 * y1 * y4 + d1 * d14 * d2 * d23 * d4 * x14 * y4**2 + d1 * d14 * d2 * d23 * d4 * x23 * y1**2 + 2 * d1 * d14 * d2 * d23 * d4 * x23 * y1 * y4 + d1 * d14 * d2 * d23 * d4 * x23 * y4**2)
-        s4 = (fe * x14 * y2 + fe * x23 * y1 + fe * xe * y1 - fe * xe * y2 + fl * x14 * y2 + fl * x23 * y1 + mlx * x14 + mlx * x23 + mly * y1 - mly * y2) / (d4 * x14 * y1 + d4 * x14 * y4 + d4 * x23 * y1 + d4 * x23 * y4)
-        phi1 = (-d1 * d14 * d23 * fe * x14 * y2 - d1 * d14 * d23 * fe * x23 * y1 - d1 * d14 * d23 * fe * xe * y1 + d1 * d14 * d23 * fe * xe * y2 - d1 * d14 * d23 * fl * x14 * y2 - d1 * d14 * d23 * fl * x23 * y1 - d1 * d14 * d23 * mlx * x14 - d1 * d14 * d23 * mlx * x23 - d1 * d14 * d23 * mly * y1 + d1 * d14 * d23 * mly * y2 - d1 * d14 * d4 * fe * x14 * y1**2 * y2 - 2 * d1 * d14 * d4 * fe * x14 * y1 * y2 * y4 - d1 * d14 * d4 * fe * x14 * y2 * y4**2 + d1 * d14 * d4 * fe * xe * y1**2 * y2 + 2 * d1 * d14 * d4 * fe * xe * y1 * y2 * y4 + d1 * d14 * d4 * fe * xe * y2 * y4**2 - d1 * d14 * d4 * fl * x14 * y1**2 * y2 - 2 * d1 * d14 * d4 * fl * x14 * y1 * y2 * y4 - d1 * d14 * d4 * fl * x14 * y2 * y4**2 + d1 * d14 * d4 * mly * y1**2 * y2 + 2 * d1 * d14 * d4 * mly * y1 * y2 * y4 + d1 * d14 * d4 * mly * y2 * y4**2 - d1 * d23 * d4 * fe * x14 * y1**2 * y2 - 2 * d1 * d23 * d4 * fe * x14 * y1 * y2 * y4 - d1 * d23 * d4 * fe * x14 * y2 * y4**2 + d1 * d23 * d4 * fe * xe * y1**2 * y2 + 2 * d1 * d23 * d4 * fe * xe * y1 * y2 * y4 + d1 * d23 * d4 * fe * xe * y2 * y4**2 - d1 * d23 * d4 * fl * x14 * y1**2 * y2 - 2 * d1 * d23 * d4 * fl * x14 * y1 * y2 * y4 - d1 * d23 * d4 * fl * x14 * y2 * y4**2 - d1 * d23 * d4 * mlx * x14 * y1**2 - 2 * d1 * d23 * d4 * mlx * x14 * y1 * y4 - d1 * d23 * d4 * mlx * x14 * y4**2 - d1 * d23 * d4 * mlx * x23 * y1**2 - 2 * d1 * d23 * d4 * mlx * x23 * y1 * y4 - d1 * d23 * d4 * mlx * x23 * y4**2 + d1 * d23 * d4 * mly * y1**2 * y2 + 2 * d1 * d23 * d4 * mly * y1 * y2 * y4 + d1 * d23 * d4 * mly * y2 * y4**2 - d14 * d23 * d4 * fe * x14 * y2 + d14 * d23 * d4 * fe * x23 * y4 + d14 * d23 * d4 * fe * xe * y2 + d14 * d23 * d4 * fe * xe * y4 - d14 * d23 * d4 * fl * x14 * y2 + d14 * d23 * d4 * fl * x23 * y4 - d14 * d23 * d4 * mlx * x14 - d14 * d23 * d4 * mlx * x23 + d14 * d23 * d4 * mly * y2 + d14 * d23 * d4 * mly * y4) / (d1 * d14 * d23 * d4 * x14 * y1**2 + 2 * d1 * d14 * d23 * d4 * x14 * y1 * y4 + d1 * d14 * d23 * d4 * x14 * y4**2 + d1 * d14 * d23 * d4 * x23 * y1**2 + 2 * d1 * d14 * d23 * d4 * x23 * y1 * y4 + d1 * d14 * d23 * d4 * x23 * y4**2)
-        phi2 = (-d1 * d14 * fe * x14 * y2 - d1 * d14 * fe * x23 * y1 - d1 * d14 * fe * xe * y1 + d1 * d14 * fe * xe * y2 - d1 * d14 * fl * x14 * y2 - d1 * d14 * fl * x23 * y1 - d1 * d14 * mlx * x14 - d1 * d14 * mlx * x23 - d1 * d14 * mly * y1 + d1 * d14 * mly * y2 - d1 * d4 * fe * x14 * y1**2 * y2 - 2 * d1 * d4 * fe * x14 * y1 * y2 * y4 - d1 * d4 * fe * x14 * y2 * y4**2 + d1 * d4 * fe * xe * y1**2 * y2 + 2 * d1 * d4 * fe * xe * y1 * y2 * y4 + d1 * d4 * fe * xe * y2 * y4**2 - d1 * d4 * fl * x14 * y1**2 * y2 - 2 * d1 * d4 * fl * x14 * y1 * y2 * y4 - d1 * d4 * fl * x14 * y2 * y4**2 - d1 * d4 * mlx * x14 * y1**2 - 2 * d1 * d4 * mlx * x14 * y1 * y4 - d1 * d4 * mlx * x14 * y4**2 - d1 * d4 * mlx * x23 * y1**2 - 2 * d1 * d4 * mlx * x23 * y1 * y4 - d1 * d4 * mlx * x23 * y4**2 + d1 * d4 * mly * y1**2 * y2 + 2 * d1 * d4 * mly * y1 * y2 * y4 + d1 * d4 * mly * y2 * y4**2 - d14 * d4 * fe * x14 * y2 + d14 * d4 * fe * x23 * y4 + d14 * d4 * fe * xe * y2 + d14 * d4 * fe * xe * y4 - d14 * d4 * fl * x14 * y2 + d14 * d4 * fl * x23 * y4 - d14 * d4 * mlx * x14 - d14 * d4 * mlx * x23 + d14 * d4 * mly * y2 + d14 * d4 * mly * y4) / (d1 * d14 * d4 * x14 * y1**2 + 2 * d1 * d14 * d4 * x14 * y1 * y4 + d1 * d14 * d4 * x14 * y4**2 + d1 * d14 * d4 * x23 * y1**2 + 2 * d1 * d14 * d4 * x23 * y1 * y4 + d1 * d14 * d4 * x23 * y4**2)
-        phi3 = (-d1 * fe * x14 * y2 - d1 * fe * x23 * y1 - d1 * fe * xe * y1 + d1 * fe * xe * y2 - d1 * fl * x14 * y2 - d1 * fl * x23 * y1 - d1 * mlx * x14 - d1 * mlx * x23 - d1 * mly * y1 + d1 * mly * y2 - d4 * fe * x14 * y2 + d4 * fe * x23 * y4 + d4 * fe * xe * y2 + d4 * fe * xe * y4 - d4 * fl * x14 * y2 + d4 * fl * x23 * y4 - d4 * mlx * x14 - d4 * mlx * x23 + d4 * mly * y2 + d4 * mly * y4) / (d1 * d4 * x14 * y1**2 + 2 * d1 * d4 * x14 * y1 * y4 + d1 * d4 * x14 * y4**2 + d1 * d4 * x23 * y1**2 + 2 * d1 * d4 * x23 * y1 * y4 + d1 * d4 * x23 * y4**2)
-        fry = (-fe * x14 + fe * xe - fl * x14 + mly) / (x14 + x23)
-        ffy = (fe * x23 + fe * xe + fl * x23 + mly) / (x14 + x23)
+        f4 = (c25) / den0
+        t14x = (c11*mlx - c26) / den1
+        t23x = (-c26) / den1
+        s1 = (c16) / den2
+        s2 = (c20) / den3
+        s3 = (c3*c36*d23*mlx*(y2 + y3) + c94*fl + fe*(-c100*c28*c42 - c100*c30*c42 - c14*c27*c42*d23 - c14*c29*c42*d23 - c14*c31*c42*d23 - c14*c35*c42*d23 - c14*c42*c5*d23 - c14*c42*c74 - c15*c27*c42*d23 - c32*c47*c99 + c42*c97 - c45*c95 - c46*c65*c98 - c48*xe - c49*xe - c50*xe - c51*xe + c53*c95 - c53*c99 - c70*xe - c71*xe - c72*xe - c73*xe + c94) + mly*(-c39*y3 - c41*c42 - c42*c45 - c42*c57 - c42*c58 - c42*c62 - c42*c64 - c42*c66 - c42*c68 - c43*y4 - c48 - c49 - c50 - c51 - c54 - c70 - c71 - c72 - c73 - c75 - c76 + d1*d14*d2*d23*y1*y2 + d1*d14*d2*d23*y1*y3)) / den4
+        s4 = (c25) / den5
+        phi1 = (-c101*d23 - c102*fl + fe*(-c102 + c28*d1*d14*d4*xe*y2 + c28*d1*d23*d4*xe*y2 + c30*d1*d14*d4*xe*y2 + c30*d1*d23*d4*xe*y2 - c97 + d1*d14*d23*xe*y2 + 2*d1*d14*d4*xe*y1*y2*y4 + 2*d1*d23*d4*xe*y1*y2*y4 + d14*d23*d4*xe*y2 + d14*d23*d4*xe*y4) + mly*(c38 + c41 + c45 - c53 + c57 + c58 + c62 + c64 + c66 + c68)) / den6
+        phi2 = (-c101 - c103*fl + fe*(-c103 + c28*d1*d4*xe*y2 + c30*d1*d4*xe*y2 - c96 + d1*d14*xe*y2 + 2*d1*d4*xe*y1*y2*y4 + d14*d4*xe*y2 + d14*d4*xe*y4) + mly*(c37 + c40 + c44 - c52 + c61 + c63 + c67)) / den7
+        phi3 = (-c104*fl - c21*(d1 + d4) + fe*(-c104 - c24*d1 + d1*xe*y2 + d4*xe*y2 + d4*xe*y4) + mly*(-c32 + c33 + c55 + c59)) / den8
+        fry = (-c17 - c18*fe + mly) / den1
+        ffy = (fe*(x23 + xe) + fl*x23 + mly) / den1
 
     if lift == 4:
-        f1 = (fe * x23 + fe * xe + fl * x23 + mly) / (x14 + x23)
-        f2 = (fe * x14 * y3 - fe * x23 * y1 - fe * xe * y1 - fe * xe * y3 + fl * x14 * y3 - fl * x23 * y1 - mlx * x14 - mlx * x23 - mly * y1 - mly * y3) / (x14 * y2 + x14 * y3 + x23 * y2 + x23 * y3)
-        f3 = (fe * x14 * y2 + fe * x23 * y1 + fe * xe * y1 - fe * xe * y2 + fl * x14 * y2 + fl * x23 * y1 + mlx * x14 + mlx * x23 + mly * y1 - mly * y2) / (x14 * y2 + x14 * y3 + x23 * y2 + x23 * y3)
+        c0 = x14 + x23
+        c1 = y2 + y3
+        c2 = c0*c1
+        c3 = c0*d1
+        c4 = c1**2
+        c5 = d2*d23
+        c6 = c5*d3
+        c7 = c6*d14
+        c8 = d2*d3
+        c9 = c0*c4
+        c10 = c6*c9
+        c11 = fl*x23
+        c12 = fe*(x23 + xe)
+        c13 = c11 + c12 + mly
+        c14 = x14*y3
+        c15 = x23*y1
+        c16 = xe*y1
+        c17 = xe*y3
+        c18 = -c0*mlx + fe*(-c15 - c16 - c17 + x14*y3) + fl*(c14 - c15) + mly*(-y1 - y3)
+        c19 = c0*mlx
+        c20 = x14*y2
+        c21 = c15 + c20
+        c22 = xe*y2
+        c23 = c19 + c21*fl + fe*(c16 + c21 - c22) + mly*(y1 - y2)
+        c24 = c11*y1 + c12*y1 + mly*y1
+        c25 = d23*d3
+        c26 = y2**2
+        c27 = c26*c8
+        c28 = y3**2
+        c29 = c28*c8
+        c30 = d3*y3
+        c31 = 2*d2*y2
+        c32 = c30*c31
+        c33 = c25 + c27 + c29 + c32 + c5
+        c34 = c5*y1
+        c35 = c34*d14
+        c36 = d1*y4
+        c37 = c25*y1
+        c38 = c37*d14
+        c39 = c38*d1
+        c40 = c25*y3
+        c41 = c40*d14
+        c42 = d1*y1**2
+        c43 = c42*d14
+        c44 = c43*c5
+        c45 = c25*c43
+        c46 = c26*c7
+        c47 = c28*c7
+        c48 = c5*y2
+        c49 = c48*d14
+        c50 = c49*d1
+        c51 = 2*c49
+        c52 = c30*c51
+        c53 = d2*y1
+        c54 = c53*d3
+        c55 = c26*c54
+        c56 = c55*d14
+        c57 = c28*c54
+        c58 = c57*d14
+        c59 = d3*y1
+        c60 = c5*c59
+        c61 = c26*c60
+        c62 = c28*c60
+        c63 = c59*y3
+        c64 = c31*c63
+        c65 = c64*d14
+        c66 = 2*c48
+        c67 = c63*c66
+        c68 = c27*c43
+        c69 = c29*c43
+        c70 = c42*c6
+        c71 = c26*c70
+        c72 = c28*c70
+        c73 = c32*c43
+        c74 = c30*c66
+        c75 = c42*c74
+        c76 = c20*c5
+        c77 = c76*d14
+        c78 = c15*c5
+        c79 = c78*d14
+        c80 = c15*c25
+        c81 = c80*d14
+        c82 = c15*c27
+        c83 = c82*d14
+        c84 = c15*c29
+        c85 = c84*d14
+        c86 = c15*d3
+        c87 = c5*c86
+        c88 = c26*c87
+        c89 = c28*c87
+        c90 = c15*c32
+        c91 = c90*d14
+        c92 = c15*c74
+        c93 = -c14*c25*c36*d14 - c14*c39 + c20*c35*d1 + c36*c77 + c36*c79 + c36*c81 + c36*c83 + c36*c85 + c36*c88 + c36*c89 + c36*c91 + c36*c92 + c44*x23 + c45*x23 + c46*x23 + c47*x23 + c52*x23 + c68*x23 + c69*x23 + c71*x23 + c72*x23 + c73*x23 + c75*x23
+        c94 = c16*c5
+        c95 = c94*d14
+        c96 = c16*c25
+        c97 = c96*d14
+        c98 = c17*c25
+        c99 = c98*d14
+        c100 = c17*d3
+        c101 = c16*c27
+        c102 = c101*d14
+        c103 = c16*c29
+        c104 = c103*d14
+        c105 = c16*d3
+        c106 = c105*c5
+        c107 = c106*c26
+        c108 = c106*c28
+        c109 = c16*c32
+        c110 = c109*d14
+        c111 = c16*c74
+        c112 = c15*d2 + c20*d2 + c86 - d3*x14*y3
+        c113 = c19*c33
+        c114 = c76 + c78 + c80 + c82 + c84 + c90 - d23*d3*x14*y3
+        c115 = c77 + c79 + c81 + c83 + c85 + c88 + c89 + c91 + c92 - d14*d23*d3*x14*y3
+        den0 = c0
+        den1 = c2
+        den2 = c3
+        den3 = c2*d2
+        den4 = c2*d3
+        den5 = c3*c4*c7
+        den6 = c8*c9
+        den7 = c10
+        den8 = c10*d14
+        f1 = (c13) / den0
+        f2 = (c18) / den1
+        f3 = (c23) / den1
         f4 = 0
-        t14x = (fe * x23 * y1 + fe * xe * y1 + fl * x23 * y1 + mly * y1) / (x14 + x23)
-        t23x = (fe * x23 * y1 + fe * xe * y1 + fl * x23 * y1 + mlx * x14 + mlx * x23 + mly * y1) / (x14 + x23)
-        s1 = (fe * x23 + fe * xe + fl * x23 + mly) / (d1 * x14 + d1 * x23)
-        s2 = (fe * x14 * y3 - fe * x23 * y1 - fe * xe * y1 - fe * xe * y3 + fl * x14 * y3 - fl * x23 * y1 - mlx * x14 - mlx * x23 - mly * y1 - mly * y3) / (d2 * x14 * y2 + d2 * x14 * y3 + d2 * x23 * y2 + d2 * x23 * y3)
-        s3 = (fe * x14 * y2 + fe * x23 * y1 + fe * xe * y1 - fe * xe * y2 + fl * x14 * y2 + fl * x23 * y1 + mlx * x14 + mlx * x23 + mly * y1 - mly * y2) / (d3 * x14 * y2 + d3 * x14 * y3 + d3 * x23 * y2 + d3 * x23 * y3)
-        s4 = (d1 * d14 * d2 * d23 * fe * x14 * y1 * y2 + d1 * d14 * d2 * d23 * fe * x14 * y2 * y4 + d1 * d14 * d2 * d23 * fe * x23 * y1**2 + d1 * d14 * d2 * d23 * fe * x23 * y1 * y4 + d1 * d14 * d2 * d23 * fe * xe * y1**2 - d1 * d14 * d2 * d23 * fe * xe * y1 * y2 + d1 * d14 * d2 * d23 * fe * xe * y1 * y4 - d1 * d14 * d2 * d23 * fe * xe * y2 * y4 + d1 * d14 * d2 * d23 * fl * x14 * y1 * y2 + d1 * d14 * d2 * d23 * fl * x14 * y2 * y4 + d1 * d14 * d2 * d23 * fl * x23 * y1**2 + d1 * d14 * d2 * d23 * fl * x23 * y1 * y4 + d1 * d14 * d2 * d23 * mlx * x14 * y1 + d1 * d14 * d2 * d23 * mlx * x14 * y4 + d1 * d14 * d2 * d23 * mlx * x23 * y1 + d1 * d14 * d2 * d23 * mlx * x23 * y4 + d1 * d14 * d2 * d23 * mly * y1**2 - d1 * d14 * d2 * d23 * mly * y1 * y2 + d1 * d14 * d2 * d23 * mly * y1 * y4 - d1 * d14 * d2 * d23 * mly * y2 * y4 + d1 * d14 * d2 * d3 * fe * x23 * y1**2 * y2**2 + 2 * d1 * d14 * d2 * d3 * fe * x23 * y1**2 * y2 * y3 + d1 * d14 * d2 * d3 * fe * x23 * y1**2 * y3**2 + d1 * d14 * d2 * d3 * fe * x23 * y1 * y2**2 * y4 + 2 * d1 * d14 * d2 * d3 * fe * x23 * y1 * y2 * y3 * y4 + d1 * d14 * d2 * d3 * fe * x23 * y1 * y3**2 * y4 + d1 * d14 * d2 * d3 * fe * xe * y1**2 * y2**2 + 2 * d1 * d14 * d2 * d3 * fe * xe * y1**2 * y2 * y3 + d1 * d14 * d2 * d3 * fe * xe * y1**2 * y3**2 + d1 * d14 * d2 * d3 * fe * xe * y1 * y2**2 * y4 + 2 * d1 * d14 * d2 * d3 * fe * xe * y1 * y2 * y3 * y4 + d1 * d14 * d2 * d3 * fe * xe * y1 * y3**2 * y4 + d1 * d14 * d2 * d3 * fl * x23 * y1**2 * y2**2 + 2 * d1 * d14 * d2 * d3 * fl * x23 * y1**2 * y2 * y3 + d1 * d14 * d2 * d3 * fl * x23 * y1**2 * y3**2 + d1 * d14 * d2 * d3 * fl * x23 * y1 * y2**2 * y4 + 2 * d1 * d14 * d2 * d3 * fl * x23 * y1 * y2 * y3 * y4 + d1 * d14 * d2 * d3 * fl * x23 * y1 * y3**2 * y4 + d1 * d14 * d2 * d3 * mlx * x14 * y1 * y2**2 + 2 * d1 * d14 * d2 * d3 * mlx * x14 * y1 * y2 * y3 + d1 * d14 * d2 * d3 * mlx * x14 * y1 * y3**2 + d1 * d14 * d2 * d3 * mlx * x14 * y2**2 * y4 + 2 * d1 * d14 * d2 * d3 * mlx * x14 * y2 * y3 * y4 + d1 * d14 * d2 * d3 * mlx * x14 * y3**2 * y4 + d1 * d14 * d2 * d3 * mlx * x23 * y1 * y2**2 + 2 * d1 * d14 * d2 * d3 * mlx * x23 * y1 * y2 * y3 + d1 * d14 * d2 * d3 * mlx * x23 * y1 * y3**2 + d1 * d14 * d2 * d3 * mlx * x23 * y2**2 * y4 + 2 * d1 * d14 * d2 * d3 * mlx * x23 * y2 * y3 * y4 + d1 * d14 * d2 * d3 * mlx * x23 * y3**2 * y4 + d1 * d14 * d2 * d3 * mly * y1**2 * y2**2 + 2 * d1 * d14 * d2 * d3 * mly * y1**2 * y2 * y3 + d1 * d14 * d2 * d3 * mly * y1**2 * y3**2 + d1 * d14 * d2 * d3 * mly * y1 * y2**2 * y4 + 2 * d1 * d14 * d2 * d3 * mly * y1 * y2 * y3 * y4 + d1 * d14 * d2 * d3 * mly * y1 * y3**2 * y4 - d1 * d14 * d23 * d3 * fe * x14 * y1 * y3 - d1 * d14 * d23 * d3 * fe * x14 * y3 * y4 + d1 * d14 * d23 * d3 * fe * x23 * y1**2 + d1 * d14 * d23 * d3 * fe * x23 * y1 * y4 + d1 * d14 * d23 * d3 * fe * xe * y1**2 + d1 * d14 * d23 * d3 * fe * xe * y1 * y3 + d1 * d14 * d23 * d3 * fe * xe * y1 * y4 + d1 * d14 * d23 * d3 * fe * xe * y3 * y4 - d1 * d14 * d23 * d3 * fl * x14 * y1 * y3 - d1 * d14 * d23 * d3 * fl * x14 * y3 * y4 + d1 * d14 * d23 * d3 * fl * x23 * y1**2 + d1 * d14 * d23 * d3 * fl * x23 * y1 * y4 + d1 * d14 * d23 * d3 * mlx * x14 * y1 + d1 * d14 * d23 * d3 * mlx * x14 * y4 + d1 * d14 * d23 * d3 * mlx * x23 * y1 + d1 * d14 * d23 * d3 * mlx * x23 * y4 + d1 * d14 * d23 * d3 * mly * y1**2 + d1 * d14 * d23 * d3 * mly * y1 * y3 + d1 * d14 * d23 * d3 * mly * y1 * y4 + d1 * d14 * d23 * d3 * mly * y3 * y4 + d1 * d2 * d23 * d3 * fe * x23 * y1**2 * y2**2 + 2 * d1 * d2 * d23 * d3 * fe * x23 * y1**2 * y2 * y3 + d1 * d2 * d23 * d3 * fe * x23 * y1**2 * y3**2 + d1 * d2 * d23 * d3 * fe * x23 * y1 * y2**2 * y4 + 2 * d1 * d2 * d23 * d3 * fe * x23 * y1 * y2 * y3 * y4 + d1 * d2 * d23 * d3 * fe * x23 * y1 * y3**2 * y4 + d1 * d2 * d23 * d3 * fe * xe * y1**2 * y2**2 + 2 * d1 * d2 * d23 * d3 * fe * xe * y1**2 * y2 * y3 + d1 * d2 * d23 * d3 * fe * xe * y1**2 * y3**2 + d1 * d2 * d23 * d3 * fe * xe * y1 * y2**2 * y4 + 2 * d1 * d2 * d23 * d3 * fe * xe * y1 * y2 * y3 * y4 + d1 * d2 * d23 * d3 * fe * xe * y1 * y3**2 * y4 + d1 * d2 * d23 * d3 * fl * x23 * y1**2 * y2**2 + 2 * d1 * d2 * d23 * d3 * fl * x23 * y1**2 * y2 * y3 + d1 * d2 * d23 * d3 * fl * x23 * y1**2 * y3**2 + d1 * d2 * d23 * d3 * fl * x23 * y1 * y2**2 * y4 + 2 * d1 * d2 * d23 * d3 * fl * x23 * y1 * y2 * y3 * y4 + d1 * d2 * d23 * d3 * fl * x23 * y1 * y3**2 * y4 + d1 * d2 * d23 * d3 * mly * y1**2 * y2**2 + 2 * d1 * d2 * d23 * d3 * mly * y1**2 * y2 * y3 + d1 * d2 * d23 * d3 * mly * y1**2 * y3**2 + d1 * d2 * d23 * d3 * mly * y1 * y2**2 * y4 + 2 * d1 * d2 * d23 * d3 * mly * y1 * y2 * y3 * y4 + d1 * d2 * d23 * d3 * mly * y1 * y3**2 * y4 + d14 * d2 * d23 * d3 * fe * x23 * y2**2 + 2 * d14 * d2 * d23 * d3 * fe * x23 * y2 * y3 + d14 * d2 * d23 * d3 * fe * x23 * y3**2 + d14 * d2 * d23 * d3 * fe * xe * y2**2 + 2 * d14 * d2 * d23 * d3 * fe * xe * y2 * y3 + d14 * d2 * d23 * d3 * fe * xe * y3**2 + d14 * d2 * d23 * d3 * fl * x23 * y2**2 + 2 * d14 * d2 * d23 * d3 * fl * x23 * y2 * y3 + d14 * d2 * d23 * d3 * fl * x23 * y3**2 + d14 * d2 * d23 * d3 * mly * y2**2 + 2 * d14 * d2 * d23 * d3 * mly * y2 * y3 + d14 * d2 * d23 * d3 * mly * y3**2) / (d1 * d14 * d2 * d23 * d3 * x14 * y2**2 + 2 * d1 * d14 * d2 * d23 * d3 * x14 * y2 * y3 + d1 * d14 * d2 * d23 * d3 * x14 * y3**2 + d1 * d14 * d2 * d23 * d3 * x23 * y2**2 + 2 * d1 * d14 * d2 * d23 * d3 * x23 * y2 * y3 + d1 * d14 * d2 * d23 * d3 * x23 * y3**2)
-        phi1 = (-d2 * fe * x14 * y2 - d2 * fe * x23 * y1 - d2 * fe * xe * y1 + d2 * fe * xe * y2 - d2 * fl * x14 * y2 - d2 * fl * x23 * y1 - d2 * mlx * x14 - d2 * mlx * x23 - d2 * mly * y1 + d2 * mly * y2 + d3 * fe * x14 * y3 - d3 * fe * x23 * y1 - d3 * fe * xe * y1 - d3 * fe * xe * y3 + d3 * fl * x14 * y3 - d3 * fl * x23 * y1 - d3 * mlx * x14 - d3 * mlx * x23 - d3 * mly * y1 - d3 * mly * y3) / (d2 * d3 * x14 * y2**2 + 2 * d2 * d3 * x14 * y2 * y3 + d2 * d3 * x14 * y3**2 + d2 * d3 * x23 * y2**2 + 2 * d2 * d3 * x23 * y2 * y3 + d2 * d3 * x23 * y3**2)
-        phi2 = (-d2 * d23 * fe * x14 * y2 - d2 * d23 * fe * x23 * y1 - d2 * d23 * fe * xe * y1 + d2 * d23 * fe * xe * y2 - d2 * d23 * fl * x14 * y2 - d2 * d23 * fl * x23 * y1 - d2 * d23 * mlx * x14 - d2 * d23 * mlx * x23 - d2 * d23 * mly * y1 + d2 * d23 * mly * y2 - d2 * d3 * fe * x23 * y1 * y2**2 - 2 * d2 * d3 * fe * x23 * y1 * y2 * y3 - d2 * d3 * fe * x23 * y1 * y3**2 - d2 * d3 * fe * xe * y1 * y2**2 - 2 * d2 * d3 * fe * xe * y1 * y2 * y3 - d2 * d3 * fe * xe * y1 * y3**2 - d2 * d3 * fl * x23 * y1 * y2**2 - 2 * d2 * d3 * fl * x23 * y1 * y2 * y3 - d2 * d3 * fl * x23 * y1 * y3**2 - d2 * d3 * mlx * x14 * y2**2 - 2 * d2 * d3 * mlx * x14 * y2 * y3 - d2 * d3 * mlx * x14 * y3**2 - d2 * d3 * mlx * x23 * y2**2 - 2 * d2 * d3 * mlx * x23 * y2 * y3 - d2 * d3 * mlx * x23 * y3**2 - d2 * d3 * mly * y1 * y2**2 - 2 * d2 * d3 * mly * y1 * y2 * y3 - d2 * d3 * mly * y1 * y3**2 + d23 * d3 * fe * x14 * y3 - d23 * d3 * fe * x23 * y1 - d23 * d3 * fe * xe * y1 - d23 * d3 * fe * xe * y3 + d23 * d3 * fl * x14 * y3 - d23 * d3 * fl * x23 * y1 - d23 * d3 * mlx * x14 - d23 * d3 * mlx * x23 - d23 * d3 * mly * y1 - d23 * d3 * mly * y3) / (d2 * d23 * d3 * x14 * y2**2 + 2 * d2 * d23 * d3 * x14 * y2 * y3 + d2 * d23 * d3 * x14 * y3**2 + d2 * d23 * d3 * x23 * y2**2 + 2 * d2 * d23 * d3 * x23 * y2 * y3 + d2 * d23 * d3 * x23 * y3**2)
-        phi3 = (-d14 * d2 * d23 * fe * x14 * y2 - d14 * d2 * d23 * fe * x23 * y1 - d14 * d2 * d23 * fe * xe * y1 + d14 * d2 * d23 * fe * xe * y2 - d14 * d2 * d23 * fl * x14 * y2 - d14 * d2 * d23 * fl * x23 * y1 - d14 * d2 * d23 * mlx * x14 - d14 * d2 * d23 * mlx * x23 - d14 * d2 * d23 * mly * y1 + d14 * d2 * d23 * mly * y2 - d14 * d2 * d3 * fe * x23 * y1 * y2**2 - 2 * d14 * d2 * d3 * fe * x23 * y1 * y2 * y3 - d14 * d2 * d3 * fe * x23 * y1 * y3**2 - d14 * d2 * d3 * fe * xe * y1 * y2**2 - 2 * d14 * d2 * d3 * fe * xe * y1 * y2 * y3 - d14 * d2 * d3 * fe * xe * y1 * y3**2 - d14 * d2 * d3 * fl * x23 * y1 * y2**2 - 2 * d14 * d2 * d3 * fl * x23 * y1 * y2 * y3 - d14 * d2 * d3 * fl * x23 * y1 * y3**2 - d14 * d2 * d3 * mlx * x14 * y2**2 - 2 * d14 * d2 * d3 * mlx * x14 * y2 * y3 - d14 * d2 * d3 * mlx * x14 * y3**2 - d14 * d2 * d3 * mlx * x23 * y2**2 - 2 * d14 * d2 * d3 * mlx * x23 * y2 * y3 - d14 * d2 * d3 * mlx * x23 * y3**2 - d14 * d2 * d3 * mly * y1 * y2**2 - 2 * d14 * d2 * d3 * mly * y1 * y2 * y3 - d14 * d2 * d3 * mly * y1 * y3**2 + d14 * d23 * d3 * fe * x14 * y3 - d14 * d23 * d3 * fe * x23 * y1 - d14 * d23 * d3 * fe * xe * y1 - d14 * d23 * d3 * fe * xe * y3 + d14 * d23 * d3 * fl * x14 * y3 - d14 * d23 * d3 * fl * x23 * y1 - d14 * d23 * d3 * mlx * x14 - d14 * d23 * d3 * mlx * x23 - d14 * d23 * d3 * mly * y1 - d14 * d23 * d3 * mly * y3 - d2 * d23 * d3 * fe * x23 * y1 * y2**2 - 2 * d2 * d23 * d3 * fe * x23 * y1 * y2 * y3 - d2 * d23 * d3 * fe * x23 * y1 * y3**2 - d2 * d23 * d3 * fe * xe * y1 * y2**2 - 2 * d2 * d23 * d3 * fe * xe * y1 * y2 * y3 - d2 * d23 * d3 * fe * xe * y1 * y3**2 - d2 * d23 * d3 * fl * x23 * y1 * y2**2 - 2 * d2 * d23 * d3 * fl * x23 * y1 * y2 * y3 - d2 * d23 * d3 * fl * x23 * y1 * y3**2 - d2 * d23 * d3 * mly * y1 * y2**2 - 2 * d2 * d23 * d3 * mly * y1 * y2 * y3 - d2 * d23 * d3 * mly * y1 * y3**2) / (d14 * d2 * d23 * d3 * x14 * y2**2 + 2 * d14 * d2 * d23 * d3 * x14 * y2 * y3 + d14 * d2 * d23 * d3 * x14 * y3**2 + d14 * d2 * d23 * d3 * x23 * y2**2 + 2 * d14 * d2 * d23 * d3 * x23 * y2 * y3 + d14 * d2 * d23 * d3 * x23 * y3**2)
-        fry = (-fe * x14 + fe * xe - fl * x14 + mly) / (x14 + x23)
-        ffy = (fe * x23 + fe * xe + fl * x23 + mly) / (x14 + x23)
+        t14x = (c24) / den0
+        t23x = (c19 + c24) / den0
+        s1 = (c13) / den2
+        s2 = (c18) / den3
+        s3 = (c23) / den4
+        s4 = (c3*c33*d14*mlx*(y1 + y4) + c93*fl + fe*(c100*c31*c43 + c100*c42*c66 + c100*c51 + c102*c36 + c104*c36 + c107*c36 + c108*c36 + c110*c36 + c111*c36 + c16*c41*d1 - c16*c50 - c22*c36*c5*d14 + c36*c95 + c36*c97 + c36*c99 + c44*xe + c45*xe + c46*xe + c47*xe + c68*xe + c69*xe + c71*xe + c72*xe + c93) + mly*(c35*c36 + c36*c38 + c36*c41 - c36*c49 + c36*c56 + c36*c58 + c36*c61 + c36*c62 + c36*c65 + c36*c67 + c39*y3 + c44 + c45 + c46 + c47 - c50*y1 + c52 + c68 + c69 + c71 + c72 + c73 + c75)) / den5
+        phi1 = (-c112*fl - c19*(d2 + d3) + fe*(-c100 - c105 - c112 - c16*d2 + d2*xe*y2) + mly*(-c30 - c53 - c59 + d2*y2)) / den6
+        phi2 = (-c113 - c114*fl + fe*(-c101 - c103 - c109 - c114 - c94 - c96 - c98 + d2*d23*xe*y2) + mly*(-c34 - c37 - c40 - c55 - c57 - c64 + d2*d23*y2)) / den7
+        phi3 = (-c113*d14 - c115*fl + fe*(-c102 - c104 - c107 - c108 - c110 - c111 - c115 - c95 - c97 - c99 + d14*d2*d23*xe*y2) + mly*(-c35 - c38 - c41 - c56 - c58 - c61 - c62 - c65 - c67 + d14*d2*d23*y2)) / den8
+        fry = (fe*(-x14 + xe) - fl*x14 + mly) / den0
+        ffy = (c13) / den0
 
     results = {'f1': f1, 'f2': f2, 'f3': f3, 'f4': f4, 't14x': t14x, 't23x': t23x, 's1': s1, 's2': s2, 's3': s3, 's4': s4, 'phi1': phi1, 'phi2': phi2, 'phi3': phi3, 'fry': fry, 'ffy': ffy}
-    if x1 and x3:
-        t14y = (-fe * x23 * x3 - fe * x3 * xe - fl * x23 * x3 - mly * x3) / (x14 + x23)
-        t23y = (-fe * x1 * x14 + fe * x1 * xe - fl * x1 * x14 + mly * x1) / (x14 + x23)
+    if x1 is not None and x3 is not None:
+        t14y = (-fe*x23*x3 - fe*x3*xe - fl*x23*x3 - mly*x3) / (x14 + x23)
         results['t14y'] = t14y
+        t23y = (-fe*x1*x14 + fe*x1*xe - fl*x1*x14 + mly*x1) / (x14 + x23)
         results['t23y'] = t23y
     return results
 
 
-if __name__ == "__main__":
+def _results_liftoff_plain_general_selected(fl, mlx, mly, fe, y1, y2, y3, y4, xe, x14, x23, d14, d23, d1, d2, d3, d4, lift, x1, x3, outputs):
+    """Lift-off models, general geometry. Only the outputs in the set outputs."""
+    want_f1 = 'f1' in outputs
+    want_f2 = 'f2' in outputs
+    want_f3 = 'f3' in outputs
+    want_f4 = 'f4' in outputs
+    want_t14x = 't14x' in outputs
+    want_t23x = 't23x' in outputs
+    want_s1 = 's1' in outputs
+    want_s2 = 's2' in outputs
+    want_s3 = 's3' in outputs
+    want_s4 = 's4' in outputs
+    want_phi1 = 'phi1' in outputs
+    want_phi2 = 'phi2' in outputs
+    want_phi3 = 'phi3' in outputs
+    want_fry = 'fry' in outputs
+    want_ffy = 'ffy' in outputs
+    want_t14y = 't14y' in outputs
+    want_t23y = 't23y' in outputs
+    results = {}
+    if lift == 1:
+        if want_f2 or want_f3 or want_f4 or want_t14x or want_t23x or want_s1 or want_s2 or want_s3 or want_s4 or want_phi1 or want_phi2 or want_phi3 or want_fry or want_ffy:
+            c0 = x14 + x23
+        if want_f2 or want_f3 or want_s1 or want_s2 or want_s3 or want_phi1 or want_phi2 or want_phi3:
+            c1 = y2 + y3
+        if want_f2 or want_f3 or want_s2 or want_s3:
+            c2 = c0*c1
+        if want_s1 or want_phi1 or want_phi2 or want_phi3:
+            c3 = c1**2
+        if want_s1 or want_s4:
+            c4 = c0*d4
+        if want_s1 or want_phi2 or want_phi3:
+            c5 = d2*d23
+            c6 = c5*d3
+        if want_s1:
+            c7 = c6*d14
+        if want_s1 or want_phi1 or want_phi2 or want_phi3:
+            c8 = d2*d3
+        if want_phi1 or want_phi2 or want_phi3:
+            c9 = c0*c3
+        if want_phi2 or want_phi3:
+            c10 = c6*c9
+        if want_f2 or want_s1 or want_s2 or want_phi1 or want_phi2 or want_phi3:
+            c11 = x14*y3
+        if want_f2 or want_f3 or want_t14x or want_t23x or want_s1 or want_s2 or want_s3 or want_phi1 or want_phi2 or want_phi3:
+            c12 = x23*y4
+        if want_f2 or want_s2:
+            c13 = c11 + c12
+        if want_f2 or want_f3 or want_s1 or want_s2 or want_s3 or want_phi1 or want_phi2 or want_phi3:
+            c14 = xe*y4
+        if want_f2 or want_s1 or want_s2 or want_phi1 or want_phi2 or want_phi3:
+            c15 = xe*y3
+        if want_f2 or want_s2:
+            c16 = -c0*mlx + c13*fl + fe*(c13 + c14 - c15) + mly*(-y3 + y4)
+        if want_f3 or want_s3 or want_phi1 or want_phi2 or want_phi3:
+            c17 = c0*mlx
+        if want_f3 or want_s1 or want_s3 or want_phi1 or want_phi2 or want_phi3:
+            c18 = x14*y2
+            c19 = xe*y2
+        if want_f3 or want_s3:
+            c20 = c17 + fe*(-c12 - c14 - c19 + x14*y2) + fl*(-c12 + c18) + mly*(-y2 - y4)
+        if want_f4 or want_t14x or want_t23x or want_s4 or want_ffy:
+            c21 = fe*(x23 + xe)
+        if want_f4 or want_s4 or want_ffy:
+            c22 = c21 + fl*x23 + mly
+        if want_t14x or want_t23x:
+            c23 = c12*fl + c21*y4 + mly*y4
+        if want_s1 or want_phi2 or want_phi3:
+            c24 = d23*d3
+            c25 = y2**2
+            c26 = c25*c8
+            c27 = y3**2
+            c28 = c27*c8
+        if want_s1 or want_phi1 or want_phi2 or want_phi3:
+            c29 = d3*y3
+            c30 = d2*y2
+        if want_s1 or want_phi2 or want_phi3:
+            c31 = 2*c30
+            c32 = c29*c31
+            c33 = c24 + c26 + c28 + c32 + c5
+            c34 = c5*y2
+        if want_s1 or want_phi3:
+            c35 = c34*d14
+        if want_s1:
+            c36 = d4*y1
+        if want_s1 or want_phi2 or want_phi3:
+            c37 = c5*y4
+        if want_s1 or want_phi3:
+            c38 = c37*d14
+        if want_s1:
+            c39 = c35*d4
+        if want_s1 or want_phi2 or want_phi3:
+            c40 = c24*y4
+        if want_s1 or want_phi3:
+            c41 = c40*d14
+        if want_s1:
+            c42 = c25*c7
+            c43 = c27*c7
+            c44 = d4*y4**2
+            c45 = c44*d14
+            c46 = c45*c5
+            c47 = c24*c45
+            c48 = 2*c35
+            c49 = c29*c48
+        if want_s1 or want_phi2 or want_phi3:
+            c50 = c24*y3
+        if want_s1 or want_phi3:
+            c51 = c50*d14
+        if want_s1:
+            c52 = c41*d4
+        if want_s1 or want_phi1 or want_phi2 or want_phi3:
+            c53 = d2*y4
+        if want_s1 or want_phi2 or want_phi3:
+            c54 = c53*d3
+            c55 = c25*c54
+        if want_s1 or want_phi3:
+            c56 = c55*d14
+        if want_s1 or want_phi2 or want_phi3:
+            c57 = c27*c54
+        if want_s1 or want_phi3:
+            c58 = c57*d14
+        if want_s1 or want_phi1 or want_phi2 or want_phi3:
+            c59 = d3*y4
+        if want_s1 or want_phi3:
+            c60 = c5*c59
+            c61 = c25*c60
+            c62 = c27*c60
+        if want_s1 or want_phi2 or want_phi3:
+            c63 = c59*y3
+            c64 = c31*c63
+        if want_s1 or want_phi3:
+            c65 = c64*d14
+            c66 = 2*c34
+            c67 = c63*c66
+        if want_s1:
+            c68 = c26*c45
+            c69 = c28*c45
+            c70 = c44*c6
+            c71 = c25*c70
+            c72 = c27*c70
+            c73 = c32*c45
+        if want_s1 or want_phi3:
+            c74 = c29*c66
+        if want_s1:
+            c75 = c44*c74
+        if want_s1 or want_phi2 or want_phi3:
+            c76 = c12*c5
+        if want_s1 or want_phi3:
+            c77 = c76*d14
+        if want_s1 or want_phi2 or want_phi3:
+            c78 = c11*c24
+        if want_s1 or want_phi3:
+            c79 = c78*d14
+        if want_s1 or want_phi2 or want_phi3:
+            c80 = c12*c24
+        if want_s1 or want_phi3:
+            c81 = c80*d14
+        if want_s1 or want_phi2 or want_phi3:
+            c82 = c18*c5
+        if want_s1 or want_phi3:
+            c83 = c82*d14
+        if want_s1 or want_phi2 or want_phi3:
+            c84 = c12*c26
+        if want_s1 or want_phi3:
+            c85 = c84*d14
+        if want_s1 or want_phi2 or want_phi3:
+            c86 = c12*c28
+        if want_s1 or want_phi3:
+            c87 = c86*d14
+        if want_s1 or want_phi1 or want_phi3:
+            c88 = c12*d3
+        if want_s1 or want_phi3:
+            c89 = c5*c88
+            c90 = c25*c89
+            c91 = c27*c89
+        if want_s1 or want_phi2 or want_phi3:
+            c92 = c12*c32
+        if want_s1 or want_phi3:
+            c93 = c92*d14
+            c94 = c12*c74
+        if want_s1:
+            c95 = c11*c52 - c18*c38*d4 + c36*c77 + c36*c79 + c36*c81 - c36*c83 + c36*c85 + c36*c87 + c36*c90 + c36*c91 + c36*c93 + c36*c94 + c42*x23 + c43*x23 + c46*x23 + c47*x23 + c49*x23 + c68*x23 + c69*x23 + c71*x23 + c72*x23 + c73*x23 + c75*x23
+        if want_s1 or want_phi2 or want_phi3:
+            c96 = c19*c5
+        if want_s1 or want_phi3:
+            c97 = c96*d14
+        if want_s1 or want_phi2 or want_phi3:
+            c98 = c14*c5
+        if want_s1 or want_phi3:
+            c99 = c98*d14
+        if want_s1 or want_phi2 or want_phi3:
+            c100 = c14*c24
+        if want_s1 or want_phi3:
+            c101 = c100*d14
+        if want_s1 or want_phi2 or want_phi3:
+            c102 = c15*c24
+        if want_s1 or want_phi3:
+            c103 = c102*d14
+        if want_s1 or want_phi1:
+            c104 = c15*d3
+        if want_s1 or want_phi2 or want_phi3:
+            c105 = c14*c26
+        if want_s1 or want_phi3:
+            c106 = c105*d14
+        if want_s1 or want_phi2 or want_phi3:
+            c107 = c14*c28
+        if want_s1 or want_phi3:
+            c108 = c107*d14
+        if want_s1 or want_phi1 or want_phi3:
+            c109 = c14*d3
+        if want_s1 or want_phi3:
+            c110 = c109*c5
+            c111 = c110*c25
+            c112 = c110*c27
+        if want_s1 or want_phi2 or want_phi3:
+            c113 = c14*c32
+        if want_s1 or want_phi3:
+            c114 = c113*d14
+            c115 = c14*c74
+        if want_phi1:
+            c116 = c11*d3 + c12*d2 - c18*d2 + c88
+        if want_phi2 or want_phi3:
+            c117 = c17*c33
+        if want_phi2:
+            c118 = c76 + c78 + c80 - c82 + c84 + c86 + c92
+        if want_phi3:
+            c119 = c77 + c79 + c81 - c83 + c85 + c87 + c90 + c91 + c93 + c94
+        if want_f2 or want_f3:
+            den0 = c2
+        if want_f4 or want_t14x or want_t23x or want_fry or want_ffy:
+            den1 = c0
+        if want_s1:
+            den2 = c3*c4*c7
+        if want_s2:
+            den3 = c2*d2
+        if want_s3:
+            den4 = c2*d3
+        if want_s4:
+            den5 = c4
+        if want_phi1:
+            den6 = c8*c9
+        if want_phi2:
+            den7 = c10
+        if want_phi3:
+            den8 = c10*d14
+        if want_f1:
+            results['f1'] = 0
+        if want_f2:
+            results['f2'] = (c16) / den0
+        if want_f3:
+            results['f3'] = (c20) / den0
+        if want_f4:
+            results['f4'] = (c22) / den1
+        if want_t14x:
+            results['t14x'] = (-c23) / den1
+        if want_t23x:
+            results['t23x'] = (c0*mlx - c23) / den1
+        if want_s1:
+            results['s1'] = (-c33*c4*d14*mlx*(y1 + y4) + c95*fl + fe*(c101*c36 - c103*c36 + c104*c31*c45 + c104*c44*c66 + c104*c48 + c106*c36 + c108*c36 + c111*c36 + c112*c36 + c114*c36 + c115*c36 + c14*c39 - c14*c51*d4 + c36*c97 + c36*c99 + c42*xe + c43*xe + c46*xe + c47*xe + c68*xe + c69*xe + c71*xe + c72*xe + c95) + mly*(c35*c36 + c36*c38 + c36*c41 - c36*c51 + c36*c56 + c36*c58 + c36*c61 + c36*c62 + c36*c65 + c36*c67 + c39*y4 + c42 + c43 + c46 + c47 + c49 - c52*y3 + c68 + c69 + c71 + c72 + c73 + c75)) / den2
+        if want_s2:
+            results['s2'] = (c16) / den3
+        if want_s3:
+            results['s3'] = (c20) / den4
+        if want_s4:
+            results['s4'] = (c22) / den5
+        if want_phi1:
+            results['phi1'] = (c116*fl - c17*(d2 + d3) + fe*(-c104 + c109 + c116 + c14*d2 + c19*d2) + mly*(-c29 + c30 + c53 + c59)) / den6
+        if want_phi2:
+            results['phi2'] = (-c117 + c118*fl + fe*(c100 - c102 + c105 + c107 + c113 + c118 + c96 + c98) + mly*(c34 + c37 + c40 - c50 + c55 + c57 + c64)) / den7
+        if want_phi3:
+            results['phi3'] = (-c117*d14 + c119*fl + fe*(c101 - c103 + c106 + c108 + c111 + c112 + c114 + c115 + c119 + c97 + c99) + mly*(c35 + c38 + c41 - c51 + c56 + c58 + c61 + c62 + c65 + c67)) / den8
+        if want_fry:
+            results['fry'] = (fe*(-x14 + xe) - fl*x14 + mly) / den1
+        if want_ffy:
+            results['ffy'] = (c22) / den1
+
+    if lift == 2:
+        if want_f1 or want_f3 or want_f4 or want_t14x or want_t23x or want_s1 or want_s2 or want_s3 or want_s4 or want_phi1 or want_phi2 or want_phi3 or want_fry or want_ffy:
+            c0 = x14 + x23
+        if want_f1 or want_f4 or want_s1 or want_s2 or want_s4 or want_phi1 or want_phi2 or want_phi3:
+            c1 = y1 + y4
+        if want_f1 or want_f4 or want_s1 or want_s4:
+            c2 = c0*c1
+        if want_s2 or want_phi1 or want_phi2 or want_phi3:
+            c3 = c1**2
+        if want_s2 or want_s3:
+            c4 = c0*d3
+        if want_s2 or want_phi1 or want_phi2:
+            c5 = d1*d14
+            c6 = c5*d4
+        if want_s2:
+            c7 = c6*d23
+        if want_phi1 or want_phi2 or want_phi3:
+            c8 = c0*c3
+        if want_phi1 or want_phi2:
+            c9 = c6*c8
+        if want_s2 or want_phi1 or want_phi2 or want_phi3:
+            c10 = d1*d4
+        if want_f1 or want_f4 or want_t14x or want_t23x or want_s1 or want_s2 or want_s4 or want_phi1 or want_phi2 or want_phi3:
+            c11 = x14*y3
+        if want_f1 or want_s1 or want_s2 or want_phi1 or want_phi2 or want_phi3:
+            c12 = x23*y4
+        if want_f1 or want_s1:
+            c13 = c11 + c12
+        if want_f1 or want_t14x or want_s1:
+            c14 = -c0*mlx
+        if want_f1 or want_s1 or want_s2 or want_phi1 or want_phi2 or want_phi3:
+            c15 = xe*y4
+        if want_f1 or want_f4 or want_s1 or want_s2 or want_s4 or want_phi1 or want_phi2 or want_phi3:
+            c16 = xe*y3
+        if want_f1 or want_s1:
+            c17 = c13*fl + c14 + fe*(c13 + c15 - c16) + mly*(-y3 + y4)
+        if want_f3 or want_s3 or want_fry:
+            c18 = fl*x14
+        if want_f3 or want_t14x or want_t23x or want_s3 or want_fry:
+            c19 = x14 - xe
+        if want_f3 or want_t14x or want_t23x or want_s3:
+            c20 = c19*fe
+        if want_f3 or want_s3:
+            c21 = c18 + c20 - mly
+        if want_f4 or want_s4 or want_phi1 or want_phi2 or want_phi3:
+            c22 = c0*mlx
+        if want_f4 or want_s2 or want_s4 or want_phi1 or want_phi2 or want_phi3:
+            c23 = x23*y1
+            c24 = xe*y1
+        if want_f4 or want_s4:
+            c25 = c22 + fe*(-c11 + c16 + c23 + c24) + fl*(-c11 + x23*y1) + mly*(y1 + y3)
+        if want_t14x or want_t23x:
+            c26 = c11*fl + c20*y3 - mly*y3
+        if want_s2 or want_phi1 or want_phi2:
+            c27 = d14*d4
+            c28 = y1**2
+            c29 = c10*c28
+            c30 = y4**2
+            c31 = c10*c30
+        if want_s2 or want_phi1 or want_phi2 or want_phi3:
+            c32 = d1*y1
+        if want_s2 or want_phi1 or want_phi2:
+            c33 = 2*d4*y4
+            c34 = c32*c33
+            c35 = c27 + c29 + c31 + c34 + c5
+            c36 = c5*y1
+        if want_s2 or want_phi1:
+            c37 = c36*d23
+        if want_s2:
+            c38 = c37*d3
+        if want_s2 or want_phi1 or want_phi2:
+            c39 = c5*y3
+        if want_s2 or want_phi1:
+            c40 = c39*d23
+        if want_s2:
+            c41 = d3*y2
+        if want_s2 or want_phi1 or want_phi2:
+            c42 = c27*y3
+        if want_s2 or want_phi1:
+            c43 = c42*d23
+        if want_s2:
+            c44 = d3*y3**2
+            c45 = c44*d23
+            c46 = c45*c5
+            c47 = c28*c7
+            c48 = c30*c7
+            c49 = c27*c45
+            c50 = c33*c37
+        if want_s2 or want_phi1 or want_phi2 or want_phi3:
+            c51 = d4*y3
+        if want_s2 or want_phi1:
+            c52 = c5*c51
+            c53 = c28*c52
+            c54 = c30*c52
+        if want_s2 or want_phi1 or want_phi2 or want_phi3:
+            c55 = d1*y3
+        if want_s2 or want_phi1 or want_phi2:
+            c56 = c55*d4
+            c57 = c28*c56
+        if want_s2 or want_phi1:
+            c58 = c57*d23
+        if want_s2 or want_phi1 or want_phi2:
+            c59 = c30*c56
+        if want_s2 or want_phi1:
+            c60 = c59*d23
+            c61 = c33*c36
+            c62 = c61*y3
+        if want_s2 or want_phi1 or want_phi2:
+            c63 = c34*y3
+        if want_s2 or want_phi1:
+            c64 = c63*d23
+        if want_s2:
+            c65 = c44*c6
+            c66 = c28*c65
+            c67 = c30*c65
+            c68 = c29*c45
+            c69 = c31*c45
+            c70 = c44*c61
+            c71 = c34*c45
+        if want_s2 or want_phi1 or want_phi2:
+            c72 = c11*c5
+        if want_s2 or want_phi1:
+            c73 = c72*d23
+        if want_s2 or want_phi1 or want_phi2:
+            c74 = c11*c27
+        if want_s2 or want_phi1:
+            c75 = c74*d23
+        if want_s2 or want_phi1 or want_phi2:
+            c76 = c12*c27
+        if want_s2 or want_phi1:
+            c77 = c76*d23
+        if want_s2:
+            c78 = c43*d3
+        if want_s2 or want_phi1 or want_phi2:
+            c79 = c23*c5
+        if want_s2 or want_phi1:
+            c80 = c79*d23
+        if want_s2 or want_phi1 or want_phi3:
+            c81 = c11*d4
+        if want_s2 or want_phi1:
+            c82 = c5*c81
+            c83 = c28*c82
+            c84 = c30*c82
+        if want_s2 or want_phi1 or want_phi2:
+            c85 = c11*c29
+        if want_s2 or want_phi1:
+            c86 = c85*d23
+        if want_s2 or want_phi1 or want_phi2:
+            c87 = c11*c31
+        if want_s2 or want_phi1:
+            c88 = c87*d23
+            c89 = c11*c61
+        if want_s2 or want_phi1 or want_phi2:
+            c90 = c11*c34
+        if want_s2 or want_phi1:
+            c91 = c90*d23
+        if want_s2:
+            c92 = c12*c78 - c23*c40*d3 + c41*c73 + c41*c75 + c41*c77 - c41*c80 + c41*c83 + c41*c84 + c41*c86 + c41*c88 + c41*c89 + c41*c91 + c46*x14 + c47*x14 + c48*x14 + c49*x14 + c50*x14 + c66*x14 + c67*x14 + c68*x14 + c69*x14 + c70*x14 + c71*x14
+        if want_s2 or want_phi1 or want_phi2:
+            c93 = c15*c27
+        if want_s2 or want_phi1:
+            c94 = c93*d23
+        if want_s2 or want_phi1 or want_phi2:
+            c95 = c24*c5
+        if want_s2 or want_phi1:
+            c96 = c95*d23
+        if want_s2 or want_phi1 or want_phi2:
+            c97 = c16*c5
+        if want_s2 or want_phi1:
+            c98 = c97*d23
+        if want_s2 or want_phi1 or want_phi2:
+            c99 = c16*c27
+        if want_s2 or want_phi1:
+            c100 = c99*d23
+        if want_s2 or want_phi3:
+            c101 = c15*d4
+        if want_s2:
+            c102 = 2*c101
+        if want_s2 or want_phi1 or want_phi3:
+            c103 = c16*d4
+        if want_s2 or want_phi1:
+            c104 = c103*c5
+            c105 = c104*c28
+            c106 = c104*c30
+        if want_s2 or want_phi1 or want_phi2:
+            c107 = c16*c29
+        if want_s2 or want_phi1:
+            c108 = c107*d23
+        if want_s2 or want_phi1 or want_phi2:
+            c109 = c16*c31
+        if want_s2 or want_phi1:
+            c110 = c109*d23
+        if want_s2 or want_phi1 or want_phi2:
+            c111 = 2*c32
+            c112 = c15*c51
+        if want_s2 or want_phi1:
+            c113 = 2*c112*c36
+        if want_s2 or want_phi1 or want_phi2:
+            c114 = c111*c112
+        if want_s2 or want_phi1:
+            c115 = c114*d23
+        if want_phi1 or want_phi2:
+            c116 = c22*c35
+        if want_phi1:
+            c117 = c73 + c75 + c77 - c80 + c83 + c84 + c86 + c88 + c89 + c91
+        if want_phi2:
+            c118 = c72 + c74 + c76 - c79 + c85 + c87 + c90
+        if want_phi3:
+            c119 = c11*d1 + c12*d4 - c23*d1 + c81
+        if want_f1 or want_f4:
+            den0 = c2
+        if want_f3 or want_t14x or want_t23x or want_fry or want_ffy:
+            den1 = c0
+        if want_s1:
+            den2 = c2*d1
+        if want_s2:
+            den3 = c3*c4*c7
+        if want_s3:
+            den4 = c4
+        if want_s4:
+            den5 = c2*d4
+        if want_phi1:
+            den6 = c9*d23
+        if want_phi2:
+            den7 = c9
+        if want_phi3:
+            den8 = c10*c8
+        if want_f1:
+            results['f1'] = (c17) / den0
+        if want_f2:
+            results['f2'] = 0
+        if want_f3:
+            results['f3'] = (c21) / den1
+        if want_f4:
+            results['f4'] = (c25) / den0
+        if want_t14x:
+            results['t14x'] = (c14 + c26) / den1
+        if want_t23x:
+            results['t23x'] = (c26) / den1
+        if want_s1:
+            results['s1'] = (c17) / den2
+        if want_s2:
+            results['s2'] = (-c35*c4*d23*mlx*(y2 + y3) + c92*fl + fe*(-c100*c41 - c101*c111*c45 - c102*c36*c44 - c102*c37 - c105*c41 - c106*c41 - c108*c41 - c110*c41 - c113*c41 - c115*c41 + c15*c78 - c16*c38 + c41*c94 - c41*c96 - c41*c98 - c46*xe - c47*xe - c48*xe - c49*xe - c66*xe - c67*xe - c68*xe - c69*xe + c92) + mly*(-c38*y2 - c38*y3 - c40*c41 - c41*c43 - c41*c53 - c41*c54 - c41*c58 - c41*c60 - c41*c62 - c41*c64 - c46 - c47 - c48 - c49 - c50 - c66 - c67 - c68 - c69 - c70 - c71 + d14*d23*d3*d4*y2*y4 + d14*d23*d3*d4*y3*y4)) / den3
+        if want_s3:
+            results['s3'] = (c21) / den4
+        if want_s4:
+            results['s4'] = (c25) / den5
+        if want_phi1:
+            results['phi1'] = (-c116*d23 + c117*fl + fe*(-c100 - c105 - c106 - c108 - c110 - c113 - c115 + c117 + c94 - c96 - c98) + mly*(-c37 - c40 - c43 - c53 - c54 - c58 - c60 - c62 - c64 + d14*d23*d4*y4)) / den6
+        if want_phi2:
+            results['phi2'] = (-c116 + c118*fl + fe*(-c107 - c109 - c114 + c118 + c93 - c95 - c97 - c99) + mly*(-c36 - c39 - c42 - c57 - c59 - c63 + d14*d4*y4)) / den7
+        if want_phi3:
+            results['phi3'] = (c119*fl - c22*(d1 + d4) + fe*(c101 - c103 + c119 - c16*d1 - c24*d1) + mly*(-c32 - c51 - c55 + d4*y4)) / den8
+        if want_fry:
+            results['fry'] = (-c18 - c19*fe + mly) / den1
+        if want_ffy:
+            results['ffy'] = (fe*(x23 + xe) + fl*x23 + mly) / den1
+
+    if lift == 3:
+        if want_f1 or want_f2 or want_f4 or want_t14x or want_t23x or want_s1 or want_s2 or want_s3 or want_s4 or want_phi1 or want_phi2 or want_phi3 or want_fry or want_ffy:
+            c0 = x14 + x23
+        if want_f1 or want_f4 or want_s1 or want_s3 or want_s4 or want_phi1 or want_phi2 or want_phi3:
+            c1 = y1 + y4
+        if want_f1 or want_f4 or want_s1 or want_s4:
+            c2 = c0*c1
+        if want_s2 or want_s3:
+            c3 = c0*d2
+        if want_s3 or want_phi1 or want_phi2 or want_phi3:
+            c4 = c1**2
+        if want_s3 or want_phi1 or want_phi2:
+            c5 = d1*d14
+            c6 = c5*d4
+        if want_s3:
+            c7 = c6*d23
+        if want_phi1 or want_phi2 or want_phi3:
+            c8 = c0*c4
+        if want_phi1 or want_phi2:
+            c9 = c6*c8
+        if want_s3 or want_phi1 or want_phi2 or want_phi3:
+            c10 = d1*d4
+        if want_f1 or want_t14x or want_s1:
+            c11 = -c0
+        if want_f1 or want_f4 or want_t14x or want_t23x or want_s1 or want_s3 or want_s4 or want_phi1 or want_phi2 or want_phi3:
+            c12 = x14*y2
+        if want_f1 or want_s1 or want_s3:
+            c13 = x23*y4
+        if want_f1 or want_f4 or want_s1 or want_s3 or want_s4:
+            c14 = xe*y2
+        if want_f1 or want_s1 or want_s3:
+            c15 = xe*y4
+        if want_f1 or want_s1:
+            c16 = c11*mlx + fe*(-c12 + c13 + c14 + c15) + fl*(-c12 + x23*y4) + mly*(y2 + y4)
+        if want_f2 or want_s2 or want_fry:
+            c17 = fl*x14
+        if want_f2 or want_t14x or want_t23x or want_s2 or want_fry:
+            c18 = x14 - xe
+        if want_f2 or want_t14x or want_t23x or want_s2:
+            c19 = c18*fe
+        if want_f2 or want_s2:
+            c20 = c17 + c19 - mly
+        if want_f4 or want_s4 or want_phi1 or want_phi2 or want_phi3:
+            c21 = c0*mlx
+        if want_f4 or want_s3 or want_s4 or want_phi1 or want_phi2 or want_phi3:
+            c22 = x23*y1
+        if want_f4 or want_s4:
+            c23 = c12 + c22
+        if want_f4 or want_s3 or want_s4 or want_phi1 or want_phi2 or want_phi3:
+            c24 = xe*y1
+        if want_f4 or want_s4:
+            c25 = c21 + c23*fl + fe*(-c14 + c23 + c24) + mly*(y1 - y2)
+        if want_t14x or want_t23x:
+            c26 = c12*fl + c19*y2 - mly*y2
+        if want_s3 or want_phi1 or want_phi2:
+            c27 = d14*d4
+            c28 = y1**2
+            c29 = c10*c28
+            c30 = y4**2
+            c31 = c10*c30
+        if want_s3 or want_phi1 or want_phi2 or want_phi3:
+            c32 = d1*y1
+            c33 = d4*y4
+        if want_s3 or want_phi1 or want_phi2:
+            c34 = 2*c33
+            c35 = c32*c34
+            c36 = c27 + c29 + c31 + c35 + c5
+            c37 = c5*y2
+        if want_s3 or want_phi1:
+            c38 = c37*d23
+        if want_s3:
+            c39 = c38*d2
+        if want_s3 or want_phi1 or want_phi2:
+            c40 = c27*y2
+        if want_s3 or want_phi1:
+            c41 = c40*d23
+        if want_s3:
+            c42 = d2*y3
+            c43 = c41*d2
+        if want_s3 or want_phi1 or want_phi2:
+            c44 = c27*y4
+        if want_s3 or want_phi1:
+            c45 = c44*d23
+        if want_s3:
+            c46 = d2*y2**2
+            c47 = c46*d23
+            c48 = c47*c5
+            c49 = c28*c7
+            c50 = c30*c7
+            c51 = c27*c47
+        if want_s3 or want_phi1 or want_phi2:
+            c52 = c5*y1
+        if want_s3 or want_phi1:
+            c53 = c52*d23
+        if want_s3:
+            c54 = c34*c53
+        if want_s3 or want_phi1 or want_phi3:
+            c55 = d4*y2
+        if want_s3 or want_phi1:
+            c56 = c5*c55
+            c57 = c28*c56
+            c58 = c30*c56
+        if want_s3 or want_phi1 or want_phi2 or want_phi3:
+            c59 = d1*y2
+        if want_s3 or want_phi1 or want_phi2:
+            c60 = c59*d4
+            c61 = c28*c60
+        if want_s3 or want_phi1:
+            c62 = c61*d23
+        if want_s3 or want_phi1 or want_phi2:
+            c63 = c30*c60
+        if want_s3 or want_phi1:
+            c64 = c63*d23
+            c65 = 2*c52
+            c66 = c55*c65*y4
+        if want_s3 or want_phi1 or want_phi2:
+            c67 = c34*c59*y1
+        if want_s3 or want_phi1:
+            c68 = c67*d23
+        if want_s3:
+            c69 = c46*c6
+            c70 = c28*c69
+            c71 = c30*c69
+            c72 = c29*c47
+            c73 = c31*c47
+        if want_s3 or want_phi1:
+            c74 = c34*c52
+        if want_s3:
+            c75 = c46*c74
+            c76 = c35*c47
+        if want_s3 or want_phi1 or want_phi2:
+            c77 = c12*c5
+        if want_s3 or want_phi1:
+            c78 = c77*d23
+        if want_s3 or want_phi1 or want_phi2:
+            c79 = c22*c5
+        if want_s3 or want_phi1:
+            c80 = c79*d23
+        if want_s3 or want_phi1 or want_phi2:
+            c81 = c12*c27
+        if want_s3 or want_phi1:
+            c82 = c81*d23
+        if want_s3 or want_phi1 or want_phi3:
+            c83 = c12*d4
+        if want_s3 or want_phi1:
+            c84 = c5*c83
+            c85 = c28*c84
+            c86 = c30*c84
+        if want_s3 or want_phi1 or want_phi2:
+            c87 = c12*c29
+        if want_s3 or want_phi1:
+            c88 = c87*d23
+        if want_s3 or want_phi1 or want_phi2:
+            c89 = c12*c31
+        if want_s3 or want_phi1:
+            c90 = c89*d23
+            c91 = c12*c74
+        if want_s3 or want_phi1 or want_phi2:
+            c92 = c12*c35
+        if want_s3 or want_phi1:
+            c93 = c92*d23
+        if want_s3:
+            c94 = -c13*c27*c42*d23 - c13*c43 + c22*c39 + c42*c78 + c42*c80 + c42*c82 + c42*c85 + c42*c86 + c42*c88 + c42*c90 + c42*c91 + c42*c93 + c48*x14 + c49*x14 + c50*x14 + c51*x14 + c54*x14 + c70*x14 + c71*x14 + c72*x14 + c73*x14 + c75*x14 + c76*x14
+            c95 = c14*d2
+        if want_s3 or want_phi1 or want_phi2:
+            c96 = c24*c5
+        if want_s3 or want_phi1:
+            c97 = c96*d23
+        if want_s3:
+            c98 = c15*d4
+            c99 = 2*c98
+            c100 = c14*c5*d4
+        if want_phi1 or want_phi2:
+            c101 = c21*c36
+        if want_phi1:
+            c102 = c78 + c80 + c82 + c85 + c86 + c88 + c90 + c91 + c93 - d14*d23*d4*x23*y4
+        if want_phi2:
+            c103 = c77 + c79 + c81 + c87 + c89 + c92 - d14*d4*x23*y4
+        if want_phi3:
+            c104 = c12*d1 + c22*d1 + c83 - d4*x23*y4
+        if want_f1 or want_f4:
+            den0 = c2
+        if want_f2 or want_t14x or want_t23x or want_fry or want_ffy:
+            den1 = c0
+        if want_s1:
+            den2 = c2*d1
+        if want_s2:
+            den3 = c3
+        if want_s3:
+            den4 = c3*c4*c7
+        if want_s4:
+            den5 = c2*d4
+        if want_phi1:
+            den6 = c9*d23
+        if want_phi2:
+            den7 = c9
+        if want_phi3:
+            den8 = c10*c8
+        if want_f1:
+            results['f1'] = (c16) / den0
+        if want_f2:
+            results['f2'] = (c20) / den1
+        if want_f3:
+            results['f3'] = 0
+        if want_f4:
+            results['f4'] = (c25) / den0
+        if want_t14x:
+            results['t14x'] = (c11*mlx - c26) / den1
+        if want_t23x:
+            results['t23x'] = (-c26) / den1
+        if want_s1:
+            results['s1'] = (c16) / den2
+        if want_s2:
+            results['s2'] = (c20) / den3
+        if want_s3:
+            results['s3'] = (c3*c36*d23*mlx*(y2 + y3) + c94*fl + fe*(-c100*c28*c42 - c100*c30*c42 - c14*c27*c42*d23 - c14*c29*c42*d23 - c14*c31*c42*d23 - c14*c35*c42*d23 - c14*c42*c5*d23 - c14*c42*c74 - c15*c27*c42*d23 - c32*c47*c99 + c42*c97 - c45*c95 - c46*c65*c98 - c48*xe - c49*xe - c50*xe - c51*xe + c53*c95 - c53*c99 - c70*xe - c71*xe - c72*xe - c73*xe + c94) + mly*(-c39*y3 - c41*c42 - c42*c45 - c42*c57 - c42*c58 - c42*c62 - c42*c64 - c42*c66 - c42*c68 - c43*y4 - c48 - c49 - c50 - c51 - c54 - c70 - c71 - c72 - c73 - c75 - c76 + d1*d14*d2*d23*y1*y2 + d1*d14*d2*d23*y1*y3)) / den4
+        if want_s4:
+            results['s4'] = (c25) / den5
+        if want_phi1:
+            results['phi1'] = (-c101*d23 - c102*fl + fe*(-c102 + c28*d1*d14*d4*xe*y2 + c28*d1*d23*d4*xe*y2 + c30*d1*d14*d4*xe*y2 + c30*d1*d23*d4*xe*y2 - c97 + d1*d14*d23*xe*y2 + 2*d1*d14*d4*xe*y1*y2*y4 + 2*d1*d23*d4*xe*y1*y2*y4 + d14*d23*d4*xe*y2 + d14*d23*d4*xe*y4) + mly*(c38 + c41 + c45 - c53 + c57 + c58 + c62 + c64 + c66 + c68)) / den6
+        if want_phi2:
+            results['phi2'] = (-c101 - c103*fl + fe*(-c103 + c28*d1*d4*xe*y2 + c30*d1*d4*xe*y2 - c96 + d1*d14*xe*y2 + 2*d1*d4*xe*y1*y2*y4 + d14*d4*xe*y2 + d14*d4*xe*y4) + mly*(c37 + c40 + c44 - c52 + c61 + c63 + c67)) / den7
+        if want_phi3:
+            results['phi3'] = (-c104*fl - c21*(d1 + d4) + fe*(-c104 - c24*d1 + d1*xe*y2 + d4*xe*y2 + d4*xe*y4) + mly*(-c32 + c33 + c55 + c59)) / den8
+        if want_fry:
+            results['fry'] = (-c17 - c18*fe + mly) / den1
+        if want_ffy:
+            results['ffy'] = (fe*(x23 + xe) + fl*x23 + mly) / den1
 
-    # Lasten
-    fl = 64305.4  # N
-    mlx = 74552.9  # Nm
-    mly = 129129.3  # Nm
-    fe = 0.  # N
+    if lift == 4:
+        if want_f1 or want_f2 or want_f3 or want_t14x or want_t23x or want_s1 or want_s2 or want_s3 or want_s4 or want_phi1 or want_phi2 or want_phi3 or want_fry or want_ffy:
+            c0 = x14 + x23
+        if want_f2 or want_f3 or want_s2 or want_s3 or want_s4 or want_phi1 or want_phi2 or want_phi3:
+            c1 = y2 + y3
+        if want_f2 or want_f3 or want_s2 or want_s3:
+            c2 = c0*c1
+        if want_s1 or want_s4:
+            c3 = c0*d1
+        if want_s4 or want_phi1 or want_phi2 or want_phi3:
+            c4 = c1**2
+        if want_s4 or want_phi2 or want_phi3:
+            c5 = d2*d23
+            c6 = c5*d3
+        if want_s4:
+            c7 = c6*d14
+        if want_s4 or want_phi1 or want_phi2 or want_phi3:
+            c8 = d2*d3
+        if want_phi1 or want_phi2 or want_phi3:
+            c9 = c0*c4
+        if want_phi2 or want_phi3:
+            c10 = c6*c9
+        if want_f1 or want_t14x or want_t23x or want_s1 or want_ffy:
+            c11 = fl*x23
+            c12 = fe*(x23 + xe)
+        if want_f1 or want_s1 or want_ffy:
+            c13 = c11 + c12 + mly
+        if want_f2 or want_s2 or want_s4:
+            c14 = x14*y3
+        if want_f2 or want_f3 or want_s2 or want_s3 or want_s4 or want_phi1 or want_phi2 or want_phi3:
+            c15 = x23*y1
+            c16 = xe*y1
+        if want_f2 or want_s2 or want_s4 or want_phi1 or want_phi2 or want_phi3:
+            c17 = xe*y3
+        if want_f2 or want_s2:
+            c18 = -c0*mlx + fe*(-c15 - c16 - c17 + x14*y3) + fl*(c14 - c15) + mly*(-y1 - y3)
+        if want_f3 or want_t23x or want_s3 or want_phi1 or want_phi2 or want_phi3:
+            c19 = c0*mlx
+        if want_f3 or want_s3 or want_s4 or want_phi1 or want_phi2 or want_phi3:
+            c20 = x14*y2
+        if want_f3 or want_s3:
+            c21 = c15 + c20
+        if want_f3 or want_s3 or want_s4:
+            c22 = xe*y2
+        if want_f3 or want_s3:
+            c23 = c19 + c21*fl + fe*(c16 + c21 - c22) + mly*(y1 - y2)
+        if want_t14x or want_t23x:
+            c24 = c11*y1 + c12*y1 + mly*y1
+        if want_s4 or want_phi2 or want_phi3:
+            c25 = d23*d3
+            c26 = y2**2
+            c27 = c26*c8
+            c28 = y3**2
+            c29 = c28*c8
+        if want_s4 or want_phi1 or want_phi2 or want_phi3:
+            c30 = d3*y3
+        if want_s4 or want_phi2 or want_phi3:
+            c31 = 2*d2*y2
+            c32 = c30*c31
+            c33 = c25 + c27 + c29 + c32 + c5
+            c34 = c5*y1
+        if want_s4 or want_phi3:
+            c35 = c34*d14
+        if want_s4:
+            c36 = d1*y4
+        if want_s4 or want_phi2 or want_phi3:
+            c37 = c25*y1
+        if want_s4 or want_phi3:
+            c38 = c37*d14
+        if want_s4:
+            c39 = c38*d1
+        if want_s4 or want_phi2 or want_phi3:
+            c40 = c25*y3
+        if want_s4 or want_phi3:
+            c41 = c40*d14
+        if want_s4:
+            c42 = d1*y1**2
+            c43 = c42*d14
+            c44 = c43*c5
+            c45 = c25*c43
+            c46 = c26*c7
+            c47 = c28*c7
+        if want_s4 or want_phi3:
+            c48 = c5*y2
+        if want_s4:
+            c49 = c48*d14
+            c50 = c49*d1
+            c51 = 2*c49
+            c52 = c30*c51
+        if want_s4 or want_phi1 or want_phi2 or want_phi3:
+            c53 = d2*y1
+        if want_s4 or want_phi2 or want_phi3:
+            c54 = c53*d3
+            c55 = c26*c54
+        if want_s4 or want_phi3:
+            c56 = c55*d14
+        if want_s4 or want_phi2 or want_phi3:
+            c57 = c28*c54
+        if want_s4 or want_phi3:
+            c58 = c57*d14
+        if want_s4 or want_phi1 or want_phi2 or want_phi3:
+            c59 = d3*y1
+        if want_s4 or want_phi3:
+            c60 = c5*c59
+            c61 = c26*c60
+            c62 = c28*c60
+        if want_s4 or want_phi2 or want_phi3:
+            c63 = c59*y3
+            c64 = c31*c63
+        if want_s4 or want_phi3:
+            c65 = c64*d14
+            c66 = 2*c48
+            c67 = c63*c66
+        if want_s4:
+            c68 = c27*c43
+            c69 = c29*c43
+            c70 = c42*c6
+            c71 = c26*c70
+            c72 = c28*c70
+            c73 = c32*c43
+        if want_s4 or want_phi3:
+            c74 = c30*c66
+        if want_s4:
+            c75 = c42*c74
+        if want_s4 or want_phi2 or want_phi3:
+            c76 = c20*c5
+        if want_s4 or want_phi3:
+            c77 = c76*d14
+        if want_s4 or want_phi2 or want_phi3:
+            c78 = c15*c5
+        if want_s4 or want_phi3:
+            c79 = c78*d14
+        if want_s4 or want_phi2 or want_phi3:
+            c80 = c15*c25
+        if want_s4 or want_phi3:
+            c81 = c80*d14
+        if want_s4 or want_phi2 or want_phi3:
+            c82 = c15*c27
+        if want_s4 or want_phi3:
+            c83 = c82*d14
+        if want_s4 or want_phi2 or want_phi3:
+            c84 = c15*c29
+        if want_s4 or want_phi3:
+            c85 = c84*d14
+        if want_s4 or want_phi1 or want_phi3:
+            c86 = c15*d3
+        if want_s4 or want_phi3:
+            c87 = c5*c86
+            c88 = c26*c87
+            c89 = c28*c87
+        if want_s4 or want_phi2 or want_phi3:
+            c90 = c15*c32
+        if want_s4 or want_phi3:
+            c91 = c90*d14
+            c92 = c15*c74
+        if want_s4:
+            c93 = -c14*c25*c36*d14 - c14*c39 + c20*c35*d1 + c36*c77 + c36*c79 + c36*c81 + c36*c83 + c36*c85 + c36*c88 + c36*c89 + c36*c91 + c36*c92 + c44*x23 + c45*x23 + c46*x23 + c47*x23 + c52*x23 + c68*x23 + c69*x23 + c71*x23 + c72*x23 + c73*x23 + c75*x23
+        if want_s4 or want_phi2 or want_phi3:
+            c94 = c16*c5
+        if want_s4 or want_phi3:
+            c95 = c94*d14
+        if want_s4 or want_phi2 or want_phi3:
+            c96 = c16*c25
+        if want_s4 or want_phi3:
+            c97 = c96*d14
+        if want_s4 or want_phi2 or want_phi3:
+            c98 = c17*c25
+        if want_s4 or want_phi3:
+            c99 = c98*d14
+        if want_s4 or want_phi1:
+            c100 = c17*d3
+        if want_s4 or want_phi2 or want_phi3:
+            c101 = c16*c27
+        if want_s4 or want_phi3:
+            c102 = c101*d14
+        if want_s4 or want_phi2 or want_phi3:
+            c103 = c16*c29
+        if want_s4 or want_phi3:
+            c104 = c103*d14
+        if want_s4 or want_phi1 or want_phi3:
+            c105 = c16*d3
+        if want_s4 or want_phi3:
+            c106 = c105*c5
+            c107 = c106*c26
+            c108 = c106*c28
+        if want_s4 or want_phi2 or want_phi3:
+            c109 = c16*c32
+        if want_s4 or want_phi3:
+            c110 = c109*d14
+            c111 = c16*c74
+        if want_phi1:
+            c112 = c15*d2 + c20*d2 + c86 - d3*x14*y3
+        if want_phi2 or want_phi3:
+            c113 = c19*c33
+        if want_phi2:
+            c114 = c76 + c78 + c80 + c82 + c84 + c90 - d23*d3*x14*y3
+        if want_phi3:
+            c115 = c77 + c79 + c81 + c83 + c85 + c88 + c89 + c91 + c92 - d14*d23*d3*x14*y3
+        if want_f1 or want_t14x or want_t23x or want_fry or want_ffy:
+            den0 = c0
+        if want_f2 or want_f3:
+            den1 = c2
+        if want_s1:
+            den2 = c3
+        if want_s2:
+            den3 = c2*d2
+        if want_s3:
+            den4 = c2*d3
+        if want_s4:
+            den5 = c3*c4*c7
+        if want_phi1:
+            den6 = c8*c9
+        if want_phi2:
+            den7 = c10
+        if want_phi3:
+            den8 = c10*d14
+        if want_f1:
+            results['f1'] = (c13) / den0
+        if want_f2:
+            results['f2'] = (c18) / den1
+        if want_f3:
+            results['f3'] = (c23) / den1
+        if want_f4:
+            results['f4'] = 0
+        if want_t14x:
+            results['t14x'] = (c24) / den0
+        if want_t23x:
+            results['t23x'] = (c19 + c24) / den0
+        if want_s1:
+            results['s1'] = (c13) / den2
+        if want_s2:
+            results['s2'] = (c18) / den3
+        if want_s3:
+            results['s3'] = (c23) / den4
+        if want_s4:
+            results['s4'] = (c3*c33*d14*mlx*(y1 + y4) + c93*fl + fe*(c100*c31*c43 + c100*c42*c66 + c100*c51 + c102*c36 + c104*c36 + c107*c36 + c108*c36 + c110*c36 + c111*c36 + c16*c41*d1 - c16*c50 - c22*c36*c5*d14 + c36*c95 + c36*c97 + c36*c99 + c44*xe + c45*xe + c46*xe + c47*xe + c68*xe + c69*xe + c71*xe + c72*xe + c93) + mly*(c35*c36 + c36*c38 + c36*c41 - c36*c49 + c36*c56 + c36*c58 + c36*c61 + c36*c62 + c36*c65 + c36*c67 + c39*y3 + c44 + c45 + c46 + c47 - c50*y1 + c52 + c68 + c69 + c71 + c72 + c73 + c75)) / den5
+        if want_phi1:
+            results['phi1'] = (-c112*fl - c19*(d2 + d3) + fe*(-c100 - c105 - c112 - c16*d2 + d2*xe*y2) + mly*(-c30 - c53 - c59 + d2*y2)) / den6
+        if want_phi2:
+            results['phi2'] = (-c113 - c114*fl + fe*(-c101 - c103 - c109 - c114 - c94 - c96 - c98 + d2*d23*xe*y2) + mly*(-c34 - c37 - c40 - c55 - c57 - c64 + d2*d23*y2)) / den7
+        if want_phi3:
+            results['phi3'] = (-c113*d14 - c115*fl + fe*(-c102 - c104 - c107 - c108 - c110 - c111 - c115 - c95 - c97 - c99 + d14*d2*d23*xe*y2) + mly*(-c35 - c38 - c41 - c56 - c58 - c61 - c62 - c65 - c67 + d14*d2*d23*y2)) / den8
+        if want_fry:
+            results['fry'] = (fe*(-x14 + xe) - fl*x14 + mly) / den0
+        if want_ffy:
+            results['ffy'] = (c13) / den0
 
-    # Geometrie
-    h = 3.000  # m
-    x14 = 4.805  # m
-    x23 = 0.780  # m
-    xe = 0.  # m
+    if x1 is not None and x3 is not None:
+        if want_t14y:
+            results['t14y'] = (-fe*x23*x3 - fe*x3*xe - fl*x23*x3 - mly*x3) / (x14 + x23)
+        if want_t23y:
+            results['t23y'] = (-fe*x1*x14 + fe*x1*xe - fl*x1*x14 + mly*x1) / (x14 + x23)
+    return results
 
-    # Federraten
-    d14 = 30230370.0  # Nm/rad
-    d23 = 155189025.3  # Nm/rad
-    d1 = 3001412.8  # N/m
-    d2 = 3001412.8  # N/m
-    d3 = 3001412.8  # N/m
-    d4 = 3001412.8  # N/m
 
-    # Symmetrie
-    y1 = h
-    y2 = h
-    y3 = h
-    y4 = h
+def _results_plain_symmetric(fl, mlx, mly, fe, h, xe, x14, x23, d14, d23, dc, x1, x3, outputs):
+    """Elastostatic model, symmetric machine (y1...y4 = h, d1...d4 = dc)."""
+    if outputs is not None:
+        return _results_plain_symmetric_selected(fl, mlx, mly, fe, h, xe, x14, x23, d14, d23, dc, x1, x3, outputs)
+    c0 = x14 + x23
+    c1 = dc*h**2
+    c2 = c1*d14 + c1*d23 + d14*d23
+    c3 = 4*c2
+    c4 = c0*c3*h
+    c5 = 2*c1
+    c6 = mlx*(c5 + d23)
+    c7 = c6*d14
+    c8 = c0*c7
+    c9 = 2*c2*h
+    c10 = c9*mly
+    c11 = fe*(x23 + xe)
+    c12 = fl*x23
+    c13 = c10 + c11*c9 + c12*c9
+    c14 = c13 - c8
+    c15 = c5 + d14
+    c16 = c15*d23*mlx
+    c17 = c0*c16
+    c18 = x14 - xe
+    c19 = -c10 - c17 + 2*c18*c2*fe*h + 2*c2*fl*h*x14
+    c20 = fl*x14
+    c21 = -c10 + c17 + c18*c9*fe + c20*c9
+    c22 = c13 + c8
+    c23 = -c7
+    den0 = c4
+    den1 = 2*c2
+    den2 = c4*dc
+    den3 = c1*c3
+    den4 = c0
+    f1 = (c14) / den0
+    f2 = (c19) / den0
+    f3 = (c21) / den0
+    f4 = (c22) / den0
+    t14x = (c23) / den1
+    t23x = (c16) / den1
+    s1 = (c14) / den2
+    s2 = (c19) / den2
+    s3 = (c21) / den2
+    s4 = (c22) / den2
+    phi1 = (-c16) / den3
+    phi2 = (-c15*c6) / den3
+    phi3 = (c23) / den3
+    fry = (-c18*fe - c20 + mly) / den4
+    ffy = (c11 + c12 + mly) / den4
+    results = {'f1': f1, 'f2': f2, 'f3': f3, 'f4': f4, 't14x': t14x, 't23x': t23x, 's1': s1, 's2': s2, 's3': s3, 's4': s4, 'phi1': phi1, 'phi2': phi2, 'phi3': phi3, 'fry': fry, 'ffy': ffy}
+    if x1 is not None and x3 is not None:
+        t14y = (-fe*x23*x3 - fe*x3*xe - fl*x23*x3 - mly*x3) / (x14 + x23)
+        results['t14y'] = t14y
+        t23y = (-fe*x1*x14 + fe*x1*xe - fl*x1*x14 + mly*x1) / (x14 + x23)
+        results['t23y'] = t23y
+    return results
+
+
+def _results_plain_symmetric_selected(fl, mlx, mly, fe, h, xe, x14, x23, d14, d23, dc, x1, x3, outputs):
+    """Elastostatic model, symmetric machine (y1...y4 = h, d1...d4 = dc). Only the outputs in the set outputs."""
+    want_f1 = 'f1' in outputs
+    want_f2 = 'f2' in outputs
+    want_f3 = 'f3' in outputs
+    want_f4 = 'f4' in outputs
+    want_t14x = 't14x' in outputs
+    want_t23x = 't23x' in outputs
+    want_s1 = 's1' in outputs
+    want_s2 = 's2' in outputs
+    want_s3 = 's3' in outputs
+    want_s4 = 's4' in outputs
+    want_phi1 = 'phi1' in outputs
+    want_phi2 = 'phi2' in outputs
+    want_phi3 = 'phi3' in outputs
+    want_fry = 'fry' in outputs
+    want_ffy = 'ffy' in outputs
+    want_t14y = 't14y' in outputs
+    want_t23y = 't23y' in outputs
+    results = {}
+    if want_f1 or want_f2 or want_f3 or want_f4 or want_s1 or want_s2 or want_s3 or want_s4 or want_fry or want_ffy:
+        c0 = x14 + x23
+    if want_f1 or want_f2 or want_f3 or want_f4 or want_t14x or want_t23x or want_s1 or want_s2 or want_s3 or want_s4 or want_phi1 or want_phi2 or want_phi3:
+        c1 = dc*h**2
+        c2 = c1*d14 + c1*d23 + d14*d23
+    if want_f1 or want_f2 or want_f3 or want_f4 or want_s1 or want_s2 or want_s3 or want_s4 or want_phi1 or want_phi2 or want_phi3:
+        c3 = 4*c2
+    if want_f1 or want_f2 or want_f3 or want_f4 or want_s1 or want_s2 or want_s3 or want_s4:
+        c4 = c0*c3*h
+    if want_f1 or want_f2 or want_f3 or want_f4 or want_t14x or want_t23x or want_s1 or want_s2 or want_s3 or want_s4 or want_phi1 or want_phi2 or want_phi3:
+        c5 = 2*c1
+    if want_f1 or want_f4 or want_t14x or want_s1 or want_s4 or want_phi2 or want_phi3:
+        c6 = mlx*(c5 + d23)
+    if want_f1 or want_f4 or want_t14x or want_s1 or want_s4 or want_phi3:
+        c7 = c6*d14
+    if want_f1 or want_f4 or want_s1 or want_s4:
+        c8 = c0*c7
+    if want_f1 or want_f2 or want_f3 or want_f4 or want_s1 or want_s2 or want_s3 or want_s4:
+        c9 = 2*c2*h
+        c10 = c9*mly
+    if want_f1 or want_f4 or want_s1 or want_s4 or want_ffy:
+        c11 = fe*(x23 + xe)
+        c12 = fl*x23
+    if want_f1 or want_f4 or want_s1 or want_s4:
+        c13 = c10 + c11*c9 + c12*c9
+    if want_f1 or want_s1:
+        c14 = c13 - c8
+    if want_f2 or want_f3 or want_t23x or want_s2 or want_s3 or want_phi1 or want_phi2:
+        c15 = c5 + d14
+    if want_f2 or want_f3 or want_t23x or want_s2 or want_s3 or want_phi1:
+        c16 = c15*d23*mlx
+    if want_f2 or want_f3 or want_s2 or want_s3:
+        c17 = c0*c16
+    if want_f2 or want_f3 or want_s2 or want_s3 or want_fry:
+        c18 = x14 - xe
+    if want_f2 or want_s2:
+        c19 = -c10 - c17 + 2*c18*c2*fe*h + 2*c2*fl*h*x14
+    if want_f3 or want_s3 or want_fry:
+        c20 = fl*x14
+    if want_f3 or want_s3:
+        c21 = -c10 + c17 + c18*c9*fe + c20*c9
+    if want_f4 or want_s4:
+        c22 = c13 + c8
+    if want_t14x or want_phi3:
+        c23 = -c7
+    if want_f1 or want_f2 or want_f3 or want_f4:
+        den0 = c4
+    if want_t14x or want_t23x:
+        den1 = 2*c2
+    if want_s1 or want_s2 or want_s3 or want_s4:
+        den2 = c4*dc
+    if want_phi1 or want_phi2 or want_phi3:
+        den3 = c1*c3
+    if want_fry or want_ffy:
+        den4 = c0
+    if want_f1:
+        results['f1'] = (c14) / den0
+    if want_f2:
+        results['f2'] = (c19) / den0
+    if want_f3:
+        results['f3'] = (c21) / den0
+    if want_f4:
+        results['f4'] = (c22) / den0
+    if want_t14x:
+        results['t14x'] = (c23) / den1
+    if want_t23x:
+        results['t23x'] = (c16) / den1
+    if want_s1:
+        results['s1'] = (c14) / den2
+    if want_s2:
+        results['s2'] = (c19) / den2
+    if want_s3:
+        results['s3'] = (c21) / den2
+    if want_s4:
+        results['s4'] = (c22) / den2
+    if want_phi1:
+        results['phi1'] = (-c16) / den3
+    if want_phi2:
+        results['phi2'] = (-c15*c6) / den3
+    if want_phi3:
+        results['phi3'] = (c23) / den3
+    if want_fry:
+        results['fry'] = (-c18*fe - c20 + mly) / den4
+    if want_ffy:
+        results['ffy'] = (c11 + c12 + mly) / den4
+    if x1 is not None and x3 is not None:
+        if want_t14y:
+            results['t14y'] = (-fe*x23*x3 - fe*x3*xe - fl*x23*x3 - mly*x3) / (x14 + x23)
+        if want_t23y:
+            results['t23y'] = (-fe*x1*x14 + fe*x1*xe - fl*x1*x14 + mly*x1) / (x14 + x23)
+    return results
 
-    ans = results_plain(fl, mlx, mly, y1, y2, y3, y4, x14, x23, d14, d23, d1, d2, d3, d4)
 
-    for key in ans:
-        print(f'{key}: {ans[key]}\n---')
+def _results_liftoff_plain_symmetric(fl, mlx, mly, fe, h, xe, x14, x23, d14, d23, dc, lift, x1, x3, outputs):
+    """Lift-off models, symmetric machine (y1...y4 = h, d1...d4 = dc)."""
+    if outputs is not None:
+        return _results_liftoff_plain_symmetric_selected(fl, mlx, mly, fe, h, xe, x14, x23, d14, d23, dc, lift, x1, x3, outputs)
+    if lift == 1:
+        c0 = 2*h
+        c1 = x14 + x23
+        c2 = c1*dc
+        c3 = d14*d23
+        c4 = h**2
+        c5 = 2*c2*c4
+        c6 = fe*h
+        c7 = fl*h
+        c8 = c6 + c7 - mlx
+        c9 = c0*mly
+        c10 = c1*mlx
+        c11 = c10 + c6*(x14 - x23 - 2*xe) + c7*(x14 - x23) - c9
+        c12 = fl*x23
+        c13 = x23 + xe
+        c14 = c13*fe
+        c15 = c12 + c14 + mly
+        c16 = h*mly
+        c17 = c7*x23
+        c18 = c13*c6
+        c19 = c16 + c17 + c18
+        c20 = c4*dc
+        c21 = 2*c20 + d23
+        c22 = c10*c21
+        c23 = -c22*d14
+        c24 = c20*d14
+        c25 = c20*d23
+        c26 = c24 + c25 + c3
+        c27 = c0*c26
+        c28 = 2*c24 + 2*c25 + c3
+        den0 = c0
+        den1 = c0*c1
+        den2 = c1
+        den3 = c2*c3*h
+        den4 = c0*dc
+        den5 = c0*c2
+        den6 = c2
+        den7 = c5
+        den8 = c5*d23
+        den9 = c3*c5
+        f1 = 0
+        f2 = (c8) / den0
+        f3 = (c11) / den1
+        f4 = (c15) / den2
+        t14x = (-c19) / den2
+        t23x = (c1*mlx - c19) / den2
+        s1 = (c12*c27 + c14*c27 + c23 + c26*c9) / den3
+        s2 = (c8) / den4
+        s3 = (c11) / den5
+        s4 = (c15) / den6
+        phi1 = (-c1*mlx + c19) / den7
+        phi2 = (c16*c21 + c17*c21 + c18*c21 - c22) / den8
+        phi3 = (c16*c28 + c17*c28 + c18*c28 + c23) / den9
+        fry = (fe*(-x14 + xe) - fl*x14 + mly) / den2
+        ffy = (c15) / den2
+
+    if lift == 2:
+        c0 = 2*h
+        c1 = x14 + x23
+        c2 = c1*dc
+        c3 = d14*d23
+        c4 = h**2
+        c5 = 2*c2*c4
+        c6 = fe*h
+        c7 = fl*h
+        c8 = c6 + c7 - mlx
+        c9 = fl*x14
+        c10 = x14 - xe
+        c11 = c10*fe + c9 - mly
+        c12 = c1*mlx - c6*(x14 - x23 - 2*xe) - c7*(x14 - x23) + 2*h*mly
+        c13 = h*mly
+        c14 = c7*x14
+        c15 = c10*c6
+        c16 = -c13 + c14 + c15
+        c17 = -c1*mlx + c16
+        c18 = c4*dc
+        c19 = 2*c18 + d14
+        c20 = c1*c19*mlx
+        c21 = c20*d23
+        c22 = c18*d14
+        c23 = c18*d23
+        c24 = c22 + c23 + c3
+        c25 = 2*c22 + 2*c23 + c3
+        den0 = c0
+        den1 = c1
+        den2 = c0*c1
+        den3 = c0*dc
+        den4 = c2*c3*h
+        den5 = c2
+        den6 = c0*c2
+        den7 = c3*c5
+        den8 = c5*d14
+        den9 = c5
+        f1 = (c8) / den0
+        f2 = 0
+        f3 = (c11) / den1
+        f4 = (c12) / den2
+        t14x = (c17) / den1
+        t23x = (c16) / den1
+        s1 = (c8) / den3
+        s2 = (-c0*c24*mly + 2*c10*c24*fe*h - c21 + 2*c24*fl*h*x14) / den4
+        s3 = (c11) / den5
+        s4 = (c12) / den6
+        phi1 = (c10*c25*fe*h - c13*c25 - c21 + c25*fl*h*x14) / den7
+        phi2 = (-c13*c19 + c14*c19 + c15*c19 - c20) / den8
+        phi3 = (c17) / den9
+        fry = (-c10*fe - c9 + mly) / den1
+        ffy = (fe*(x23 + xe) + fl*x23 + mly) / den1
+
+    if lift == 3:
+        c0 = x14 + x23
+        c1 = 2*h
+        c2 = c0*dc
+        c3 = d14*d23
+        c4 = h**2
+        c5 = 2*c2*c4
+        c6 = fl*h
+        c7 = c0*mlx
+        c8 = fe*h
+        c9 = -c6*(x14 - x23) - c7 - c8*(x14 - x23 - 2*xe) + 2*h*mly
+        c10 = fl*x14
+        c11 = x14 - xe
+        c12 = c11*fe
+        c13 = c10 + c12 - mly
+        c14 = c6 + c8 + mlx
+        c15 = c10*h
+        c16 = c12*h
+        c17 = c15 + c16 - h*mly
+        c18 = -c17 - c7
+        c19 = c4*dc
+        c20 = 2*c19 + d14
+        c21 = c0*c20*mlx
+        c22 = c21*d23
+        c23 = c19*d14
+        c24 = c19*d23
+        c25 = c23 + c24 + c3
+        c26 = c1*c25
+        c27 = 2*c23 + 2*c24 + c3
+        den0 = c0*c1
+        den1 = c0
+        den2 = c1
+        den3 = c1*c2
+        den4 = c2
+        den5 = c2*c3*h
+        den6 = c1*dc
+        den7 = c3*c5
+        den8 = c5*d14
+        den9 = c5
+        f1 = (c9) / den0
+        f2 = (c13) / den1
+        f3 = 0
+        f4 = (c14) / den2
+        t14x = (c18) / den1
+        t23x = (-c17) / den1
+        s1 = (c9) / den3
+        s2 = (c13) / den4
+        s3 = (-c1*c25*mly + c10*c26 + c12*c26 + c22) / den5
+        s4 = (c14) / den6
+        phi1 = (-c15*c27 - c16*c27 - c22 + c27*h*mly) / den7
+        phi2 = (-c15*c20 - c16*c20 + c20*h*mly - c21) / den8
+        phi3 = (c18) / den9
+        fry = (-c10 - c11*fe + mly) / den1
+        ffy = (fe*(x23 + xe) + fl*x23 + mly) / den1
+
+    if lift == 4:
+        c0 = x14 + x23
+        c1 = 2*h
+        c2 = c0*dc
+        c3 = d14*d23
+        c4 = h**2
+        c5 = 2*c2*c4
+        c6 = fl*x23
+        c7 = fe*(x23 + xe)
+        c8 = c6 + c7 + mly
+        c9 = c1*mly
+        c10 = fl*h
+        c11 = -c0
+        c12 = fe*h
+        c13 = c10*(x14 - x23) + c11*mlx + c12*(x14 - x23 - 2*xe) - c9
+        c14 = c10 + c12 + mlx
+        c15 = h*mly
+        c16 = c6*h
+        c17 = c7*h
+        c18 = c15 + c16 + c17
+        c19 = c0*mlx
+        c20 = c4*dc
+        c21 = 2*c20 + d23
+        c22 = c19*c21
+        c23 = c22*d14
+        c24 = c20*d14
+        c25 = c20*d23
+        c26 = c24 + c25 + c3
+        c27 = c1*c26
+        c28 = 2*c24 + 2*c25 + c3
+        den0 = c0
+        den1 = c0*c1
+        den2 = c1
+        den3 = c2
+        den4 = c1*c2
+        den5 = c1*dc
+        den6 = c2*c3*h
+        den7 = c5
+        den8 = c5*d23
+        den9 = c3*c5
+        f1 = (c8) / den0
+        f2 = (c13) / den1
+        f3 = (c14) / den2
+        f4 = 0
+        t14x = (c18) / den0
+        t23x = (c18 + c19) / den0
+        s1 = (c8) / den3
+        s2 = (c13) / den4
+        s3 = (c14) / den5
+        s4 = (c23 + c26*c9 + c27*c6 + c27*c7) / den6
+        phi1 = (c11*mlx - c18) / den7
+        phi2 = (-c15*c21 - c16*c21 - c17*c21 - c22) / den8
+        phi3 = (-c15*c28 - c16*c28 - c17*c28 - c23) / den9
+        fry = (fe*(-x14 + xe) - fl*x14 + mly) / den0
+        ffy = (c8) / den0
+
+    results = {'f1': f1, 'f2': f2, 'f3': f3, 'f4': f4, 't14x': t14x, 't23x': t23x, 's1': s1, 's2': s2, 's3': s3, 's4': s4, 'phi1': phi1, 'phi2': phi2, 'phi3': phi3, 'fry': fry, 'ffy': ffy}
+    if x1 is not None and x3 is not None:
+        t14y = (-fe*x23*x3 - fe*x3*xe - fl*x23*x3 - mly*x3) / (x14 + x23)
+        results['t14y'] = t14y
+        t23y = (-fe*x1*x14 + fe*x1*xe - fl*x1*x14 + mly*x1) / (x14 + x23)
+        results['t23y'] = t23y
+    return results
+
+
+def _results_liftoff_plain_symmetric_selected(fl, mlx, mly, fe, h, xe, x14, x23, d14, d23, dc, lift, x1, x3, outputs):
+    """Lift-off models, symmetric machine (y1...y4 = h, d1...d4 = dc). Only the outputs in the set outputs."""
+    want_f1 = 'f1' in outputs
+    want_f2 = 'f2' in outputs
+    want_f3 = 'f3' in outputs
+    want_f4 = 'f4' in outputs
+    want_t14x = 't14x' in outputs
+    want_t23x = 't23x' in outputs
+    want_s1 = 's1' in outputs
+    want_s2 = 's2' in outputs
+    want_s3 = 's3' in outputs
+    want_s4 = 's4' in outputs
+    want_phi1 = 'phi1' in outputs
+    want_phi2 = 'phi2' in outputs
+    want_phi3 = 'phi3' in outputs
+    want_fry = 'fry' in outputs
+    want_ffy = 'ffy' in outputs
+    want_t14y = 't14y' in outputs
+    want_t23y = 't23y' in outputs
+    results = {}
+    if lift == 1:
+        if want_f2 or want_f3 or want_s1 or want_s2 or want_s3:
+            c0 = 2*h
+        if want_f3 or want_f4 or want_t14x or want_t23x or want_s1 or want_s3 or want_s4 or want_phi1 or want_phi2 or want_phi3 or want_fry or want_ffy:
+            c1 = x14 + x23
+        if want_s1 or want_s3 or want_s4 or want_phi1 or want_phi2 or want_phi3:
+            c2 = c1*dc
+        if want_s1 or want_phi3:
+            c3 = d14*d23
+        if want_s1 or want_phi1 or want_phi2 or want_phi3:
+            c4 = h**2
+        if want_phi1 or want_phi2 or want_phi3:
+            c5 = 2*c2*c4
+        if want_f2 or want_f3 or want_t14x or want_t23x or want_s2 or want_s3 or want_phi1 or want_phi2 or want_phi3:
+            c6 = fe*h
+            c7 = fl*h
+        if want_f2 or want_s2:
+            c8 = c6 + c7 - mlx
+        if want_f3 or want_s1 or want_s3:
+            c9 = c0*mly
+        if want_f3 or want_s1 or want_s3 or want_phi2 or want_phi3:
+            c10 = c1*mlx
+        if want_f3 or want_s3:
+            c11 = c10 + c6*(x14 - x23 - 2*xe) + c7*(x14 - x23) - c9
+        if want_f4 or want_s1 or want_s4 or want_ffy:
+            c12 = fl*x23
+        if want_f4 or want_t14x or want_t23x or want_s1 or want_s4 or want_phi1 or want_phi2 or want_phi3 or want_ffy:
+            c13 = x23 + xe
+        if want_f4 or want_s1 or want_s4 or want_ffy:
+            c14 = c13*fe
+        if want_f4 or want_s4 or want_ffy:
+            c15 = c12 + c14 + mly
+        if want_t14x or want_t23x or want_phi1 or want_phi2 or want_phi3:
+            c16 = h*mly
+            c17 = c7*x23
+            c18 = c13*c6
+        if want_t14x or want_t23x or want_phi1:
+            c19 = c16 + c17 + c18
+        if want_s1 or want_phi2 or want_phi3:
+            c20 = c4*dc
+            c21 = 2*c20 + d23
+            c22 = c10*c21
+        if want_s1 or want_phi3:
+            c23 = -c22*d14
+            c24 = c20*d14
+            c25 = c20*d23
+        if want_s1:
+            c26 = c24 + c25 + c3
+            c27 = c0*c26
+        if want_phi3:
+            c28 = 2*c24 + 2*c25 + c3
+        if want_f2:
+            den0 = c0
+        if want_f3:
+            den1 = c0*c1
+        if want_f4 or want_t14x or want_t23x or want_fry or want_ffy:
+            den2 = c1
+        if want_s1:
+            den3 = c2*c3*h
+        if want_s2:
+            den4 = c0*dc
+        if want_s3:
+            den5 = c0*c2
+        if want_s4:
+            den6 = c2
+        if want_phi1:
+            den7 = c5
+        if want_phi2:
+            den8 = c5*d23
+        if want_phi3:
+            den9 = c3*c5
+        if want_f1:
+            results['f1'] = 0
+        if want_f2:
+            results['f2'] = (c8) / den0
+        if want_f3:
+            results['f3'] = (c11) / den1
+        if want_f4:
+            results['f4'] = (c15) / den2
+        if want_t14x:
+            results['t14x'] = (-c19) / den2
+        if want_t23x:
+            results['t23x'] = (c1*mlx - c19) / den2
+        if want_s1:
+            results['s1'] = (c12*c27 + c14*c27 + c23 + c26*c9) / den3
+        if want_s2:
+            results['s2'] = (c8) / den4
+        if want_s3:
+            results['s3'] = (c11) / den5
+        if want_s4:
+            results['s4'] = (c15) / den6
+        if want_phi1:
+            results['phi1'] = (-c1*mlx + c19) / den7
+        if want_phi2:
+            results['phi2'] = (c16*c21 + c17*c21 + c18*c21 - c22) / den8
+        if want_phi3:
+            results['phi3'] = (c16*c28 + c17*c28 + c18*c28 + c23) / den9
+        if want_fry:
+            results['fry'] = (fe*(-x14 + xe) - fl*x14 + mly) / den2
+        if want_ffy:
+            results['ffy'] = (c15) / den2
+
+    if lift == 2:
+        if want_f1 or want_f4 or want_s1 or want_s2 or want_s4:
+            c0 = 2*h
+        if want_f3 or want_f4 or want_t14x or want_t23x or want_s2 or want_s3 or want_s4 or want_phi1 or want_phi2 or want_phi3 or want_fry or want_ffy:
+            c1 = x14 + x23
+        if want_s2 or want_s3 or want_s4 or want_phi1 or want_phi2 or want_phi3:
+            c2 = c1*dc
+        if want_s2 or want_phi1:
+            c3 = d14*d23
+        if want_s2 or want_phi1 or want_phi2 or want_phi3:
+            c4 = h**2
+        if want_phi1 or want_phi2 or want_phi3:
+            c5 = 2*c2*c4
+        if want_f1 or want_f4 or want_t14x or want_t23x or want_s1 or want_s4 or want_phi2 or want_phi3:
+            c6 = fe*h
+            c7 = fl*h
+        if want_f1 or want_s1:
+            c8 = c6 + c7 - mlx
+        if want_f3 or want_s3 or want_fry:
+            c9 = fl*x14
+        if want_f3 or want_t14x or want_t23x or want_s2 or want_s3 or want_phi1 or want_phi2 or want_phi3 or want_fry:
+            c10 = x14 - xe
+        if want_f3 or want_s3:
+            c11 = c10*fe + c9 - mly
+        if want_f4 or want_s4:
+            c12 = c1*mlx - c6*(x14 - x23 - 2*xe) - c7*(x14 - x23) + 2*h*mly
+        if want_t14x or want_t23x or want_phi1 or want_phi2 or want_phi3:
+            c13 = h*mly
+        if want_t14x or want_t23x or want_phi2 or want_phi3:
+            c14 = c7*x14
+            c15 = c10*c6
+        if want_t14x or want_t23x or want_phi3:
+            c16 = -c13 + c14 + c15
+        if want_t14x or want_phi3:
+            c17 = -c1*mlx + c16
+        if want_s2 or want_phi1 or want_phi2:
+            c18 = c4*dc
+            c19 = 2*c18 + d14
+            c20 = c1*c19*mlx
+        if want_s2 or want_phi1:
+            c21 = c20*d23
+            c22 = c18*d14
+            c23 = c18*d23
+        if want_s2:
+            c24 = c22 + c23 + c3
+        if want_phi1:
+            c25 = 2*c22 + 2*c23 + c3
+        if want_f1:
+            den0 = c0
+        if want_f3 or want_t14x or want_t23x or want_fry or want_ffy:
+            den1 = c1
+        if want_f4:
+            den2 = c0*c1
+        if want_s1:
+            den3 = c0*dc
+        if want_s2:
+            den4 = c2*c3*h
+        if want_s3:
+            den5 = c2
+        if want_s4:
+            den6 = c0*c2
+        if want_phi1:
+            den7 = c3*c5
+        if want_phi2:
+            den8 = c5*d14
+        if want_phi3:
+            den9 = c5
+        if want_f1:
+            results['f1'] = (c8) / den0
+        if want_f2:
+            results['f2'] = 0
+        if want_f3:
+            results['f3'] = (c11) / den1
+        if want_f4:
+            results['f4'] = (c12) / den2
+        if want_t14x:
+            results['t14x'] = (c17) / den1
+        if want_t23x:
+            results['t23x'] = (c16) / den1
+        if want_s1:
+            results['s1'] = (c8) / den3
+        if want_s2:
+            results['s2'] = (-c0*c24*mly + 2*c10*c24*fe*h - c21 + 2*c24*fl*h*x14) / den4
+        if want_s3:
+            results['s3'] = (c11) / den5
+        if want_s4:
+            results['s4'] = (c12) / den6
+        if want_phi1:
+            results['phi1'] = (c10*c25*fe*h - c13*c25 - c21 + c25*fl*h*x14) / den7
+        if want_phi2:
+            results['phi2'] = (-c13*c19 + c14*c19 + c15*c19 - c20) / den8
+        if want_phi3:
+            results['phi3'] = (c17) / den9
+        if want_fry:
+            results['fry'] = (-c10*fe - c9 + mly) / den1
+        if want_ffy:
+            results['ffy'] = (fe*(x23 + xe) + fl*x23 + mly) / den1
+
+    if lift == 3:
+        if want_f1 or want_f2 or want_t14x or want_t23x or want_s1 or want_s2 or want_s3 or want_phi1 or want_phi2 or want_phi3 or want_fry or want_ffy:
+            c0 = x14 + x23
+        if want_f1 or want_f4 or want_s1 or want_s3 or want_s4:
+            c1 = 2*h
+        if want_s1 or want_s2 or want_s3 or want_phi1 or want_phi2 or want_phi3:
+            c2 = c0*dc
+        if want_s3 or want_phi1:
+            c3 = d14*d23
+        if want_s3 or want_phi1 or want_phi2 or want_phi3:
+            c4 = h**2
+        if want_phi1 or want_phi2 or want_phi3:
+            c5 = 2*c2*c4
+        if want_f1 or want_f4 or want_s1 or want_s4:
+            c6 = fl*h
+        if want_f1 or want_t14x or want_s1 or want_phi3:
+            c7 = c0*mlx
+        if want_f1 or want_f4 or want_s1 or want_s4:
+            c8 = fe*h
+        if want_f1 or want_s1:
+            c9 = -c6*(x14 - x23) - c7 - c8*(x14 - x23 - 2*xe) + 2*h*mly
+        if want_f2 or want_t14x or want_t23x or want_s2 or want_s3 or want_phi1 or want_phi2 or want_phi3 or want_fry:
+            c10 = fl*x14
+            c11 = x14 - xe
+        if want_f2 or want_t14x or want_t23x or want_s2 or want_s3 or want_phi1 or want_phi2 or want_phi3:
+            c12 = c11*fe
+        if want_f2 or want_s2:
+            c13 = c10 + c12 - mly
+        if want_f4 or want_s4:
+            c14 = c6 + c8 + mlx
+        if want_t14x or want_t23x or want_phi1 or want_phi2 or want_phi3:
+            c15 = c10*h
+            c16 = c12*h
+        if want_t14x or want_t23x or want_phi3:
+            c17 = c15 + c16 - h*mly
+        if want_t14x or want_phi3:
+            c18 = -c17 - c7
+        if want_s3 or want_phi1 or want_phi2:
+            c19 = c4*dc
+            c20 = 2*c19 + d14
+            c21 = c0*c20*mlx
+        if want_s3 or want_phi1:
+            c22 = c21*d23
+            c23 = c19*d14
+            c24 = c19*d23
+        if want_s3:
+            c25 = c23 + c24 + c3
+            c26 = c1*c25
+        if want_phi1:
+            c27 = 2*c23 + 2*c24 + c3
+        if want_f1:
+            den0 = c0*c1
+        if want_f2 or want_t14x or want_t23x or want_fry or want_ffy:
+            den1 = c0
+        if want_f4:
+            den2 = c1
+        if want_s1:
+            den3 = c1*c2
+        if want_s2:
+            den4 = c2
+        if want_s3:
+            den5 = c2*c3*h
+        if want_s4:
+            den6 = c1*dc
+        if want_phi1:
+            den7 = c3*c5
+        if want_phi2:
+            den8 = c5*d14
+        if want_phi3:
+            den9 = c5
+        if want_f1:
+            results['f1'] = (c9) / den0
+        if want_f2:
+            results['f2'] = (c13) / den1
+        if want_f3:
+            results['f3'] = 0
+        if want_f4:
+            results['f4'] = (c14) / den2
+        if want_t14x:
+            results['t14x'] = (c18) / den1
+        if want_t23x:
+            results['t23x'] = (-c17) / den1
+        if want_s1:
+            results['s1'] = (c9) / den3
+        if want_s2:
+            results['s2'] = (c13) / den4
+        if want_s3:
+            results['s3'] = (-c1*c25*mly + c10*c26 + c12*c26 + c22) / den5
+        if want_s4:
+            results['s4'] = (c14) / den6
+        if want_phi1:
+            results['phi1'] = (-c15*c27 - c16*c27 - c22 + c27*h*mly) / den7
+        if want_phi2:
+            results['phi2'] = (-c15*c20 - c16*c20 + c20*h*mly - c21) / den8
+        if want_phi3:
+            results['phi3'] = (c18) / den9
+        if want_fry:
+            results['fry'] = (-c10 - c11*fe + mly) / den1
+        if want_ffy:
+            results['ffy'] = (fe*(x23 + xe) + fl*x23 + mly) / den1
+
+    if lift == 4:
+        if want_f1 or want_f2 or want_t14x or want_t23x or want_s1 or want_s2 or want_s4 or want_phi1 or want_phi2 or want_phi3 or want_fry or want_ffy:
+            c0 = x14 + x23
+        if want_f2 or want_f3 or want_s2 or want_s3 or want_s4:
+            c1 = 2*h
+        if want_s1 or want_s2 or want_s4 or want_phi1 or want_phi2 or want_phi3:
+            c2 = c0*dc
+        if want_s4 or want_phi3:
+            c3 = d14*d23
+        if want_s4 or want_phi1 or want_phi2 or want_phi3:
+            c4 = h**2
+        if want_phi1 or want_phi2 or want_phi3:
+            c5 = 2*c2*c4
+        if want_f1 or want_t14x or want_t23x or want_s1 or want_s4 or want_phi1 or want_phi2 or want_phi3 or want_ffy:
+            c6 = fl*x23
+            c7 = fe*(x23 + xe)
+        if want_f1 or want_s1 or want_ffy:
+            c8 = c6 + c7 + mly
+        if want_f2 or want_s2 or want_s4:
+            c9 = c1*mly
+        if want_f2 or want_f3 or want_s2 or want_s3:
+            c10 = fl*h
+        if want_f2 or want_s2 or want_phi1:
+            c11 = -c0
+        if want_f2 or want_f3 or want_s2 or want_s3:
+            c12 = fe*h
+        if want_f2 or want_s2:
+            c13 = c10*(x14 - x23) + c11*mlx + c12*(x14 - x23 - 2*xe) - c9
+        if want_f3 or want_s3:
+            c14 = c10 + c12 + mlx
+        if want_t14x or want_t23x or want_phi1 or want_phi2 or want_phi3:
+            c15 = h*mly
+            c16 = c6*h
+            c17 = c7*h
+        if want_t14x or want_t23x or want_phi1:
+            c18 = c15 + c16 + c17
+        if want_t23x or want_s4 or want_phi2 or want_phi3:
+            c19 = c0*mlx
+        if want_s4 or want_phi2 or want_phi3:
+            c20 = c4*dc
+            c21 = 2*c20 + d23
+            c22 = c19*c21
+        if want_s4 or want_phi3:
+            c23 = c22*d14
+            c24 = c20*d14
+            c25 = c20*d23
+        if want_s4:
+            c26 = c24 + c25 + c3
+            c27 = c1*c26
+        if want_phi3:
+            c28 = 2*c24 + 2*c25 + c3
+        if want_f1 or want_t14x or want_t23x or want_fry or want_ffy:
+            den0 = c0
+        if want_f2:
+            den1 = c0*c1
+        if want_f3:
+            den2 = c1
+        if want_s1:
+            den3 = c2
+        if want_s2:
+            den4 = c1*c2
+        if want_s3:
+            den5 = c1*dc
+        if want_s4:
+            den6 = c2*c3*h
+        if want_phi1:
+            den7 = c5
+        if want_phi2:
+            den8 = c5*d23
+        if want_phi3:
+            den9 = c3*c5
+        if want_f1:
+            results['f1'] = (c8) / den0
+        if want_f2:
+            results['f2'] = (c13) / den1
+        if want_f3:
+            results['f3'] = (c14) / den2
+        if want_f4:
+            results['f4'] = 0
+        if want_t14x:
+            results['t14x'] = (c18) / den0
+        if want_t23x:
+            results['t23x'] = (c18 + c19) / den0
+        if want_s1:
+            results['s1'] = (c8) / den3
+        if want_s2:
+            results['s2'] = (c13) / den4
+        if want_s3:
+            results['s3'] = (c14) / den5
+        if want_s4:
+            results['s4'] = (c23 + c26*c9 + c27*c6 + c27*c7) / den6
+        if want_phi1:
+            results['phi1'] = (c11*mlx - c18) / den7
+        if want_phi2:
+            results['phi2'] = (-c15*c21 - c16*c21 - c17*c21 - c22) / den8
+        if want_phi3:
+            results['phi3'] = (-c15*c28 - c16*c28 - c17*c28 - c23) / den9
+        if want_fry:
+            results['fry'] = (fe*(-x14 + xe) - fl*x14 + mly) / den0
+        if want_ffy:
+            results['ffy'] = (c8) / den0
+
+    if x1 is not None and x3 is not None:
+        if want_t14y:
+            results['t14y'] = (-fe*x23*x3 - fe*x3*xe - fl*x23*x3 - mly*x3) / (x14 + x23)
+        if want_t23y:
+            results['t23y'] = (-fe*x1*x14 + fe*x1*xe - fl*x1*x14 + mly*x1) / (x14 + x23)
+    return results
+
+
+def _results_plain_values(fl, mlx, mly, fe, y1, y2, y3, y4, xe, x14, x23, d14, d23, d1, d2, d3, d4, x1, x3):
+    """Elastostatic model, general geometry. All outputs as tuple in the order of VALUE_KEYS (x1, x3 must be numbers)."""
+    c0 = x14 + x23
+    c1 = d1*d14
+    c2 = y2**2
+    c3 = d2*d23
+    c4 = c2*c3
+    c5 = c1*c4
+    c6 = y3**2
+    c7 = c3*c6
+    c8 = c7*d3
+    c9 = y1**2
+    c10 = c1*c9
+    c11 = c10*c3
+    c12 = y4**2
+    c13 = c1*c12
+    c14 = c13*d4
+    c15 = d23*d3
+    c16 = c10*c15
+    c17 = d14*d4
+    c18 = c17*c4
+    c19 = y2*y3
+    c20 = 2*c19
+    c21 = c20*c3
+    c22 = c21*d3
+    c23 = y1*y4
+    c24 = 2*c23
+    c25 = c1*c24
+    c26 = c25*d4
+    c27 = d2*d3
+    c28 = c1*c23
+    c29 = c28*d4
+    c30 = c19*c3
+    c31 = d1*d4
+    c32 = c23*c31
+    c33 = c2*c27
+    c34 = c10*d4
+    c35 = c27*c6
+    c36 = c31*c9
+    c37 = c4*d3
+    c38 = c12*c31
+    c39 = c20*c27
+    c40 = c24*c31
+    c41 = y1 + y4
+    c42 = c15 + c3 + c33 + c35 + c39
+    c43 = c0*c42*mlx
+    c44 = c41*c43
+    c45 = c1*c44
+    c46 = c45*d4
+    c47 = c12*c17
+    c48 = c3*c47
+    c49 = c15*c47
+    c50 = c3*y2
+    c51 = c17*c50
+    c52 = c51*y1
+    c53 = c17*c23
+    c54 = c3*c53
+    c55 = c51*y4
+    c56 = c33*c47
+    c57 = c35*c47
+    c58 = c15*c53
+    c59 = c12*d4
+    c60 = c37*c59
+    c61 = c59*c8
+    c62 = c15*y3
+    c63 = c17*c62
+    c64 = c63*y1
+    c65 = c17*y4
+    c66 = c15*c65
+    c67 = c66*y3
+    c68 = -c67
+    c69 = c33*c53
+    c70 = c35*c53
+    c71 = c23*d4
+    c72 = c37*c71
+    c73 = c71*c8
+    c74 = c39*c47
+    c75 = c22*c59
+    c76 = c39*c53
+    c77 = c22*c71
+    c78 = d14*d3
+    c79 = c4*c78
+    c80 = c7*c78
+    c81 = c21*c78
+    c82 = c79 + c80 + c81
+    c83 = c48 + c49 + c52 + c54 + c55 + c56 + c57 + c58 + c60 + c61 - c64 + c68 + c69 + c70 + c72 + c73 + c74 + c75 + c76 + c77 + c82
+    c84 = c79*x23 + c80*x23 + c81*x23
+    c85 = c48*x23 + c49*x23 + c54*x23 + c56*x23 + c57*x23 + c58*x23 + c60*x23 + c61*x23 + c64*x14 + c67*x14 + c69*x23 + c70*x23 + c72*x23 + c73*x23 + c74*x23 + c75*x23 + c76*x23 + c77*x23 + c84 - d14*d2*d23*d4*x14*y1*y2 - d14*d2*d23*d4*x14*y2*y4
+    c86 = c55*xe
+    c87 = c79*xe + c80*xe + c81*xe
+    c88 = c48*xe + c49*xe + c52*xe + c54*xe + c56*xe + c57*xe + c58*xe + c60*xe + c61*xe + c69*xe + c70*xe + c72*xe + c73*xe + c74*xe + c75*xe + c76*xe + c77*xe + c85 + c86 + c87 - d14*d23*d3*d4*xe*y1*y3 - d14*d23*d3*d4*xe*y3*y4
+    c89 = y2 + y3
+    c90 = c1 + c17 + c36 + c38 + c40
+    c91 = c0*c90*mlx
+    c92 = c89*c91
+    c93 = c3*c92
+    c94 = c93*d3
+    c95 = c15*c6
+    c96 = c1*c95
+    c97 = c17*c95
+    c98 = c1*y1
+    c99 = c15*c98
+    c100 = c99*y2
+    c101 = c99*y3
+    c102 = c15*c19
+    c103 = c1*c102
+    c104 = c6*d3
+    c105 = c104*c34
+    c106 = c104*c14
+    c107 = c36*c95
+    c108 = c38*c95
+    c109 = c102*c17
+    c110 = c66*y2
+    c111 = c19*d3
+    c112 = c111*c34
+    c113 = c111*c14
+    c114 = c102*c36
+    c115 = c102*c38
+    c116 = c104*c26
+    c117 = c40*c95
+    c118 = c20*c29
+    c119 = c118*d3
+    c120 = c15*c20*c32
+    c121 = d23*d4
+    c122 = c10*c121
+    c123 = c121*c13
+    c124 = c121*c25
+    c125 = c122 + c123 + c124
+    c126 = c100 + c101 + c103 + c105 + c106 + c107 + c108 + c109 - c110 + c112 + c113 + c114 + c115 + c116 + c117 + c119 + c120 + c125 + c68 + c96 + c97
+    c127 = c122*x14 + c123*x14 + c124*x14
+    c128 = -c100*x23 - c101*x23 + c103*x14 + c105*x14 + c106*x14 + c107*x14 + c108*x14 + c109*x14 + c110*x23 + c112*x14 + c113*x14 + c114*x14 + c115*x14 + c116*x14 + c117*x14 + c119*x14 + c120*x14 + c127 + c67*x23 + c96*x14 + c97*x14
+    c129 = c101*xe
+    c130 = -c122*xe - c123*xe - c124*xe
+    c131 = -c100*xe - c103*xe - c105*xe - c106*xe - c107*xe - c108*xe - c109*xe + c110*xe - c112*xe - c113*xe - c114*xe - c115*xe - c116*xe - c117*xe - c119*xe - c120*xe + c128 - c129 + c130 + c67*xe - c96*xe - c97*xe
+    c132 = c1*c30
+    c133 = c2*d2
+    c134 = c133*c34
+    c135 = c133*c14
+    c136 = c36*c4
+    c137 = c38*c4
+    c138 = c17*c30
+    c139 = c3*c65*y3
+    c140 = c1*c50
+    c141 = c140*y1
+    c142 = -c141
+    c143 = c3*c98
+    c144 = c143*y3
+    c145 = c19*d2
+    c146 = c145*c34
+    c147 = c14*c145
+    c148 = c30*c36
+    c149 = c30*c38
+    c150 = c133*c26
+    c151 = c4*c40
+    c152 = c118*d2
+    c153 = c21*c32
+    c154 = c125 + c132 + c134 + c135 + c136 + c137 + c138 + c139 + c142 - c144 + c146 + c147 + c148 + c149 + c150 + c151 + c152 + c153 + c18 + c5 + c55
+    c155 = c127 + c132*x14 + c134*x14 + c135*x14 + c136*x14 + c137*x14 + c138*x14 - c139*x23 + c141*x23 + c144*x23 + c146*x14 + c147*x14 + c148*x14 + c149*x14 + c150*x14 + c151*x14 + c152*x14 + c153*x14 + c18*x14 + c5*x14 - c55*x23
+    c156 = c155*fl
+    c157 = c141*xe
+    c158 = fe*(c130 - c132*xe - c134*xe - c135*xe - c136*xe - c137*xe - c138*xe - c139*xe + c144*xe - c146*xe - c147*xe - c148*xe - c149*xe - c150*xe - c151*xe - c152*xe - c153*xe + c155 + c157 - c18*xe - c5*xe - c86)
+    c159 = c28*c3
+    c160 = c10*c33
+    c161 = c10*c35
+    c162 = c15*c28
+    c163 = c1*c62
+    c164 = c163*y4
+    c165 = c9*d1
+    c166 = c165*c37
+    c167 = c165*c8
+    c168 = c140*y4
+    c169 = c28*c33
+    c170 = c28*c35
+    c171 = c23*d1
+    c172 = c171*c37
+    c173 = c171*c8
+    c174 = c10*c39
+    c175 = c165*c22
+    c176 = c28*c39
+    c177 = c171*c22
+    c178 = mly*(c101 + c11 + c142 + c159 + c16 + c160 + c161 + c162 + c164 + c166 + c167 - c168 + c169 + c170 + c172 + c173 + c174 + c175 + c176 + c177 + c82)
+    c179 = -c101*x14 + c11*x23 + c141*x14 + c159*x23 + c16*x23 + c160*x23 + c161*x23 + c162*x23 - c164*x14 + c166*x23 + c167*x23 + c168*x14 + c169*x23 + c170*x23 + c172*x23 + c173*x23 + c174*x23 + c175*x23 + c176*x23 + c177*x23 + c84
+    c180 = c179*fl
+    c181 = fe*(c11*xe + c129 - c157 + c159*xe + c16*xe + c160*xe + c161*xe + c162*xe + c164*xe + c166*xe + c167*xe - c168*xe + c169*xe + c170*xe + c172*xe + c173*xe + c174*xe + c175*xe + c176*xe + c177*xe + c179 + c87)
+    c182 = d1*y1
+    c183 = c182*c33
+    c184 = c182*c35
+    c185 = d2*y2
+    c186 = c185*c36
+    c187 = c185*c38
+    c188 = c182*c39
+    c189 = c185*c40
+    c190 = d3*y3
+    c191 = c190*c36
+    c192 = c190*c38
+    c193 = c190*c40
+    c194 = -c12*d1*d2*d4*x14*y2 + c183*x23 + c184*x23 + c188*x23 + c191*x14 + c192*x14 + c193*x14 - c2*d2*d3*d4*x23*y4 - c6*d2*d3*d4*x23*y4 - c9*d1*d2*d4*x14*y2 - 2*d1*d2*d4*x14*y1*y2*y4 - 2*d2*d3*d4*x23*y2*y3*y4
+    c195 = d14*d23
+    c196 = d4*y4
+    c197 = -c194*c195*fl + c195*fe*(c12*d1*d3*d4*xe*y3 - c183*xe - c184*xe - c186*xe - c187*xe - c188*xe - c189*xe - c194 + c2*d2*d3*d4*xe*y4 + c6*d2*d3*d4*xe*y4 + c9*d1*d3*d4*xe*y3 + 2*d1*d3*d4*xe*y1*y3*y4 + 2*d2*d3*d4*xe*y2*y3*y4) - d14*d23*mly*(c183 + c184 + c186 + c187 + c188 + c189 - c191 - c192 - c193 - c196*c33 - c196*c35 - c196*c39)
+    c198 = c190*c34
+    c199 = c14*c190
+    c200 = c190*c26
+    c201 = c36*c62
+    c202 = c38*c62
+    c203 = c40*c62
+    c204 = c143 + c163 + c63 + c99 - d1*d14*d2*d23*y2 - d14*d2*d23*d4*y2 - d14*d2*d23*d4*y4 - d14*d23*d3*d4*y4
+    c205 = -c12*d1*d2*d23*d4*y2 + c201 + c202 + c203 + c204 - c9*d1*d2*d23*d4*y2 - 2*d1*d2*d23*d4*y1*y2*y4
+    c206 = c140*x14 + c143*x23 + c51*x14 + c99*x23 - d1*d14*d23*d3*x14*y3 - d14*d2*d23*d4*x23*y4 - d14*d23*d3*d4*x14*y3 - d14*d23*d3*d4*x23*y4
+    c207 = -c12*d1*d23*d3*d4*x14*y3 + c206 + c36*c50*x14 + c38*c50*x14 + c40*c50*x14 - c9*d1*d23*d3*d4*x14*y3 - 2*d1*d23*d3*d4*x14*y1*y3*y4
+    c208 = -c12*d1*d14*d3*d4*x14*y3 + c14*c185*x14 + c185*c26*x14 + c185*c34*x14 + c207 - c9*d1*d14*d3*d4*x14*y3 - 2*d1*d14*d3*d4*x14*y1*y3*y4
+    c209 = c143*xe + c163*xe + c63*xe + c99*xe - d1*d14*d2*d23*xe*y2 - d14*d2*d23*d4*xe*y2 - d14*d2*d23*d4*xe*y4 - d14*d23*d3*d4*xe*y4
+    c210 = -c12*d1*d2*d23*d4*xe*y2 + c201*xe + c202*xe + c203*xe + c209 - c9*d1*d2*d23*d4*xe*y2 - 2*d1*d2*d23*d4*xe*y1*y2*y4
+    c211 = c33*c98
+    c212 = c35*c98
+    c213 = c39*c98
+    c214 = -c2*d14*d2*d3*d4*y4 + c211 + c212 + c213 - c6*d14*d2*d3*d4*y4 - 2*d14*d2*d3*d4*y2*y3*y4
+    c215 = -c2*d14*d2*d3*d4*x23*y4 + c211*x23 + c212*x23 + c213*x23 - c6*d14*d2*d3*d4*x23*y4 - 2*d14*d2*d3*d4*x23*y2*y3*y4
+    c216 = c207 + c215
+    c217 = -c2*d14*d2*d3*d4*xe*y4 + c211*xe + c212*xe + c213*xe - c6*d14*d2*d3*d4*xe*y4 - 2*d14*d2*d3*d4*xe*y2*y3*y4
+    c218 = c182*c37
+    c219 = c182*c8
+    c220 = c182*c22
+    c221 = -c2*d2*d23*d3*d4*x23*y4 + c206 + c215 + c218*x23 + c219*x23 + c220*x23 - c6*d2*d23*d3*d4*x23*y4 - 2*d2*d23*d3*d4*x23*y2*y3*y4
+    den0 = c0*(c1*c22 + c1*c8 + c11*d4 + c14*c15 + c14*c3 + c14*c33 + c14*c35 + c14*c39 + c15*c26 + c16*d4 + c17*c22 + c17*c8 + c18*d3 + 4*c19*c27*c29 + c22*c36 + c22*c38 + c26*c3 + c26*c33 + c26*c35 + 4*c30*c32*d3 + c33*c34 + c34*c35 + c34*c39 + c36*c37 + c36*c8 + c37*c38 + c37*c40 + c38*c8 + c40*c8 + c5*d3)
+    den1 = c0
+    f1 = (-c46 + c83*d1*mly + c85*d1*fl + c88*d1*fe) / den0
+    f2 = (-c126*d2*mly + c128*d2*fl + c131*d2*fe - c94) / den0
+    f3 = (-c154*d3*mly + c156*d3 + c158*d3 + c94) / den0
+    f4 = (c178*d4 + c180*d4 + c181*d4 + c46) / den0
+    t14x = (-c1*c41**2*c43*d4 - c197) / den0
+    t23x = (c0*c89**2*c90*d2*d23*d3*mlx - c197) / den0
+    s1 = (-c17*c44 + c83*mly + c85*fl + c88*fe) / den0
+    s2 = (-c126*mly + c128*fl + c131*fe - c15*c92) / den0
+    s3 = (-c154*mly + c156 + c158 + c93) / den0
+    s4 = (c178 + c180 + c181 + c45) / den0
+    phi1 = (-c208*fl - c91*d23*(d2 + d3) + fe*(c12*d1*d14*d2*d4*xe*y2 - c198*xe - c199*xe - c200*xe - c208 - c210 + c9*d1*d14*d2*d4*xe*y2 + 2*d1*d14*d2*d4*xe*y1*y2*y4) + mly*(c12*d1*d14*d2*d4*y2 - c198 - c199 - c200 - c205 + c9*d1*d14*d2*d4*y2 + 2*d1*d14*d2*d4*y1*y2*y4)) / den0
+    phi2 = (-c216*fl - c42*c91 + fe*(-c210 - c216 - c217) + mly*(-c205 - c214)) / den0
+    phi3 = (-c221*fl - c43*d14*(d1 + d4) + fe*(c2*d2*d23*d3*d4*xe*y4 - c209 - c217 - c218*xe - c219*xe - c220*xe - c221 + c6*d2*d23*d3*d4*xe*y4 + 2*d2*d23*d3*d4*xe*y2*y3*y4) + mly*(c2*d2*d23*d3*d4*y4 - c204 - c214 - c218 - c219 - c220 + c6*d2*d23*d3*d4*y4 + 2*d2*d23*d3*d4*y2*y3*y4)) / den0
+    fry = (fe*(-x14 + xe) - fl*x14 + mly) / den1
+    ffy = (fe*(x23 + xe) + fl*x23 + mly) / den1
+    t14y = (-fe*x23*x3 - fe*x3*xe - fl*x23*x3 - mly*x3) / (x14 + x23)
+    t23y = (-fe*x1*x14 + fe*x1*xe - fl*x1*x14 + mly*x1) / (x14 + x23)
+    return (f1, f2, f3, f4, t14x, t23x, t14y, t23y, s1, s2, s3, s4, phi1, phi2, phi3, fry, ffy)
+
+
+def _results_liftoff_plain_values(fl, mlx, mly, fe, y1, y2, y3, y4, xe, x14, x23, d14, d23, d1, d2, d3, d4, lift, x1, x3):
+    """Lift-off models, general geometry. All outputs as tuple in the order of VALUE_KEYS (x1, x3 must be numbers)."""
+    if lift == 1:
+        c0 = x14 + x23
+        c1 = y2 + y3
+        c2 = c0*c1
+        c3 = c1**2
+        c4 = c0*d4
+        c5 = d2*d23
+        c6 = c5*d3
+        c7 = c6*d14
+        c8 = d2*d3
+        c9 = c0*c3
+        c10 = c6*c9
+        c11 = x14*y3
+        c12 = x23*y4
+        c13 = c11 + c12
+        c14 = xe*y4
+        c15 = xe*y3
+        c16 = -c0*mlx + c13*fl + fe*(c13 + c14 - c15) + mly*(-y3 + y4)
+        c17 = c0*mlx
+        c18 = x14*y2
+        c19 = xe*y2
+        c20 = c17 + fe*(-c12 - c14 - c19 + x14*y2) + fl*(-c12 + c18) + mly*(-y2 - y4)
+        c21 = fe*(x23 + xe)
+        c22 = c21 + fl*x23 + mly
+        c23 = c12*fl + c21*y4 + mly*y4
+        c24 = d23*d3
+        c25 = y2**2
+        c26 = c25*c8
+        c27 = y3**2
+        c28 = c27*c8
+        c29 = d3*y3
+        c30 = d2*y2
+        c31 = 2*c30
+        c32 = c29*c31
+        c33 = c24 + c26 + c28 + c32 + c5
+        c34 = c5*y2
+        c35 = c34*d14
+        c36 = d4*y1
+        c37 = c5*y4
+        c38 = c37*d14
+        c39 = c35*d4
+        c40 = c24*y4
+        c41 = c40*d14
+        c42 = c25*c7
+        c43 = c27*c7
+        c44 = d4*y4**2
+        c45 = c44*d14
+        c46 = c45*c5
+        c47 = c24*c45
+        c48 = 2*c35
+        c49 = c29*c48
+        c50 = c24*y3
+        c51 = c50*d14
+        c52 = c41*d4
+        c53 = d2*y4
+        c54 = c53*d3
+        c55 = c25*c54
+        c56 = c55*d14
+        c57 = c27*c54
+        c58 = c57*d14
+        c59 = d3*y4
+        c60 = c5*c59
+        c61 = c25*c60
+        c62 = c27*c60
+        c63 = c59*y3
+        c64 = c31*c63
+        c65 = c64*d14
+        c66 = 2*c34
+        c67 = c63*c66
+        c68 = c26*c45
+        c69 = c28*c45
+        c70 = c44*c6
+        c71 = c25*c70
+        c72 = c27*c70
+        c73 = c32*c45
+        c74 = c29*c66
+        c75 = c44*c74
+        c76 = c12*c5
+        c77 = c76*d14
+        c78 = c11*c24
+        c79 = c78*d14
+        c80 = c12*c24
+        c81 = c80*d14
+        c82 = c18*c5
+        c83 = c82*d14
+        c84 = c12*c26
+        c85 = c84*d14
+        c86 = c12*c28
+        c87 = c86*d14
+        c88 = c12*d3
+        c89 = c5*c88
+        c90 = c25*c89
+        c91 = c27*c89
+        c92 = c12*c32
+        c93 = c92*d14
+        c94 = c12*c74
+        c95 = c11*c52 - c18*c38*d4 + c36*c77 + c36*c79 + c36*c81 - c36*c83 + c36*c85 + c36*c87 + c36*c90 + c36*c91 + c36*c93 + c36*c94 + c42*x23 + c43*x23 + c46*x23 + c47*x23 + c49*x23 + c68*x23 + c69*x23 + c71*x23 + c72*x23 + c73*x23 + c75*x23
+        c96 = c19*c5
+        c97 = c96*d14
+        c98 = c14*c5
+        c99 = c98*d14
+        c100 = c14*c24
+        c101 = c100*d14
+        c102 = c15*c24
+        c103 = c102*d14
+        c104 = c15*d3
+        c105 = c14*c26
+        c106 = c105*d14
+        c107 = c14*c28
+        c108 = c107*d14
+        c109 = c14*d3
+        c110 = c109*c5
+        c111 = c110*c25
+        c112 = c110*c27
+        c113 = c14*c32
+        c114 = c113*d14
+        c115 = c14*c74
+        c116 = c11*d3 + c12*d2 - c18*d2 + c88
+        c117 = c17*c33
+        c118 = c76 + c78 + c80 - c82 + c84 + c86 + c92
+        c119 = c77 + c79 + c81 - c83 + c85 + c87 + c90 + c91 + c93 + c94
+        den0 = c2
+        den1 = c0
+        den2 = c3*c4*c7
+        den3 = c2*d2
+        den4 = c2*d3
+        den5 = c4
+        den6 = c8*c9
+        den7 = c10
+        den8 = c10*d14
+        f1 = 0.0
+        f2 = (c16) / den0
+        f3 = (c20) / den0
+        f4 = (c22) / den1
+        t14x = (-c23) / den1
+        t23x = (c0*mlx - c23) / den1
+        s1 = (-c33*c4*d14*mlx*(y1 + y4) + c95*fl + fe*(c101*c36 - c103*c36 + c104*c31*c45 + c104*c44*c66 + c104*c48 + c106*c36 + c108*c36 + c111*c36 + c112*c36 + c114*c36 + c115*c36 + c14*c39 - c14*c51*d4 + c36*c97 + c36*c99 + c42*xe + c43*xe + c46*xe + c47*xe + c68*xe + c69*xe + c71*xe + c72*xe + c95) + mly*(c35*c36 + c36*c38 + c36*c41 - c36*c51 + c36*c56 + c36*c58 + c36*c61 + c36*c62 + c36*c65 + c36*c67 + c39*y4 + c42 + c43 + c46 + c47 + c49 - c52*y3 + c68 + c69 + c71 + c72 + c73 + c75)) / den2
+        s2 = (c16) / den3
+        s3 = (c20) / den4
+        s4 = (c22) / den5
+        phi1 = (c116*fl - c17*(d2 + d3) + fe*(-c104 + c109 + c116 + c14*d2 + c19*d2) + mly*(-c29 + c30 + c53 + c59)) / den6
+        phi2 = (-c117 + c118*fl + fe*(c100 - c102 + c105 + c107 + c113 + c118 + c96 + c98) + mly*(c34 + c37 + c40 - c50 + c55 + c57 + c64)) / den7
+        phi3 = (-c117*d14 + c119*fl + fe*(c101 - c103 + c106 + c108 + c111 + c112 + c114 + c115 + c119 + c97 + c99) + mly*(c35 + c38 + c41 - c51 + c56 + c58 + c61 + c62 + c65 + c67)) / den8
+        fry = (fe*(-x14 + xe) - fl*x14 + mly) / den1
+        ffy = (c22) / den1
+    elif lift == 2:
+        c0 = x14 + x23
+        c1 = y1 + y4
+        c2 = c0*c1
+        c3 = c1**2
+        c4 = c0*d3
+        c5 = d1*d14
+        c6 = c5*d4
+        c7 = c6*d23
+        c8 = c0*c3
+        c9 = c6*c8
+        c10 = d1*d4
+        c11 = x14*y3
+        c12 = x23*y4
+        c13 = c11 + c12
+        c14 = -c0*mlx
+        c15 = xe*y4
+        c16 = xe*y3
+        c17 = c13*fl + c14 + fe*(c13 + c15 - c16) + mly*(-y3 + y4)
+        c18 = fl*x14
+        c19 = x14 - xe
+        c20 = c19*fe
+        c21 = c18 + c20 - mly
+        c22 = c0*mlx
+        c23 = x23*y1
+        c24 = xe*y1
+        c25 = c22 + fe*(-c11 + c16 + c23 + c24) + fl*(-c11 + x23*y1) + mly*(y1 + y3)
+        c26 = c11*fl + c20*y3 - mly*y3
+        c27 = d14*d4
+        c28 = y1**2
+        c29 = c10*c28
+        c30 = y4**2
+        c31 = c10*c30
+        c32 = d1*y1
+        c33 = 2*d4*y4
+        c34 = c32*c33
+        c35 = c27 + c29 + c31 + c34 + c5
+        c36 = c5*y1
+        c37 = c36*d23
+        c38 = c37*d3
+        c39 = c5*y3
+        c40 = c39*d23
+        c41 = d3*y2
+        c42 = c27*y3
+        c43 = c42*d23
+        c44 = d3*y3**2
+        c45 = c44*d23
+        c46 = c45*c5
+        c47 = c28*c7
+        c48 = c30*c7
+        c49 = c27*c45
+        c50 = c33*c37
+        c51 = d4*y3
+        c52 = c5*c51
+        c53 = c28*c52
+        c54 = c30*c52
+        c55 = d1*y3
+        c56 = c55*d4
+        c57 = c28*c56
+        c58 = c57*d23
+        c59 = c30*c56
+        c60 = c59*d23
+        c61 = c33*c36
+        c62 = c61*y3
+        c63 = c34*y3
+        c64 = c63*d23
+        c65 = c44*c6
+        c66 = c28*c65
+        c67 = c30*c65
+        c68 = c29*c45
+        c69 = c31*c45
+        c70 = c44*c61
+        c71 = c34*c45
+        c72 = c11*c5
+        c73 = c72*d23
+        c74 = c11*c27
+        c75 = c74*d23
+        c76 = c12*c27
+        c77 = c76*d23
+        c78 = c43*d3
+        c79 = c23*c5
+        c80 = c79*d23
+        c81 = c11*d4
+        c82 = c5*c81
+        c83 = c28*c82
+        c84 = c30*c82
+        c85 = c11*c29
+        c86 = c85*d23
+        c87 = c11*c31
+        c88 = c87*d23
+        c89 = c11*c61
+        c90 = c11*c34
+        c91 = c90*d23
+        c92 = c12*c78 - c23*c40*d3 + c41*c73 + c41*c75 + c41*c77 - c41*c80 + c41*c83 + c41*c84 + c41*c86 + c41*c88 + c41*c89 + c41*c91 + c46*x14 + c47*x14 + c48*x14 + c49*x14 + c50*x14 + c66*x14 + c67*x14 + c68*x14 + c69*x14 + c70*x14 + c71*x14
+        c93 = c15*c27
+        c94 = c93*d23
+        c95 = c24*c5
+        c96 = c95*d23
+        c97 = c16*c5
+        c98 = c97*d23
+        c99 = c16*c27
+        c100 = c99*d23
+        c101 = c15*d4
+        c102 = 2*c101
+        c103 = c16*d4
+        c104 = c103*c5
+        c105 = c104*c28
+        c106 = c104*c30
+        c107 = c16*c29
+        c108 = c107*d23
+        c109 = c16*c31
+        c110 = c109*d23
+        c111 = 2*c32
+        c112 = c15*c51
+        c113 = 2*c112*c36
+        c114 = c111*c112
+        c115 = c114*d23
+        c116 = c22*c35
+        c117 = c73 + c75 + c77 - c80 + c83 + c84 + c86 + c88 + c89 + c91
+        c118 = c72 + c74 + c76 - c79 + c85 + c87 + c90
+        c119 = c11*d1 + c12*d4 - c23*d1 + c81
+        den0 = c2
+        den1 = c0
+        den2 = c2*d1
+        den3 = c3*c4*c7
+        den4 = c4
+        den5 = c2*d4
+        den6 = c9*d23
+        den7 = c9
+        den8 = c10*c8
+        f1 = (c17) / den0
+        f2 = 0.0
+        f3 = (c21) / den1
+        f4 = (c25) / den0
+        t14x = (c14 + c26) / den1
+        t23x = (c26) / den1
+        s1 = (c17) / den2
+        s2 = (-c35*c4*d23*mlx*(y2 + y3) + c92*fl + fe*(-c100*c41 - c101*c111*c45 - c102*c36*c44 - c102*c37 - c105*c41 - c106*c41 - c108*c41 - c110*c41 - c113*c41 - c115*c41 + c15*c78 - c16*c38 + c41*c94 - c41*c96 - c41*c98 - c46*xe - c47*xe - c48*xe - c49*xe - c66*xe - c67*xe - c68*xe - c69*xe + c92) + mly*(-c38*y2 - c38*y3 - c40*c41 - c41*c43 - c41*c53 - c41*c54 - c41*c58 - c41*c60 - c41*c62 - c41*c64 - c46 - c47 - c48 - c49 - c50 - c66 - c67 - c68 - c69 - c70 - c71 + d14*d23*d3*d4*y2*y4 + d14*d23*d3*d4*y3*y4)) / den3
+        s3 = (c21) / den4
+        s4 = (c25) / den5
+        phi1 = (-c116*d23 + c117*fl + fe*(-c100 - c105 - c106 - c108 - c110 - c113 - c115 + c117 + c94 - c96 - c98) + mly*(-c37 - c40 - c43 - c53 - c54 - c58 - c60 - c62 - c64 + d14*d23*d4*y4)) / den6
+        phi2 = (-c116 + c118*fl + fe*(-c107 - c109 - c114 + c118 + c93 - c95 - c97 - c99) + mly*(-c36 - c39 - c42 - c57 - c59 - c63 + d14*d4*y4)) / den7
+        phi3 = (c119*fl - c22*(d1 + d4) + fe*(c101 - c103 + c119 - c16*d1 - c24*d1) + mly*(-c32 - c51 - c55 + d4*y4)) / den8
+        fry = (-c18 - c19*fe + mly) / den1
+        ffy = (fe*(x23 + xe) + fl*x23 + mly) / den1
+    elif lift == 3:
+        c0 = x14 + x23
+        c1 = y1 + y4
+        c2 = c0*c1
+        c3 = c0*d2
+        c4 = c1**2
+        c5 = d1*d14
+        c6 = c5*d4
+        c7 = c6*d23
+        c8 = c0*c4
+        c9 = c6*c8
+        c10 = d1*d4
+        c11 = -c0
+        c12 = x14*y2
+        c13 = x23*y4
+        c14 = xe*y2
+        c15 = xe*y4
+        c16 = c11*mlx + fe*(-c12 + c13 + c14 + c15) + fl*(-c12 + x23*y4) + mly*(y2 + y4)
+        c17 = fl*x14
+        c18 = x14 - xe
+        c19 = c18*fe
+        c20 = c17 + c19 - mly
+        c21 = c0*mlx
+        c22 = x23*y1
+        c23 = c12 + c22
+        c24 = xe*y1
+        c25 = c21 + c23*fl + fe*(-c14 + c23 + c24) + mly*(y1 - y2)
+        c26 = c12*fl + c19*y2 - mly*y2
+        c27 = d14*d4
+        c28 = y1**2
+        c29 = c10*c28
+        c30 = y4**2
+        c31 = c10*c30
+        c32 = d1*y1
+        c33 = d4*y4
+        c34 = 2*c33
+        c35 = c32*c34
+        c36 = c27 + c29 + c31 + c35 + c5
+        c37 = c5*y2
+        c38 = c37*d23
+        c39 = c38*d2
+        c40 = c27*y2
+        c41 = c40*d23
+        c42 = d2*y3
+        c43 = c41*d2
+        c44 = c27*y4
+        c45 = c44*d23
+        c46 = d2*y2**2
+        c47 = c46*d23
+        c48 = c47*c5
+        c49 = c28*c7
+        c50 = c30*c7
+        c51 = c27*c47
+        c52 = c5*y1
+        c53 = c52*d23
+        c54 = c34*c53
+        c55 = d4*y2
+        c56 = c5*c55
+        c57 = c28*c56
+        c58 = c30*c56
+        c59 = d1*y2
+        c60 = c59*d4
+        c61 = c28*c60
+        c62 = c61*d23
+        c63 = c30*c60
+        c64 = c63*d23
+        c65 = 2*c52
+        c66 = c55*c65*y4
+        c67 = c34*c59*y1
+        c68 = c67*d23
+        c69 = c46*c6
+        c70 = c28*c69
+        c71 = c30*c69
+        c72 = c29*c47
+        c73 = c31*c47
+        c74 = c34*c52
+        c75 = c46*c74
+        c76 = c35*c47
+        c77 = c12*c5
+        c78 = c77*d23
+        c79 = c22*c5
+        c80 = c79*d23
+        c81 = c12*c27
+        c82 = c81*d23
+        c83 = c12*d4
+        c84 = c5*c83
+        c85 = c28*c84
+        c86 = c30*c84
+        c87 = c12*c29
+        c88 = c87*d23
+        c89 = c12*c31
+        c90 = c89*d23
+        c91 = c12*c74
+        c92 = c12*c35
+        c93 = c92*d23
+        c94 = -c13*c27*c42*d23 - c13*c43 + c22*c39 + c42*c78 + c42*c80 + c42*c82 + c42*c85 + c42*c86 + c42*c88 + c42*c90 + c42*c91 + c42*c93 + c48*x14 + c49*x14 + c50*x14 + c51*x14 + c54*x14 + c70*x14 + c71*x14 + c72*x14 + c73*x14 + c75*x14 + c76*x14
+        c95 = c14*d2
+        c96 = c24*c5
+        c97 = c96*d23
+        c98 = c15*d4
+        c99 = 2*c98
+        c100 = c14*c5*d4
+        c101 = c21*c36
+        c102 = c78 + c80 + c82 + c85 + c86 + c88 + c90 + c91 + c93 - d14*d23*d4*x23*y4
+        c103 = c77 + c79 + c81 + c87 + c89 + c92 - d14*d4*x23*y4
+        c104 = c12*d1 + c22*d1 + c83 - d4*x23*y4
+        den0 = c2
+        den1 = c0
+        den2 = c2*d1
+        den3 = c3
+        den4 = c3*c4*c7
+        den5 = c2*d4
+        den6 = c9*d23
+        den7 = c9
+        den8 = c10*c8
+        f1 = (c16) / den0
+        f2 = (c20) / den1
+        f3 = 0.0
+        f4 = (c25) / den0
+        t14x = (c11*mlx - c26) / den1
+        t23x = (-c26) / den1
+        s1 = (c16) / den2
+        s2 = (c20) / den3
+        s3 = (c3*c36*d23*mlx*(y2 + y3) + c94*fl + fe*(-c100*c28*c42 - c100*c30*c42 - c14*c27*c42*d23 - c14*c29*c42*d23 - c14*c31*c42*d23 - c14*c35*c42*d23 - c14*c42*c5*d23 - c14*c42*c74 - c15*c27*c42*d23 - c32*c47*c99 + c42*c97 - c45*c95 - c46*c65*c98 - c48*xe - c49*xe - c50*xe - c51*xe + c53*c95 - c53*c99 - c70*xe - c71*xe - c72*xe - c73*xe + c94) + mly*(-c39*y3 - c41*c42 - c42*c45 - c42*c57 - c42*c58 - c42*c62 - c42*c64 - c42*c66 - c42*c68 - c43*y4 - c48 - c49 - c50 - c51 - c54 - c70 - c71 - c72 - c73 - c75 - c76 + d1*d14*d2*d23*y1*y2 + d1*d14*d2*d23*y1*y3)) / den4
+        s4 = (c25) / den5
+        phi1 = (-c101*d23 - c102*fl + fe*(-c102 + c28*d1*d14*d4*xe*y2 + c28*d1*d23*d4*xe*y2 + c30*d1*d14*d4*xe*y2 + c30*d1*d23*d4*xe*y2 - c97 + d1*d14*d23*xe*y2 + 2*d1*d14*d4*xe*y1*y2*y4 + 2*d1*d23*d4*xe*y1*y2*y4 + d14*d23*d4*xe*y2 + d14*d23*d4*xe*y4) + mly*(c38 + c41 + c45 - c53 + c57 + c58 + c62 + c64 + c66 + c68)) / den6
+        phi2 = (-c101 - c103*fl + fe*(-c103 + c28*d1*d4*xe*y2 + c30*d1*d4*xe*y2 - c96 + d1*d14*xe*y2 + 2*d1*d4*xe*y1*y2*y4 + d14*d4*xe*y2 + d14*d4*xe*y4) + mly*(c37 + c40 + c44 - c52 + c61 + c63 + c67)) / den7
+        phi3 = (-c104*fl - c21*(d1 + d4) + fe*(-c104 - c24*d1 + d1*xe*y2 + d4*xe*y2 + d4*xe*y4) + mly*(-c32 + c33 + c55 + c59)) / den8
+        fry = (-c17 - c18*fe + mly) / den1
+        ffy = (fe*(x23 + xe) + fl*x23 + mly) / den1
+    elif lift == 4:
+        c0 = x14 + x23
+        c1 = y2 + y3
+        c2 = c0*c1
+        c3 = c0*d1
+        c4 = c1**2
+        c5 = d2*d23
+        c6 = c5*d3
+        c7 = c6*d14
+        c8 = d2*d3
+        c9 = c0*c4
+        c10 = c6*c9
+        c11 = fl*x23
+        c12 = fe*(x23 + xe)
+        c13 = c11 + c12 + mly
+        c14 = x14*y3
+        c15 = x23*y1
+        c16 = xe*y1
+        c17 = xe*y3
+        c18 = -c0*mlx + fe*(-c15 - c16 - c17 + x14*y3) + fl*(c14 - c15) + mly*(-y1 - y3)
+        c19 = c0*mlx
+        c20 = x14*y2
+        c21 = c15 + c20
+        c22 = xe*y2
+        c23 = c19 + c21*fl + fe*(c16 + c21 - c22) + mly*(y1 - y2)
+        c24 = c11*y1 + c12*y1 + mly*y1
+        c25 = d23*d3
+        c26 = y2**2
+        c27 = c26*c8
+        c28 = y3**2
+        c29 = c28*c8
+        c30 = d3*y3
+        c31 = 2*d2*y2
+        c32 = c30*c31
+        c33 = c25 + c27 + c29 + c32 + c5
+        c34 = c5*y1
+        c35 = c34*d14
+        c36 = d1*y4
+        c37 = c25*y1
+        c38 = c37*d14
+        c39 = c38*d1
+        c40 = c25*y3
+        c41 = c40*d14
+        c42 = d1*y1**2
+        c43 = c42*d14
+        c44 = c43*c5
+        c45 = c25*c43
+        c46 = c26*c7
+        c47 = c28*c7
+        c48 = c5*y2
+        c49 = c48*d14
+        c50 = c49*d1
+        c51 = 2*c49
+        c52 = c30*c51
+        c53 = d2*y1
+        c54 = c53*d3
+        c55 = c26*c54
+        c56 = c55*d14
+        c57 = c28*c54
+        c58 = c57*d14
+        c59 = d3*y1
+        c60 = c5*c59
+        c61 = c26*c60
+        c62 = c28*c60
+        c63 = c59*y3
+        c64 = c31*c63
+        c65 = c64*d14
+        c66 = 2*c48
+        c67 = c63*c66
+        c68 = c27*c43
+        c69 = c29*c43
+        c70 = c42*c6
+        c71 = c26*c70
+        c72 = c28*c70
+        c73 = c32*c43
+        c74 = c30*c66
+        c75 = c42*c74
+        c76 = c20*c5
+        c77 = c76*d14
+        c78 = c15*c5
+        c79 = c78*d14
+        c80 = c15*c25
+        c81 = c80*d14
+        c82 = c15*c27
+        c83 = c82*d14
+        c84 = c15*c29
+        c85 = c84*d14
+        c86 = c15*d3
+        c87 = c5*c86
+        c88 = c26*c87
+        c89 = c28*c87
+        c90 = c15*c32
+        c91 = c90*d14
+        c92 = c15*c74
+        c93 = -c14*c25*c36*d14 - c14*c39 + c20*c35*d1 + c36*c77 + c36*c79 + c36*c81 + c36*c83 + c36*c85 + c36*c88 + c36*c89 + c36*c91 + c36*c92 + c44*x23 + c45*x23 + c46*x23 + c47*x23 + c52*x23 + c68*x23 + c69*x23 + c71*x23 + c72*x23 + c73*x23 + c75*x23
+        c94 = c16*c5
+        c95 = c94*d14
+        c96 = c16*c25
+        c97 = c96*d14
+        c98 = c17*c25
+        c99 = c98*d14
+        c100 = c17*d3
+        c101 = c16*c27
+        c102 = c101*d14
+        c103 = c16*c29
+        c104 = c103*d14
+        c105 = c16*d3
+        c106 = c105*c5
+        c107 = c106*c26
+        c108 = c106*c28
+        c109 = c16*c32
+        c110 = c109*d14
+        c111 = c16*c74
+        c112 = c15*d2 + c20*d2 + c86 - d3*x14*y3
+        c113 = c19*c33
+        c114 = c76 + c78 + c80 + c82 + c84 + c90 - d23*d3*x14*y3
+        c115 = c77 + c79 + c81 + c83 + c85 + c88 + c89 + c91 + c92 - d14*d23*d3*x14*y3
+        den0 = c0
+        den1 = c2
+        den2 = c3
+        den3 = c2*d2
+        den4 = c2*d3
+        den5 = c3*c4*c7
+        den6 = c8*c9
+        den7 = c10
+        den8 = c10*d14
+        f1 = (c13) / den0
+        f2 = (c18) / den1
+        f3 = (c23) / den1
+        f4 = 0.0
+        t14x = (c24) / den0
+        t23x = (c19 + c24) / den0
+        s1 = (c13) / den2
+        s2 = (c18) / den3
+        s3 = (c23) / den4
+        s4 = (c3*c33*d14*mlx*(y1 + y4) + c93*fl + fe*(c100*c31*c43 + c100*c42*c66 + c100*c51 + c102*c36 + c104*c36 + c107*c36 + c108*c36 + c110*c36 + c111*c36 + c16*c41*d1 - c16*c50 - c22*c36*c5*d14 + c36*c95 + c36*c97 + c36*c99 + c44*xe + c45*xe + c46*xe + c47*xe + c68*xe + c69*xe + c71*xe + c72*xe + c93) + mly*(c35*c36 + c36*c38 + c36*c41 - c36*c49 + c36*c56 + c36*c58 + c36*c61 + c36*c62 + c36*c65 + c36*c67 + c39*y3 + c44 + c45 + c46 + c47 - c50*y1 + c52 + c68 + c69 + c71 + c72 + c73 + c75)) / den5
+        phi1 = (-c112*fl - c19*(d2 + d3) + fe*(-c100 - c105 - c112 - c16*d2 + d2*xe*y2) + mly*(-c30 - c53 - c59 + d2*y2)) / den6
+        phi2 = (-c113 - c114*fl + fe*(-c101 - c103 - c109 - c114 - c94 - c96 - c98 + d2*d23*xe*y2) + mly*(-c34 - c37 - c40 - c55 - c57 - c64 + d2*d23*y2)) / den7
+        phi3 = (-c113*d14 - c115*fl + fe*(-c102 - c104 - c107 - c108 - c110 - c111 - c115 - c95 - c97 - c99 + d14*d2*d23*xe*y2) + mly*(-c35 - c38 - c41 - c56 - c58 - c61 - c62 - c65 - c67 + d14*d2*d23*y2)) / den8
+        fry = (fe*(-x14 + xe) - fl*x14 + mly) / den0
+        ffy = (c13) / den0
+    else:
+        raise ValueError('lift must be 1...4')
+    t14y = (-fe*x23*x3 - fe*x3*xe - fl*x23*x3 - mly*x3) / (x14 + x23)
+    t23y = (-fe*x1*x14 + fe*x1*xe - fl*x1*x14 + mly*x1) / (x14 + x23)
+    return (f1, f2, f3, f4, t14x, t23x, t14y, t23y, s1, s2, s3, s4, phi1, phi2, phi3, fry, ffy)
@@ -1,10 +1,10 @@
 # -*- coding: utf-8 -*-
 """Support Force Distribution dashboard page."""
 import streamlit as st
-from plot import topview_plot, sideview_plot, supports_bar_plot
-from helpers import xy_load, case_dependent_results, restlast
+from helpers import xy_load, restlast
+from spec import MachineSpec
+from dashboard_cache import SUPPORT_FORCE_LOADCASES, load_case, support_forces, envelope, support_force_figures
 import pandas as pd
-import loadcases
 from loadcases import lim_support_force_dist as lim
 from Home import check_password
 
@@ -18,25 +18,11 @@ if check_password():
     # ini, _ = loadcases.elast_a()
     # ini, _ = loadcases.liftoff_d()
 
-    opts = ['Elast A',
-            'Elast B',
-            'Elast C',
-            'Liftoff A',
-            'Liftoff B',
-            'Liftoff C',
-            'Liftoff D']
-
-    lcs = {'Elast A': loadcases.elast_a(),
-           'Elast B': loadcases.elast_a(),
-           'Elast C': loadcases.elast_c(),
-           'Liftoff A': loadcases.liftoff_a(),
-           'Liftoff B': loadcases.liftoff_b(),
-           'Liftoff C': loadcases.liftoff_c(),
-           'Liftoff D': loadcases.liftoff_d()}
+    opts = list(SUPPORT_FORCE_LOADCASES)
 
     st.sidebar.header('Import Loadcase')
     selection = st.sidebar.selectbox('Select a predefined data set', options=opts, index=3, help='Lodcase data sets are defined in elastomech\\loadcases.py', key='sel-lc')
-    ini, _ = lcs[selection]
+    ini, _ = load_case(selection)
 
     # Initialize session state
     for key in ini:
@@ -111,7 +97,8 @@ if check_password():
     # Compute new figures
     inputs = {'fl': fl, 'mlx': mlx, 'mly': mly, 'fe': fe, 'xe': xe, 'x14': x14, 'x23': x23, 'd14': d14, 'd23': d23, 'd1': d1, 'd2': d2, 'd3': d3, 'd4': d4, 'y1': y1, 'y2': y2, 'y3': y3, 'y4': y4}
 
-    results, errors, warnings = case_dependent_results(fl, mlx, mly, fe, y1, y2, y3, y4, xe, x14, x23, d14, d23, d1, d2, d3, d4)
+    spec = MachineSpec.from_inputs(inputs)
+    results, errors, warnings = support_forces(spec)
 
     for s in errors:
         st.error(s)
@@ -122,10 +109,7 @@ if check_password():
     data = inputs | results  # Merge dicts (>= python 3.9.0)
     df = pd.DataFrame(data, index=[0])
 
-    fig_top = topview_plot(data, range_x, range_y)
-    fig_side1 = sideview_plot(data, 'xz')
-    fig_side2 = sideview_plot(data, 'yz')
-    fig_bar = supports_bar_plot(data)
+    fig_top, fig_side1, fig_side2, fig_bar = support_force_figures(data, range_x, range_y)
 
     # Create Central Layout
     st.subheader('Results')
@@ -137,6 +121,13 @@ if check_password():
     df_restlast = pd.DataFrame(rl, index=['Value'])
     st.dataframe(df_restlast)
 
+    st.subheader('Envelope over a full rotation of the boom')
+    env, regimes = envelope(spec, ml)
+    st.dataframe(pd.DataFrame(env))
+    if any(regime < 0 for _, _, regime in regimes):
+        ranges = ', '.join(f'{lo:.1f}°...{hi:.1f}°' for lo, hi, regime in regimes if regime < 0)
+        st.warning(f'Mehr als eine Stütze hebt ab für phi_deg_boom = {ranges}. Diese Bereiche sind in der Einhüllenden nicht enthalten.')
+
     # Define ROW 1
     # c12 = Row 1, Column 2
     c11, c12 = st.columns([3, 1])
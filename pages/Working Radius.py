@@ -1,104 +1,98 @@
 # -*- coding: utf-8 -*-
 """Working Radius dashboard page."""
 import streamlit as st
-from plot import topview_plot_ro_polar, results_plot
-from helpers import xy_load, case_dependent_results, limited_reachout, load_moment, check_liftoffs, restlast, box_section_stress
+from plot import topview_plot_ro_polar, update_ro_polar, results_plot, load_chart_heatmap
+from dashboard_cache import WORKING_RADIUS_LOADCASES, load_case, support_forces, polar_figure, process_pool, sweep_cache, job_manager, rerun
+from jobs import DONE, CANCELLED, FINISHED
+from limit_curve import response_key, reachout_responses, limit_curve_from_responses
+from load_chart import load_chart, chart_table
+from spec import MachineSpec
 import pandas as pd
-import loadcases
 from loadcases import lim_working_radius as lim
 import numpy as np
 import time
+import os
 from Home import check_password
 
 # ---- Internal functions
 
+# Seconds between two updates of the partial limit curve of a running sweep job
+POLL_INTERVAL = 0.5
+
 
 def _update_slider(slider_keys, values):
     for k, v in zip(slider_keys, values):
         st.session_state[k] = v
 
 
-def _grenzkurve(inputs):
-    i = inputs
-    step = i['stepsize']
-    mode = 'lines+markers'
-    j = 0
-    step_array = np.arange(0., 360., step)
-    progbar = st.progress(0)
-
-    # Create dict of empty lists
-    ks = ['phi', 'ro', 'ml', 'mlx', 'mly', 'lift id',
-          'Restlast key', 'Restlast val', 'f12', 'f23', 'f34', 'f14']
-    res_ks = ['f1', 'f2', 'f3', 'f4', 'ffy', 'fry', 'phi1', 'phi2', 'phi3',
-              's1', 's2', 's3', 's4', 't14x', 't23x', 't14y', 't23y', 'sv14', 'sv23']
-    d_ro = {}
-    d_fails = {'phi': [],
-               'msg': [],
-               'No of iterations': [],
-               'status': []}
-
-    for k in ks + res_ks:
-        d_ro[k] = []
-
-    for phi in step_array:
-        i['phi_deg_boom'] = phi
-        i['phi_deg_load'] = phi + 90.
-        res = limited_reachout(inputs)
-        ro = float(res.x[0])  # Sanitize ro before using it further!
-        if res.success:  # If optimization is successful
-            ml = load_moment([(i['f_ro'], ro)])
-            mlx, mly = xy_load(ml, i['phi_deg_load'])
-            results, errors, warnings = case_dependent_results(i['fl'], mlx, mly, i['fe'], i['y1'], i['y2'], i['y3'], i['y4'],
-                                                               i['xe'], i['x14'], i['x23'], i['d14'], i['d23'], i['d1'], i['d2'], i['d3'], i['d4'], x1=i['x1'], x3=i['x3'])
-
-            # Zusätzlich Spannungen im Rahmen berechnen
-            results['sv14'] = box_section_stress(B=i['B'], H=i['H'], tb=i['tb'], th=i['th'], m_t=results['t14x'], m_by=results['t14y'])
-            results['sv23'] = box_section_stress(B=i['B'], H=i['H'], tb=i['tb'], th=i['th'], m_t=results['t23x'], m_by=results['t23y'])
-
-            data = inputs | results
-
-            _, lift_ids, _ = check_liftoffs(results)
-            rl_min, rl = restlast(results)
-
-            # Write freshly computed values to corresponding list in dict
-            vs = [phi, ro, ml, mlx, mly, lift_ids, rl_min[0],
-                  rl_min[1], rl['f12'], rl['f23'], rl['f34'], rl['f14']]
-            for k, v in zip(ks, vs):
-                d_ro[k].append(v)
-            # Do the same with values from results dict
-            for k in res_ks:
-                v = float(results[k])
-                d_ro[k].append(v)
-
-        else:  # If optimization is NOT successful
-            d_fails['phi'].append(phi)
-            d_fails['msg'].append(res.message)
-            d_fails['No of iterations'].append(res.nit)
-            d_fails['status'].append(res.status)
-            data = inputs
-            mode = 'markers'
-
-        print(f'j: {j}, phi: {phi}, ro: {ro}')
-
-        j += 1
-        progbar.progress(j / step_array.size)
-
-    fig = topview_plot_ro_polar(d=data, d_ro=d_ro, mode=mode)
-
-    return fig, d_ro, d_fails
+def _grenzkurve(spec, run):
+    # Sweep als Hintergrund-Job starten, das Skript blockiert nicht
+    executor = process_pool() if run['workers'] > 1 else None
+    return job_manager().submit(spec, run['stepsize'], time_budget=run['time_budget'], cache=sweep_cache(),
+                                executor=executor, max_workers=run['workers'], method=run['method'],
+                                continuation=run['continuation'], adaptive=run['adaptive'], tol_ro=run['tol_ro'],
+                                coarse_to_fine=True)
+
+
+def _show_progress(job):
+    status = job.status()
+    st.progress(status['done'] / status['total'] if status['total'] else 0.)
+    st.caption(f"Calculating: {status['done']}/{status['total']} angles, {status['elapsed']:.1f} s")
+
+
+def _job_panel(jobs):
+    """Show the sweep job of the session, store its result when done. Return the job while it is running."""
+    job_id = st.session_state.get('ro-job')
+    if job_id is None:
+        return None
+    job = jobs.job(job_id)
+    if job is None or job.state in FINISHED:
+        del st.session_state['ro-job']
+    if job is None:
+        return None
+
+    if job.state == DONE:
+        result = job.result
+        # Antwort über ro je Winkel speichern, bei geänderten Grenzen wird nur neu geschnitten
+        phis = np.concatenate([result['phi'], result.fails['phi']])
+        st.session_state['ro-last'] = {'key': response_key(job.inputs), 'spec': job.inputs, 'result': result,
+                                       'responses': reachout_responses(job.inputs, phis)}
+        stats = sweep_cache().stats()
+        st.caption(f"Sweep cache: {stats['hits']} hits, {stats['misses']} misses, {stats['entries']} sweeps ({stats['bytes'] / 2**20:.1f} MB)")
+        return None
+    if job.state == CANCELLED:
+        st.info('Calculation cancelled.')
+        return None
+    if job.state in FINISHED:
+        st.error('Calculation failed.')
+        st.code(job.error)
+        return None
+
+    _show_progress(job)
+    st.button('Abbrechen', on_click=jobs.cancel, args=(job_id,), key='bt-cancel')
+    return job
+
+
+def _figure(spec, result):
+    # Spalten ohne Kopie als DataFrame
+    df_ro = result.to_pandas().set_index('phi', drop=False)
+    df_fails = result.fails_frame().set_index('phi', drop=False)
+
+    mode = 'markers' if not df_fails.empty else 'lines+markers'
+    fig = topview_plot_ro_polar(d=spec.inputs(), d_ro=df_ro, mode=mode)
+
+    return fig, df_ro, df_fails
 
 
 # ---- Password check
 if check_password():
     # Dashboard starts here
-    opts = ['Default', 'Pillow A']
-    lcs = {'Default': loadcases.ro_default(),
-           'Pillow A': loadcases.ro_pillow_a()}
+    opts = list(WORKING_RADIUS_LOADCASES)
 
     st.sidebar.header('Import Loadcase')
     selection = st.sidebar.selectbox('Select a predefined data set', options=opts, index=0,
                                      help='Lodcase data sets are defined in elastomech\\loadcases.py', key='sel-lc')
-    ini, _ = lcs[selection]
+    ini, _ = load_case(selection)
     export_dfs = []
 
     # ---- Initialize session state
@@ -309,12 +303,11 @@ if check_password():
 
     df_bounds = pd.DataFrame.from_dict(d_bounds, orient='columns')
 
-    results, _, _ = case_dependent_results(
-        fl, mlx, mly, fe, y1, y2, y3, y4, xe, x14, x23, d14, d23, d1, d2, d3, d4, x1=x1, x3=x3)
+    spec = MachineSpec.from_inputs(inputs)
+    results, _, _ = support_forces(spec)
     data = inputs | results
 
-    d_ro = {'phi': [], 'ro': []}
-    fig_ro = topview_plot_ro_polar(d=data, d_ro=d_ro)
+    fig_ro = polar_figure(data)
     show_data = False
 
     export_dfs.extend((df_inputs))
@@ -324,13 +317,48 @@ if check_password():
         st.subheader('Run Settings')
         stepsize = st.slider('Step size for φ (in deg)',
                              1, 15, 5, 1, key='sl-step')
-        inputs['stepsize'] = stepsize
-
+        run = {'stepsize': stepsize}
+        method = st.selectbox('Solver', ['SLSQP', 'exact'], index=0,
+                              help='SLSQP: numerical optimization. exact: closed-form solution per lift-off regime (no iterations).',
+                              key='sel-method')
+        run['method'] = method
+        workers = st.slider('Parallel workers', 1, max(os.cpu_count() or 1, 2), 1, 1,
+                            help='Number of worker processes for the angles of the sweep.',
+                            key='sl-workers')
+        run['workers'] = workers
+        continuation = st.checkbox('Warm start from previous angle', value=False,
+                                   help='Start each angle from the solution of the previous angle (serial sweep). Failed angles are retried from their neighbours.',
+                                   key='cb-continuation')
+        run['continuation'] = continuation
+        adaptive = st.checkbox('Adaptive refinement', value=False,
+                               help='Start with the step size above and bisect the intervals where ro, the governing bound or the lift-off changes.',
+                               key='cb-adaptive')
+        run['adaptive'] = adaptive
+        tol_ro = st.number_input('Tolerance of ro', min_value=0.001, value=0.1, step=0.05, format='%.3f',
+                                 disabled=not adaptive, key='ni-tol-ro')
+        run['tol_ro'] = tol_ro
+        time_budget = st.number_input('Time budget per angle (s)', min_value=0.1, value=2., step=0.5, format='%.1f',
+                                      disabled=method != 'SLSQP',
+                                      help='SLSQP: an angle is stopped after this time and logged as failed.',
+                                      key='ni-time-budget')
+        run['time_budget'] = time_budget
+
+        jobs = job_manager()
         if st.button('Grenzkurve ermitteln'):
-            fig_ro, d_ro, d_fails = _grenzkurve(inputs)
-            df_ro = pd.DataFrame(d_ro, index=d_ro['phi'])
-            df_fails = pd.DataFrame(d_fails, index=d_fails['phi'])
-
+            # Ein laufender Job der Session wird ersetzt
+            if 'ro-job' in st.session_state:
+                jobs.cancel(st.session_state['ro-job'])
+            st.session_state['ro-job'] = _grenzkurve(spec, run)
+        job = _job_panel(jobs)
+
+        last = st.session_state.get('ro-last')
+        if last is not None and last['key'] == response_key(spec):
+            if last['spec'] == spec:
+                result = last['result']
+            else:
+                result = limit_curve_from_responses(spec, last['responses'], columnar=True)
+                st.caption('Bounds changed: limit curve updated from the stored response of the last run (exact solution).')
+            fig_ro, df_ro, df_fails = _figure(spec, result)
             show_data = True
 
     # ---- Create Central Layout
@@ -339,6 +367,11 @@ if check_password():
     c11, c12 = st.columns([1, 2])
     with c11:
         st.subheader('Reachout(φ)')
+        if job is not None:
+            # Laufender Job: Winkel bisher (coarse-to-fine, erst der ganze Kreis)
+            partial = job.partial_result()
+            fig_ro = polar_figure(data)
+            update_ro_polar(fig_ro, partial.to_pandas(), mode='markers' if partial.fails['phi'] else 'lines+markers')
         st.plotly_chart(fig_ro, use_container_width=True)
 
     if show_data:
@@ -438,3 +471,27 @@ if check_password():
             key='dl-res-csv')
 
         st.dataframe(df_ro)
+
+    # ---- Load chart: allowable tip load over ro and phi
+    st.subheader('Load chart')
+    with st.expander('👉 Allowable tip load f_ro over ro and φ (all bounds above)'):
+        c31, c32 = st.columns([1, 1])
+        n_ro = c31.slider('Number of radii', 10, 200, 60, 10, key='sl-chart-nro')
+        step_chart = c32.slider('Step size for φ (in deg)', 1, 15, 5, 1, key='sl-chart-step')
+        if st.button('Lastdiagramm ermitteln'):
+            chart = load_chart(spec, np.linspace(inputs['ro_lb'], inputs['ro_ub'], n_ro), np.arange(0., 360., step_chart))
+            st.plotly_chart(load_chart_heatmap(chart), use_container_width=True)
+            chart_csv = chart_table(chart, long=True).to_csv(index=False).encode('utf-8')
+            st.download_button(
+                "Download Load chart as csv",
+                chart_csv,
+                "Loadchart_" + time.strftime("%Y%m%d-%H%M%S") + ".csv",
+                "text/csv",
+                key='dl-chart-csv')
+            st.dataframe(chart_table(chart))
+
+    # ---- Running sweep job: rerun the page after POLL_INTERVAL to show the next
+    # partial limit curve (the script thread does not wait for the job)
+    if job is not None:
+        time.sleep(POLL_INTERVAL)
+        rerun()
@@ -463,6 +463,35 @@ def topview_plot_ro_polar(d, d_ro, mode='lines+markers'):
     return fig
 
 
+def update_ro_polar(fig, d_ro, mode='lines+markers'):
+    """Replace the limit curve of a polar plot of topview_plot_ro_polar in place (e.g. with partial results of a running sweep)."""
+    df_ro = pd.DataFrame(d_ro, columns=['ro', 'phi'])
+    fig.update_traces(selector=dict(name='Max Reachout'), r=df_ro['ro'], theta=df_ro['phi'], mode=mode)
+    if not df_ro.empty:
+        fig.update_polars(radialaxis_range=[0., df_ro['ro'].max() * 1.1])
+    return fig
+
+
+def load_chart_heatmap(chart):
+    """Return plotly heatmap of the load chart (allowable tip load over ro and phi, see load_chart.load_chart)."""
+    fig = go.Figure(
+        go.Heatmap(z=chart['f_ro'],
+                   x=chart['ro'],
+                   y=chart['phi'],
+                   customdata=chart['active'],
+                   colorscale='Viridis',
+                   colorbar=dict(title='f_ro'),
+                   hovertemplate='ro: %{x:.2f}<br>phi: %{y:.1f}°<br>f_ro: %{z:,.1f}<br>%{customdata}<extra></extra>'))
+
+    # Tight layout, labels, etc.
+    fig.update_layout(margin=dict(l=0, r=0, t=0, b=0),
+                      xaxis_title='Working radius (ro)',
+                      yaxis_title='Boom angle (phi)',
+                      template='seaborn')
+
+    return fig
+
+
 def sideview_plot(d, plane, proj_type='perspective'):
     """
     Return plotly figure for Support Force Distribution's 3D side view plot.
@@ -0,0 +1,405 @@
+#!/usr/bin/env python
+# coding: utf-8
+"""
+Generate model_plain.py from the sympy solutions of the mechanical models.
+
+The numerators of all solutions are collected by the load terms (fl, mlx,
+mly, fe), the shared denominators are factored out and computed only once and
+a common subexpression elimination (CSE) is run over each model. The resulting
+module has the same interface as the hand-pasted one (results_plain,
+results_liftoff_plain). For symmetric machines (y1...y4 = h, d1...d4 = dc, as
+in stuetzkraft_simplify_ans.py but with general torsion springs d14, d23) much
+shorter kernels are generated, results_plain dispatches to them automatically.
+
+Run from this directory:
+    python stuetzkraft_codegen.py
+
+The elastostatic solution is read from ans_elasto_pickle.p (solving it takes
+very long), the lift-off solutions are solved on the fly.
+"""
+import os
+import pickle
+import timeit
+from sympy import cancel, collect, count_ops, cse, expand, factor, fraction, numbered_symbols, symbols, sympify
+from sympy.printing.pycode import pycode
+from stuetzkraft_solve_eqs import solve_liftoff_model
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+TARGET = os.path.join(HERE, '..', '..', 'model_plain.py')
+
+fl, mlx, mly, fe = symbols('fl, mlx, mly, fe')
+LOADS = [fl, mlx, mly, fe]
+
+# Order of the result dict
+KEYS = ['f1', 'f2', 'f3', 'f4', 't14x', 't23x', 's1', 's2', 's3', 's4', 'phi1', 'phi2', 'phi3', 'fry', 'ffy']
+# Only available if x1 and x3 are given
+KEYS_Y = ['t14y', 't23y']
+# Order of the outputs of the tuple kernels (same as model_batch.OUTPUT_KEYS)
+VALUE_KEYS = ['f1', 'f2', 'f3', 'f4', 't14x', 't23x', 't14y', 't23y', 's1', 's2', 's3', 's4', 'phi1', 'phi2', 'phi3', 'fry', 'ffy']
+
+SIGNATURE = 'fl, mlx, mly, fe, y1, y2, y3, y4, xe, x14, x23, d14, d23, d1, d2, d3, d4'
+SIGNATURE_SYMMETRIC = 'fl, mlx, mly, fe, h, xe, x14, x23, d14, d23, dc'
+
+# Symmetric machine: equal support distances and support stiffnesses. The
+# torsion springs d14, d23 stay general (they differ e.g. for ro_default).
+y1, y2, y3, y4, d1, d2, d3, d4, h, dc = symbols('y1, y2, y3, y4, d1, d2, d3, d4, h, dc')
+SYMMETRIC = [(y1, h), (y2, h), (y3, h), (y4, h), (d1, dc), (d2, dc), (d3, dc), (d4, dc)]
+
+HEADER = '''# -*- coding: utf-8 -*-
+"""
+Solutions of the basic mechanical models in plain python.
+
+Generated by resources/solve_equations/stuetzkraft_codegen.py, do not edit.
+"""
+'''
+
+
+def load_solutions():
+    """Return dict of sympy solutions: {None: elastostatic, 1...4: lift-off}."""
+    with open(os.path.join(HERE, 'ans_elasto_pickle.p'), 'rb') as f:
+        sols = {None: pickle.load(f)}
+    for lift in (1, 2, 3, 4):
+        sols[lift] = solve_liftoff_model(lift)
+    return {k: {str(sym): expr for sym, expr in ans.items()} for k, ans in sols.items()}
+
+
+def split_denominators(ans):
+    """
+    Split the solutions into numerators and a list of unique denominators.
+
+    Returns
+    -------
+    nums : dict
+        Numerators, collected by the load terms.
+    dens : list
+        Unique denominators.
+    den_ids : dict
+        Index into dens for every key.
+    """
+    nums, dens, den_ids = {}, [], {}
+    for key in KEYS:
+        if ans[key] == 0:  # Force of the lifted support
+            nums[key] = 0
+            continue
+        num, den = fraction(ans[key])
+        den = factor(den)
+        for i, known in enumerate(dens):
+            if expand(den - known) == 0:
+                break
+            if expand(den + known) == 0:
+                num = -num
+                break
+        else:
+            dens.append(den)
+            i = len(dens) - 1
+        nums[key] = collect(expand(num), LOADS, func=factor)
+        den_ids[key] = i
+    return nums, dens, den_ids
+
+
+def cse_block(ans):
+    """
+    Run the CSE over one model.
+
+    Returns
+    -------
+    replacements : list
+        Temporaries (symbol, expression) in order of evaluation.
+    dens : list
+        Reduced shared denominators.
+    nums : dict
+        Reduced numerators (0 for constant outputs).
+    den_ids : dict
+        Index into dens for every non-constant key.
+    """
+    nums, dens, den_ids = split_denominators(ans)
+    const = [k for k in KEYS if nums[k] == 0]
+    exprs = dens + [nums[k] for k in KEYS if k not in const]
+    replacements, reduced = cse(exprs, symbols=numbered_symbols('c'))
+    red_nums = iter(reduced[len(dens):])
+    nums = {k: 0 if k in const else next(red_nums) for k in KEYS}
+    return replacements, reduced[:len(dens)], nums, den_ids
+
+
+def emit_block(ans, indent, optimize=True, zero='0'):
+    """Return source lines computing all KEYS of one model."""
+    pad = ' ' * indent
+    lines = []
+    if optimize:
+        replacements, dens, nums, den_ids = cse_block(ans)
+        for sym, expr in replacements:
+            lines.append(f'{pad}{sym} = {pycode(expr)}')
+        for i, den in enumerate(dens):
+            lines.append(f'{pad}den{i} = {pycode(den)}')
+        for k in KEYS:
+            if k in den_ids:
+                lines.append(f'{pad}{k} = ({pycode(nums[k])}) / den{den_ids[k]}')
+            else:
+                lines.append(f'{pad}{k} = {zero}')
+    else:
+        for k in KEYS:
+            lines.append(f'{pad}{k} = {pycode(ans[k])}')
+    return lines
+
+
+def emit_selective_block(ans, indent):
+    """
+    Return source lines computing only the requested KEYS of one model.
+
+    Every temporary and shared denominator is guarded by the set of outputs
+    which depend on it, so it is computed once if any of them is requested and
+    skipped otherwise. Runs of temporaries with the same guard share one if.
+    The flags want_<key> must be defined.
+    """
+    pad = ' ' * indent
+    replacements, dens, nums, den_ids = cse_block(ans)
+    defs = dict(replacements)
+    for i, den in enumerate(dens):
+        defs[symbols(f'den{i}')] = den
+
+    # Outputs depending on each temporary (transitively)
+    needed_by = {sym: set() for sym in defs}
+
+    def mark(expr, key):
+        for sym in expr.free_symbols:
+            if sym in defs and key not in needed_by[sym]:
+                needed_by[sym].add(key)
+                mark(defs[sym], key)
+
+    for k in KEYS:
+        if k in den_ids:
+            mark(nums[k], k)
+            mark(symbols(f'den{den_ids[k]}'), k)
+
+    lines = []
+    guard = None
+    assignments = [(sym, expr) for sym, expr in replacements] + [(symbols(f'den{i}'), den) for i, den in enumerate(dens)]
+    for sym, expr in assignments:
+        keys = sorted(needed_by[sym], key=KEYS.index)
+        if not keys:
+            continue
+        if keys != guard:
+            guard = keys
+            lines.append(f"{pad}if {' or '.join('want_' + k for k in keys)}:")
+        lines.append(f'{pad}    {sym} = {pycode(expr)}')
+    for k in KEYS:
+        value = f'({pycode(nums[k])}) / den{den_ids[k]}' if k in den_ids else '0'
+        lines.append(f'{pad}if want_{k}:')
+        lines.append(f"{pad}    results['{k}'] = {value}")
+    return lines
+
+
+def emit_y_block(ans, indent, selective=False):
+    """Return source lines for the frame moments t14y, t23y (depend on x1, x3)."""
+    pad = ' ' * indent
+    lines = []
+    for k in KEYS_Y:
+        num, den = fraction(ans[k])
+        if selective:
+            lines.append(f'{pad}if want_{k}:')
+            lines.append(f"{pad}    results['{k}'] = ({pycode(num)}) / ({pycode(den)})")
+        else:
+            lines.append(f'{pad}{k} = ({pycode(num)}) / ({pycode(den)})')
+            lines.append(f"{pad}results['{k}'] = {k}")
+    return lines
+
+
+def symmetric_solutions(sols):
+    """Return the solutions for symmetric machines (y1...y4 = h, d1...d4 = dc), see stuetzkraft_simplify_ans.py."""
+    return {lift: {k: cancel(sympify(expr).subs(SYMMETRIC)) for k, expr in ans.items()} for lift, ans in sols.items()}
+
+
+def emit_kernel(name, signature, sols, liftoff, doc):
+    """
+    Return source lines of a model kernel and its output-selective variant.
+
+    The kernel has the arguments (signature, [lift,] x1, x3, outputs).
+    """
+    lift_arg = 'lift, ' if liftoff else ''
+    lifts = (1, 2, 3, 4) if liftoff else (None,)
+    results = ' ' * 4 + 'results = {' + ', '.join(f"'{k}': {k}" for k in KEYS) + '}'
+    lines = [f'def {name}({signature}, {lift_arg}x1, x3, outputs):',
+             f'    """{doc}"""',
+             '    if outputs is not None:',
+             f'        return {name}_selected({signature}, {lift_arg}x1, x3, outputs)']
+    for lift in lifts:
+        if lift is None:
+            lines += emit_block(sols[lift], 4)
+        else:
+            lines.append(f'    if lift == {lift}:')
+            lines += emit_block(sols[lift], 8)
+            lines.append('')
+    lines += [results, '    if x1 is not None and x3 is not None:']
+    lines += emit_y_block(sols[lifts[0]], 8)
+    lines += ['    return results', '', '',
+              f'def {name}_selected({signature}, {lift_arg}x1, x3, outputs):',
+              f'    """{doc} Only the outputs in the set outputs."""']
+    lines += [f"    want_{k} = '{k}' in outputs" for k in KEYS + KEYS_Y] + ['    results = {}']
+    for lift in lifts:
+        if lift is None:
+            lines += emit_selective_block(sols[lift], 4)
+        else:
+            lines.append(f'    if lift == {lift}:')
+            lines += emit_selective_block(sols[lift], 8)
+            lines.append('')
+    lines += ['    if x1 is not None and x3 is not None:']
+    lines += emit_y_block(sols[lifts[0]], 8, selective=True)
+    lines += ['    return results', '', '']
+    return lines
+
+
+def emit_values_kernel(name, sols, liftoff):
+    """Return source lines of a kernel returning all VALUE_KEYS as tuple (for compiled loops, e.g. numba)."""
+    lift_arg = 'lift, ' if liftoff else ''
+    lifts = (1, 2, 3, 4) if liftoff else (None,)
+    model = 'Lift-off models' if liftoff else 'Elastostatic model'
+    lines = [f'def {name}({SIGNATURE}, {lift_arg}x1, x3):',
+             f'    """{model}, general geometry. All outputs as tuple in the order of VALUE_KEYS (x1, x3 must be numbers)."""']
+    for lift in lifts:
+        if lift is None:
+            lines += emit_block(sols[lift], 4, zero='0.0')
+        else:
+            lines.append(f'    {"if" if lift == 1 else "elif"} lift == {lift}:')
+            lines += emit_block(sols[lift], 8, zero='0.0')
+    if liftoff:
+        lines += ['    else:', "        raise ValueError('lift must be 1...4')"]
+    for k in KEYS_Y:
+        num, den = fraction(sols[lifts[0]][k])
+        lines.append(f'    {k} = ({pycode(num)}) / ({pycode(den)})')
+    lines += ['    return (' + ', '.join(VALUE_KEYS) + ')', '', '']
+    return lines
+
+
+def emit_module(sols, sym_sols=None, optimize=True):
+    """
+    Return the source code of the model module.
+
+    The public functions dispatch to the kernels for symmetric machines if
+    y1...y4 and d1...d4 are equal, otherwise to the general kernels. Without
+    optimize, only the uncompressed general solutions are emitted (for the
+    benchmark).
+    """
+    if not optimize:
+        results = '    results = {' + ', '.join(f"'{k}': {k}" for k in KEYS) + '}'
+        lines = [HEADER, '', f'def results_plain({SIGNATURE}, x1=None, x3=None):']
+        lines += emit_block(sols[None], 4, optimize=False) + [results, '    return results', '', '',
+                                                              f'def results_liftoff_plain({SIGNATURE}, lift, x1=None, x3=None):']
+        for lift in (1, 2, 3, 4):
+            lines.append(f'    if lift == {lift}:')
+            lines += emit_block(sols[lift], 8, optimize=False)
+        lines += [results, '    return results', '']
+        return '\n'.join(lines)
+
+    sym_args = 'fl, mlx, mly, fe, y1, xe, x14, x23, d14, d23, d1'
+    lines = [HEADER + 'import numpy as np', '',
+             '# Order of the outputs of the _values kernels',
+             'VALUE_KEYS = [' + ', '.join(f"'{k}'" for k in VALUE_KEYS) + ']', '', '',
+             f'def results_plain({SIGNATURE}, x1=None, x3=None, outputs=None):',
+             '    """Solutions of the Elastostatic model (Statically overdetermined). If outputs (set of keys) is given, only these results are computed."""',
+             '    if _symmetric(y1, y2, y3, y4, d1, d2, d3, d4):',
+             f'        return _results_plain_symmetric({sym_args}, x1, x3, outputs)',
+             f'    return _results_plain_general({SIGNATURE}, x1, x3, outputs)', '', '',
+             f'def results_liftoff_plain({SIGNATURE}, lift, x1=None, x3=None, outputs=None):',
+             '    """Solutions of the Static model (Statically determined). A lift index (int) must be passed to indicate which support is lifted from the ground. If outputs (set of keys) is given, only these results are computed."""',
+             '    if _symmetric(y1, y2, y3, y4, d1, d2, d3, d4):',
+             f'        return _results_liftoff_plain_symmetric({sym_args}, lift, x1, x3, outputs)',
+             f'    return _results_liftoff_plain_general({SIGNATURE}, lift, x1, x3, outputs)', '', '',
+             'def _symmetric(y1, y2, y3, y4, d1, d2, d3, d4):',
+             '    """True if all supports have the same distance y and stiffness d (numbers or equal arrays)."""',
+             '    try:',
+             '        return bool(y1 == y2 == y3 == y4 and d1 == d2 == d3 == d4)',
+             '    except ValueError:  # Arrays',
+             '        return all(np.array_equal(a, b) for a, b in [(y1, y2), (y1, y3), (y1, y4), (d1, d2), (d1, d3), (d1, d4)])',
+             '', '']
+    lines += emit_kernel('_results_plain_general', SIGNATURE, sols, False, 'Elastostatic model, general geometry.')
+    lines += emit_kernel('_results_liftoff_plain_general', SIGNATURE, sols, True, 'Lift-off models, general geometry.')
+    lines += emit_kernel('_results_plain_symmetric', SIGNATURE_SYMMETRIC, sym_sols, False,
+                         'Elastostatic model, symmetric machine (y1...y4 = h, d1...d4 = dc).')
+    lines += emit_kernel('_results_liftoff_plain_symmetric', SIGNATURE_SYMMETRIC, sym_sols, True,
+                         'Lift-off models, symmetric machine (y1...y4 = h, d1...d4 = dc).')
+    lines += emit_values_kernel('_results_plain_values', sols, False)
+    lines += emit_values_kernel('_results_liftoff_plain_values', sols, True)
+    return '\n'.join(lines).rstrip('\n') + '\n'
+
+
+def count_module_ops(sols, optimize=True):
+    """Return number of arithmetic operations per model (CSE'd or plain)."""
+    counts = {}
+    for lift, ans in sols.items():
+        if optimize:
+            nums, dens, den_ids = split_denominators(ans)
+            replacements, reduced = cse(dens + list(nums.values()), symbols=numbered_symbols('c'))
+            # + one division per non-constant output
+            counts[lift] = sum(count_ops(e) for _, e in replacements) + sum(count_ops(e) for e in reduced) + len(den_ids)
+        else:
+            counts[lift] = sum(count_ops(ans[k]) for k in KEYS)
+    return counts
+
+
+def _timed(fun, reps):
+    return min(timeit.repeat(fun, number=reps, repeat=3)) / reps
+
+
+def benchmark(sols, sym_sols, src_cse, n=2000):
+    """Print operation counts and per-call latency of plain vs. CSE code, output selection and symmetric kernels."""
+    import numpy as np
+    src_plain = emit_module(sols, optimize=False)
+    ns_plain, ns_cse = {}, {}
+    exec(compile(src_plain, 'model_plain_uncse', 'exec'), ns_plain)
+    exec(compile(src_cse, 'model_plain_cse', 'exec'), ns_cse)
+    general = ns_cse['_results_plain_general']
+
+    ops_plain = count_module_ops(sols, optimize=False)
+    ops_cse = count_module_ops(sols, optimize=True)
+    ops_sym = count_module_ops(sym_sols, optimize=True)
+    print('Operation count (plain -> CSE -> CSE symmetric)')
+    for lift in sols:
+        name = 'elasto' if lift is None else f'liftoff {lift}'
+        print(f'  {name:10s}: {ops_plain[lift]:6d} -> {ops_cse[lift]:5d} -> {ops_sym[lift]:4d}')
+
+    args = (50000., -62619.2, 108459.7, 3000., 3., 3., 3., 3., 3.2, 4.805, 0.78, 30230369.96, 155189025.29, 3001412.8, 3001412.8, 3001412.8, 3001412.8)
+    batch = tuple(np.full(10000, a) for a in args)
+    print('Per-call latency (plain -> CSE, general kernel)')
+    for label, a, reps in [('scalar', args, n), ('10k batch', batch, 20)]:
+        t_plain = _timed(lambda: ns_plain['results_plain'](*a), reps)
+        t_cse = _timed(lambda: general(*a, None, None, None), reps)
+        print(f'  {label:10s}: {t_plain * 1e6:9.1f} us -> {t_cse * 1e6:8.1f} us ({t_plain / t_cse:.1f}x)')
+
+        r_plain = ns_plain['results_plain'](*a)
+        r_cse = general(*a, None, None, None)
+        dev = max(float(np.max(np.abs(r_plain[k] - r_cse[k]) / np.maximum(np.abs(r_plain[k]), 1e-9))) for k in KEYS)
+        print(f'  {"":10s}  max. relative deviation: {dev:.2e}')
+
+    x13 = (0.78, 4.805)
+    print('Output selection (all -> selected, general kernel, x1/x3 given)')
+    for label, outputs in [('reachout', {'f1', 'f2', 'f3', 'f4', 't14x', 't23x', 't14y', 't23y'}),
+                           ('forces', {'f1', 'f2', 'f3', 'f4'})]:
+        for name, a, reps in [('scalar', args, n), ('10k batch', batch, 20)]:
+            t_all = _timed(lambda: general(*a, *x13, None), reps)
+            t_sel = _timed(lambda: general(*a, *x13, outputs), reps)
+            print(f'  {label:8s} {name:10s}: {t_all * 1e6:8.1f} us -> {t_sel * 1e6:8.1f} us ({t_all / t_sel:.1f}x)')
+            r_all = general(*a, *x13, None)
+            r_sel = general(*a, *x13, outputs)
+            assert set(r_sel) == outputs and all(np.array_equal(r_sel[k], r_all[k]) for k in outputs)
+
+    print('Symmetric machine (general kernel -> results_plain dispatching to the symmetric kernel, x1/x3 given)')
+    for model, lift in [('elasto', ()), ('liftoff 1', (1,)), ('liftoff 3', (3,))]:
+        fun = ns_cse['results_plain' if not lift else 'results_liftoff_plain']
+        gen = ns_cse['_results_plain_general' if not lift else '_results_liftoff_plain_general']
+        for name, a, reps in [('scalar', args, n), ('10k batch', batch, 20)]:
+            t_gen = _timed(lambda: gen(*a, *lift, *x13, None), reps)
+            t_sym = _timed(lambda: fun(*a, *lift, *x13), reps)
+            r_gen = gen(*a, *lift, *x13, None)
+            r_sym = fun(*a, *lift, *x13)
+            dev = max(float(np.max(np.abs(r_gen[k] - r_sym[k]) / np.maximum(np.abs(r_gen[k]), 1e-6))) for k in r_gen)
+            print(f'  {model:9s} {name:10s}: {t_gen * 1e6:8.1f} us -> {t_sym * 1e6:8.1f} us ({t_gen / t_sym:.1f}x), max. rel. deviation {dev:.1e}')
+
+
+if __name__ == "__main__":
+    sols = load_solutions()
+    sym_sols = symmetric_solutions(sols)
+    src = emit_module(sols, sym_sols)
+    with open(TARGET, 'w', encoding='utf-8') as f:
+        f.write(src)
+    print(f'Written {os.path.normpath(TARGET)}')
+    benchmark(sols, sym_sols, src)
@@ -49,16 +49,13 @@ def solve_elasto_model():
     
     return ans
 
-def solve_liftoff_model():
+def solve_liftoff_model(lift=4):
     # Known
     fl, mlx, mly, fe, y1, y2, y3, y4, xe, x1, x2, x3, x14, x23, d14, d23, d1, d2, d3, d4 = symbols('fl, mlx, mly, fe, y1, y2, y3, y4, xe, x1, x2, x3, x14, x23, d14, d23, d1, d2, d3, d4')
     
     # Unknown
     f1, f2, f3, f4, t14x, t23x, t14y, t23y, s1, s2, s3, s4, phi1, phi2, phi3, fry, ffy = symbols('f1, f2, f3, f4, t14x, t23x, t14y, t23y, s1, s2, s3, s4, phi1, phi2, phi3, fry, ffy')
     
-    # Liftoff
-    f4 = 0
-    
     # Rigid Body I
     eq1 = Eq(f3+f2+fry, 0)
     eq2 = Eq(f2*y2-f3*y3+t23x, 0)
@@ -88,29 +85,20 @@ def solve_liftoff_model():
     eq16 = Eq((s2-s3)/(y2+y3)-phi1, 0)
     eq17 = Eq((s1-s4)/(y1+y4)-phi3, 0)
     
-   
-    eqs = [eq1,
-           eq2,
-           eq3,
-           eq4,
-           eq5,
-           eq6,
-           eq7,
-           eq8,
-           eq9,
-           eq10,
-           #eq11,
-           eq12,
-           eq13,
-           eq14,
-           eq15,
-           eq16,
-           eq17]
+    # Liftoff: support force of the lifted support is zero and its spring
+    # equation is removed from the system
+    f_lift = {1: f1, 2: f2, 3: f3, 4: f4}[lift]
+    eq_lift = {1: eq10, 2: eq12, 3: eq13, 4: eq11}[lift]
+    
+    eqs = [eq1, eq2, eq3, eq4, eq5, eq6, eq7, eq8, eq9, eq10, eq11, eq12, eq13, eq14, eq15, eq16, eq17]
+    eqs = [eq.subs(f_lift, 0) for eq in eqs if eq is not eq_lift]
     unknowns = [f1, f2, f3, f4, t14x, t23x, t14y, t23y, s1, s2, s3, s4, phi1, phi2, phi3, fry, ffy]
+    unknowns.remove(f_lift)
     
     print(f'No of equations: {len(eqs)}\nNo of unknowns: {len(unknowns)}')
     
     ans = solve(eqs, unknowns)
+    ans[f_lift] = 0
     return ans  
  
 if __name__ == "__main__":
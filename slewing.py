@@ -0,0 +1,223 @@
+# -*- coding: utf-8 -*-
+"""
+Lift-off regimes and envelope of the support forces over a full slewing rotation of the boom.
+
+For a fixed load moment ml, every result of a calculation model is harmonic in
+the load angle phi: r(phi) = c + a cos(phi) + b sin(phi) (influence matrix, see
+influence.py). The lift-off regimes change where a support force of the
+elastostatic or of a lift-off model crosses zero, these angles are found
+analytically as well. Within each regime the extrema are either at the regime
+boundaries or at the stationary points phi = atan2(b, a) (+ 180°), so the
+envelope is exact without sampling the boom angle.
+"""
+from bisect import bisect_right
+import numpy as np
+from helpers import restlast, REGIME_ELASTIC, REGIME_SEVERAL
+from influence import influence_matrix
+from spec import as_inputs
+
+# Results of the envelope (support forces, torsional moments and residual loads of restlast)
+ENVELOPE_KEYS = ['f1', 'f2', 'f3', 'f4', 't14x', 't23x', 'f12', 'f23', 'f34', 'f14']
+
+FORCE_KEYS = ['f1', 'f2', 'f3', 'f4']
+
+
+def harmonic_coefficients(inputs, ml, lift=None):
+    """
+    Return the coefficients of the results over the load angle for a fixed load moment.
+
+    Parameters
+    ----------
+    inputs : dict or MachineSpec
+        Dict of input values (geometry, stiffness, fl, fe, xe).
+    ml : float
+        Load moment.
+    lift : int, optional
+        Id of the lifted support (1...4). If None, the elastostatic model is
+        used. The default is None.
+
+    Returns
+    -------
+    c, a, b : dict
+        Results (including the residual loads) as
+        c + a * cos(phi_load) + b * sin(phi_load).
+    """
+    i = as_inputs(inputs)
+    keys, matrix = influence_matrix(i, lift)
+    c = dict(zip(keys, matrix @ np.array([i['fl'], 0., 0., i['fe'], i['fe'] * i['xe']])))
+    a = dict(zip(keys, matrix[:, 1] * ml))
+    b = dict(zip(keys, matrix[:, 2] * ml))
+    for d in (c, a, b):
+        _, rl = restlast(d)
+        d.update(rl)
+    return c, a, b
+
+
+def _evaluate(coefficients, key, phi):
+    c, a, b = coefficients
+    return c[key] + a[key] * np.cos(phi) + b[key] * np.sin(phi)
+
+
+def _zeros(coefficients, key):
+    """Angles in [0, 2 pi) where c + a cos(phi) + b sin(phi) = 0."""
+    c, a, b = (d[key] for d in coefficients)
+    amplitude = np.hypot(a, b)
+    if amplitude == 0. or abs(c) > amplitude:
+        return []
+    base = np.arctan2(b, a)
+    delta = np.arccos(-c / amplitude)
+    return [(base + delta) % (2 * np.pi), (base - delta) % (2 * np.pi)]
+
+
+def _regime(models, phi):
+    """Regime code at the load angle phi, selection as in case_dependent_results."""
+    lift_ids = [n + 1 for n, k in enumerate(FORCE_KEYS) if _evaluate(models[None], k, phi) <= 0]
+    if not lift_ids:
+        return REGIME_ELASTIC
+    if len(lift_ids) > 1:
+        return REGIME_SEVERAL
+    lift = lift_ids[0]
+    if any(_evaluate(models[lift], k, phi) <= 0 for n, k in enumerate(FORCE_KEYS) if n + 1 != lift):
+        return REGIME_SEVERAL
+    return lift
+
+
+def _boom_angle(phi_load):
+    return float((np.degrees(phi_load) - 90.) % 360.)
+
+
+def _models(inputs, ml):
+    return {lift: harmonic_coefficients(inputs, ml, lift) for lift in (None, 1, 2, 3, 4)}
+
+
+def _partition(models):
+    """Intervals [lo, hi, regime] of the load angle in rad, starting at phi_deg_boom = 0."""
+    # Regime boundaries: zero crossings of the support forces of all models
+    start = np.pi / 2
+    cuts = [start, start + 2 * np.pi]
+    for lift, coefficients in models.items():
+        for n, k in enumerate(FORCE_KEYS):
+            if n + 1 != lift:
+                cuts += [start + (phi - start) % (2 * np.pi) for phi in _zeros(coefficients, k)]
+    cuts = np.unique(cuts)
+
+    intervals = []
+    for lo, hi in zip(cuts[:-1], cuts[1:]):
+        if hi - lo < 1e-12:
+            continue
+        regime = _regime(models, (lo + hi) / 2)
+        if intervals and intervals[-1][2] == regime:
+            intervals[-1][1] = hi
+        else:
+            intervals.append([lo, hi, regime])
+    return intervals
+
+
+def regime_partition(inputs, ml=None):
+    """
+    Return the lift-off regimes over a full rotation of the boom.
+
+    The boundaries are the exact boom angles where a support force of the
+    elastostatic model (or, in a lift-off regime, of the lift-off model)
+    crosses zero.
+
+    Parameters
+    ----------
+    inputs : dict or MachineSpec
+        Dict of input values (geometry, stiffness, fl, fe, xe and, if ml is
+        not given, mlx and mly).
+    ml : float, optional
+        Load moment. The default is None (magnitude of mlx, mly).
+
+    Returns
+    -------
+    regimes : list of tuples
+        Angle ranges (phi_from, phi_to, regime) of the boom in degrees,
+        covering [0, 360). regime is REGIME_ELASTIC, the id of the lifted
+        support (1...4) or REGIME_SEVERAL.
+    """
+    i = as_inputs(inputs)
+    if ml is None:
+        ml = float(np.hypot(i['mlx'], i['mly']))
+    start = np.pi / 2
+    return [(float(np.degrees(lo - start)), float(np.degrees(hi - start)), regime) for lo, hi, regime in _partition(_models(i, ml))]
+
+
+def regime_at(regimes, phi):
+    """
+    Return the regime of regime_partition at the boom angle phi.
+
+    Parameters
+    ----------
+    regimes : list of tuples
+        Result of regime_partition.
+    phi : float
+        Boom angle in degrees.
+
+    Returns
+    -------
+    regime : int
+        Regime code, e.g. for case_dependent_results(..., regime=regime).
+    """
+    n = bisect_right([r[0] for r in regimes], phi % 360.) - 1
+    return regimes[max(n, 0)][2]
+
+
+def slewing_envelope(inputs, ml=None, keys=None):
+    """
+    Return the maximum and minimum of the results over a full rotation of the boom and the angles where they occur.
+
+    Parameters
+    ----------
+    inputs : dict or MachineSpec
+        Dict of input values (geometry, stiffness, fl, fe, xe and, if ml is
+        not given, mlx and mly).
+    ml : float, optional
+        Load moment. The default is None (magnitude of mlx, mly).
+    keys : list of str, optional
+        Results of the envelope. The default is None (ENVELOPE_KEYS).
+
+    Returns
+    -------
+    envelope : dict
+        For each key a dict with 'max', 'phi_max', 'min', 'phi_min' (boom
+        angles in degrees). Angle ranges where several supports lift off
+        (calculation invalid) are excluded, if the whole rotation is invalid
+        the values are nan.
+    regimes : list of tuples
+        See regime_partition.
+    """
+    i = as_inputs(inputs)
+    keys = ENVELOPE_KEYS if keys is None else keys
+    if ml is None:
+        ml = float(np.hypot(i['mlx'], i['mly']))
+
+    models = _models(i, ml)
+    intervals = _partition(models)
+
+    envelope = {}
+    for k in keys:
+        candidates = []
+        for lo, hi, regime in intervals:
+            if regime == REGIME_SEVERAL:
+                continue
+            coefficients = models[None if regime == REGIME_ELASTIC else regime]
+            c, a, b = (d[k] for d in coefficients)
+            phis = [lo, hi]
+            if np.hypot(a, b) > 0:
+                top = np.arctan2(b, a)
+                for phi in (top, top + np.pi):
+                    phi = lo + (phi - lo) % (2 * np.pi)
+                    if phi <= hi:
+                        phis.append(phi)
+            candidates += [(_evaluate(coefficients, k, phi), phi) for phi in phis]
+        if candidates:
+            vmax, phi_max = max(candidates)
+            vmin, phi_min = min(candidates)
+            envelope[k] = {'max': float(vmax), 'phi_max': _boom_angle(phi_max), 'min': float(vmin), 'phi_min': _boom_angle(phi_min)}
+        else:
+            envelope[k] = {'max': np.nan, 'phi_max': np.nan, 'min': np.nan, 'phi_min': np.nan}
+
+    start = np.pi / 2
+    regimes = [(float(np.degrees(lo - start)), float(np.degrees(hi - start)), regime) for lo, hi, regime in intervals]
+    return envelope, regimes
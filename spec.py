@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+"""
+Immutable machine and load specification.
+
+A MachineSpec groups the inputs of the models into geometry, stiffness, box
+section, load and bounds. All groups are named tuples: immutable, without
+instance dict (__slots__ = ()) and hashable with a stable hash (numbers
+only), so they can be shared between threads/processes and used as cache
+keys. Geometry and stiffness together define the influence matrix
+(influence.influence_matrix), so this precomputation is cached independent of
+the load.
+
+Functions taking an input dict also accept a MachineSpec (see as_inputs).
+"""
+from typing import NamedTuple, Optional
+
+
+class Geometry(NamedTuple):
+    """Support distances y1...y4, frame lengths x14, x23 and positions x1, x3 of the virtual torsion springs."""
+    y1: float
+    y2: float
+    y3: float
+    y4: float
+    x14: float
+    x23: float
+    x1: Optional[float] = None
+    x3: Optional[float] = None
+
+
+class Stiffness(NamedTuple):
+    """Torsion springs d14, d23 and compression springs d1...d4 of the supports."""
+    d14: float
+    d23: float
+    d1: float
+    d2: float
+    d3: float
+    d4: float
+
+
+class Section(NamedTuple):
+    """Box section of the frame (outer width B, height H, wall thicknesses tb, th)."""
+    B: float
+    H: float
+    tb: float
+    th: float
+
+
+class Load(NamedTuple):
+    """Vertical load fl, load moment mlx/mly, dead weight fe at xe, tip load f_ro and boom angle."""
+    fl: float
+    mlx: float = 0.
+    mly: float = 0.
+    fe: float = 0.
+    xe: float = 0.
+    f_ro: Optional[float] = None
+    phi_deg_boom: Optional[float] = None
+
+
+class Bounds(NamedTuple):
+    """Lower and upper bounds of limited_reachout."""
+    ro_lb: float
+    ro_ub: float
+    rl_lb: float
+    rl_ub: float
+    f1_lb: float
+    f1_ub: float
+    f2_lb: float
+    f2_ub: float
+    f3_lb: float
+    f3_ub: float
+    f4_lb: float
+    f4_ub: float
+    t14x_lb: float
+    t14x_ub: float
+    t23x_lb: float
+    t23x_ub: float
+    sv14_lb: float
+    sv14_ub: float
+    sv23_lb: float
+    sv23_ub: float
+
+
+class MachineSpec(NamedTuple):
+    """Machine (geometry, stiffness, section) with load case and optional bounds."""
+    geometry: Geometry
+    stiffness: Stiffness
+    load: Load
+    section: Optional[Section] = None
+    bounds: Optional[Bounds] = None
+
+    @classmethod
+    def from_inputs(cls, inputs):
+        """Return the spec of an input dict (e.g. loadcases.ro_default()[0]), other keys are ignored."""
+        def group(kind):
+            fields = kind._fields
+            if not all(k in inputs for k in fields if k not in kind._field_defaults):
+                return None
+            return kind(**{k: None if inputs.get(k) is None else float(inputs[k]) for k in fields if k in inputs})
+
+        return cls(group(Geometry), group(Stiffness), group(Load), group(Section), group(Bounds))
+
+    def inputs(self):
+        """Return the spec as flat input dict (including phi_deg_load = phi_deg_boom + 90)."""
+        d = {}
+        for g in self:
+            if g is not None:
+                d.update(g._asdict())
+        d = {k: v for k, v in d.items() if v is not None}
+        if 'phi_deg_boom' in d:
+            d['phi_deg_load'] = d['phi_deg_boom'] + 90.
+        return d
+
+    def geometry_key(self):
+        """Hashable key of the load independent part (geometry and stiffness)."""
+        return self.geometry, self.stiffness
+
+    def with_load(self, **changes):
+        """Return a new spec with changed load values, e.g. spec.with_load(phi_deg_boom=90.)."""
+        return self._replace(load=self.load._replace(**changes))
+
+
+def as_inputs(inputs):
+    """Return a flat input dict for a MachineSpec, any other input unchanged."""
+    if isinstance(inputs, MachineSpec):
+        return inputs.inputs()
+    return inputs
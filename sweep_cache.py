@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+"""
+Persistent, content-addressed cache of limit curve sweeps (SQLite).
+
+A sweep is identified by the SHA-256 hash of a canonical JSON document of all
+inputs the limit curve depends on (geometry, stiffness, loads, box section,
+bounds), the sweep settings (step, solver, refinement) and
+limit_curve.SOLVER_VERSION. The results are stored as serialized SweepResult.
+If the database grows beyond max_bytes, the least recently used sweeps are
+evicted. Hits and misses are counted in the database, so the statistics are
+shared by all processes using the same cache file (dashboard and command
+line).
+
+The cache directory is taken from the environment variable
+ELASTOMECH_CACHE_DIR, default ~/.cache/elastomech.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from helpers import STATUS_TIME_BUDGET
+from influence import GEOMETRY_KEYS
+from limit_curve import limit_curve, limit_curve_adaptive, BOUND_KEYS, RESPONSE_LOAD_KEYS, SOLVER_VERSION
+from spec import as_inputs
+from sweep_result import SweepResult
+
+# Inputs of the cache key in addition to GEOMETRY_KEYS and RESPONSE_LOAD_KEYS
+SECTION_KEYS = ['B', 'H', 'tb', 'th']
+
+DEFAULT_MAX_BYTES = 256 * 2**20
+
+
+def default_path():
+    """Return the default database file."""
+    cache_dir = os.environ.get('ELASTOMECH_CACHE_DIR', os.path.join(os.path.expanduser('~'), '.cache', 'elastomech'))
+    return os.path.join(cache_dir, 'sweeps.sqlite')
+
+
+def sweep_key(inputs, **settings):
+    """
+    Return the cache key of a sweep.
+
+    Parameters
+    ----------
+    inputs : dict or MachineSpec
+        Dict of input values (see limit_curve.default_inputs).
+    **settings
+        Sweep settings which change the result, e.g. step=5., method='exact'.
+
+    Returns
+    -------
+    key : str
+        Hex digest of the canonical JSON of inputs, settings and solver
+        version.
+    """
+    i = as_inputs(inputs)
+    keys = GEOMETRY_KEYS + RESPONSE_LOAD_KEYS + SECTION_KEYS + [k + s for k in BOUND_KEYS for s in ('_lb', '_ub')]
+    doc = {'inputs': {k: None if i.get(k) is None else float(i[k]) for k in keys},
+           'settings': {k: float(v) if isinstance(v, (int, float)) and not isinstance(v, bool) else v for k, v in settings.items()},
+           'version': SOLVER_VERSION}
+    text = json.dumps(doc, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+class SweepCache:
+    """
+    SQLite cache of SweepResult objects with size-based LRU eviction.
+
+    Parameters
+    ----------
+    path : str, optional
+        Database file. The default is None (default_path()).
+    max_bytes : int, optional
+        Maximum total size of the stored sweeps. The default is
+        DEFAULT_MAX_BYTES.
+    """
+
+    def __init__(self, path=None, max_bytes=DEFAULT_MAX_BYTES):
+        self.path = path or default_path()
+        self.max_bytes = max_bytes
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        with self._connect() as con:
+            con.execute('CREATE TABLE IF NOT EXISTS sweeps (key TEXT PRIMARY KEY, data BLOB, size INTEGER, last_used REAL)')
+            con.execute('CREATE TABLE IF NOT EXISTS stats (name TEXT PRIMARY KEY, value INTEGER)')
+            con.execute("INSERT OR IGNORE INTO stats VALUES ('hits', 0), ('misses', 0), ('evictions', 0)")
+
+    def _connect(self):
+        # Eine Verbindung je Aufruf: threadsicher (Streamlit) und prozesssicher
+        con = sqlite3.connect(self.path, timeout=30.)
+        con.execute('PRAGMA journal_mode=WAL')
+        return con
+
+    def get(self, key):
+        """Return the stored SweepResult of key or None, and count the hit or miss."""
+        with self._connect() as con:
+            row = con.execute('SELECT data FROM sweeps WHERE key = ?', (key,)).fetchone()
+            if row is None:
+                con.execute("UPDATE stats SET value = value + 1 WHERE name = 'misses'")
+                return None
+            con.execute('UPDATE sweeps SET last_used = ? WHERE key = ?', (time.time(), key))
+            con.execute("UPDATE stats SET value = value + 1 WHERE name = 'hits'")
+        return SweepResult.from_bytes(row[0])
+
+    def put(self, key, result):
+        """Store a SweepResult and evict the least recently used sweeps beyond max_bytes."""
+        data = result.to_bytes()
+        with self._connect() as con:
+            con.execute('INSERT OR REPLACE INTO sweeps VALUES (?, ?, ?, ?)', (key, data, len(data), time.time()))
+            total = con.execute('SELECT COALESCE(SUM(size), 0) FROM sweeps').fetchone()[0]
+            evicted = 0
+            for old_key, size in con.execute('SELECT key, size FROM sweeps ORDER BY last_used').fetchall():
+                if total <= self.max_bytes:
+                    break
+                con.execute('DELETE FROM sweeps WHERE key = ?', (old_key,))
+                total -= size
+                evicted += 1
+            con.execute("UPDATE stats SET value = value + ? WHERE name = 'evictions'", (evicted,))
+
+    def stats(self):
+        """Return a dict with hits, misses, evictions, number of entries and stored bytes."""
+        with self._connect() as con:
+            d = dict(con.execute('SELECT name, value FROM stats').fetchall())
+            d['entries'], d['bytes'] = con.execute('SELECT COUNT(*), COALESCE(SUM(size), 0) FROM sweeps').fetchone()
+        return d
+
+    def clear(self):
+        """Delete all sweeps and reset the statistics."""
+        with self._connect() as con:
+            con.execute('DELETE FROM sweeps')
+            con.execute('UPDATE stats SET value = 0')
+
+
+def cached_limit_curve(inputs, step, method='SLSQP', continuation=False, adaptive=False, min_step=0.5, tol_ro=0.1, cache=None,
+                       coarse_to_fine=False, **kwargs):
+    """
+    Return the limit curve as SweepResult from the cache or compute and store it.
+
+    Parameters
+    ----------
+    inputs : dict or MachineSpec
+        Dict of input values (see limited_reachout).
+    step, method, continuation : see limit_curve
+    adaptive : bool, optional
+        Use limit_curve_adaptive (with min_step, tol_ro). The default is
+        False.
+    cache : SweepCache, optional
+        The default is None (no caching).
+    coarse_to_fine : bool, optional
+        See limit_curve (the adaptive sweep is coarse-to-fine anyway). The
+        default is False.
+    **kwargs
+        Further arguments of limit_curve/limit_curve_adaptive which do not
+        change the result (executor, max_workers, progress, on_row, disp) and
+        time_budget.
+        Sweeps with angles stopped by the time budget are not stored, their
+        result depends on the load of the machine.
+
+    Returns
+    -------
+    result : SweepResult
+    """
+    if adaptive:
+        settings = {'step': step, 'method': method, 'adaptive': True, 'min_step': min_step, 'tol_ro': tol_ro}
+    else:
+        settings = {'step': step, 'method': method, 'continuation': continuation}
+    key = sweep_key(inputs, **settings) if cache is not None else None
+    result = cache.get(key) if cache is not None else None
+    if result is not None:
+        return result
+
+    if adaptive:
+        result = limit_curve_adaptive(inputs, step, min_step=min_step, tol_ro=tol_ro, method=method, columnar=True, **kwargs)
+    else:
+        result = limit_curve(inputs, step, method=method, continuation=continuation, columnar=True, coarse_to_fine=coarse_to_fine,
+                             **kwargs)
+    if cache is not None and STATUS_TIME_BUDGET not in result.fails['status']:
+        cache.put(key, result)
+    return result
@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+"""
+Columnar, preallocated container for the results of a limit curve sweep.
+
+All numeric results of an angle are stored in one float64 array of shape
+(len(FLOAT_KEYS), capacity), i.e. every column is contiguous and can be
+handed to pandas and Arrow without copying. The lift-off regime, the active
+bound and the key of the minimum residual load are stored as int8 codes.
+
+Memory per angle: len(FLOAT_KEYS) * 8 + len(CODE_KEYS) * 1 = BYTES_PER_ANGLE
+(243 bytes), independent of the solver. Failed angles are kept separately in
+small lists (FAIL_KEYS of limit_curve).
+"""
+import io
+import json
+import numpy as np
+import pandas as pd
+from helpers import REACHOUT_CONSTRAINTS, REGIME_ELASTIC, REGIME_SEVERAL, LIFTOFF_LABELS
+
+# Numeric columns (same names as the d_ro dict of limit_curve)
+FLOAT_KEYS = ['phi', 'ro', 'ml', 'mlx', 'mly', 'Restlast val', 'f12', 'f23', 'f34', 'f14', 'nit',
+              'f1', 'f2', 'f3', 'f4', 'ffy', 'fry', 'phi1', 'phi2', 'phi3',
+              's1', 's2', 's3', 's4', 't14x', 't23x', 't14y', 't23y', 'sv14', 'sv23']
+
+# Coded columns (int8)
+CODE_KEYS = ['regime', 'active', 'Restlast key']
+
+# Labels of the codes of 'active' and 'Restlast key', code -1: unknown
+CONSTRAINT_LABELS = ['ro_lb', 'ro_ub'] + [f'{key}_{side}' for key, _ in REACHOUT_CONSTRAINTS for side in ('lb', 'ub')] + ['liftoff'] + list(LIFTOFF_LABELS.values())
+RESTLAST_LABELS = ['f12', 'f23', 'f34', 'f14']
+
+BYTES_PER_ANGLE = len(FLOAT_KEYS) * 8 + len(CODE_KEYS)
+
+FAIL_KEYS = ['phi', 'msg', 'No of iterations', 'status']
+
+
+def regime_code(lift_ids):
+    """Return the regime code of a list of lifted support ids (0: none, 1...4: one support, -1: several)."""
+    if not lift_ids:
+        return REGIME_ELASTIC
+    return lift_ids[0] if len(lift_ids) == 1 else REGIME_SEVERAL
+
+
+def _json_default(value):
+    return value.item()  # numpy scalars (e.g. nit, status of SLSQP)
+
+
+def _code(labels, label):
+    return labels.index(label) if label in labels else -1
+
+
+class SweepResult:
+    """
+    Preallocated result table of a limit curve sweep.
+
+    Parameters
+    ----------
+    capacity : int, optional
+        Number of angles to allocate. The table grows (doubling) if more
+        rows are appended. The default is 0.
+    """
+
+    def __init__(self, capacity=0):
+        self._floats = np.full((len(FLOAT_KEYS), capacity), np.nan)
+        self._codes = np.zeros((len(CODE_KEYS), capacity), dtype=np.int8)
+        self._n = 0
+        self.fails = {k: [] for k in FAIL_KEYS}
+
+    def __len__(self):
+        return self._n
+
+    @property
+    def nbytes(self):
+        """Allocated bytes of the columns."""
+        return self._floats.nbytes + self._codes.nbytes
+
+    def _grow(self):
+        capacity = max(2 * self._floats.shape[1], 16)
+        floats = np.full((len(FLOAT_KEYS), capacity), np.nan)
+        codes = np.zeros((len(CODE_KEYS), capacity), dtype=np.int8)
+        floats[:, :self._n] = self._floats[:, :self._n]
+        codes[:, :self._n] = self._codes[:, :self._n]
+        self._floats, self._codes = floats, codes
+
+    def append(self, success, row):
+        """Append a row of reachout_at (limit curve row or, if not success, error log row)."""
+        if not success:
+            for k in FAIL_KEYS:
+                self.fails[k].append(row[k])
+            return
+        if self._n == self._floats.shape[1]:
+            self._grow()
+        j = self._n
+        for n, k in enumerate(FLOAT_KEYS):
+            self._floats[n, j] = row[k]
+        self._codes[:, j] = (regime_code(row['lift id']),
+                             _code(CONSTRAINT_LABELS, row['active']),
+                             _code(RESTLAST_LABELS, row['Restlast key']))
+        self._n += 1
+
+    def sort(self):
+        """Sort the rows by phi (in place)."""
+        order = np.argsort(self._floats[0, :self._n], kind='stable')
+        self._floats[:, :self._n] = self._floats[:, order]
+        self._codes[:, :self._n] = self._codes[:, order]
+        order = np.argsort(self.fails['phi'], kind='stable')
+        self.fails = {k: [v[i] for i in order] for k, v in self.fails.items()}
+
+    def copy(self):
+        """Return a copy of the appended rows."""
+        result = SweepResult()
+        result._floats = self._floats[:, :self._n].copy()
+        result._codes = self._codes[:, :self._n].copy()
+        result._n = self._n
+        result.fails = {k: list(v) for k, v in self.fails.items()}
+        return result
+
+    def column(self, key):
+        """Return a read-only view of a column (FLOAT_KEYS or CODE_KEYS)."""
+        if key in CODE_KEYS:
+            view = self._codes[CODE_KEYS.index(key), :self._n]
+        else:
+            view = self._floats[FLOAT_KEYS.index(key), :self._n]
+        view = view.view()
+        view.setflags(write=False)
+        return view
+
+    def __getitem__(self, key):
+        return self.column(key)
+
+    def to_pandas(self):
+        """
+        Return the successful angles as DataFrame.
+
+        The float columns are a view of the internal array (no copy), the
+        coded columns active and Restlast key are categoricals.
+        """
+        df = pd.DataFrame(self._floats[:, :self._n].T, columns=FLOAT_KEYS, copy=False)
+        df['regime'] = self._codes[0, :self._n]
+        df['active'] = pd.Categorical.from_codes(self._codes[1, :self._n], categories=CONSTRAINT_LABELS)
+        df['Restlast key'] = pd.Categorical.from_codes(self._codes[2, :self._n], categories=RESTLAST_LABELS)
+        return df
+
+    def to_arrow(self):
+        """Return the successful angles as pyarrow Table (float and code columns without copy). Requires pyarrow."""
+        import pyarrow as pa
+        arrays = [pa.array(self._floats[n, :self._n]) for n in range(len(FLOAT_KEYS))]
+        arrays.append(pa.array(self._codes[0, :self._n]))
+        for n, labels in [(1, CONSTRAINT_LABELS), (2, RESTLAST_LABELS)]:
+            codes = self._codes[n, :self._n]
+            arrays.append(pa.DictionaryArray.from_arrays(pa.array(codes, mask=codes < 0), pa.array(labels)))
+        return pa.Table.from_arrays(arrays, names=FLOAT_KEYS + CODE_KEYS)
+
+    def fails_frame(self):
+        """Return the error log as DataFrame."""
+        return pd.DataFrame(self.fails, columns=FAIL_KEYS)
+
+    def to_bytes(self):
+        """Serialize the table (npz with the float and code columns and the error log as JSON)."""
+        buf = io.BytesIO()
+        np.savez(buf, floats=self._floats[:, :self._n], codes=self._codes[:, :self._n],
+                 fails=np.array(json.dumps(self.fails, default=_json_default)))
+        return buf.getvalue()
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Return the table serialized with to_bytes."""
+        result = cls()
+        with np.load(io.BytesIO(data)) as npz:
+            result._floats = np.ascontiguousarray(npz['floats'])
+            result._codes = np.ascontiguousarray(npz['codes'])
+            result.fails = json.loads(str(npz['fails']))
+        result._n = result._floats.shape[1]
+        return result
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+"""
+Consistency checks of the solver backends and solvers against each other (pytest).
+
+Complements validation_tests.py (reference values of the load cases): the
+closed-form model, the linear equation system, the batch and influence matrix
+evaluation, the exact and the SLSQP limit curve and the two lift-off modes of
+the batch evaluation must give the same results.
+"""
+import numpy as np
+import pytest
+import loadcases as lc
+from helpers import case_dependent_results, case_dependent_results_batch, limited_reachout, REGIME_ELASTIC
+from influence import results_influence
+from limit_curve import default_inputs, limit_curve
+from model_batch import INPUT_KEYS, results_batch
+from model_linear import results_linear, results_liftoff_linear
+from model_plain import results_plain, results_liftoff_plain
+
+LOADCASES = [lc.elast_a, lc.elast_b, lc.elast_c, lc.liftoff_a, lc.liftoff_b, lc.liftoff_c, lc.liftoff_d]
+
+RTOL = 1e-9
+
+
+def _args(ini):
+    return [ini[k] for k in INPUT_KEYS]
+
+
+def _assert_close(a, b, keys=None, rtol=RTOL, atol=1e-6):
+    for k in keys or a:
+        np.testing.assert_allclose(a[k], b[k], rtol=rtol, atol=atol, err_msg=k)
+
+
+def _batch(n=200, seed=0):
+    """Load cases of elast_a with random load moments in all directions (elastostatic and lift-off)."""
+    ini, _ = lc.elast_a()
+    rng = np.random.default_rng(seed)
+    ml = rng.uniform(0., 3. * np.hypot(ini['mlx'], ini['mly']) + 1., n)
+    phi = rng.uniform(0., 2. * np.pi, n)
+    cols = {k: ini[k] for k in INPUT_KEYS}
+    cols.update(mlx=ml * np.cos(phi), mly=ml * np.sin(phi), x1=ini['x23'], x3=ini['x14'])
+    return cols
+
+
+@pytest.mark.parametrize('loadcase', LOADCASES)
+@pytest.mark.parametrize('lift', [None, 1, 2, 3, 4])
+def test_plain_vs_linear(loadcase, lift):
+    ini, _ = loadcase()
+    args = _args(ini)
+    if lift is None:
+        a = results_plain(*args, x1=ini['x23'], x3=ini['x14'])
+        b = results_linear(*args, x1=ini['x23'], x3=ini['x14'])
+    else:
+        a = results_liftoff_plain(*args, lift, x1=ini['x23'], x3=ini['x14'])
+        b = results_liftoff_linear(*args, lift, x1=ini['x23'], x3=ini['x14'])
+    _assert_close(a, b)
+
+
+@pytest.mark.parametrize('loadcase', LOADCASES)
+def test_case_dependent_plain_vs_linear(loadcase):
+    ini, _ = loadcase()
+    a, _, _ = case_dependent_results(*_args(ini), x1=ini['x23'], x3=ini['x14'], backend='plain')
+    b, _, _ = case_dependent_results(*_args(ini), x1=ini['x23'], x3=ini['x14'], backend='linear')
+    _assert_close(a, b)
+
+
+@pytest.mark.parametrize('lift', [None, 1, 2, 3, 4])
+def test_batch_vs_scalar(lift):
+    cols = _batch(50)
+    batch = results_batch(cols, lift)
+    for n in range(len(cols['mlx'])):
+        args = [cols[k] if np.isscalar(cols[k]) else cols[k][n] for k in INPUT_KEYS]
+        if lift is None:
+            scalar = results_plain(*args, x1=cols['x1'], x3=cols['x3'])
+        else:
+            scalar = results_liftoff_plain(*args, lift, x1=cols['x1'], x3=cols['x3'])
+        _assert_close({k: v[n] for k, v in batch.items()}, scalar, keys=list(scalar))
+
+
+@pytest.mark.parametrize('lift', [None, 1, 2, 3, 4])
+def test_influence_vs_direct(lift):
+    cols = _batch(50)
+    influence = results_influence(cols, lift)
+    direct = results_batch(cols, lift)
+    _assert_close(influence, direct, keys=[k for k in influence if k in direct])
+
+
+def test_active_set_vs_regime():
+    cols = _batch(400)
+    a, regime_a, error_a = case_dependent_results_batch(cols, mode='regime')
+    b, regime_b, error_b = case_dependent_results_batch(cols, mode='active_set')
+    assert (regime_a == REGIME_ELASTIC).any() and (regime_a > REGIME_ELASTIC).any()
+    # Wo der Fall eindeutig ist (keine oder genau eine abhebende Stütze), stimmen beide Verfahren überein
+    valid = ~error_a & ~error_b
+    assert valid.sum() > len(valid) // 2
+    np.testing.assert_array_equal(regime_a[valid], regime_b[valid])
+    _assert_close({k: v[valid] for k, v in a.items()}, {k: v[valid] for k, v in b.items()})
+
+
+@pytest.mark.parametrize('phi', np.arange(0., 360., 15.))
+def test_exact_vs_slsqp(phi):
+    ini, _ = lc.ro_default()
+    i = default_inputs(ini)
+    i['phi_deg_boom'] = phi
+    i['phi_deg_load'] = phi + 90.
+    slsqp = limited_reachout(i, method='SLSQP')
+    exact = limited_reachout(i, method='exact')
+    if not slsqp.success:
+        pytest.skip('SLSQP does not converge')
+    assert exact.success
+    np.testing.assert_allclose(exact.x[0], slsqp.x[0], rtol=1e-4, atol=1e-4)
+
+
+def test_exact_liftoff_several():
+    # Symmetrische Maschine, Last nach hinten: f1 und f4 werden gleichzeitig null
+    ini, _ = lc.ro_default()
+    i = default_inputs(ini)
+    for k in i:
+        if k.endswith('_lb') and k != 'ro_lb':
+            i[k] = -1e12
+        elif k.endswith('_ub') and k != 'ro_ub':
+            i[k] = 1e12
+    i['phi_deg_boom'] = 180.
+    i['phi_deg_load'] = 270.
+    exact = limited_reachout(i, method='exact')
+    assert exact.success and exact.x[0] < i['ro_ub']
+    assert exact.active == 'liftoff_several'
+    result = limit_curve(i, 90., method='exact', columnar=True)
+    assert list(result.to_pandas()['active']) == ['ro_ub', 'ro_ub', 'liftoff_several', 'ro_ub']
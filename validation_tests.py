@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 """A script to validate the results of the Support Force Distribution Dashboard."""
+from math import isclose
 from model_plain import results_plain
 from helpers import check_liftoffs, case_dependent_results
 from plot import topview_plot
@@ -48,3 +49,13 @@ for (ini, expected) in loadcases:
         else:
             percent = 0.
         print(f'{key}: {delta:.6f} ({percent:.3f}%)')
+
+# Cross-check of the solver backends (closed-form vs. linear equation system)
+print('Abweichungen plain-linear:')
+for (ini, expected) in loadcases:
+    args = [ini[k] for k in ['fl', 'mlx', 'mly', 'fe', 'y1', 'y2', 'y3', 'y4', 'xe', 'x14', 'x23', 'd14', 'd23', 'd1', 'd2', 'd3', 'd4']]
+    res_plain, _, _ = case_dependent_results(*args, x1=ini['x23'], x3=ini['x14'], backend='plain')
+    res_linear, _, _ = case_dependent_results(*args, x1=ini['x23'], x3=ini['x14'], backend='linear')
+    deviating = [k for k in res_plain if not isclose(res_plain[k], res_linear[k], rel_tol=1e-9, abs_tol=1e-9)]
+    print(f"phi={ini['phi_deg_boom']}: deviating values {deviating}")
+    assert not deviating, f"plain and linear backend deviate: {deviating}"